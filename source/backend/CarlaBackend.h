@@ -1421,7 +1421,19 @@ typedef enum {
     /*!
      * Capture console output into debug callbacks.
      */
-    ENGINE_OPTION_DEBUG_CONSOLE_OUTPUT = 33
+    ENGINE_OPTION_DEBUG_CONSOLE_OUTPUT = 33,
+
+    /*!
+     * Start all plugin bridges of a project at once, instead of waiting for each to finish loading.
+     * Default is no, EXPERIMENTAL.
+     */
+    ENGINE_OPTION_PARALLEL_PROJECT_LOAD = 34,
+
+    /*!
+     * Memory budget for plugins created ahead of time via carla_prewarm_plugin(), in MiB.
+     * Default is 0, which disables the plugin pool, EXPERIMENTAL.
+     */
+    ENGINE_OPTION_PLUGIN_POOL_MEMORY = 35
 
 } EngineOption;
 
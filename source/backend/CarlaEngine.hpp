@@ -237,6 +237,8 @@ struct CARLA_API EngineOptions {
     bool forceStereo;
     bool resetXruns;
     bool preferPluginBridges;
+    bool parallelProjectLoad;
+    uint pluginPoolMemory;
     bool preferUiBridges;
     bool uisAlwaysOnTop;
     uint bgColor;
@@ -986,6 +988,21 @@ public:
     bool removeAllPlugins();
 
 #ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
+    /*!
+     * Create a plugin ahead of time and keep it inactive in the plugin pool.
+     * A later addPlugin() call with matching arguments takes this instance instead of creating a new one.
+     * The pool is limited by ENGINE_OPTION_PLUGIN_POOL_MEMORY, least recently used instances are dropped first.
+     * This only queues the request, the plugin is created later on a separate engine thread.
+     */
+    bool prewarmPlugin(BinaryType btype, PluginType ptype,
+                       const char* filename, const char* name, const char* label, int64_t uniqueId,
+                       const void* extra, uint options = PLUGIN_OPTIONS_NULL);
+
+    /*!
+     * Remove all plugins from the plugin pool, including the ones not created yet.
+     */
+    void clearPluginPool();
+
     /*!
      * Rename plugin with id @a id to @a newName.
      * Returns the new name, or null if the operation failed.
@@ -1031,6 +1048,12 @@ public:
      */
     CarlaPlugin* getPluginUnchecked(uint id) const noexcept;
 
+    /*!
+     * Get the time it took to load plugin with id @a id, in milliseconds.
+     * For plugins loaded from a project this includes restoring their state.
+     */
+    uint32_t getPluginLoadTime(uint id) const noexcept;
+
     /*!
      * Get a unique plugin name within the engine.
      * Returned variable must be deleted if non-null.
@@ -1292,6 +1315,7 @@ protected:
     friend class CarlaEngineEventPort;
     friend class CarlaEngineOsc;
     friend class CarlaEngineThread;
+    friend class CarlaEnginePrewarmThread;
     friend class CarlaPluginInstance;
     friend class EngineInternalGraph;
     friend class PendingRtEventsRunner;
@@ -1337,6 +1361,21 @@ protected:
      */
     bool loadProjectInternal(water::XmlDocument& xmlDoc);
 
+    /*!
+     * Create a new plugin instance, without adding it to the engine.
+     */
+    CarlaPlugin* newPluginInstance(uint id, BinaryType btype, PluginType ptype,
+                                   const char* filename, const char* name, const char* label, int64_t uniqueId,
+                                   const void* extra, uint options);
+
+#ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
+    /*!
+     * Create the next plugin queued by prewarmPlugin() and add it to the plugin pool.
+     * Called from the plugin pool thread, returns false if there was nothing to do.
+     */
+    bool prewarmNextPlugin();
+#endif
+
     // -------------------------------------------------------------------
     // Helper functions
 
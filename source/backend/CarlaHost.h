@@ -665,6 +665,24 @@ CARLA_EXPORT bool carla_replace_plugin(CarlaHostHandle handle, uint pluginId);
  * @param pluginIdB Plugin B
  */
 CARLA_EXPORT bool carla_switch_plugins(CarlaHostHandle handle, uint pluginIdA, uint pluginIdB);
+
+/*!
+ * Create a plugin ahead of time and keep it inactive in the plugin pool.
+ * A later carla_add_plugin() call with the same arguments takes this instance instead of creating a new one,
+ * which also applies to carla_replace_plugin().
+ * The pool is limited by ENGINE_OPTION_PLUGIN_POOL_MEMORY, least recently used instances are dropped first.
+ * Arguments are the same as in carla_add_plugin(), extraPtr must be NULL.
+ * The plugin is created asynchronously, a true return value only means the request was queued.
+ */
+CARLA_EXPORT bool carla_prewarm_plugin(CarlaHostHandle handle,
+                                       BinaryType btype, PluginType ptype,
+                                       const char* filename, const char* name, const char* label, int64_t uniqueId,
+                                       const void* extraPtr, uint options);
+
+/*!
+ * Remove all plugins from the plugin pool.
+ */
+CARLA_EXPORT void carla_clear_plugin_pool(CarlaHostHandle handle);
 #endif
 
 /*!
@@ -905,6 +923,13 @@ CARLA_EXPORT float carla_get_input_peak_value(CarlaHostHandle handle, uint plugi
  */
 CARLA_EXPORT float carla_get_output_peak_value(CarlaHostHandle handle, uint pluginId, bool isLeft);
 
+/*!
+ * Get the time it took to load a plugin, in milliseconds.
+ * For plugins loaded from a project this includes restoring their state.
+ * @param pluginId Plugin
+ */
+CARLA_EXPORT uint32_t carla_get_plugin_load_time(CarlaHostHandle handle, uint pluginId);
+
 /*!
  * Render a plugin's inline display.
  * @param pluginId Plugin
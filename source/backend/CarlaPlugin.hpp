@@ -946,6 +946,10 @@ public:
     static CarlaPlugin* newNative(const Initializer& init);
     static CarlaPlugin* newBridge(const Initializer& init, BinaryType btype, PluginType ptype, const char* bridgeBinary);
 
+    // split version of newBridge, the bridge process is started in prepare and waited for in finish
+    static CarlaPlugin* prepareBridge(const Initializer& init, BinaryType btype, PluginType ptype, const char* bridgeBinary);
+    static CarlaPlugin* finishBridge(CarlaPlugin* plugin, const Initializer& init);
+
     static CarlaPlugin* newLADSPA(const Initializer& init, const LADSPA_RDF_Descriptor* rdfDescriptor);
     static CarlaPlugin* newDSSI(const Initializer& init);
     static CarlaPlugin* newLV2(const Initializer& init);
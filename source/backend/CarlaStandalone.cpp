@@ -209,6 +209,8 @@ static void carla_engine_init_common(const CarlaHostStandalone& standalone, Carl
 #else
     engine->setOption(CB::ENGINE_OPTION_FORCE_STEREO,          standalone.engineOptions.forceStereo         ? 1 : 0,        nullptr);
     engine->setOption(CB::ENGINE_OPTION_PREFER_PLUGIN_BRIDGES, standalone.engineOptions.preferPluginBridges ? 1 : 0,        nullptr);
+    engine->setOption(CB::ENGINE_OPTION_PARALLEL_PROJECT_LOAD, standalone.engineOptions.parallelProjectLoad ? 1 : 0,        nullptr);
+    engine->setOption(CB::ENGINE_OPTION_PLUGIN_POOL_MEMORY,    static_cast<int>(standalone.engineOptions.pluginPoolMemory), nullptr);
     engine->setOption(CB::ENGINE_OPTION_PREFER_UI_BRIDGES,     standalone.engineOptions.preferUiBridges     ? 1 : 0,        nullptr);
     engine->setOption(CB::ENGINE_OPTION_UIS_ALWAYS_ON_TOP,     standalone.engineOptions.uisAlwaysOnTop      ? 1 : 0,        nullptr);
     engine->setOption(CB::ENGINE_OPTION_MAX_PARAMETERS,        static_cast<int>(standalone.engineOptions.maxParameters),    nullptr);
@@ -659,6 +661,16 @@ void carla_set_engine_option(CarlaHostHandle handle, EngineOption option, int va
             shandle.engineOptions.preferPluginBridges = (value != 0);
             break;
 
+        case CB::ENGINE_OPTION_PARALLEL_PROJECT_LOAD:
+            CARLA_SAFE_ASSERT_RETURN(value == 0 || value == 1,);
+            shandle.engineOptions.parallelProjectLoad = (value != 0);
+            break;
+
+        case CB::ENGINE_OPTION_PLUGIN_POOL_MEMORY:
+            CARLA_SAFE_ASSERT_RETURN(value >= 0,);
+            shandle.engineOptions.pluginPoolMemory = static_cast<uint>(value);
+            break;
+
         case CB::ENGINE_OPTION_PREFER_UI_BRIDGES:
             CARLA_SAFE_ASSERT_RETURN(value == 0 || value == 1,);
             shandle.engineOptions.preferUiBridges = (value != 0);
@@ -1156,6 +1168,31 @@ bool carla_switch_plugins(CarlaHostHandle handle, uint pluginIdA, uint pluginIdB
 
     return handle->engine->switchPlugins(pluginIdA, pluginIdB);
 }
+
+bool carla_prewarm_plugin(CarlaHostHandle handle,
+                          BinaryType btype, PluginType ptype,
+                          const char* filename, const char* name, const char* label, int64_t uniqueId,
+                          const void* extraPtr, uint options)
+{
+    CARLA_SAFE_ASSERT_WITH_LAST_ERROR_RETURN(handle->engine != nullptr, "Engine is not initialized", false);
+
+    carla_debug("carla_prewarm_plugin(%p, %i:%s, %i:%s, \"%s\", \"%s\", \"%s\", " P_INT64 ", %p, %u)",
+                handle,
+                btype, CB::BinaryType2Str(btype),
+                ptype, CB::PluginType2Str(ptype),
+                filename, name, label, uniqueId, extraPtr, options);
+
+    return handle->engine->prewarmPlugin(btype, ptype, filename, name, label, uniqueId, extraPtr, options);
+}
+
+void carla_clear_plugin_pool(CarlaHostHandle handle)
+{
+    CARLA_SAFE_ASSERT_RETURN(handle->engine != nullptr,);
+
+    carla_debug("carla_clear_plugin_pool(%p)", handle);
+
+    handle->engine->clearPluginPool();
+}
 #endif
 
 // --------------------------------------------------------------------------------------------------------------------
@@ -1863,6 +1900,13 @@ float carla_get_output_peak_value(CarlaHostHandle handle, uint pluginId, bool is
     return handle->engine->getOutputPeak(pluginId, isLeft);
 }
 
+uint32_t carla_get_plugin_load_time(CarlaHostHandle handle, uint pluginId)
+{
+    CARLA_SAFE_ASSERT_RETURN(handle->engine != nullptr, 0);
+
+    return handle->engine->getPluginLoadTime(pluginId);
+}
+
 // --------------------------------------------------------------------------------------------------------------------
 
 CARLA_BACKEND_START_NAMESPACE
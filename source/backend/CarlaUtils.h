@@ -209,6 +209,25 @@ CARLA_EXPORT CarlaPipeClientHandle carla_pipe_client_new(const char* argv[], Car
  */
 CARLA_EXPORT const char* carla_pipe_client_idle(CarlaPipeClientHandle handle);
 
+/*!
+ * Read all lines currently available in the pipe, without waiting, as an alternative to carla_pipe_client_idle().
+ * Lines are separated by '\n', newlines within them are escaped as '\r' (same as written to the pipe).
+ * Returns null if there is nothing to read.
+ */
+CARLA_EXPORT const char* carla_pipe_client_readlines(CarlaPipeClientHandle handle);
+
+/*!
+ * Start reading the pipe in a background thread, so carla_pipe_client_readlines() only takes the lines read so far.
+ * Once started, carla_pipe_client_idle() and the carla_pipe_client_readlineblock*() calls must not be used.
+ */
+CARLA_EXPORT bool carla_pipe_client_start_reader(CarlaPipeClientHandle handle);
+
+/*!
+ * Map a shared memory object created by the other side of the pipe, replacing any previous one.
+ * Returns the address of the mapped memory, valid until the pipe client is destroyed, or null on failure.
+ */
+CARLA_EXPORT void* carla_pipe_client_map_shared_data(CarlaPipeClientHandle handle, const char* filename, uint size);
+
 /*!
  * TODO.
  */
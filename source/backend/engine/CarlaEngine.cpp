@@ -40,6 +40,7 @@
 #include "jackbridge/JackBridge.hpp"
 
 #include "water/files/File.h"
+#include "water/misc/Time.h"
 #include "water/streams/MemoryOutputStream.h"
 #include "water/xml/XmlDocument.h"
 #include "water/xml/XmlElement.h"
@@ -53,6 +54,7 @@ using water::File;
 using water::MemoryOutputStream;
 using water::String;
 using water::StringArray;
+using water::Time;
 using water::XmlDocument;
 using water::XmlElement;
 
@@ -345,6 +347,12 @@ bool CarlaEngine::close()
         removeAllPlugins();
     }
 
+#ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
+    pData->prewarmThread.stopThread(-1);
+    pData->clearPrewarmRequests();
+    pData->clearPluginPool();
+#endif
+
     pData->close();
 
     callback(true, true, ENGINE_CALLBACK_ENGINE_STOPPED, 0, 0, 0, 0, 0.0f, nullptr);
@@ -379,6 +387,13 @@ void CarlaEngine::idle() noexcept
         }
     }
 
+#ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
+    if (pData->loadingProject)
+        pData->idlePreparedBridges();
+
+    pData->idlePooledPlugins();
+#endif
+
 #if defined(HAVE_LIBLO) && !defined(BUILD_BRIDGE)
     pData->osc.idle();
 #endif
@@ -434,75 +449,9 @@ bool CarlaEngine::setBufferSizeAndSampleRate(const uint, const double)
 // -----------------------------------------------------------------------
 // Plugin management
 
-bool CarlaEngine::addPlugin(const BinaryType btype,
-                            const PluginType ptype,
-                            const char* const filename,
-                            const char* const name,
-                            const char* const label,
-                            const int64_t uniqueId,
-                            const void* const extra,
-                            const uint options)
+static CarlaString getBridgeBinaryForType(const char* const binaryDir, const BinaryType btype)
 {
-    CARLA_SAFE_ASSERT_RETURN_ERR(pData->isIdling == 0, "An operation is still being processed, please wait for it to finish");
-#ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
-    CARLA_SAFE_ASSERT_RETURN_ERR(pData->plugins != nullptr, "Invalid engine internal data");
-    CARLA_SAFE_ASSERT_RETURN_ERR(pData->nextPluginId <= pData->maxPluginNumber, "Invalid engine internal data");
-#endif
-    CARLA_SAFE_ASSERT_RETURN_ERR(pData->nextAction.opcode == kEnginePostActionNull, "Invalid engine internal data");
-    CARLA_SAFE_ASSERT_RETURN_ERR(btype != BINARY_NONE, "Invalid plugin binary mode");
-    CARLA_SAFE_ASSERT_RETURN_ERR(ptype != PLUGIN_NONE, "Invalid plugin type");
-    CARLA_SAFE_ASSERT_RETURN_ERR((filename != nullptr && filename[0] != '\0') || (label != nullptr && label[0] != '\0'), "Invalid plugin filename and label");
-    carla_debug("CarlaEngine::addPlugin(%i:%s, %i:%s, \"%s\", \"%s\", \"%s\", " P_INT64 ", %p, %u)",
-                btype, BinaryType2Str(btype), ptype, PluginType2Str(ptype), filename, name, label, uniqueId, extra, options);
-
-#ifndef CARLA_OS_WIN
-    if (ptype != PLUGIN_JACK && ptype != PLUGIN_LV2 && filename != nullptr && filename[0] != '\0') {
-        CARLA_SAFE_ASSERT_RETURN_ERR(filename[0] == CARLA_OS_SEP || filename[0] == '.' || filename[0] == '~', "Invalid plugin filename");
-    }
-#endif
-
-    uint id;
-
-#ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
-    CarlaPlugin* oldPlugin = nullptr;
-
-    if (pData->nextPluginId < pData->curPluginCount)
-    {
-        id = pData->nextPluginId;
-        pData->nextPluginId = pData->maxPluginNumber;
-
-        oldPlugin = pData->plugins[id].plugin;
-
-        CARLA_SAFE_ASSERT_RETURN_ERR(oldPlugin != nullptr, "Invalid replace plugin Id");
-    }
-    else
-#endif
-    {
-        id = pData->curPluginCount;
-
-        if (id == pData->maxPluginNumber)
-        {
-            setLastError("Maximum number of plugins reached");
-            return false;
-        }
-
-#ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
-        CARLA_SAFE_ASSERT_RETURN_ERR(pData->plugins[id].plugin == nullptr, "Invalid engine internal data");
-#endif
-    }
-
-    CarlaPlugin::Initializer initializer = {
-        this,
-        id,
-        filename,
-        name,
-        label,
-        uniqueId,
-        options
-    };
-
-    CarlaPlugin* plugin = nullptr;
-    CarlaString bridgeBinary(pData->options.binaryDir);
+    CarlaString bridgeBinary(binaryDir);
 
     if (bridgeBinary.isNotEmpty())
     {
@@ -538,6 +487,63 @@ bool CarlaEngine::addPlugin(const BinaryType btype,
             bridgeBinary.clear();
     }
 
+    return bridgeBinary;
+}
+
+#ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
+// pooled plugins are accounted for at least this much memory, so the pool budget also limits their number
+static const size_t kMinPooledPluginMemory = 1024 * 1024;
+
+// resident memory of this process in bytes, or 0 if unknown
+static size_t getProcessResidentMemory() noexcept
+{
+#ifdef CARLA_OS_LINUX
+    if (FILE* const file = std::fopen("/proc/self/statm", "r"))
+    {
+        unsigned long size = 0, resident = 0;
+        const int ret = std::fscanf(file, "%lu %lu", &size, &resident);
+        std::fclose(file);
+
+        if (ret == 2)
+            return static_cast<size_t>(resident) * static_cast<size_t>(::sysconf(_SC_PAGESIZE));
+    }
+#endif
+
+    return 0;
+}
+#endif
+
+static bool canPluginTypeBeBridged(const PluginType ptype) noexcept
+{
+    return ptype != PLUGIN_INTERNAL
+        && ptype != PLUGIN_SF2
+        && ptype != PLUGIN_SFZ
+        && ptype != PLUGIN_JACK;
+}
+
+CarlaPlugin* CarlaEngine::newPluginInstance(const uint id,
+                                            const BinaryType btype,
+                                            const PluginType ptype,
+                                            const char* const filename,
+                                            const char* const name,
+                                            const char* const label,
+                                            const int64_t uniqueId,
+                                            const void* const extra,
+                                            const uint options)
+{
+    CarlaPlugin::Initializer initializer = {
+        this,
+        id,
+        filename,
+        name,
+        label,
+        uniqueId,
+        options
+    };
+
+    CarlaPlugin* plugin = nullptr;
+    const CarlaString bridgeBinary(getBridgeBinaryForType(pData->options.binaryDir, btype));
+
     // Prefer bridges for some specific plugins
     const bool preferBridges = pData->options.preferPluginBridges;
 
@@ -556,21 +562,24 @@ bool CarlaEngine::addPlugin(const BinaryType btype,
     }
 #endif // ! BUILD_BRIDGE
 
-    const bool canBeBridged = ptype != PLUGIN_INTERNAL
-                           && ptype != PLUGIN_SF2
-                           && ptype != PLUGIN_SFZ
-                           && ptype != PLUGIN_JACK;
+    const bool canBeBridged = canPluginTypeBeBridged(ptype);
 
     if (canBeBridged && (btype != BINARY_NATIVE || (preferBridges && bridgeBinary.isNotEmpty())))
     {
         if (bridgeBinary.isNotEmpty())
         {
+#ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
+            // use the bridge started early during project load, if there is one
+            if (CarlaPlugin* const preparedPlugin = pData->takePreparedBridge(btype, ptype, filename, label, uniqueId))
+                plugin = CarlaPlugin::finishBridge(preparedPlugin, initializer);
+            else
+#endif
             plugin = CarlaPlugin::newBridge(initializer, btype, ptype, bridgeBinary);
         }
         else
         {
             setLastError("This Carla build cannot handle this binary");
-            return false;
+            return nullptr;
         }
     }
     else
@@ -644,6 +653,101 @@ bool CarlaEngine::addPlugin(const BinaryType btype,
         }
     }
 
+
+    return plugin;
+}
+
+bool CarlaEngine::addPlugin(const BinaryType btype,
+                            const PluginType ptype,
+                            const char* const filename,
+                            const char* const name,
+                            const char* const label,
+                            const int64_t uniqueId,
+                            const void* const extra,
+                            const uint options)
+{
+    CARLA_SAFE_ASSERT_RETURN_ERR(pData->isIdling == 0, "An operation is still being processed, please wait for it to finish");
+#ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
+    CARLA_SAFE_ASSERT_RETURN_ERR(pData->plugins != nullptr, "Invalid engine internal data");
+    CARLA_SAFE_ASSERT_RETURN_ERR(pData->nextPluginId <= pData->maxPluginNumber, "Invalid engine internal data");
+#endif
+    CARLA_SAFE_ASSERT_RETURN_ERR(pData->nextAction.opcode == kEnginePostActionNull, "Invalid engine internal data");
+    CARLA_SAFE_ASSERT_RETURN_ERR(btype != BINARY_NONE, "Invalid plugin binary mode");
+    CARLA_SAFE_ASSERT_RETURN_ERR(ptype != PLUGIN_NONE, "Invalid plugin type");
+    CARLA_SAFE_ASSERT_RETURN_ERR((filename != nullptr && filename[0] != '\0') || (label != nullptr && label[0] != '\0'), "Invalid plugin filename and label");
+    carla_debug("CarlaEngine::addPlugin(%i:%s, %i:%s, \"%s\", \"%s\", \"%s\", " P_INT64 ", %p, %u)",
+                btype, BinaryType2Str(btype), ptype, PluginType2Str(ptype), filename, name, label, uniqueId, extra, options);
+
+    const uint32_t startTime = Time::getMillisecondCounter();
+
+#ifndef CARLA_OS_WIN
+    if (ptype != PLUGIN_JACK && ptype != PLUGIN_LV2 && filename != nullptr && filename[0] != '\0') {
+        CARLA_SAFE_ASSERT_RETURN_ERR(filename[0] == CARLA_OS_SEP || filename[0] == '.' || filename[0] == '~', "Invalid plugin filename");
+    }
+#endif
+
+    uint id;
+
+#ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
+    CarlaPlugin* oldPlugin = nullptr;
+
+    if (pData->nextPluginId < pData->curPluginCount)
+    {
+        id = pData->nextPluginId;
+        pData->nextPluginId = pData->maxPluginNumber;
+
+        oldPlugin = pData->plugins[id].plugin;
+
+        CARLA_SAFE_ASSERT_RETURN_ERR(oldPlugin != nullptr, "Invalid replace plugin Id");
+    }
+    else
+#endif
+    {
+        id = pData->curPluginCount;
+
+        if (id == pData->maxPluginNumber)
+        {
+            setLastError("Maximum number of plugins reached");
+            return false;
+        }
+
+#ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
+        CARLA_SAFE_ASSERT_RETURN_ERR(pData->plugins[id].plugin == nullptr, "Invalid engine internal data");
+#endif
+    }
+
+    CarlaPlugin* plugin = nullptr;
+
+#ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
+    // use a pre-warmed instance if there is one
+    if (extra == nullptr)
+        plugin = pData->takePooledPlugin(btype, ptype, filename, label, uniqueId, options);
+
+    if (plugin != nullptr)
+    {
+        plugin->setId(id);
+
+        // the instance was named when created, other plugins might have taken its name since
+        if (const char* const uniqueName = getUniquePluginName((name != nullptr && name[0] != '\0') ? name
+                                                                                                    : plugin->getName()))
+        {
+            plugin->setName(uniqueName);
+            delete[] uniqueName;
+        }
+
+        // pooled bridges are not idled, re-enable the ping check that was turned off for them
+        if ((plugin->getHints() & PLUGIN_IS_BRIDGE) != 0 && ! pData->loadingProject)
+            plugin->setCustomData(CUSTOM_DATA_TYPE_STRING, "__CarlaPingOnOff__", "true", false);
+    }
+    else
+#endif
+    {
+#ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
+        const CarlaMutexLocker cml(pData->newPluginMutex);
+#endif
+        plugin = newPluginInstance(id, btype, ptype, filename, name, label, uniqueId, extra, options);
+    }
+
     if (plugin == nullptr)
         return false;
 
@@ -676,6 +780,7 @@ bool CarlaEngine::addPlugin(const BinaryType btype,
 
     EnginePluginData& pluginData(pData->plugins[id]);
     pluginData.plugin = plugin;
+    pluginData.loadTime = Time::getMillisecondCounter() - startTime;
     carla_zeroFloats(pluginData.peaks, 4);
 
 #ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
@@ -815,6 +920,7 @@ bool CarlaEngine::removeAllPlugins()
             pluginData.plugin = nullptr;
         }
 
+        pluginData.loadTime = 0;
         carla_zeroFloats(pluginData.peaks, 4);
 
         callback(true, true, ENGINE_CALLBACK_PLUGIN_REMOVED, id, 0, 0, 0, 0.0f, nullptr);
@@ -825,6 +931,154 @@ bool CarlaEngine::removeAllPlugins()
 }
 
 #ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
+bool CarlaEngine::prewarmPlugin(const BinaryType btype,
+                                const PluginType ptype,
+                                const char* const filename,
+                                const char* const name,
+                                const char* const label,
+                                const int64_t uniqueId,
+                                const void* const extra,
+                                const uint options)
+{
+    CARLA_SAFE_ASSERT_RETURN_ERR(pData->isIdling == 0, "An operation is still being processed, please wait for it to finish");
+    CARLA_SAFE_ASSERT_RETURN_ERR(pData->plugins != nullptr, "Invalid engine internal data");
+    CARLA_SAFE_ASSERT_RETURN_ERR(pData->nextAction.opcode == kEnginePostActionNull, "Invalid engine internal data");
+    CARLA_SAFE_ASSERT_RETURN_ERR(btype != BINARY_NONE, "Invalid plugin binary mode");
+    CARLA_SAFE_ASSERT_RETURN_ERR(ptype != PLUGIN_NONE, "Invalid plugin type");
+    CARLA_SAFE_ASSERT_RETURN_ERR((filename != nullptr && filename[0] != '\0') || (label != nullptr && label[0] != '\0'), "Invalid plugin filename and label");
+    carla_debug("CarlaEngine::prewarmPlugin(%i:%s, %i:%s, \"%s\", \"%s\", \"%s\", " P_INT64 ", %p, %u)",
+                btype, BinaryType2Str(btype), ptype, PluginType2Str(ptype), filename, name, label, uniqueId, extra, options);
+
+    const size_t maxMemoryUsage = static_cast<size_t>(pData->options.pluginPoolMemory) * 1024 * 1024;
+
+    if (maxMemoryUsage == 0)
+    {
+        setLastError("Plugin pool is disabled");
+        return false;
+    }
+
+    if (extra != nullptr || ptype == PLUGIN_JACK || pData->options.processMode == ENGINE_PROCESS_MODE_MULTIPLE_CLIENTS)
+    {
+        setLastError("This plugin cannot be added to the plugin pool");
+        return false;
+    }
+
+    // already there, just mark it as recently used
+    if (pData->touchPooledPlugin(btype, ptype, filename, label, uniqueId, options))
+        return true;
+
+    const EnginePrewarmRequest request = {
+        btype,
+        ptype,
+        carla_strdup(filename != nullptr ? filename : ""),
+        carla_strdup(name != nullptr ? name : ""),
+        carla_strdup(label != nullptr ? label : ""),
+        uniqueId,
+        options
+    };
+
+    if (! pData->appendPrewarmRequest(request))
+    {
+        delete[] request.filename;
+        delete[] request.name;
+        delete[] request.label;
+    }
+
+    // plugin creation can take a while, so it is done on its own thread
+    if (! pData->prewarmThread.isThreadRunning())
+        pData->prewarmThread.startThread();
+
+    return true;
+}
+
+bool CarlaEngine::prewarmNextPlugin()
+{
+    EnginePrewarmRequest request;
+
+    if (! pData->takePrewarmRequest(request))
+        return false;
+
+    const size_t maxMemoryUsage = static_cast<size_t>(pData->options.pluginPoolMemory) * 1024 * 1024;
+
+    CarlaPlugin* plugin = nullptr;
+    size_t memoryUsage = 0;
+
+    // the pool might have been disabled, or this plugin pooled already, while the request was waiting
+    if (maxMemoryUsage != 0 && ! pData->touchPooledPlugin(request.btype, request.ptype,
+                                                          request.filename, request.label,
+                                                          request.uniqueId, request.options))
+    {
+        const CarlaMutexLocker cml(pData->newPluginMutex);
+
+        const size_t memoryBefore = getProcessResidentMemory();
+
+        // pooled plugins do not have a valid id until added to the engine
+        plugin = newPluginInstance(pData->maxPluginNumber,
+                                   request.btype, request.ptype,
+                                   request.filename[0] != '\0' ? request.filename : nullptr,
+                                   request.name[0] != '\0' ? request.name : nullptr,
+                                   request.label[0] != '\0' ? request.label : nullptr,
+                                   request.uniqueId, nullptr, request.options);
+
+        const size_t memoryAfter = getProcessResidentMemory();
+        memoryUsage = std::max(memoryAfter > memoryBefore ? memoryAfter - memoryBefore : 0,
+                               kMinPooledPluginMemory);
+    }
+
+    delete[] request.name;
+
+    if (plugin == nullptr)
+    {
+        delete[] request.filename;
+        delete[] request.label;
+        return true;
+    }
+
+    if (memoryUsage > maxMemoryUsage)
+    {
+        carla_stderr("Plugin '%s' uses more memory than allowed for the plugin pool", request.label);
+        delete plugin;
+        delete[] request.filename;
+        delete[] request.label;
+        return true;
+    }
+
+    // pooled bridges are only idled, not processed, so make sure they do not quit while waiting
+    if ((plugin->getHints() & PLUGIN_IS_BRIDGE) != 0)
+        plugin->setCustomData(CUSTOM_DATA_TYPE_STRING, "__CarlaPingOnOff__", "false", false);
+
+    const EnginePooledPlugin pooled = {
+        plugin,
+        request.btype,
+        request.ptype,
+        request.filename,
+        request.label,
+        request.uniqueId,
+        request.options,
+        pData->bufferSize,
+        pData->sampleRate,
+        memoryUsage
+    };
+
+    if (! pData->appendPooledPlugin(pooled))
+    {
+        delete plugin;
+        delete[] pooled.filename;
+        delete[] pooled.label;
+        return true;
+    }
+
+    pData->trimPluginPool(maxMemoryUsage);
+
+    return true;
+}
+
+void CarlaEngine::clearPluginPool()
+{
+    pData->clearPrewarmRequests();
+    pData->clearPluginPool();
+}
+
 bool CarlaEngine::renamePlugin(const uint id, const char* const newName)
 {
     CARLA_SAFE_ASSERT_RETURN_ERR(pData->isIdling == 0, "An operation is still being processed, please wait for it to finish");
@@ -975,6 +1229,13 @@ CarlaPlugin* CarlaEngine::getPluginUnchecked(const uint id) const noexcept
     return pData->plugins[id].plugin;
 }
 
+uint32_t CarlaEngine::getPluginLoadTime(const uint id) const noexcept
+{
+    CARLA_SAFE_ASSERT_RETURN(id < pData->curPluginCount, 0);
+
+    return pData->plugins[id].loadTime;
+}
+
 const char* CarlaEngine::getUniquePluginName(const char* const name) const
 {
     CARLA_SAFE_ASSERT_RETURN(pData->nextAction.opcode == kEnginePostActionNull, nullptr);
@@ -1419,6 +1680,7 @@ void CarlaEngine::callback(const bool sendHost, const bool sendOSC,
                 CARLA_SAFE_ASSERT_BREAK(plugin != nullptr);
 
                 pData->osc.sendPluginInfo(plugin);
+                pData->osc.sendPluginStateHash(plugin);
                 break;
             }
 
@@ -1434,6 +1696,8 @@ void CarlaEngine::callback(const bool sendHost, const bool sendOSC,
                     for (uint32_t i=0; i<count; ++i)
                       pData->osc.sendPluginParameterInfo(plugin, i);
                 }
+
+                pData->osc.sendPluginStateHash(plugin);
                 break;
             }
 
@@ -1455,6 +1719,8 @@ void CarlaEngine::callback(const bool sendHost, const bool sendOSC,
                     for (uint32_t i=0; i<count; ++i)
                       pData->osc.sendPluginMidiProgram(plugin, i);
                 }
+
+                pData->osc.sendPluginStateHash(plugin);
                 break;
             }
 
@@ -1493,6 +1759,7 @@ void CarlaEngine::callback(const bool sendHost, const bool sendOSC,
                 }
 
                 pData->osc.sendPluginInternalParameterValues(plugin);
+                pData->osc.sendPluginStateHash(plugin);
                 break;
             }
 
@@ -1695,6 +1962,23 @@ void CarlaEngine::setOption(const EngineOption option, const int value, const ch
         pData->options.preferPluginBridges = (value != 0);
         break;
 
+    case ENGINE_OPTION_PARALLEL_PROJECT_LOAD:
+#ifdef BUILD_BRIDGE_ALTERNATIVE_ARCH
+        CARLA_SAFE_ASSERT_RETURN(value == 0,);
+#else
+        CARLA_SAFE_ASSERT_RETURN(value == 0 || value == 1,);
+#endif
+        pData->options.parallelProjectLoad = (value != 0);
+        break;
+
+    case ENGINE_OPTION_PLUGIN_POOL_MEMORY:
+        CARLA_SAFE_ASSERT_RETURN(value >= 0,);
+        pData->options.pluginPoolMemory = static_cast<uint>(value);
+#ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
+        pData->trimPluginPool(static_cast<size_t>(value) * 1024 * 1024);
+#endif
+        break;
+
     case ENGINE_OPTION_PREFER_UI_BRIDGES:
         CARLA_SAFE_ASSERT_RETURN(value == 0 || value == 1,);
         pData->options.preferUiBridges = (value != 0);
@@ -2033,6 +2317,10 @@ void CarlaEngine::bufferSizeChanged(const uint32_t newBufferSize)
         }
     }
 
+#ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
+    pData->dropStalePooledPlugins();
+#endif
+
     callback(true, true, ENGINE_CALLBACK_BUFFER_SIZE_CHANGED, 0, static_cast<int>(newBufferSize), 0, 0, 0.0f, nullptr);
 }
 
@@ -2062,6 +2350,10 @@ void CarlaEngine::sampleRateChanged(const double newSampleRate)
         }
     }
 
+#ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
+    pData->dropStalePooledPlugins();
+#endif
+
     callback(true, true, ENGINE_CALLBACK_SAMPLE_RATE_CHANGED, 0, 0, 0, 0, static_cast<float>(newSampleRate), nullptr);
 }
 
@@ -2419,6 +2711,86 @@ static String findBinaryInCustomPath(const char* const searchPath, const char* c
     return String();
 }
 
+// resolves the binary of a plugin saved in a project (looking for it if moved), returning its binary type
+static BinaryType resolveStateSaveBinary(const EngineOptions& options, const PluginType ptype, CarlaStateSave& stateSave)
+{
+    switch (ptype)
+    {
+    case PLUGIN_LADSPA:
+    case PLUGIN_DSSI:
+    case PLUGIN_VST2:
+    case PLUGIN_VST3:
+    case PLUGIN_SF2:
+    case PLUGIN_SFZ:
+        if (stateSave.binary != nullptr && stateSave.binary[0] != '\0' &&
+            ! (File::isAbsolutePath(stateSave.binary) && File(stateSave.binary).exists()))
+        {
+            const char* searchPath;
+
+            switch (ptype)
+            {
+            case PLUGIN_LADSPA: searchPath = options.pathLADSPA; break;
+            case PLUGIN_DSSI:   searchPath = options.pathDSSI;   break;
+            case PLUGIN_VST2:   searchPath = options.pathVST2;   break;
+            case PLUGIN_VST3:   searchPath = options.pathVST3;   break;
+            case PLUGIN_SF2:    searchPath = options.pathSF2;    break;
+            case PLUGIN_SFZ:    searchPath = options.pathSFZ;    break;
+            default:            searchPath = nullptr;            break;
+            }
+
+            if (searchPath != nullptr && searchPath[0] != '\0')
+            {
+                carla_stderr("Plugin binary '%s' doesn't exist on this filesystem, let's look for it...",
+                             stateSave.binary);
+
+                String result = findBinaryInCustomPath(searchPath, stateSave.binary);
+
+                if (result.isEmpty())
+                {
+                    switch (ptype)
+                    {
+                    case PLUGIN_LADSPA: searchPath = std::getenv("LADSPA_PATH"); break;
+                    case PLUGIN_DSSI:   searchPath = std::getenv("DSSI_PATH");   break;
+                    case PLUGIN_VST2:   searchPath = std::getenv("VST_PATH");    break;
+                    case PLUGIN_VST3:   searchPath = std::getenv("VST3_PATH");   break;
+                    case PLUGIN_SF2:    searchPath = std::getenv("SF2_PATH");    break;
+                    case PLUGIN_SFZ:    searchPath = std::getenv("SFZ_PATH");    break;
+                    default:            searchPath = nullptr;                    break;
+                    }
+
+                    if (searchPath != nullptr && searchPath[0] != '\0')
+                        result = findBinaryInCustomPath(searchPath, stateSave.binary);
+                }
+
+                if (result.isNotEmpty())
+                {
+                    delete[] stateSave.binary;
+                    stateSave.binary = carla_strdup(result.toRawUTF8());
+                    carla_stderr("Found it! :)");
+                }
+                else
+                {
+                    carla_stderr("Damn, we failed... :(");
+                }
+            }
+        }
+        break;
+    default:
+        break;
+    }
+
+    switch (ptype)
+    {
+    case PLUGIN_LADSPA:
+    case PLUGIN_DSSI:
+    case PLUGIN_LV2:
+    case PLUGIN_VST2:
+        return getBinaryTypeFromFile(stateSave.binary);
+    default:
+        return BINARY_NATIVE;
+    }
+}
+
 bool CarlaEngine::loadProjectInternal(water::XmlDocument& xmlDoc)
 {
     CarlaScopedPointer<XmlElement> xmlElement(xmlDoc.getDocumentElement(true));
@@ -2607,6 +2979,89 @@ bool CarlaEngine::loadProjectInternal(water::XmlDocument& xmlDoc)
         }
     }
 
+#ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
+    // bridges started in advance are only meant for this project, close the unused ones when done
+    struct ScopedPreparedBridgesCleaner {
+        CarlaEngine::ProtectedData* const data;
+        ~ScopedPreparedBridgesCleaner() { data->clearPreparedBridges(); }
+    } const spbc = { pData };
+
+    // start all plugin bridges at once, addPlugin() picks them up as each plugin gets loaded below
+    if (pData->options.parallelProjectLoad && ! (isPreset || isPlugin))
+    {
+        uint id = pData->curPluginCount;
+
+        for (XmlElement* elem = xmlElement->getFirstChildElement(); elem != nullptr; elem = elem->getNextElement())
+        {
+            if (elem->getTagName() != "Plugin")
+                continue;
+            if (id == pData->maxPluginNumber)
+                break;
+
+            CarlaStateSave stateSave;
+            stateSave.fillFromXmlElement(elem);
+
+            // expected plugin id, adjusted later if any previous plugin fails to load
+            const uint nextId = id++;
+
+            CARLA_SAFE_ASSERT_CONTINUE(stateSave.type != nullptr);
+
+            if (std::strcmp(stateSave.type, "GIG") == 0)
+                continue;
+
+            const PluginType ptype(getPluginTypeFromString(stateSave.type));
+
+            if (! canPluginTypeBeBridged(ptype))
+                continue;
+
+            const BinaryType btype(resolveStateSaveBinary(pData->options, ptype, stateSave));
+
+            if (btype == BINARY_NATIVE && ! pData->options.preferPluginBridges)
+                continue;
+
+            const CarlaString bridgeBinary(getBridgeBinaryForType(pData->options.binaryDir, btype));
+
+            if (bridgeBinary.isEmpty())
+                continue;
+
+            const CarlaPlugin::Initializer initializer = {
+                this,
+                nextId,
+                stateSave.binary,
+                stateSave.name,
+                stateSave.label,
+                stateSave.uniqueId,
+                stateSave.options
+            };
+
+            // on failure we just skip it, the error will show up again when loading the plugin normally
+            CarlaPlugin* const plugin = CarlaPlugin::prepareBridge(initializer, btype, ptype, bridgeBinary);
+
+            if (plugin == nullptr)
+                continue;
+
+            // deactivate bridge client-side ping check, since it might take a while until we get to this plugin
+            plugin->setCustomData(CUSTOM_DATA_TYPE_STRING, "__CarlaPingOnOff__", "false", false);
+
+            const EnginePreparedBridge prepared = {
+                plugin,
+                btype,
+                ptype,
+                carla_strdup(stateSave.binary != nullptr ? stateSave.binary : ""),
+                carla_strdup(stateSave.label != nullptr ? stateSave.label : ""),
+                stateSave.uniqueId
+            };
+
+            if (! pData->appendPreparedBridge(prepared))
+            {
+                delete plugin;
+                delete[] prepared.filename;
+                delete[] prepared.label;
+            }
+        }
+    }
+#endif
+
     // and we handle plugins
     for (XmlElement* elem = xmlElement->getFirstChildElement(); elem != nullptr; elem = elem->getNextElement())
     {
@@ -2618,6 +3073,9 @@ bool CarlaEngine::loadProjectInternal(water::XmlDocument& xmlDoc)
             stateSave.fillFromXmlElement(isPreset ? xmlElement.get() : elem);
 
             callback(true, true, ENGINE_CALLBACK_IDLE, 0, 0, 0, 0, 0.0f, nullptr);
+#ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
+            pData->idlePreparedBridges();
+#endif
 
             if (pData->aboutToClose)
                 return true;
@@ -2697,88 +3155,11 @@ bool CarlaEngine::loadProjectInternal(water::XmlDocument& xmlDoc)
 
             const PluginType ptype(getPluginTypeFromString(stateSave.type));
 
-            switch (ptype)
-            {
-            case PLUGIN_SF2:
-                if (CarlaString(stateSave.label).endsWith(" (16 outs)"))
-                    extraStuff = kTrue;
-                // fall through
-            case PLUGIN_LADSPA:
-            case PLUGIN_DSSI:
-            case PLUGIN_VST2:
-            case PLUGIN_VST3:
-            case PLUGIN_SFZ:
-                if (stateSave.binary != nullptr && stateSave.binary[0] != '\0' &&
-                    ! (File::isAbsolutePath(stateSave.binary) && File(stateSave.binary).exists()))
-                {
-                    const char* searchPath;
-
-                    switch (ptype)
-                    {
-                    case PLUGIN_LADSPA: searchPath = pData->options.pathLADSPA; break;
-                    case PLUGIN_DSSI:   searchPath = pData->options.pathDSSI;   break;
-                    case PLUGIN_VST2:   searchPath = pData->options.pathVST2;   break;
-                    case PLUGIN_VST3:   searchPath = pData->options.pathVST3;   break;
-                    case PLUGIN_SF2:    searchPath = pData->options.pathSF2;    break;
-                    case PLUGIN_SFZ:    searchPath = pData->options.pathSFZ;    break;
-                    default:            searchPath = nullptr;                   break;
-                    }
-
-                    if (searchPath != nullptr && searchPath[0] != '\0')
-                    {
-                        carla_stderr("Plugin binary '%s' doesn't exist on this filesystem, let's look for it...",
-                                     stateSave.binary);
-
-                        String result = findBinaryInCustomPath(searchPath, stateSave.binary);
-
-                        if (result.isEmpty())
-                        {
-                            switch (ptype)
-                            {
-                            case PLUGIN_LADSPA: searchPath = std::getenv("LADSPA_PATH"); break;
-                            case PLUGIN_DSSI:   searchPath = std::getenv("DSSI_PATH");   break;
-                            case PLUGIN_VST2:   searchPath = std::getenv("VST_PATH");    break;
-                            case PLUGIN_VST3:   searchPath = std::getenv("VST3_PATH");   break;
-                            case PLUGIN_SF2:    searchPath = std::getenv("SF2_PATH");    break;
-                            case PLUGIN_SFZ:    searchPath = std::getenv("SFZ_PATH");    break;
-                            default:            searchPath = nullptr;                    break;
-                            }
-
-                            if (searchPath != nullptr && searchPath[0] != '\0')
-                                result = findBinaryInCustomPath(searchPath, stateSave.binary);
-                        }
-
-                        if (result.isNotEmpty())
-                        {
-                            delete[] stateSave.binary;
-                            stateSave.binary = carla_strdup(result.toRawUTF8());
-                            carla_stderr("Found it! :)");
-                        }
-                        else
-                        {
-                            carla_stderr("Damn, we failed... :(");
-                        }
-                    }
-                }
-                break;
-            default:
-                break;
-            }
-
-            BinaryType btype;
+            if (ptype == PLUGIN_SF2 && CarlaString(stateSave.label).endsWith(" (16 outs)"))
+                extraStuff = kTrue;
 
-            switch (ptype)
-            {
-            case PLUGIN_LADSPA:
-            case PLUGIN_DSSI:
-            case PLUGIN_LV2:
-            case PLUGIN_VST2:
-                btype = getBinaryTypeFromFile(stateSave.binary);
-                break;
-            default:
-                btype = BINARY_NATIVE;
-                break;
-            }
+            const BinaryType btype(resolveStateSaveBinary(pData->options, ptype, stateSave));
+            const uint32_t loadStartTime = Time::getMillisecondCounter();
 
             if (addPlugin(btype, ptype, stateSave.binary,
                           stateSave.name, stateSave.label, stateSave.uniqueId, extraStuff, stateSave.options))
@@ -2807,6 +3188,7 @@ bool CarlaEngine::loadProjectInternal(water::XmlDocument& xmlDoc)
                         plugin->setCustomData(CUSTOM_DATA_TYPE_STRING, "__CarlaPingOnOff__", "false", false);
 
                     plugin->loadStateSave(stateSave);
+                    pData->plugins[pluginId].loadTime = Time::getMillisecondCounter() - loadStartTime;
 
                     /* NOTE: The following code is the same as the end of addPlugin().
                      *       When project is loading we do not enable the plugin right away,
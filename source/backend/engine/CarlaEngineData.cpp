@@ -186,6 +186,8 @@ EngineOptions::EngineOptions() noexcept
       forceStereo(false),
       resetXruns(false),
       preferPluginBridges(false),
+      parallelProjectLoad(false),
+      pluginPoolMemory(0),
 #if defined(CARLA_OS_MAC) || defined(CARLA_OS_WIN)
       preferUiBridges(false),
 #else
@@ -386,6 +386,15 @@ CarlaEngine::ProtectedData::ProtectedData(CarlaEngine* const engine) noexcept
 #ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
       loadingProject(false),
       currentProjectFilename(),
+      preparedBridges(),
+      preparedBridgesMutex(),
+      pluginPool(),
+      pluginPoolMemoryUsage(0),
+      pluginPoolMutex(),
+      prewarmRequests(),
+      prewarmRequestsMutex(),
+      newPluginMutex(),
+      prewarmThread(engine),
 #endif
       bufferSize(0),
       sampleRate(0.0),
@@ -424,6 +433,9 @@ CarlaEngine::ProtectedData::~ProtectedData() noexcept
     CARLA_SAFE_ASSERT(isIdling == 0);
 #ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
     CARLA_SAFE_ASSERT(plugins == nullptr);
+    CARLA_SAFE_ASSERT(preparedBridges.isEmpty());
+    CARLA_SAFE_ASSERT(pluginPool.isEmpty());
+    CARLA_SAFE_ASSERT(prewarmRequests.isEmpty());
 #endif
 }
 
@@ -567,6 +579,7 @@ void CarlaEngine::ProtectedData::doPluginRemove(const uint pluginId) noexcept
         plugin->setId(i);
 
         plugins[i].plugin = plugin;
+        plugins[i].loadTime = plugins[i+1].loadTime;
         carla_zeroFloats(plugins[i].peaks, 4);
     }
 
@@ -574,6 +587,7 @@ void CarlaEngine::ProtectedData::doPluginRemove(const uint pluginId) noexcept
 
     // reset last plugin (now removed)
     plugins[id].plugin = nullptr;
+    plugins[id].loadTime = 0;
     carla_zeroFloats(plugins[id].peaks, 4);
 }
 
@@ -590,11 +604,330 @@ void CarlaEngine::ProtectedData::doPluginsSwitch(const uint idA, const uint idB)
     CarlaPlugin* const pluginB(plugins[idB].plugin);
     CARLA_SAFE_ASSERT_RETURN(pluginB != nullptr,);
 
+    const uint32_t loadTimeA(plugins[idA].loadTime);
+
     pluginA->setId(idB);
     plugins[idA].plugin = pluginB;
+    plugins[idA].loadTime = plugins[idB].loadTime;
 
     pluginB->setId(idA);
     plugins[idB].plugin = pluginA;
+    plugins[idB].loadTime = loadTimeA;
+}
+
+// -----------------------------------------------------------------------
+
+void CarlaEngine::ProtectedData::idlePreparedBridges() noexcept
+{
+    // keep reading from bridges that are still starting, so their message buffers do not fill up
+    const EnginePreparedBridge fallback = { nullptr, BINARY_NONE, PLUGIN_NONE, nullptr, nullptr, 0 };
+
+    // addPlugin() takes bridges from the list in the project load thread
+    const CarlaMutexLocker cml(preparedBridgesMutex);
+
+    for (LinkedList<EnginePreparedBridge>::Itenerator it = preparedBridges.begin2(); it.valid(); it.next())
+    {
+        const EnginePreparedBridge& prepared(it.getValue(fallback));
+        CARLA_SAFE_ASSERT_CONTINUE(prepared.plugin != nullptr);
+
+        try {
+            prepared.plugin->idle();
+        } CARLA_SAFE_EXCEPTION_CONTINUE("Prepared bridge idle");
+    }
+}
+
+void CarlaEngine::ProtectedData::clearPreparedBridges() noexcept
+{
+    const EnginePreparedBridge fallback = { nullptr, BINARY_NONE, PLUGIN_NONE, nullptr, nullptr, 0 };
+    const CarlaMutexLocker cml(preparedBridgesMutex);
+
+    for (LinkedList<EnginePreparedBridge>::Itenerator it = preparedBridges.begin2(); it.valid(); it.next())
+    {
+        const EnginePreparedBridge& prepared(it.getValue(fallback));
+
+        if (prepared.plugin != nullptr)
+            delete prepared.plugin;
+
+        delete[] prepared.filename;
+        delete[] prepared.label;
+    }
+
+    preparedBridges.clear();
+}
+
+bool CarlaEngine::ProtectedData::appendPreparedBridge(const EnginePreparedBridge& prepared) noexcept
+{
+    const CarlaMutexLocker cml(preparedBridgesMutex);
+
+    return preparedBridges.append(prepared);
+}
+
+CarlaPlugin* CarlaEngine::ProtectedData::takePreparedBridge(const BinaryType btype, const PluginType ptype,
+                                                            const char* const filename, const char* const label,
+                                                            const int64_t uniqueId) noexcept
+{
+    const EnginePreparedBridge fallback = { nullptr, BINARY_NONE, PLUGIN_NONE, nullptr, nullptr, 0 };
+    const CarlaMutexLocker cml(preparedBridgesMutex);
+
+    for (LinkedList<EnginePreparedBridge>::Itenerator it = preparedBridges.begin2(); it.valid(); it.next())
+    {
+        const EnginePreparedBridge& prepared(it.getValue(fallback));
+
+        if (prepared.btype != btype || prepared.ptype != ptype || prepared.uniqueId != uniqueId)
+            continue;
+        if (std::strcmp(prepared.filename, filename != nullptr ? filename : "") != 0)
+            continue;
+        if (std::strcmp(prepared.label, label != nullptr ? label : "") != 0)
+            continue;
+
+        CarlaPlugin* const plugin(prepared.plugin);
+
+        delete[] prepared.filename;
+        delete[] prepared.label;
+        preparedBridges.remove(it);
+
+        return plugin;
+    }
+
+    return nullptr;
+}
+
+// -----------------------------------------------------------------------
+
+void CarlaEngine::ProtectedData::idlePooledPlugins() noexcept
+{
+    // bridges keep sending messages while they wait in the pool, so keep reading from them
+    const EnginePooledPlugin fallback = { nullptr, BINARY_NONE, PLUGIN_NONE, nullptr, nullptr, 0, 0x0, 0, 0.0, 0 };
+
+    // addPlugin() takes plugins from the pool in the project load thread
+    const CarlaMutexLocker cml(pluginPoolMutex);
+
+    for (LinkedList<EnginePooledPlugin>::Itenerator it = pluginPool.begin2(); it.valid(); it.next())
+    {
+        const EnginePooledPlugin& pooled(it.getValue(fallback));
+        CARLA_SAFE_ASSERT_CONTINUE(pooled.plugin != nullptr);
+
+        if ((pooled.plugin->getHints() & PLUGIN_IS_BRIDGE) == 0)
+            continue;
+
+        try {
+            pooled.plugin->idle();
+        } CARLA_SAFE_EXCEPTION_CONTINUE("Pooled plugin idle");
+    }
+}
+
+void CarlaEngine::ProtectedData::clearPluginPool() noexcept
+{
+    const EnginePooledPlugin fallback = { nullptr, BINARY_NONE, PLUGIN_NONE, nullptr, nullptr, 0, 0x0, 0, 0.0, 0 };
+    const CarlaMutexLocker cml(pluginPoolMutex);
+
+    for (LinkedList<EnginePooledPlugin>::Itenerator it = pluginPool.begin2(); it.valid(); it.next())
+    {
+        const EnginePooledPlugin& pooled(it.getValue(fallback));
+
+        if (pooled.plugin != nullptr)
+            delete pooled.plugin;
+
+        delete[] pooled.filename;
+        delete[] pooled.label;
+    }
+
+    pluginPool.clear();
+    pluginPoolMemoryUsage = 0;
+}
+
+void CarlaEngine::ProtectedData::trimPluginPool(const size_t maxMemoryUsage) noexcept
+{
+    EnginePooledPlugin fallback = { nullptr, BINARY_NONE, PLUGIN_NONE, nullptr, nullptr, 0, 0x0, 0, 0.0, 0 };
+    const CarlaMutexLocker cml(pluginPoolMutex);
+
+    for (; pluginPoolMemoryUsage > maxMemoryUsage && pluginPool.isNotEmpty();)
+    {
+        const EnginePooledPlugin pooled(pluginPool.getFirst(fallback, true));
+        carla_debug("dropping pooled plugin '%s', over memory budget", pooled.label);
+
+        if (pooled.plugin != nullptr)
+            delete pooled.plugin;
+
+        delete[] pooled.filename;
+        delete[] pooled.label;
+
+        pluginPoolMemoryUsage -= std::min(pooled.memoryUsage, pluginPoolMemoryUsage);
+    }
+}
+
+void CarlaEngine::ProtectedData::dropStalePooledPlugins() noexcept
+{
+    // instances created with other audio settings cannot be used anymore
+    const EnginePooledPlugin fallback = { nullptr, BINARY_NONE, PLUGIN_NONE, nullptr, nullptr, 0, 0x0, 0, 0.0, 0 };
+    const CarlaMutexLocker cml(pluginPoolMutex);
+
+    for (LinkedList<EnginePooledPlugin>::Itenerator it = pluginPool.begin2(); it.valid(); it.next())
+    {
+        const EnginePooledPlugin& pooled(it.getValue(fallback));
+
+        if (carla_isEqual(pooled.sampleRate, sampleRate) && pooled.bufferSize == bufferSize)
+            continue;
+
+        carla_debug("dropping pooled plugin '%s', audio settings changed", pooled.label);
+
+        if (pooled.plugin != nullptr)
+            delete pooled.plugin;
+
+        pluginPoolMemoryUsage -= std::min(pooled.memoryUsage, pluginPoolMemoryUsage);
+
+        delete[] pooled.filename;
+        delete[] pooled.label;
+        pluginPool.remove(it);
+    }
+}
+
+bool CarlaEngine::ProtectedData::appendPooledPlugin(const EnginePooledPlugin& pooled) noexcept
+{
+    const CarlaMutexLocker cml(pluginPoolMutex);
+
+    if (! pluginPool.append(pooled))
+        return false;
+
+    pluginPoolMemoryUsage += pooled.memoryUsage;
+    return true;
+}
+
+static bool isMatchingPooledPlugin(const EnginePooledPlugin& pooled,
+                                   const BinaryType btype, const PluginType ptype,
+                                   const char* const filename, const char* const label,
+                                   const int64_t uniqueId, const uint options) noexcept
+{
+    if (pooled.btype != btype || pooled.ptype != ptype || pooled.uniqueId != uniqueId || pooled.options != options)
+        return false;
+    if (std::strcmp(pooled.filename, filename != nullptr ? filename : "") != 0)
+        return false;
+    if (std::strcmp(pooled.label, label != nullptr ? label : "") != 0)
+        return false;
+    return true;
+}
+
+bool CarlaEngine::ProtectedData::touchPooledPlugin(const BinaryType btype, const PluginType ptype,
+                                                   const char* const filename, const char* const label,
+                                                   const int64_t uniqueId, const uint options) noexcept
+{
+    const EnginePooledPlugin fallback = { nullptr, BINARY_NONE, PLUGIN_NONE, nullptr, nullptr, 0, 0x0, 0, 0.0, 0 };
+    const CarlaMutexLocker cml(pluginPoolMutex);
+
+    for (LinkedList<EnginePooledPlugin>::Itenerator it = pluginPool.begin2(); it.valid(); it.next())
+    {
+        const EnginePooledPlugin pooled(it.getValue(fallback));
+
+        if (! isMatchingPooledPlugin(pooled, btype, ptype, filename, label, uniqueId, options))
+            continue;
+
+        // move to the end of the list, as the most recently used
+        pluginPool.remove(it);
+
+        if (pluginPool.append(pooled))
+            return true;
+
+        // no longer in the pool, drop it
+        if (pooled.plugin != nullptr)
+            delete pooled.plugin;
+
+        pluginPoolMemoryUsage -= std::min(pooled.memoryUsage, pluginPoolMemoryUsage);
+
+        delete[] pooled.filename;
+        delete[] pooled.label;
+        return false;
+    }
+
+    return false;
+}
+
+CarlaPlugin* CarlaEngine::ProtectedData::takePooledPlugin(const BinaryType btype, const PluginType ptype,
+                                                          const char* const filename, const char* const label,
+                                                          const int64_t uniqueId, const uint options) noexcept
+{
+    const EnginePooledPlugin fallback = { nullptr, BINARY_NONE, PLUGIN_NONE, nullptr, nullptr, 0, 0x0, 0, 0.0, 0 };
+    const CarlaMutexLocker cml(pluginPoolMutex);
+
+    for (LinkedList<EnginePooledPlugin>::Itenerator it = pluginPool.begin2(); it.valid(); it.next())
+    {
+        const EnginePooledPlugin& pooled(it.getValue(fallback));
+
+        if (! isMatchingPooledPlugin(pooled, btype, ptype, filename, label, uniqueId, options))
+            continue;
+
+        CarlaPlugin* plugin(pooled.plugin);
+
+        // audio settings changed since this instance was created, it cannot be used anymore
+        if (carla_isNotEqual(pooled.sampleRate, sampleRate) || pooled.bufferSize != bufferSize)
+        {
+            delete plugin;
+            plugin = nullptr;
+        }
+
+        pluginPoolMemoryUsage -= std::min(pooled.memoryUsage, pluginPoolMemoryUsage);
+
+        delete[] pooled.filename;
+        delete[] pooled.label;
+        pluginPool.remove(it);
+
+        return plugin;
+    }
+
+    return nullptr;
+}
+
+// -----------------------------------------------------------------------
+
+void CarlaEngine::ProtectedData::clearPrewarmRequests() noexcept
+{
+    const EnginePrewarmRequest fallback = { BINARY_NONE, PLUGIN_NONE, nullptr, nullptr, nullptr, 0, 0x0 };
+    const CarlaMutexLocker cml(prewarmRequestsMutex);
+
+    for (LinkedList<EnginePrewarmRequest>::Itenerator it = prewarmRequests.begin2(); it.valid(); it.next())
+    {
+        const EnginePrewarmRequest& request(it.getValue(fallback));
+
+        delete[] request.filename;
+        delete[] request.name;
+        delete[] request.label;
+    }
+
+    prewarmRequests.clear();
+}
+
+bool CarlaEngine::ProtectedData::appendPrewarmRequest(const EnginePrewarmRequest& request) noexcept
+{
+    const EnginePrewarmRequest fallback = { BINARY_NONE, PLUGIN_NONE, nullptr, nullptr, nullptr, 0, 0x0 };
+    const CarlaMutexLocker cml(prewarmRequestsMutex);
+
+    for (LinkedList<EnginePrewarmRequest>::Itenerator it = prewarmRequests.begin2(); it.valid(); it.next())
+    {
+        const EnginePrewarmRequest& queued(it.getValue(fallback));
+
+        if (queued.btype != request.btype || queued.ptype != request.ptype)
+            continue;
+        if (queued.uniqueId != request.uniqueId || queued.options != request.options)
+            continue;
+        if (std::strcmp(queued.filename, request.filename) != 0 || std::strcmp(queued.label, request.label) != 0)
+            continue;
+
+        // already queued, the caller keeps ownership of the request strings
+        return false;
+    }
+
+    return prewarmRequests.append(request);
+}
+
+bool CarlaEngine::ProtectedData::takePrewarmRequest(EnginePrewarmRequest& request) noexcept
+{
+    EnginePrewarmRequest fallback = { BINARY_NONE, PLUGIN_NONE, nullptr, nullptr, nullptr, 0, 0x0 };
+    const CarlaMutexLocker cml(prewarmRequestsMutex);
+
+    if (prewarmRequests.isEmpty())
+        return false;
+
+    request = prewarmRequests.getFirst(fallback, true);
+    return request.btype != BINARY_NONE;
 }
 #endif
 
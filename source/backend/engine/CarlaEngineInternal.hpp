@@ -210,8 +210,52 @@ struct EngineNextAction {
 struct EnginePluginData {
     CarlaPlugin* plugin;
     float peaks[4];
+    uint32_t loadTime; // in ms
 };
 
+#ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
+// -----------------------------------------------------------------------
+// EnginePreparedBridge
+
+struct EnginePreparedBridge {
+    CarlaPlugin* plugin;
+    BinaryType btype;
+    PluginType ptype;
+    const char* filename;
+    const char* label;
+    int64_t uniqueId;
+};
+
+// -----------------------------------------------------------------------
+// EnginePooledPlugin
+
+struct EnginePooledPlugin {
+    CarlaPlugin* plugin;
+    BinaryType btype;
+    PluginType ptype;
+    const char* filename;
+    const char* label;
+    int64_t uniqueId;
+    uint options;
+    uint32_t bufferSize;
+    double sampleRate;
+    size_t memoryUsage; // estimated, in bytes
+};
+
+// -----------------------------------------------------------------------
+// EnginePrewarmRequest
+
+struct EnginePrewarmRequest {
+    BinaryType btype;
+    PluginType ptype;
+    const char* filename;
+    const char* name;
+    const char* label;
+    int64_t uniqueId;
+    uint options;
+};
+#endif
+
 // -----------------------------------------------------------------------
 // CarlaEngineProtectedData
 
@@ -233,6 +277,15 @@ struct CarlaEngine::ProtectedData {
 #ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
     bool loadingProject;
     CarlaString currentProjectFilename;
+    LinkedList<EnginePreparedBridge> preparedBridges; // protected by preparedBridgesMutex
+    CarlaMutex preparedBridgesMutex;
+    LinkedList<EnginePooledPlugin> pluginPool; // least recently used first, protected by pluginPoolMutex
+    size_t pluginPoolMemoryUsage;
+    CarlaMutex pluginPoolMutex;
+    LinkedList<EnginePrewarmRequest> prewarmRequests; // protected by prewarmRequestsMutex
+    CarlaMutex prewarmRequestsMutex;
+    CarlaMutex newPluginMutex; // plugins are created one at a time, so pooling does not race addPlugin()
+    CarlaEnginePrewarmThread prewarmThread;
 #endif
 
     uint32_t bufferSize;
@@ -284,6 +337,34 @@ struct CarlaEngine::ProtectedData {
     void doPluginsSwitch(uint idA, uint idB) noexcept;
     void doNextPluginAction() noexcept;
 
+#ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
+    // -------------------------------------------------------------------
+
+    void idlePreparedBridges() noexcept;
+    void clearPreparedBridges() noexcept;
+    bool appendPreparedBridge(const EnginePreparedBridge& prepared) noexcept;
+    CarlaPlugin* takePreparedBridge(BinaryType btype, PluginType ptype,
+                                    const char* filename, const char* label, int64_t uniqueId) noexcept;
+
+    // -------------------------------------------------------------------
+
+    void idlePooledPlugins() noexcept;
+    void clearPluginPool() noexcept;
+    void trimPluginPool(size_t maxMemoryUsage) noexcept;
+    void dropStalePooledPlugins() noexcept;
+    bool appendPooledPlugin(const EnginePooledPlugin& pooled) noexcept;
+    bool touchPooledPlugin(BinaryType btype, PluginType ptype,
+                           const char* filename, const char* label, int64_t uniqueId, uint options) noexcept;
+    CarlaPlugin* takePooledPlugin(BinaryType btype, PluginType ptype,
+                                  const char* filename, const char* label, int64_t uniqueId, uint options) noexcept;
+
+    // -------------------------------------------------------------------
+
+    void clearPrewarmRequests() noexcept;
+    bool appendPrewarmRequest(const EnginePrewarmRequest& request) noexcept;
+    bool takePrewarmRequest(EnginePrewarmRequest& request) noexcept;
+#endif
+
     // -------------------------------------------------------------------
 
 #ifdef CARLA_PROPER_CPP11_SUPPORT
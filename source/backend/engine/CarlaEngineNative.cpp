@@ -29,6 +29,7 @@
 #include "CarlaBase64Utils.hpp"
 #include "CarlaBinaryUtils.hpp"
 #include "CarlaMathUtils.hpp"
+#include "CarlaShmUtils.hpp"
 #include "CarlaStateUtils.hpp"
 
 #include "CarlaExternalUI.hpp"
@@ -72,6 +73,34 @@ static const uint32_t kNumOutParams = 10;
 static const uint16_t kUiWidth = 1024;
 static const uint16_t kUiHeight = 712;
 
+// -----------------------------------------------------------------------
+// Peaks and output parameter values shared with the UI, instead of sending them through the pipe.
+// Written on every UI idle, as a seqlock: 'sequence' is odd while being written,
+// readers must discard what they read if it was odd or changed in the meantime.
+// The layout must match the one in the carla-plugin frontend.
+
+#ifdef CARLA_OS_WIN
+# define CARLA_UI_SHARED_DATA_NAMEPREFIX "Local\\carla-ui_shm_"
+#else
+# define CARLA_UI_SHARED_DATA_NAMEPREFIX "/crlui_shm_"
+#endif
+
+static const uint32_t kUiSharedDataMaxPlugins = MAX_PATCHBAY_PLUGINS + 1;
+static const uint32_t kUiSharedDataMaxOutputs = 2048;
+
+struct CarlaEngineNativeUiSharedData {
+    uint32_t sequence;
+    uint32_t pluginCount;
+    uint32_t outputCount;
+    uint32_t reserved;
+    float peaks[kUiSharedDataMaxPlugins][4];
+    struct Output {
+        uint32_t pluginId;
+        uint32_t parameterId;
+        float value;
+    } outputs[kUiSharedDataMaxOutputs];
+};
+
 // -----------------------------------------------------------------------
 
 #ifdef USE_JUCE_MESSAGE_THREAD
@@ -182,11 +211,16 @@ public:
           fIsActive(false),
           fIsRunning(false),
           fUiServer(this),
+          fUiSharedMem(),
+          fUiSharedData(nullptr),
+          fUiSharedDataReady(false),
           fLastScaleFactor(1.0f),
           fOptionsForced(false)
     {
         carla_debug("CarlaEngineNative::CarlaEngineNative()");
 
+        carla_shm_init(fUiSharedMem);
+
         carla_zeroFloats(fParameters, kNumInParams+kNumOutParams);
 
 #ifdef USE_JUCE_MESSAGE_THREAD
@@ -258,6 +292,8 @@ public:
 
         pData->graph.destroy();
 
+        clearUiSharedData();
+
 #ifdef USE_JUCE_MESSAGE_THREAD
         if (kNeedsJuceMsgThread)
             fJuceMsgThread->decRef();
@@ -390,6 +426,12 @@ public:
         pHost->dispatcher(pHost->handle, NATIVE_HOST_OPCODE_RELOAD_PARAMETERS, 0, 0, nullptr, 0.0f);
     }
 
+    // the UI has mapped the shared data, peaks and output values are no longer sent through the pipe
+    void setUiSharedDataReady() noexcept
+    {
+        fUiSharedDataReady = fUiSharedData != nullptr;
+    }
+
 protected:
     // -------------------------------------------------------------------
 
@@ -820,6 +862,56 @@ protected:
         return nullptr;
     }
 
+    void uiServerSharedData()
+    {
+        clearUiSharedData();
+
+        char tmpFileBase[64];
+        std::sprintf(tmpFileBase, CARLA_UI_SHARED_DATA_NAMEPREFIX "XXXXXX");
+
+        const carla_shm_t shm = carla_shm_create_temp(tmpFileBase);
+
+        // the pipe is used for everything if this fails
+        if (! carla_is_shm_valid(shm))
+            return;
+
+        carla_copyStruct(fUiSharedMem, shm);
+
+        if (! carla_shm_map<CarlaEngineNativeUiSharedData>(fUiSharedMem, fUiSharedData))
+        {
+            carla_shm_close(fUiSharedMem);
+            return;
+        }
+
+        carla_zeroStruct(*fUiSharedData);
+
+        char tmpBuf[STR_MAX+1];
+        carla_zeroChars(tmpBuf, STR_MAX+1);
+
+        const CarlaMutexLocker cml(fUiServer.getPipeLock());
+
+        CARLA_SAFE_ASSERT_RETURN(fUiServer.writeAndFixMessage("shared-data"),);
+        CARLA_SAFE_ASSERT_RETURN(fUiServer.writeAndFixMessage(tmpFileBase),);
+        std::snprintf(tmpBuf, STR_MAX, P_SIZE "\n", sizeof(CarlaEngineNativeUiSharedData));
+        CARLA_SAFE_ASSERT_RETURN(fUiServer.writeMessage(tmpBuf),);
+
+        fUiServer.flushMessages();
+    }
+
+    void clearUiSharedData() noexcept
+    {
+        fUiSharedDataReady = false;
+
+        if (fUiSharedData != nullptr)
+        {
+            carla_shm_unmap(fUiSharedMem, fUiSharedData);
+            fUiSharedData = nullptr;
+        }
+
+        if (carla_is_shm_valid(fUiSharedMem))
+            carla_shm_close(fUiSharedMem);
+    }
+
     void uiServerInfo()
     {
         CARLA_SAFE_ASSERT_RETURN(fIsRunning,);
@@ -1269,6 +1361,7 @@ protected:
                 return;
             }
 
+            uiServerSharedData();
             uiServerInfo();
             uiServerOptions();
             uiServerCallback(ENGINE_CALLBACK_ENGINE_STARTED,
@@ -1297,6 +1390,7 @@ protected:
         else
         {
             fUiServer.stopPipeServer(2000);
+            clearUiSharedData();
 
             // hide all custom uis
             for (uint i=0; i < pData->curPluginCount; ++i)
@@ -1348,6 +1442,7 @@ protected:
         case CarlaExternalUI::UiHide:
             pHost->ui_closed(pHost->handle);
             fUiServer.stopPipeServer(1000);
+            clearUiSharedData();
             break;
         }
 
@@ -1431,7 +1526,10 @@ protected:
         fUiServer.flushMessages();
 
         // ------------------------------------------------------------------------------------------------------------
-        // send peaks and param outputs for all plugins
+        // send peaks and param outputs for all plugins, through the pipe if they do not fit in the shared data
+
+        if (fUiSharedDataReady && writeUiSharedData())
+            return;
 
         for (uint i=0; i < pData->curPluginCount; ++i)
         {
@@ -1464,6 +1562,53 @@ protected:
         }
     }
 
+    // Returns false if some values did not fit, in which case they must be sent through the pipe as well.
+    bool writeUiSharedData() noexcept
+    {
+        CarlaEngineNativeUiSharedData* const sharedData(fUiSharedData);
+        CARLA_SAFE_ASSERT_RETURN(sharedData != nullptr, false);
+
+        const uint32_t pluginCount = std::min(pData->curPluginCount, kUiSharedDataMaxPlugins);
+        uint32_t outputCount = 0;
+        bool complete = pluginCount == pData->curPluginCount;
+
+        ++sharedData->sequence;
+        __sync_synchronize();
+
+        for (uint32_t i=0; i < pluginCount; ++i)
+        {
+            const EnginePluginData& plugData(pData->plugins[i]);
+            const CarlaPlugin* const plugin(plugData.plugin);
+
+            carla_copyFloats(sharedData->peaks[i], plugData.peaks, 4);
+
+            for (uint32_t j=0, count=plugin->getParameterCount(); j < count; ++j)
+            {
+                if (! plugin->isParameterOutput(j))
+                    continue;
+
+                if (outputCount == kUiSharedDataMaxOutputs)
+                {
+                    complete = false;
+                    break;
+                }
+
+                CarlaEngineNativeUiSharedData::Output& output(sharedData->outputs[outputCount++]);
+                output.pluginId = i;
+                output.parameterId = j;
+                output.value = plugin->getParameterValue(j);
+            }
+        }
+
+        sharedData->pluginCount = pluginCount;
+        sharedData->outputCount = outputCount;
+
+        __sync_synchronize();
+        ++sharedData->sequence;
+
+        return complete;
+    }
+
     // -------------------------------------------------------------------
     // Plugin state calls
 
@@ -1679,6 +1824,10 @@ private:
     bool fIsActive, fIsRunning;
     CarlaEngineNativeUI fUiServer;
 
+    carla_shm_t fUiSharedMem;
+    CarlaEngineNativeUiSharedData* fUiSharedData;
+    bool fUiSharedDataReady;
+
     float fParameters[kNumInParams+kNumOutParams];
     float fLastScaleFactor;
 
@@ -1766,6 +1915,10 @@ bool CarlaEngineNativeUI::msgReceived(const char* const msg) noexcept
     {
         fEngine->clearXruns();
     }
+    else if (std::strcmp(msg, "shared_data_ready") == 0)
+    {
+        fEngine->setUiSharedDataReady();
+    }
     else if (std::strcmp(msg, "cancel_engine_action") == 0)
     {
         fEngine->setActionCanceled(true);
@@ -29,6 +29,8 @@ CarlaEngineOsc::CarlaEngineOsc(CarlaEngine* const engine) noexcept
     : fEngine(engine),
       fControlDataTCP(),
       fControlDataUDP(),
+      fControlPackedPeaks(false),
+      fControlStateHashes(false),
       fName(),
       fServerPathTCP(),
       fServerPathUDP(),
@@ -204,6 +206,8 @@ void CarlaEngineOsc::close() noexcept
 
     fControlDataTCP.clear();
     fControlDataUDP.clear();
+    fControlPackedPeaks = false;
+    fControlStateHashes = false;
 }
 
 // -----------------------------------------------------------------------
@@ -90,6 +90,11 @@ public:
         return fControlDataUDP.target != nullptr;
     }
 
+    bool isControlUsingPackedPeaks() const noexcept
+    {
+        return fControlPackedPeaks;
+    }
+
     // -------------------------------------------------------------------
     // TCP
 
@@ -105,6 +110,8 @@ public:
     void sendPluginMidiProgram(const CarlaPlugin* plugin, uint32_t index) const noexcept;
     void sendPluginCustomData(const CarlaPlugin* plugin, uint32_t index) const noexcept;
     void sendPluginInternalParameterValues(const CarlaPlugin* plugin) const noexcept;
+    void sendPluginParameterValues(const CarlaPlugin* plugin) const noexcept;
+    void sendPluginStateHash(const CarlaPlugin* plugin) const noexcept;
     void sendPing() const noexcept;
     void sendResponse(int messageId, const char* error) const noexcept;
     void sendExit() const noexcept;
@@ -115,6 +122,16 @@ public:
     void sendRuntimeInfo() const noexcept;
     void sendParameterValue(uint pluginId, uint32_t index, float value) const noexcept;
     void sendPeaks(uint pluginId, const float peaks[4]) const noexcept;
+    void sendPeaksPacked() const noexcept;
+
+    // to any client, registered or not
+    void sendRuntimeInfo(lo_address target, const char* path) const noexcept;
+    void sendPeaksPacked(lo_address target, const char* path) const noexcept;
+
+    // -------------------------------------------------------------------
+    // Plugin state hash, covering everything sent to clients except current values
+
+    static uint32_t getPluginStateHash(const CarlaPlugin* plugin) noexcept;
 
     // -------------------------------------------------------------------
 
@@ -124,6 +141,8 @@ private:
     // for carla-control
     CarlaOscData fControlDataTCP;
     CarlaOscData fControlDataUDP;
+    bool fControlPackedPeaks;
+    bool fControlStateHashes;
 
     CarlaString  fName;
     CarlaString  fServerPathTCP;
@@ -138,6 +157,7 @@ private:
 
     int handleMsgRegister(bool isTCP, int argc, const lo_arg* const* argv, const char* types);
     int handleMsgUnregister(bool isTCP, int argc, const lo_arg* const* argv, const char* types);
+    int handleMsgQueryStatus(bool isTCP, int argc, const lo_arg* const* argv, const char* types);
     int handleMsgControl(const char* method,
                          int argc, const lo_arg* const* argv, const char* types);
 
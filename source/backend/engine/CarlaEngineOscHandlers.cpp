@@ -57,6 +57,9 @@ int CarlaEngineOsc::handleMessage(const bool isTCP, const char* const path, cons
     if (std::strcmp(path, "/unregister") == 0)
         return handleMsgUnregister(isTCP, argc, argv, types);
 
+    if (std::strcmp(path, "/query_status") == 0)
+        return handleMsgQueryStatus(isTCP, argc, argv, types);
+
     if (std::strncmp(path, "/ctrl/", 6) == 0)
     {
         CARLA_SAFE_ASSERT_RETURN(isTCP, 1);
@@ -190,9 +193,21 @@ int CarlaEngineOsc::handleMsgRegister(const bool isTCP,
                                       const int argc, const lo_arg* const* const argv, const char* const types)
 {
     carla_debug("CarlaEngineOsc::handleMsgRegister()");
-    CARLA_ENGINE_OSC_CHECK_OSC_TYPES(1, "s");
+    CARLA_SAFE_ASSERT_RETURN(argc == 1 || argc == 2, 1);
+    CARLA_SAFE_ASSERT_RETURN(types != nullptr && std::strcmp(types, argc == 1 ? "s" : "sb") == 0, 1);
 
     const char* const url = &argv[0]->s;
+
+    // optional state hashes of the plugins the client already knows about, indexed by plugin id.
+    // their data is not sent again if unchanged, only the current values.
+    const uint8_t* cachedHashes = nullptr;
+    uint cachedHashCount = 0;
+
+    if (argc == 2 && isTCP && argv[1]->blob.size > 0)
+    {
+        cachedHashes = reinterpret_cast<const uint8_t*>(&argv[1]->blob.data);
+        cachedHashCount = static_cast<uint>(argv[1]->blob.size) / sizeof(uint32_t);
+    }
     const lo_address addr = lo_address_new_from_url(url);
 
     CarlaOscData& oscData(isTCP ? fControlDataTCP : fControlDataUDP);
@@ -226,6 +241,12 @@ int CarlaEngineOsc::handleMsgRegister(const bool isTCP,
 
         if (isTCP)
         {
+            // new clients need to ask for packed peaks again
+            fControlPackedPeaks = false;
+
+            // clients registering with cached hashes want updated ones too
+            fControlStateHashes = (argc == 2);
+
             const EngineOptions& opts(fEngine->getOptions());
 
             fEngine->callback(false, true,
@@ -242,6 +263,24 @@ int CarlaEngineOsc::handleMsgRegister(const bool isTCP,
                 CarlaPlugin* const plugin(fEngine->getPluginUnchecked(i));
                 CARLA_SAFE_ASSERT_CONTINUE(plugin != nullptr);
 
+                if (i < cachedHashCount)
+                {
+                    // NOTE assumes a little-endian host, like every platform Carla runs on
+                    uint32_t cachedHash;
+                    std::memcpy(&cachedHash, cachedHashes + i*sizeof(uint32_t), sizeof(uint32_t));
+
+                    if (cachedHash == getPluginStateHash(plugin))
+                    {
+                        // not sendPluginDataCount(), clients reset their program lists on it
+                        sendCallback(ENGINE_CALLBACK_PROGRAM_CHANGED, i, plugin->getCurrentProgram(), 0, 0, 0.0f, nullptr);
+                        sendCallback(ENGINE_CALLBACK_MIDI_PROGRAM_CHANGED, i, plugin->getCurrentMidiProgram(), 0, 0, 0.0f, nullptr);
+                        sendPluginParameterValues(plugin);
+                        sendPluginInternalParameterValues(plugin);
+                        sendCallback(ENGINE_CALLBACK_PLUGIN_ADDED, i, 0, 0, 0, 0.0f, plugin->getName());
+                        continue;
+                    }
+                }
+
                 fEngine->callback(false, true, ENGINE_CALLBACK_PLUGIN_ADDED, i, 0, 0, 0, 0.0f, plugin->getName());
             }
 
@@ -273,6 +312,12 @@ int CarlaEngineOsc::handleMsgUnregister(const bool isTCP,
     {
         carla_stdout("OSC client %s unregistered", url);
         oscData.clear();
+
+        if (isTCP)
+        {
+            fControlPackedPeaks = false;
+            fControlStateHashes = false;
+        }
         return 0;
     }
 
@@ -280,6 +325,39 @@ int CarlaEngineOsc::handleMsgUnregister(const bool isTCP,
     return 0;
 }
 
+int CarlaEngineOsc::handleMsgQueryStatus(const bool isTCP,
+                                         const int argc, const lo_arg* const* const argv, const char* const types)
+{
+    carla_debug("CarlaEngineOsc::handleMsgQueryStatus()");
+    CARLA_ENGINE_OSC_CHECK_OSC_TYPES(1, "s");
+    CARLA_SAFE_ASSERT_RETURN(! isTCP, 0);
+
+    // answered once, without registering, so it does not take the place of a regular client
+    const char* const url = &argv[0]->s;
+
+    const lo_address addr = lo_address_new_from_url(url);
+    CARLA_SAFE_ASSERT_RETURN(addr != nullptr, 0);
+
+    const lo_address target = lo_address_new_with_proto(LO_UDP,
+                                                        lo_address_get_hostname(addr),
+                                                        lo_address_get_port(addr));
+    char* const path = lo_url_get_path(url);
+
+    if (target != nullptr && path != nullptr && path[0] != '\0')
+    {
+        // runtime info last, as it completes the reply
+        sendPeaksPacked(target, path);
+        sendRuntimeInfo(target, path);
+    }
+
+    if (target != nullptr)
+        lo_address_free(target);
+
+    free(path);
+    lo_address_free(addr);
+    return 0;
+}
+
 int CarlaEngineOsc::handleMsgControl(const char* const method,
                                      const int argc, const lo_arg* const* const argv, const char* const types)
 {
@@ -542,6 +620,28 @@ int CarlaEngineOsc::handleMsgControl(const char* const method,
 
         ok = fEngine->replacePlugin(static_cast<uint32_t>(id));
     }
+    else if (std::strcmp(method, "get_plugin_hashes") == 0)
+    {
+        fControlStateHashes = true;
+
+        for (uint i=0, count=fEngine->getCurrentPluginCount(); i < count; ++i)
+        {
+            const CarlaPlugin* const plugin(fEngine->getPluginUnchecked(i));
+            CARLA_SAFE_ASSERT_CONTINUE(plugin != nullptr);
+
+            sendPluginStateHash(plugin);
+        }
+
+        ok = true;
+    }
+    else if (std::strcmp(method, "set_packed_peaks") == 0)
+    {
+        CARLA_SAFE_ASSERT_RETURN_OSC_ERR(argc == 2);
+        CARLA_SAFE_ASSERT_RETURN_OSC_ERR(types[1] == 'i');
+
+        fControlPackedPeaks = (argv[1]->i != 0);
+        ok = true;
+    }
     else if (std::strcmp(method, "switch_plugins") == 0)
     {
         CARLA_SAFE_ASSERT_RETURN_OSC_ERR(argc == 3);
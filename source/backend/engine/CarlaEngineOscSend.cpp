@@ -27,6 +27,34 @@ CARLA_BACKEND_START_NAMESPACE
 
 static const char* const kNullString = "";
 
+// -----------------------------------------------------------------------
+// FNV-1a, used for plugin state hashes
+
+static void hash_add(uint32_t& hash, const void* const data, const std::size_t size) noexcept
+{
+    const uint8_t* const bytes = static_cast<const uint8_t*>(data);
+
+    for (std::size_t i=0; i<size; ++i)
+    {
+        hash ^= bytes[i];
+        hash *= 16777619U;
+    }
+}
+
+static void hash_add_string(uint32_t& hash, const char* const str) noexcept
+{
+    if (str != nullptr)
+        hash_add(hash, str, std::strlen(str)+1);
+    else
+        hash_add(hash, kNullString, 1);
+}
+
+template<typename T>
+static void hash_add_value(uint32_t& hash, const T value) noexcept
+{
+    hash_add(hash, &value, sizeof(T));
+}
+
 // -----------------------------------------------------------------------
 
 void CarlaEngineOsc::sendCallback(const EngineCallbackOpcode action, const uint pluginId,
@@ -312,6 +340,154 @@ void CarlaEngineOsc::sendPluginInternalParameterValues(const CarlaPlugin* const
 
 // -----------------------------------------------------------------------
 
+void CarlaEngineOsc::sendPluginParameterValues(const CarlaPlugin* const plugin) const noexcept
+{
+    CARLA_SAFE_ASSERT_RETURN(fControlDataTCP.path != nullptr && fControlDataTCP.path[0] != '\0',);
+    CARLA_SAFE_ASSERT_RETURN(fControlDataTCP.target != nullptr,);
+    CARLA_SAFE_ASSERT_RETURN(plugin != nullptr,);
+    carla_debug("CarlaEngineOsc::sendPluginParameterValues(%p)", plugin);
+
+    const uint32_t count = plugin->getParameterCount();
+
+    if (count == 0)
+        return;
+
+    // NOTE assumes a little-endian host, like every platform Carla runs on
+    float values[count];
+
+    for (uint32_t i=0; i<count; ++i)
+        values[i] = plugin->getParameterValue(i);
+
+    const lo_blob blob = lo_blob_new(static_cast<int32_t>(sizeof(float)*count), values);
+    CARLA_SAFE_ASSERT_RETURN(blob != nullptr,);
+
+    char targetPath[std::strlen(fControlDataTCP.path)+8];
+    std::strcpy(targetPath, fControlDataTCP.path);
+    std::strcat(targetPath, "/values");
+    try_lo_send(fControlDataTCP.target, targetPath, "ib", static_cast<int32_t>(plugin->getId()), blob);
+
+    lo_blob_free(blob);
+}
+
+void CarlaEngineOsc::sendPluginStateHash(const CarlaPlugin* const plugin) const noexcept
+{
+    CARLA_SAFE_ASSERT_RETURN(plugin != nullptr,);
+
+    // only for clients that asked for it
+    if (! fControlStateHashes)
+        return;
+
+    CARLA_SAFE_ASSERT_RETURN(fControlDataTCP.path != nullptr && fControlDataTCP.path[0] != '\0',);
+    CARLA_SAFE_ASSERT_RETURN(fControlDataTCP.target != nullptr,);
+    carla_debug("CarlaEngineOsc::sendPluginStateHash(%p)", plugin);
+
+    char targetPath[std::strlen(fControlDataTCP.path)+6];
+    std::strcpy(targetPath, fControlDataTCP.path);
+    std::strcat(targetPath, "/hash");
+    try_lo_send(fControlDataTCP.target, targetPath, "ii",
+                static_cast<int32_t>(plugin->getId()),
+                static_cast<int32_t>(getPluginStateHash(plugin)));
+}
+
+uint32_t CarlaEngineOsc::getPluginStateHash(const CarlaPlugin* const plugin) noexcept
+{
+    CARLA_SAFE_ASSERT_RETURN(plugin != nullptr, 0);
+
+    uint32_t hash = 2166136261U;
+
+    // same data as sendPluginInfo()
+    char strBuf[STR_MAX+1];
+    carla_zeroChars(strBuf, STR_MAX+1);
+
+    hash_add_value<int32_t>(hash, plugin->getType());
+    hash_add_value<int32_t>(hash, plugin->getCategory());
+    hash_add_value<uint>(hash, plugin->getHints());
+    hash_add_value<int64_t>(hash, plugin->getUniqueId());
+    hash_add_value<uint>(hash, plugin->getOptionsAvailable());
+    hash_add_value<uint>(hash, plugin->getOptionsEnabled());
+    hash_add_string(hash, plugin->getName());
+    hash_add_string(hash, plugin->getFilename());
+    hash_add_string(hash, plugin->getIconName());
+
+    hash_add_string(hash, plugin->getRealName(strBuf) ? strBuf : kNullString);
+    hash_add_string(hash, plugin->getLabel(strBuf) ? strBuf : kNullString);
+    hash_add_string(hash, plugin->getMaker(strBuf) ? strBuf : kNullString);
+    hash_add_string(hash, plugin->getCopyright(strBuf) ? strBuf : kNullString);
+
+    // same data as sendPluginPortCount()
+    uint32_t paramIns, paramOuts;
+    plugin->getParameterCountInfo(paramIns, paramOuts);
+
+    hash_add_value<uint32_t>(hash, plugin->getAudioInCount());
+    hash_add_value<uint32_t>(hash, plugin->getAudioOutCount());
+    hash_add_value<uint32_t>(hash, plugin->getMidiInCount());
+    hash_add_value<uint32_t>(hash, plugin->getMidiOutCount());
+    hash_add_value<uint32_t>(hash, paramIns);
+    hash_add_value<uint32_t>(hash, paramOuts);
+
+    // same data as sendPluginParameterInfo(), except for the current value
+    const uint32_t parameterCount = plugin->getParameterCount();
+    hash_add_value<uint32_t>(hash, parameterCount);
+
+    for (uint32_t i=0; i<parameterCount; ++i)
+    {
+        hash_add_string(hash, plugin->getParameterName(i, strBuf) ? strBuf : kNullString);
+        hash_add_string(hash, plugin->getParameterUnit(i, strBuf) ? strBuf : kNullString);
+        hash_add_string(hash, plugin->getParameterComment(i, strBuf) ? strBuf : kNullString);
+        hash_add_string(hash, plugin->getParameterGroupName(i, strBuf) ? strBuf : kNullString);
+
+        const ParameterData& paramData(plugin->getParameterData(i));
+        hash_add_value<int32_t>(hash, paramData.type);
+        hash_add_value<uint>(hash, paramData.hints);
+        hash_add_value<uint8_t>(hash, paramData.midiChannel);
+        hash_add_value<int16_t>(hash, paramData.mappedControlIndex);
+        hash_add_value<float>(hash, paramData.mappedMinimum);
+        hash_add_value<float>(hash, paramData.mappedMaximum);
+
+        const ParameterRanges& paramRanges(plugin->getParameterRanges(i));
+        hash_add_value<float>(hash, paramRanges.def);
+        hash_add_value<float>(hash, paramRanges.min);
+        hash_add_value<float>(hash, paramRanges.max);
+        hash_add_value<float>(hash, paramRanges.step);
+        hash_add_value<float>(hash, paramRanges.stepSmall);
+        hash_add_value<float>(hash, paramRanges.stepLarge);
+    }
+
+    // same data as sendPluginProgram(), sendPluginMidiProgram() and sendPluginCustomData()
+    const uint32_t programCount = plugin->getProgramCount();
+    hash_add_value<uint32_t>(hash, programCount);
+
+    for (uint32_t i=0; i<programCount; ++i)
+        hash_add_string(hash, plugin->getProgramName(i, strBuf) ? strBuf : kNullString);
+
+    const uint32_t midiProgramCount = plugin->getMidiProgramCount();
+    hash_add_value<uint32_t>(hash, midiProgramCount);
+
+    for (uint32_t i=0; i<midiProgramCount; ++i)
+    {
+        const MidiProgramData& mpdata(plugin->getMidiProgramData(i));
+        hash_add_value<uint32_t>(hash, mpdata.bank);
+        hash_add_value<uint32_t>(hash, mpdata.program);
+        hash_add_string(hash, mpdata.name);
+    }
+
+    const uint32_t customDataCount = plugin->getCustomDataCount();
+    hash_add_value<uint32_t>(hash, customDataCount);
+
+    for (uint32_t i=0; i<customDataCount; ++i)
+    {
+        const CustomData& cdata(plugin->getCustomData(i));
+        hash_add_string(hash, cdata.type);
+        hash_add_string(hash, cdata.key);
+        hash_add_string(hash, cdata.value);
+    }
+
+    // 0 means unknown for clients
+    return hash != 0 ? hash : 1;
+}
+
+// -----------------------------------------------------------------------
+
 void CarlaEngineOsc::sendPing() const noexcept
 {
     CARLA_SAFE_ASSERT_RETURN(fControlDataTCP.path != nullptr && fControlDataTCP.path[0] != '\0',);
@@ -354,12 +530,17 @@ void CarlaEngineOsc::sendRuntimeInfo() const noexcept
     CARLA_SAFE_ASSERT_RETURN(fControlDataUDP.path != nullptr && fControlDataUDP.path[0] != '\0',);
     CARLA_SAFE_ASSERT_RETURN(fControlDataUDP.target != nullptr,);
 
+    sendRuntimeInfo(fControlDataUDP.target, fControlDataUDP.path);
+}
+
+void CarlaEngineOsc::sendRuntimeInfo(const lo_address target, const char* const path) const noexcept
+{
     const EngineTimeInfo timeInfo(fEngine->getTimeInfo());
 
-    char targetPath[std::strlen(fControlDataUDP.path)+18];
-    std::strcpy(targetPath, fControlDataUDP.path);
+    char targetPath[std::strlen(path)+18];
+    std::strcpy(targetPath, path);
     std::strcat(targetPath, "/runtime");
-    try_lo_send(fControlDataUDP.target, targetPath, "fiihiiif",
+    try_lo_send(target, targetPath, "fiihiiif",
                 static_cast<double>(fEngine->getDSPLoad()),
                 static_cast<int32_t>(fEngine->getTotalXruns()),
                 timeInfo.playing ? 1 : 0,
@@ -399,6 +580,39 @@ void CarlaEngineOsc::sendPeaks(const uint pluginId, const float peaks[4]) const
                 static_cast<double>(peaks[3]));
 }
 
+void CarlaEngineOsc::sendPeaksPacked() const noexcept
+{
+    CARLA_SAFE_ASSERT_RETURN(fControlDataUDP.path != nullptr && fControlDataUDP.path[0] != '\0',);
+    CARLA_SAFE_ASSERT_RETURN(fControlDataUDP.target != nullptr,);
+
+    sendPeaksPacked(fControlDataUDP.target, fControlDataUDP.path);
+}
+
+void CarlaEngineOsc::sendPeaksPacked(const lo_address target, const char* const path) const noexcept
+{
+    const uint count = fEngine->getCurrentPluginCount();
+
+    if (count == 0)
+        return;
+
+    // 4 floats per plugin (input left, input right, output left, output right), starting at plugin 0
+    // NOTE assumes a little-endian host, like every platform Carla runs on
+    float peaks[count*4];
+
+    for (uint i=0; i < count; ++i)
+        std::memcpy(peaks + i*4, fEngine->getPeaks(i), sizeof(float)*4);
+
+    const lo_blob blob = lo_blob_new(static_cast<int32_t>(sizeof(float)*count*4), peaks);
+    CARLA_SAFE_ASSERT_RETURN(blob != nullptr,);
+
+    char targetPath[std::strlen(path)+18];
+    std::strcpy(targetPath, path);
+    std::strcat(targetPath, "/peaks_packed");
+    try_lo_send(target, targetPath, "b", blob);
+
+    lo_blob_free(blob);
+}
+
 // -----------------------------------------------------------------------
 
 CARLA_BACKEND_END_NAMESPACE
@@ -62,6 +62,7 @@ void CarlaEngineThread::run() noexcept
     {
 #if defined(HAVE_LIBLO) && ! defined(BUILD_BRIDGE)
         const bool oscRegistedForUDP = engineOsc.isControlRegisteredForUDP();
+        const bool oscUsingPackedPeaks = engineOsc.isControlUsingPackedPeaks();
 #else
         const bool oscRegistedForUDP = false;
 #endif
@@ -125,12 +126,16 @@ void CarlaEngineThread::run() noexcept
             // -----------------------------------------------------------
             // Update OSC control client peaks
 
-            if (oscRegistedForUDP)
+            if (oscRegistedForUDP && ! oscUsingPackedPeaks)
                 engineOsc.sendPeaks(i, kEngine->getPeaks(i));
 #endif
         }
 
 #if defined(HAVE_LIBLO) && !defined(BUILD_BRIDGE)
+        // all plugin peaks at once, if the client asked for it
+        if (oscRegistedForUDP && oscUsingPackedPeaks)
+            engineOsc.sendPeaksPacked();
+
         if (oscRegistedForUDP)
             engineOsc.sendRuntimeInfo();
 
@@ -154,6 +159,50 @@ void CarlaEngineThread::run() noexcept
     carla_debug("CarlaEngineThread closed");
 }
 
+#ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
+// -----------------------------------------------------------------------
+
+CarlaEnginePrewarmThread::CarlaEnginePrewarmThread(CarlaEngine* const engine) noexcept
+    : CarlaThread("CarlaEnginePrewarmThread"),
+      kEngine(engine)
+{
+    CARLA_SAFE_ASSERT(engine != nullptr);
+    carla_debug("CarlaEnginePrewarmThread::CarlaEnginePrewarmThread(%p)", engine);
+}
+
+CarlaEnginePrewarmThread::~CarlaEnginePrewarmThread() noexcept
+{
+    carla_debug("CarlaEnginePrewarmThread::~CarlaEnginePrewarmThread()");
+}
+
+void CarlaEnginePrewarmThread::run() noexcept
+{
+    CARLA_SAFE_ASSERT_RETURN(kEngine != nullptr,);
+    carla_debug("CarlaEnginePrewarmThread::run()");
+
+    for (; ! shouldThreadExit();)
+    {
+        // wait for the project to finish loading, it needs the cpu more than we do
+        if (kEngine->pData->loadingProject || kEngine->pData->aboutToClose)
+        {
+            carla_msleep(100);
+            continue;
+        }
+
+        bool prewarmed = false;
+
+        try {
+            prewarmed = kEngine->prewarmNextPlugin();
+        } CARLA_SAFE_EXCEPTION("prewarmNextPlugin()")
+
+        if (! prewarmed)
+            carla_msleep(100);
+    }
+
+    carla_debug("CarlaEnginePrewarmThread closed");
+}
+#endif
+
 // -----------------------------------------------------------------------
 
 CARLA_BACKEND_END_NAMESPACE
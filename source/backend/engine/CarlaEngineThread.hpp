@@ -43,6 +43,26 @@ private:
     CARLA_DECLARE_NON_COPYABLE_WITH_LEAK_DETECTOR(CarlaEngineThread)
 };
 
+#ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
+// -----------------------------------------------------------------------
+// CarlaEnginePrewarmThread
+
+class CarlaEnginePrewarmThread : public CarlaThread
+{
+public:
+    CarlaEnginePrewarmThread(CarlaEngine* engine) noexcept;
+    ~CarlaEnginePrewarmThread() noexcept override;
+
+protected:
+    void run() noexcept override;
+
+private:
+    CarlaEngine* const kEngine;
+
+    CARLA_DECLARE_NON_COPYABLE_WITH_LEAK_DETECTOR(CarlaEnginePrewarmThread)
+};
+#endif
+
 // -----------------------------------------------------------------------
 
 CARLA_BACKEND_END_NAMESPACE
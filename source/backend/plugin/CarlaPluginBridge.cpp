@@ -2475,6 +2475,18 @@ public:
               const int64_t uniqueId,
               const uint options,
               const char* const bridgeBinary)
+    {
+        if (! prepare(filename, name, label, uniqueId, bridgeBinary))
+            return false;
+
+        return finishInit(nullptr, label, options);
+    }
+
+    bool prepare(const char* const filename,
+                 const char* const name,
+                 const char* const label,
+                 const int64_t uniqueId,
+                 const char* const bridgeBinary)
     {
         CARLA_SAFE_ASSERT_RETURN(pData->engine != nullptr, false);
 
@@ -2586,7 +2598,27 @@ public:
                                   bridgeBinary, label, shmIdsStr);
         }
 
-        if (! restartBridgeThread())
+        startBridgeThread();
+        return true;
+    }
+
+    bool finishInit(const char* const name, const char* const label, const uint options)
+    {
+        CARLA_SAFE_ASSERT_RETURN(pData->engine != nullptr, false);
+
+        // ---------------------------------------------------------------
+        // set info
+
+        // plugins loaded while this bridge was starting might have taken its name by now
+        if (name != nullptr && name[0] != '\0')
+        {
+            if (pData->name != nullptr)
+                delete[] pData->name;
+
+            pData->name = pData->engine->getUniquePluginName(name);
+        }
+
+        if (! waitForBridgeThread())
             return false;
 
         // ---------------------------------------------------------------
@@ -2909,6 +2941,12 @@ private:
     }
 
     bool restartBridgeThread()
+    {
+        startBridgeThread();
+        return waitForBridgeThread();
+    }
+
+    void startBridgeThread()
     {
         fInitiated  = false;
         fInitError  = false;
@@ -2950,7 +2988,10 @@ private:
         }
 
         fBridgeThread.startThread();
+    }
 
+    bool waitForBridgeThread()
+    {
         const bool needsEngineIdle = pData->engine->getType() != kEngineTypePlugin;
 #ifndef BUILD_BRIDGE_ALTERNATIVE_ARCH
         const bool needsCancelableAction = ! pData->engine->isLoadingProject();
@@ -3074,6 +3115,53 @@ CarlaPlugin* CarlaPlugin::newBridge(const Initializer& init, BinaryType btype, P
     return plugin;
 }
 
+CarlaPlugin* CarlaPlugin::prepareBridge(const Initializer& init, BinaryType btype, PluginType ptype, const char* bridgeBinary)
+{
+    carla_debug("CarlaPlugin::prepareBridge({%p, \"%s\", \"%s\", \"%s\"}, %s, %s, \"%s\")", init.engine, init.filename, init.name, init.label, BinaryType2Str(btype), PluginType2Str(ptype), bridgeBinary);
+
+    if (bridgeBinary == nullptr || bridgeBinary[0] == '\0')
+    {
+        init.engine->setLastError("Bridge not possible, bridge-binary not found");
+        return nullptr;
+    }
+
+#ifndef CARLA_OS_WIN
+    // FIXME: somewhere, somehow, we end up with double slashes, wine doesn't like that.
+    if (std::strncmp(bridgeBinary, "//", 2) == 0)
+        ++bridgeBinary;
+#endif
+
+    CarlaPluginBridge* const plugin(new CarlaPluginBridge(init.engine, init.id, btype, ptype));
+
+    if (! plugin->prepare(init.filename, init.name, init.label, init.uniqueId, bridgeBinary))
+    {
+        delete plugin;
+        return nullptr;
+    }
+
+    return plugin;
+}
+
+CarlaPlugin* CarlaPlugin::finishBridge(CarlaPlugin* const plugin, const Initializer& init)
+{
+    carla_debug("CarlaPlugin::finishBridge(%p, {%p, \"%s\", \"%s\", \"%s\"})", plugin, init.engine, init.filename, init.name, init.label);
+
+    CARLA_SAFE_ASSERT_RETURN(plugin != nullptr, nullptr);
+    CARLA_SAFE_ASSERT_RETURN((plugin->getHints() & PLUGIN_IS_BRIDGE) != 0, nullptr);
+
+    CarlaPluginBridge* const bridge((CarlaPluginBridge*)plugin);
+
+    bridge->setId(init.id);
+
+    if (! bridge->finishInit(init.name, init.label, init.options))
+    {
+        delete bridge;
+        return nullptr;
+    }
+
+    return bridge;
+}
+
 CARLA_BACKEND_END_NAMESPACE
 
 // ---------------------------------------------------------------------------------------------------------------------
@@ -18,6 +18,8 @@
 #include "CarlaUtils.h"
 
 #include "CarlaPipeUtils.hpp"
+#include "CarlaShmUtils.hpp"
+#include "CarlaThread.hpp"
 
 #ifdef CARLA_OS_HAIKU
 # include "CarlaStringList.hpp"
@@ -28,24 +30,37 @@ namespace CB = CarlaBackend;
 
 // -------------------------------------------------------------------------------------------------------------------
 
-class ExposedCarlaPipeClient : public CarlaPipeClient
+class ExposedCarlaPipeClient : public CarlaPipeClient,
+                               private CarlaThread
 {
 public:
     ExposedCarlaPipeClient(const CarlaPipeCallbackFunc callbackFunc, void* const callbackPtr) noexcept
         : CarlaPipeClient(),
+          CarlaThread("CarlaPipeClientReader"),
           fCallbackFunc(callbackFunc),
           fCallbackPtr(callbackPtr),
 #ifdef CARLA_PIPE_WITHOUT_CALLBACK
           fMsgsReceived(),
           fLastMsgReceived(nullptr),
 #endif
-          fLastReadLine(nullptr)
+          fLastReadLine(nullptr),
+          fReadLines(),
+          fReaderLines(),
+          fReceivedLines(),
+          fReceivedLinesMutex(),
+          fSharedMem(),
+          fSharedData(nullptr)
     {
         CARLA_SAFE_ASSERT(fCallbackFunc != nullptr);
+
+        carla_shm_init(fSharedMem);
     }
 
     ~ExposedCarlaPipeClient() override
     {
+        stopReader();
+        unmapSharedData();
+
         if (fLastReadLine != nullptr)
         {
             delete[] fLastReadLine;
@@ -76,6 +91,75 @@ public:
 #endif
     }
 
+    void* mapSharedData(const char* const filename, const uint size) noexcept
+    {
+        unmapSharedData();
+
+        fSharedMem = carla_shm_attach(filename);
+        CARLA_SAFE_ASSERT_RETURN(carla_is_shm_valid(fSharedMem), nullptr);
+
+        fSharedData = carla_shm_map(fSharedMem, size);
+
+        if (fSharedData == nullptr)
+            carla_shm_close(fSharedMem);
+
+        return fSharedData;
+    }
+
+    void unmapSharedData() noexcept
+    {
+        if (fSharedData != nullptr)
+        {
+            carla_shm_unmap(fSharedMem, fSharedData);
+            fSharedData = nullptr;
+        }
+
+        if (carla_is_shm_valid(fSharedMem))
+            carla_shm_close(fSharedMem);
+    }
+
+    const char* readlines() noexcept
+    {
+        fReadLines.clear();
+
+#ifdef CARLA_PIPE_WITHOUT_CALLBACK
+        while (fMsgsReceived.count() != 0)
+        {
+            delete[] fLastMsgReceived;
+            fLastMsgReceived = fMsgsReceived.getAndRemoveFirst();
+            fReadLines.appendLine(fLastMsgReceived);
+        }
+#endif
+
+        // take everything assembled by the reader thread so far, even if it has stopped since
+        {
+            const CarlaMutexLocker cml(fReceivedLinesMutex);
+            fReadLines.append(fReceivedLines);
+            fReceivedLines.clear();
+        }
+
+        if (! isThreadRunning())
+        {
+            while (const char* const line = CarlaPipeClient::readNextLineIfAvailable())
+                fReadLines.appendLine(line);
+        }
+
+        if (fReadLines.size == 0)
+            return nullptr;
+
+        return fReadLines.data;
+    }
+
+    bool startReader() noexcept
+    {
+        return startThread();
+    }
+
+    void stopReader() noexcept
+    {
+        stopThread(-1);
+    }
+
     const char* readlineblock(const uint timeout) noexcept
     {
 #ifdef CARLA_PIPE_WITHOUT_CALLBACK
@@ -87,6 +171,8 @@ public:
         }
 #endif
 
+        CARLA_SAFE_ASSERT_RETURN(! isThreadRunning(), nullptr);
+
         delete[] fLastReadLine;
         fLastReadLine = CarlaPipeClient::_readlineblock(true, 0, timeout);
         return fLastReadLine;
@@ -103,6 +189,8 @@ public:
         }
 #endif
 
+        CARLA_SAFE_ASSERT_RETURN(! isThreadRunning(), false);
+
         if (const char* const line = CarlaPipeClient::_readlineblock(false, 0, timeout))
             return std::strcmp(line, "true") == 0;
 
@@ -120,6 +208,8 @@ public:
         }
 #endif
 
+        CARLA_SAFE_ASSERT_RETURN(! isThreadRunning(), 0);
+
         if (const char* const line = CarlaPipeClient::_readlineblock(false, 0, timeout))
             return std::atoi(line);
 
@@ -137,6 +227,8 @@ public:
         }
 #endif
 
+        CARLA_SAFE_ASSERT_RETURN(! isThreadRunning(), 0.0);
+
         if (const char* const line = CarlaPipeClient::_readlineblock(false, 0, timeout))
             return std::atof(line);
 
@@ -159,7 +251,132 @@ public:
         return true;
     }
 
+protected:
+    void run() override
+    {
+        // hand lines over in chunks, so a flood of messages does not keep them all in the reader buffer
+        static const std::size_t kMaxLinesPerChunk = 256;
+
+        // stop reading when the other side does not take lines fast enough, the pipe then fills up instead
+        static const std::size_t kMaxPendingSize = 4 * 1024 * 1024;
+
+        while (! shouldThreadExit())
+        {
+            bool tooManyPending;
+
+            {
+                const CarlaMutexLocker cml(fReceivedLinesMutex);
+                tooManyPending = fReceivedLines.size >= kMaxPendingSize;
+            }
+
+            if (tooManyPending)
+            {
+                carla_msleep(5);
+                continue;
+            }
+
+            fReaderLines.clear();
+
+            for (std::size_t numLines = 0; numLines < kMaxLinesPerChunk && ! shouldThreadExit(); ++numLines)
+            {
+                const char* const line = CarlaPipeClient::readNextLineIfAvailable();
+
+                if (line == nullptr)
+                    break;
+
+                fReaderLines.appendLine(line);
+            }
+
+            if (fReaderLines.size != 0)
+            {
+                const CarlaMutexLocker cml(fReceivedLinesMutex);
+                fReceivedLines.append(fReaderLines);
+                continue;
+            }
+
+            if (! isPipeRunning())
+                break;
+
+            // block until there is something to read, waking up regularly to check if we should stop
+            if (! waitForPipeData(50))
+                break;
+        }
+    }
+
 private:
+    // Lines separated by '\n', with newlines inside them escaped as '\r', as written to the pipe.
+    struct LineBuffer {
+        char* data;
+        std::size_t size;
+        std::size_t capacity;
+
+        LineBuffer() noexcept
+            : data(nullptr),
+              size(0),
+              capacity(0) {}
+
+        ~LineBuffer() noexcept
+        {
+            std::free(data);
+        }
+
+        void clear() noexcept
+        {
+            size = 0;
+        }
+
+        void append(const LineBuffer& other) noexcept
+        {
+            if (other.size == 0 || ! reserve(other.size))
+                return;
+
+            std::memcpy(data + size, other.data, other.size);
+            size += other.size;
+            data[size] = '\0';
+        }
+
+        void appendLine(const char* const line) noexcept
+        {
+            CARLA_SAFE_ASSERT_RETURN(line != nullptr,);
+
+            const std::size_t len = std::strlen(line);
+
+            if (! reserve(len + 1))
+                return;
+
+            char* const ptr = data + size;
+
+            // escape newlines again, as done when writing
+            for (std::size_t i=0; i<len; ++i)
+                ptr[i] = line[i] != '\n' ? line[i] : '\r';
+
+            ptr[len] = '\n';
+            size += len + 1;
+            data[size] = '\0';
+        }
+
+        // room for 'extra' more bytes and a final null
+        bool reserve(const std::size_t extra) noexcept
+        {
+            if (size + extra + 1 <= capacity)
+                return true;
+
+            std::size_t newCapacity = capacity != 0 ? capacity : 0x1000;
+
+            while (size + extra + 1 > newCapacity)
+                newCapacity *= 2;
+
+            char* const newData = static_cast<char*>(std::realloc(data, newCapacity));
+            CARLA_SAFE_ASSERT_RETURN(newData != nullptr, false);
+
+            data = newData;
+            capacity = newCapacity;
+            return true;
+        }
+
+        CARLA_DECLARE_NON_COPY_STRUCT(LineBuffer)
+    };
+
     const CarlaPipeCallbackFunc fCallbackFunc;
     void* const fCallbackPtr;
 #ifdef CARLA_PIPE_WITHOUT_CALLBACK
@@ -168,6 +385,18 @@ private:
 #endif
     const char* fLastReadLine;
 
+    // returned by readlines(), valid until its next call
+    LineBuffer fReadLines;
+
+    // used by the reader thread only
+    LineBuffer fReaderLines;
+
+    // complete lines from the reader thread, not yet taken by readlines()
+    LineBuffer fReceivedLines;
+    CarlaMutex fReceivedLinesMutex;
+    carla_shm_t fSharedMem;
+    void* fSharedData;
+
     CARLA_DECLARE_NON_COPYABLE_WITH_LEAK_DETECTOR(ExposedCarlaPipeClient)
 };
 
@@ -193,6 +422,31 @@ const char* carla_pipe_client_idle(CarlaPipeClientHandle handle)
     return ((ExposedCarlaPipeClient*)handle)->idlePipeAndReturnMessage();
 }
 
+const char* carla_pipe_client_readlines(CarlaPipeClientHandle handle)
+{
+    CARLA_SAFE_ASSERT_RETURN(handle != nullptr, nullptr);
+
+    return ((ExposedCarlaPipeClient*)handle)->readlines();
+}
+
+bool carla_pipe_client_start_reader(CarlaPipeClientHandle handle)
+{
+    CARLA_SAFE_ASSERT_RETURN(handle != nullptr, false);
+    carla_debug("carla_pipe_client_start_reader(%p)", handle);
+
+    return ((ExposedCarlaPipeClient*)handle)->startReader();
+}
+
+void* carla_pipe_client_map_shared_data(CarlaPipeClientHandle handle, const char* filename, uint size)
+{
+    CARLA_SAFE_ASSERT_RETURN(handle != nullptr, nullptr);
+    CARLA_SAFE_ASSERT_RETURN(filename != nullptr && filename[0] != '\0', nullptr);
+    CARLA_SAFE_ASSERT_RETURN(size > 0, nullptr);
+    carla_debug("carla_pipe_client_map_shared_data(%p, \"%s\", %u)", handle, filename, size);
+
+    return ((ExposedCarlaPipeClient*)handle)->mapSharedData(filename, size);
+}
+
 bool carla_pipe_client_is_running(CarlaPipeClientHandle handle)
 {
     CARLA_SAFE_ASSERT_RETURN(handle != nullptr, false);
@@ -279,6 +533,7 @@ void carla_pipe_client_destroy(CarlaPipeClientHandle handle)
     carla_debug("carla_pipe_client_destroy(%p)", handle);
 
     ExposedCarlaPipeClient* const pipe = (ExposedCarlaPipeClient*)handle;
+    pipe->stopReader();
     pipe->closePipeClient();
     delete pipe;
 }
@@ -1000,6 +1000,14 @@ ENGINE_OPTION_WINE_SERVER_RT_PRIO = 32
 # Capture console output into debug callbacks
 ENGINE_OPTION_DEBUG_CONSOLE_OUTPUT = 33
 
+# Start all plugin bridges of a project at once, instead of waiting for each to finish loading.
+# Default is no, EXPERIMENTAL.
+ENGINE_OPTION_PARALLEL_PROJECT_LOAD = 34
+
+# Memory budget for plugins created ahead of time via carla_prewarm_plugin(), in MiB.
+# Default is 0, which disables the plugin pool, EXPERIMENTAL.
+ENGINE_OPTION_PLUGIN_POOL_MEMORY = 35
+
 # ------------------------------------------------------------------------------------------------------------
 # Engine Process Mode
 # Engine process mode.
@@ -1509,11 +1517,14 @@ class CarlaHostMeta(object):
         self.audioDriverForced = None
 
         # settings
+        self.asyncProjectLoad    = False
         self.experimental        = False
         self.exportLV2           = False
         self.forceStereo         = False
         self.manageUIs           = False
         self.maxParameters       = 0
+        self.parallelProjectLoad = False
+        self.pluginPoolMemory    = 0
         self.resetXruns          = False
         self.preferPluginBridges = False
         self.preferUIBridges     = False
@@ -1796,6 +1807,21 @@ class CarlaHostMeta(object):
     def switch_plugins(self, pluginIdA, pluginIdB):
         raise NotImplementedError
 
+    # Create a plugin ahead of time and keep it inactive in the plugin pool.
+    # A later add_plugin() call with the same arguments takes this instance instead of creating a new one,
+    # which also applies to replace_plugin().
+    # The pool is limited by ENGINE_OPTION_PLUGIN_POOL_MEMORY, least recently used instances are dropped first.
+    # Arguments are the same as in add_plugin(), extraPtr must be None.
+    # The plugin is created asynchronously, a true return value only means the request was queued.
+    @abstractmethod
+    def prewarm_plugin(self, btype, ptype, filename, name, label, uniqueId, extraPtr, options):
+        raise NotImplementedError
+
+    # Remove all plugins from the plugin pool.
+    @abstractmethod
+    def clear_plugin_pool(self):
+        raise NotImplementedError
+
     # Load a plugin state.
     # @param pluginId Plugin
     # @param filename Path to plugin state
@@ -2013,6 +2039,13 @@ class CarlaHostMeta(object):
     def get_output_peak_value(self, pluginId, isLeft):
         raise NotImplementedError
 
+    # Get the time it took to load a plugin, in milliseconds.
+    # For plugins loaded from a project this includes restoring their state.
+    # @param pluginId Plugin
+    @abstractmethod
+    def get_plugin_load_time(self, pluginId):
+        raise NotImplementedError
+
     # Render a plugin's inline display.
     # @param pluginId Plugin
     @abstractmethod
@@ -2373,6 +2406,12 @@ class CarlaHostNull(CarlaHostMeta):
     def switch_plugins(self, pluginIdA, pluginIdB):
         return False
 
+    def prewarm_plugin(self, btype, ptype, filename, name, label, uniqueId, extraPtr, options):
+        return False
+
+    def clear_plugin_pool(self):
+        return
+
     def load_plugin_state(self, pluginId, filename):
         return False
 
@@ -2463,6 +2502,9 @@ class CarlaHostNull(CarlaHostMeta):
     def get_output_peak_value(self, pluginId, isLeft):
         return 0.0
 
+    def get_plugin_load_time(self, pluginId):
+        return 0
+
     def render_inline_display(self, pluginId, width, height):
         return None
 
@@ -2554,325 +2596,151 @@ class CarlaHostNull(CarlaHostMeta):
         return
 
 # ------------------------------------------------------------------------------------------------------------
-# Carla Host object using a DLL
-
-class CarlaHostDLL(CarlaHostMeta):
-    def __init__(self, libName, loadGlobal):
-        CarlaHostMeta.__init__(self)
-
-        # info about this host object
-        self.isPlugin = False
-
-        self.lib = CDLL(libName, RTLD_GLOBAL if loadGlobal else RTLD_LOCAL)
-
-        self.lib.carla_get_engine_driver_count.argtypes = None
-        self.lib.carla_get_engine_driver_count.restype = c_uint
-
-        self.lib.carla_get_engine_driver_name.argtypes = (c_uint,)
-        self.lib.carla_get_engine_driver_name.restype = c_char_p
-
-        self.lib.carla_get_engine_driver_device_names.argtypes = (c_uint,)
-        self.lib.carla_get_engine_driver_device_names.restype = POINTER(c_char_p)
-
-        self.lib.carla_get_engine_driver_device_info.argtypes = (c_uint, c_char_p)
-        self.lib.carla_get_engine_driver_device_info.restype = POINTER(EngineDriverDeviceInfo)
-
-        self.lib.carla_show_engine_driver_device_control_panel.argtypes = (c_uint, c_char_p)
-        self.lib.carla_show_engine_driver_device_control_panel.restype = c_bool
-
-        self.lib.carla_standalone_host_init.argtypes = None
-        self.lib.carla_standalone_host_init.restype = c_void_p
-
-        self.lib.carla_engine_init.argtypes = (c_void_p, c_char_p, c_char_p)
-        self.lib.carla_engine_init.restype = c_bool
-
-        self.lib.carla_engine_close.argtypes = (c_void_p,)
-        self.lib.carla_engine_close.restype = c_bool
-
-        self.lib.carla_engine_idle.argtypes = (c_void_p,)
-        self.lib.carla_engine_idle.restype = None
-
-        self.lib.carla_is_engine_running.argtypes = (c_void_p,)
-        self.lib.carla_is_engine_running.restype = c_bool
-
-        self.lib.carla_get_runtime_engine_info.argtypes = (c_void_p,)
-        self.lib.carla_get_runtime_engine_info.restype = POINTER(CarlaRuntimeEngineInfo)
-
-        self.lib.carla_get_runtime_engine_driver_device_info.argtypes = (c_void_p,)
-        self.lib.carla_get_runtime_engine_driver_device_info.restype = POINTER(CarlaRuntimeEngineDriverDeviceInfo)
-
-        self.lib.carla_set_engine_buffer_size_and_sample_rate.argtypes = (c_void_p, c_uint, c_double)
-        self.lib.carla_set_engine_buffer_size_and_sample_rate.restype = c_bool
-
-        self.lib.carla_show_engine_device_control_panel.argtypes = (c_void_p,)
-        self.lib.carla_show_engine_device_control_panel.restype = c_bool
-
-        self.lib.carla_clear_engine_xruns.argtypes = (c_void_p,)
-        self.lib.carla_clear_engine_xruns.restype = None
-
-        self.lib.carla_cancel_engine_action.argtypes = (c_void_p,)
-        self.lib.carla_cancel_engine_action.restype = None
-
-        self.lib.carla_set_engine_about_to_close.argtypes = (c_void_p,)
-        self.lib.carla_set_engine_about_to_close.restype = c_bool
-
-        self.lib.carla_set_engine_callback.argtypes = (c_void_p, EngineCallbackFunc, c_void_p)
-        self.lib.carla_set_engine_callback.restype = None
-
-        self.lib.carla_set_engine_option.argtypes = (c_void_p, c_enum, c_int, c_char_p)
-        self.lib.carla_set_engine_option.restype = None
-
-        self.lib.carla_set_file_callback.argtypes = (c_void_p, FileCallbackFunc, c_void_p)
-        self.lib.carla_set_file_callback.restype = None
-
-        self.lib.carla_load_file.argtypes = (c_void_p, c_char_p)
-        self.lib.carla_load_file.restype = c_bool
-
-        self.lib.carla_load_project.argtypes = (c_void_p, c_char_p)
-        self.lib.carla_load_project.restype = c_bool
-
-        self.lib.carla_save_project.argtypes = (c_void_p, c_char_p)
-        self.lib.carla_save_project.restype = c_bool
-
-        self.lib.carla_clear_project_filename.argtypes = (c_void_p,)
-        self.lib.carla_clear_project_filename.restype = None
-
-        self.lib.carla_patchbay_connect.argtypes = (c_void_p, c_bool, c_uint, c_uint, c_uint, c_uint)
-        self.lib.carla_patchbay_connect.restype = c_bool
-
-        self.lib.carla_patchbay_disconnect.argtypes = (c_void_p, c_bool, c_uint)
-        self.lib.carla_patchbay_disconnect.restype = c_bool
-
-        self.lib.carla_patchbay_set_group_pos.argtypes = (c_void_p, c_bool, c_uint, c_int, c_int, c_int, c_int)
-        self.lib.carla_patchbay_set_group_pos.restype = c_bool
-
-        self.lib.carla_patchbay_refresh.argtypes = (c_void_p, c_bool)
-        self.lib.carla_patchbay_refresh.restype = c_bool
-
-        self.lib.carla_transport_play.argtypes = (c_void_p,)
-        self.lib.carla_transport_play.restype = None
-
-        self.lib.carla_transport_pause.argtypes = (c_void_p,)
-        self.lib.carla_transport_pause.restype = None
-
-        self.lib.carla_transport_bpm.argtypes = (c_void_p, c_double)
-        self.lib.carla_transport_bpm.restype = None
-
-        self.lib.carla_transport_relocate.argtypes = (c_void_p, c_uint64)
-        self.lib.carla_transport_relocate.restype = None
-
-        self.lib.carla_get_current_transport_frame.argtypes = (c_void_p,)
-        self.lib.carla_get_current_transport_frame.restype = c_uint64
-
-        self.lib.carla_get_transport_info.argtypes = (c_void_p,)
-        self.lib.carla_get_transport_info.restype = POINTER(CarlaTransportInfo)
-
-        self.lib.carla_get_current_plugin_count.argtypes = (c_void_p,)
-        self.lib.carla_get_current_plugin_count.restype = c_uint32
-
-        self.lib.carla_get_max_plugin_number.argtypes = (c_void_p,)
-        self.lib.carla_get_max_plugin_number.restype = c_uint32
-
-        self.lib.carla_add_plugin.argtypes = (c_void_p, c_enum, c_enum, c_char_p, c_char_p, c_char_p, c_int64, c_void_p, c_uint)
-        self.lib.carla_add_plugin.restype = c_bool
-
-        self.lib.carla_remove_plugin.argtypes = (c_void_p, c_uint)
-        self.lib.carla_remove_plugin.restype = c_bool
-
-        self.lib.carla_remove_all_plugins.argtypes = (c_void_p,)
-        self.lib.carla_remove_all_plugins.restype = c_bool
-
-        self.lib.carla_rename_plugin.argtypes = (c_void_p, c_uint, c_char_p)
-        self.lib.carla_rename_plugin.restype = c_bool
-
-        self.lib.carla_clone_plugin.argtypes = (c_void_p, c_uint)
-        self.lib.carla_clone_plugin.restype = c_bool
-
-        self.lib.carla_replace_plugin.argtypes = (c_void_p, c_uint)
-        self.lib.carla_replace_plugin.restype = c_bool
-
-        self.lib.carla_switch_plugins.argtypes = (c_void_p, c_uint, c_uint)
-        self.lib.carla_switch_plugins.restype = c_bool
+# Lazily bound DLL
 
-        self.lib.carla_load_plugin_state.argtypes = (c_void_p, c_uint, c_char_p)
-        self.lib.carla_load_plugin_state.restype = c_bool
-
-        self.lib.carla_save_plugin_state.argtypes = (c_void_p, c_uint, c_char_p)
-        self.lib.carla_save_plugin_state.restype = c_bool
-
-        self.lib.carla_export_plugin_lv2.argtypes = (c_void_p, c_uint, c_char_p)
-        self.lib.carla_export_plugin_lv2.restype = c_bool
-
-        self.lib.carla_get_plugin_info.argtypes = (c_void_p, c_uint)
-        self.lib.carla_get_plugin_info.restype = POINTER(CarlaPluginInfo)
-
-        self.lib.carla_get_audio_port_count_info.argtypes = (c_void_p, c_uint)
-        self.lib.carla_get_audio_port_count_info.restype = POINTER(CarlaPortCountInfo)
-
-        self.lib.carla_get_midi_port_count_info.argtypes = (c_void_p, c_uint)
-        self.lib.carla_get_midi_port_count_info.restype = POINTER(CarlaPortCountInfo)
-
-        self.lib.carla_get_parameter_count_info.argtypes = (c_void_p, c_uint)
-        self.lib.carla_get_parameter_count_info.restype = POINTER(CarlaPortCountInfo)
-
-        self.lib.carla_get_parameter_info.argtypes = (c_void_p, c_uint, c_uint32)
-        self.lib.carla_get_parameter_info.restype = POINTER(CarlaParameterInfo)
-
-        self.lib.carla_get_parameter_scalepoint_info.argtypes = (c_void_p, c_uint, c_uint32, c_uint32)
-        self.lib.carla_get_parameter_scalepoint_info.restype = POINTER(CarlaScalePointInfo)
-
-        self.lib.carla_get_parameter_data.argtypes = (c_void_p, c_uint, c_uint32)
-        self.lib.carla_get_parameter_data.restype = POINTER(ParameterData)
-
-        self.lib.carla_get_parameter_ranges.argtypes = (c_void_p, c_uint, c_uint32)
-        self.lib.carla_get_parameter_ranges.restype = POINTER(ParameterRanges)
-
-        self.lib.carla_get_midi_program_data.argtypes = (c_void_p, c_uint, c_uint32)
-        self.lib.carla_get_midi_program_data.restype = POINTER(MidiProgramData)
-
-        self.lib.carla_get_custom_data.argtypes = (c_void_p, c_uint, c_uint32)
-        self.lib.carla_get_custom_data.restype = POINTER(CustomData)
-
-        self.lib.carla_get_custom_data_value.argtypes = (c_void_p, c_uint, c_char_p, c_char_p)
-        self.lib.carla_get_custom_data_value.restype = c_char_p
-
-        self.lib.carla_get_chunk_data.argtypes = (c_void_p, c_uint)
-        self.lib.carla_get_chunk_data.restype = c_char_p
-
-        self.lib.carla_get_parameter_count.argtypes = (c_void_p, c_uint)
-        self.lib.carla_get_parameter_count.restype = c_uint32
-
-        self.lib.carla_get_program_count.argtypes = (c_void_p, c_uint)
-        self.lib.carla_get_program_count.restype = c_uint32
-
-        self.lib.carla_get_midi_program_count.argtypes = (c_void_p, c_uint)
-        self.lib.carla_get_midi_program_count.restype = c_uint32
-
-        self.lib.carla_get_custom_data_count.argtypes = (c_void_p, c_uint)
-        self.lib.carla_get_custom_data_count.restype = c_uint32
-
-        self.lib.carla_get_parameter_text.argtypes = (c_void_p, c_uint, c_uint32)
-        self.lib.carla_get_parameter_text.restype = c_char_p
-
-        self.lib.carla_get_program_name.argtypes = (c_void_p, c_uint, c_uint32)
-        self.lib.carla_get_program_name.restype = c_char_p
-
-        self.lib.carla_get_midi_program_name.argtypes = (c_void_p, c_uint, c_uint32)
-        self.lib.carla_get_midi_program_name.restype = c_char_p
-
-        self.lib.carla_get_real_plugin_name.argtypes = (c_void_p, c_uint)
-        self.lib.carla_get_real_plugin_name.restype = c_char_p
-
-        self.lib.carla_get_current_program_index.argtypes = (c_void_p, c_uint)
-        self.lib.carla_get_current_program_index.restype = c_int32
-
-        self.lib.carla_get_current_midi_program_index.argtypes = (c_void_p, c_uint)
-        self.lib.carla_get_current_midi_program_index.restype = c_int32
-
-        self.lib.carla_get_default_parameter_value.argtypes = (c_void_p, c_uint, c_uint32)
-        self.lib.carla_get_default_parameter_value.restype = c_float
-
-        self.lib.carla_get_current_parameter_value.argtypes = (c_void_p, c_uint, c_uint32)
-        self.lib.carla_get_current_parameter_value.restype = c_float
-
-        self.lib.carla_get_internal_parameter_value.argtypes = (c_void_p, c_uint, c_int32)
-        self.lib.carla_get_internal_parameter_value.restype = c_float
-
-        self.lib.carla_get_input_peak_value.argtypes = (c_void_p, c_uint, c_bool)
-        self.lib.carla_get_input_peak_value.restype = c_float
-
-        self.lib.carla_get_output_peak_value.argtypes = (c_void_p, c_uint, c_bool)
-        self.lib.carla_get_output_peak_value.restype = c_float
-
-        self.lib.carla_render_inline_display.argtypes = (c_void_p, c_uint, c_uint, c_uint)
-        self.lib.carla_render_inline_display.restype = POINTER(CarlaInlineDisplayImageSurface)
-
-        self.lib.carla_set_option.argtypes = (c_void_p, c_uint, c_uint, c_bool)
-        self.lib.carla_set_option.restype = None
-
-        self.lib.carla_set_active.argtypes = (c_void_p, c_uint, c_bool)
-        self.lib.carla_set_active.restype = None
-
-        self.lib.carla_set_drywet.argtypes = (c_void_p, c_uint, c_float)
-        self.lib.carla_set_drywet.restype = None
-
-        self.lib.carla_set_volume.argtypes = (c_void_p, c_uint, c_float)
-        self.lib.carla_set_volume.restype = None
-
-        self.lib.carla_set_balance_left.argtypes = (c_void_p, c_uint, c_float)
-        self.lib.carla_set_balance_left.restype = None
-
-        self.lib.carla_set_balance_right.argtypes = (c_void_p, c_uint, c_float)
-        self.lib.carla_set_balance_right.restype = None
-
-        self.lib.carla_set_panning.argtypes = (c_void_p, c_uint, c_float)
-        self.lib.carla_set_panning.restype = None
-
-        self.lib.carla_set_ctrl_channel.argtypes = (c_void_p, c_uint, c_int8)
-        self.lib.carla_set_ctrl_channel.restype = None
-
-        self.lib.carla_set_parameter_value.argtypes = (c_void_p, c_uint, c_uint32, c_float)
-        self.lib.carla_set_parameter_value.restype = None
-
-        self.lib.carla_set_parameter_midi_channel.argtypes = (c_void_p, c_uint, c_uint32, c_uint8)
-        self.lib.carla_set_parameter_midi_channel.restype = None
-
-        self.lib.carla_set_parameter_mapped_control_index.argtypes = (c_void_p, c_uint, c_uint32, c_int16)
-        self.lib.carla_set_parameter_mapped_control_index.restype = None
-
-        self.lib.carla_set_parameter_mapped_range.argtypes = (c_void_p, c_uint, c_uint32, c_float, c_float)
-        self.lib.carla_set_parameter_mapped_range.restype = None
-
-        self.lib.carla_set_parameter_touch.argtypes = (c_void_p, c_uint, c_uint32, c_bool)
-        self.lib.carla_set_parameter_touch.restype = None
-
-        self.lib.carla_set_program.argtypes = (c_void_p, c_uint, c_uint32)
-        self.lib.carla_set_program.restype = None
-
-        self.lib.carla_set_midi_program.argtypes = (c_void_p, c_uint, c_uint32)
-        self.lib.carla_set_midi_program.restype = None
-
-        self.lib.carla_set_custom_data.argtypes = (c_void_p, c_uint, c_char_p, c_char_p, c_char_p)
-        self.lib.carla_set_custom_data.restype = None
-
-        self.lib.carla_set_chunk_data.argtypes = (c_void_p, c_uint, c_char_p)
-        self.lib.carla_set_chunk_data.restype = None
-
-        self.lib.carla_prepare_for_save.argtypes = (c_void_p, c_uint)
-        self.lib.carla_prepare_for_save.restype = None
-
-        self.lib.carla_reset_parameters.argtypes = (c_void_p, c_uint)
-        self.lib.carla_reset_parameters.restype = None
-
-        self.lib.carla_randomize_parameters.argtypes = (c_void_p, c_uint)
-        self.lib.carla_randomize_parameters.restype = None
+# Wraps a ctypes library so that each function gets its argtypes/restype set on first use,
+# instead of looking up and setting up every single function when the library is loaded.
+# 'functions' maps function names to (argtypes, restype) tuples.
+class CarlaLazyLibrary(object):
+    def __init__(self, lib, functions):
+        object.__init__(self)
 
-        self.lib.carla_send_midi_note.argtypes = (c_void_p, c_uint, c_uint8, c_uint8, c_uint8)
-        self.lib.carla_send_midi_note.restype = None
+        self._lib = lib
+        self._functions = functions
 
-        self.lib.carla_show_custom_ui.argtypes = (c_void_p, c_uint, c_bool)
-        self.lib.carla_show_custom_ui.restype = None
+    def __getattr__(self, name):
+        func = getattr(self._lib, name)
 
-        self.lib.carla_get_buffer_size.argtypes = (c_void_p,)
-        self.lib.carla_get_buffer_size.restype = c_uint32
+        try:
+            func.argtypes, func.restype = self._functions[name]
+        except KeyError:
+            pass
 
-        self.lib.carla_get_sample_rate.argtypes = (c_void_p,)
-        self.lib.carla_get_sample_rate.restype = c_double
+        # keep it as a regular attribute, so we do not get here again
+        setattr(self, name, func)
+        return func
 
-        self.lib.carla_get_last_error.argtypes = (c_void_p,)
-        self.lib.carla_get_last_error.restype = c_char_p
+# ------------------------------------------------------------------------------------------------------------
+# Carla Host object using a DLL
 
-        self.lib.carla_get_host_osc_url_tcp.argtypes = (c_void_p,)
-        self.lib.carla_get_host_osc_url_tcp.restype = c_char_p
+CARLA_HOST_DLL_FUNCTIONS = {
+    # name: (argtypes, restype)
+    "carla_get_engine_driver_count": (None, c_uint),
+    "carla_get_engine_driver_name": ((c_uint,), c_char_p),
+    "carla_get_engine_driver_device_names": ((c_uint,), POINTER(c_char_p)),
+    "carla_get_engine_driver_device_info": ((c_uint, c_char_p), POINTER(EngineDriverDeviceInfo)),
+    "carla_show_engine_driver_device_control_panel": ((c_uint, c_char_p), c_bool),
+    "carla_standalone_host_init": (None, c_void_p),
+    "carla_engine_init": ((c_void_p, c_char_p, c_char_p), c_bool),
+    "carla_engine_close": ((c_void_p,), c_bool),
+    "carla_engine_idle": ((c_void_p,), None),
+    "carla_is_engine_running": ((c_void_p,), c_bool),
+    "carla_get_runtime_engine_info": ((c_void_p,), POINTER(CarlaRuntimeEngineInfo)),
+    "carla_get_runtime_engine_driver_device_info": ((c_void_p,), POINTER(CarlaRuntimeEngineDriverDeviceInfo)),
+    "carla_set_engine_buffer_size_and_sample_rate": ((c_void_p, c_uint, c_double), c_bool),
+    "carla_show_engine_device_control_panel": ((c_void_p,), c_bool),
+    "carla_clear_engine_xruns": ((c_void_p,), None),
+    "carla_cancel_engine_action": ((c_void_p,), None),
+    "carla_set_engine_about_to_close": ((c_void_p,), c_bool),
+    "carla_set_engine_callback": ((c_void_p, EngineCallbackFunc, c_void_p), None),
+    "carla_set_engine_option": ((c_void_p, c_enum, c_int, c_char_p), None),
+    "carla_set_file_callback": ((c_void_p, FileCallbackFunc, c_void_p), None),
+    "carla_load_file": ((c_void_p, c_char_p), c_bool),
+    "carla_load_project": ((c_void_p, c_char_p), c_bool),
+    "carla_save_project": ((c_void_p, c_char_p), c_bool),
+    "carla_clear_project_filename": ((c_void_p,), None),
+    "carla_patchbay_connect": ((c_void_p, c_bool, c_uint, c_uint, c_uint, c_uint), c_bool),
+    "carla_patchbay_disconnect": ((c_void_p, c_bool, c_uint), c_bool),
+    "carla_patchbay_set_group_pos": ((c_void_p, c_bool, c_uint, c_int, c_int, c_int, c_int), c_bool),
+    "carla_patchbay_refresh": ((c_void_p, c_bool), c_bool),
+    "carla_transport_play": ((c_void_p,), None),
+    "carla_transport_pause": ((c_void_p,), None),
+    "carla_transport_bpm": ((c_void_p, c_double), None),
+    "carla_transport_relocate": ((c_void_p, c_uint64), None),
+    "carla_get_current_transport_frame": ((c_void_p,), c_uint64),
+    "carla_get_transport_info": ((c_void_p,), POINTER(CarlaTransportInfo)),
+    "carla_get_current_plugin_count": ((c_void_p,), c_uint32),
+    "carla_get_max_plugin_number": ((c_void_p,), c_uint32),
+    "carla_add_plugin": ((c_void_p, c_enum, c_enum, c_char_p, c_char_p, c_char_p, c_int64, c_void_p, c_uint), c_bool),
+    "carla_remove_plugin": ((c_void_p, c_uint), c_bool),
+    "carla_remove_all_plugins": ((c_void_p,), c_bool),
+    "carla_rename_plugin": ((c_void_p, c_uint, c_char_p), c_bool),
+    "carla_clone_plugin": ((c_void_p, c_uint), c_bool),
+    "carla_replace_plugin": ((c_void_p, c_uint), c_bool),
+    "carla_switch_plugins": ((c_void_p, c_uint, c_uint), c_bool),
+    "carla_prewarm_plugin": ((c_void_p, c_enum, c_enum, c_char_p, c_char_p, c_char_p, c_int64, c_void_p, c_uint), c_bool),
+    "carla_clear_plugin_pool": ((c_void_p,), None),
+    "carla_load_plugin_state": ((c_void_p, c_uint, c_char_p), c_bool),
+    "carla_save_plugin_state": ((c_void_p, c_uint, c_char_p), c_bool),
+    "carla_export_plugin_lv2": ((c_void_p, c_uint, c_char_p), c_bool),
+    "carla_get_plugin_info": ((c_void_p, c_uint), POINTER(CarlaPluginInfo)),
+    "carla_get_audio_port_count_info": ((c_void_p, c_uint), POINTER(CarlaPortCountInfo)),
+    "carla_get_midi_port_count_info": ((c_void_p, c_uint), POINTER(CarlaPortCountInfo)),
+    "carla_get_parameter_count_info": ((c_void_p, c_uint), POINTER(CarlaPortCountInfo)),
+    "carla_get_parameter_info": ((c_void_p, c_uint, c_uint32), POINTER(CarlaParameterInfo)),
+    "carla_get_parameter_scalepoint_info": ((c_void_p, c_uint, c_uint32, c_uint32), POINTER(CarlaScalePointInfo)),
+    "carla_get_parameter_data": ((c_void_p, c_uint, c_uint32), POINTER(ParameterData)),
+    "carla_get_parameter_ranges": ((c_void_p, c_uint, c_uint32), POINTER(ParameterRanges)),
+    "carla_get_midi_program_data": ((c_void_p, c_uint, c_uint32), POINTER(MidiProgramData)),
+    "carla_get_custom_data": ((c_void_p, c_uint, c_uint32), POINTER(CustomData)),
+    "carla_get_custom_data_value": ((c_void_p, c_uint, c_char_p, c_char_p), c_char_p),
+    "carla_get_chunk_data": ((c_void_p, c_uint), c_char_p),
+    "carla_get_parameter_count": ((c_void_p, c_uint), c_uint32),
+    "carla_get_program_count": ((c_void_p, c_uint), c_uint32),
+    "carla_get_midi_program_count": ((c_void_p, c_uint), c_uint32),
+    "carla_get_custom_data_count": ((c_void_p, c_uint), c_uint32),
+    "carla_get_parameter_text": ((c_void_p, c_uint, c_uint32), c_char_p),
+    "carla_get_program_name": ((c_void_p, c_uint, c_uint32), c_char_p),
+    "carla_get_midi_program_name": ((c_void_p, c_uint, c_uint32), c_char_p),
+    "carla_get_real_plugin_name": ((c_void_p, c_uint), c_char_p),
+    "carla_get_current_program_index": ((c_void_p, c_uint), c_int32),
+    "carla_get_current_midi_program_index": ((c_void_p, c_uint), c_int32),
+    "carla_get_default_parameter_value": ((c_void_p, c_uint, c_uint32), c_float),
+    "carla_get_current_parameter_value": ((c_void_p, c_uint, c_uint32), c_float),
+    "carla_get_internal_parameter_value": ((c_void_p, c_uint, c_int32), c_float),
+    "carla_get_input_peak_value": ((c_void_p, c_uint, c_bool), c_float),
+    "carla_get_output_peak_value": ((c_void_p, c_uint, c_bool), c_float),
+    "carla_get_plugin_load_time": ((c_void_p, c_uint), c_uint32),
+    "carla_render_inline_display": ((c_void_p, c_uint, c_uint, c_uint), POINTER(CarlaInlineDisplayImageSurface)),
+    "carla_set_option": ((c_void_p, c_uint, c_uint, c_bool), None),
+    "carla_set_active": ((c_void_p, c_uint, c_bool), None),
+    "carla_set_drywet": ((c_void_p, c_uint, c_float), None),
+    "carla_set_volume": ((c_void_p, c_uint, c_float), None),
+    "carla_set_balance_left": ((c_void_p, c_uint, c_float), None),
+    "carla_set_balance_right": ((c_void_p, c_uint, c_float), None),
+    "carla_set_panning": ((c_void_p, c_uint, c_float), None),
+    "carla_set_ctrl_channel": ((c_void_p, c_uint, c_int8), None),
+    "carla_set_parameter_value": ((c_void_p, c_uint, c_uint32, c_float), None),
+    "carla_set_parameter_midi_channel": ((c_void_p, c_uint, c_uint32, c_uint8), None),
+    "carla_set_parameter_mapped_control_index": ((c_void_p, c_uint, c_uint32, c_int16), None),
+    "carla_set_parameter_mapped_range": ((c_void_p, c_uint, c_uint32, c_float, c_float), None),
+    "carla_set_parameter_touch": ((c_void_p, c_uint, c_uint32, c_bool), None),
+    "carla_set_program": ((c_void_p, c_uint, c_uint32), None),
+    "carla_set_midi_program": ((c_void_p, c_uint, c_uint32), None),
+    "carla_set_custom_data": ((c_void_p, c_uint, c_char_p, c_char_p, c_char_p), None),
+    "carla_set_chunk_data": ((c_void_p, c_uint, c_char_p), None),
+    "carla_prepare_for_save": ((c_void_p, c_uint), None),
+    "carla_reset_parameters": ((c_void_p, c_uint), None),
+    "carla_randomize_parameters": ((c_void_p, c_uint), None),
+    "carla_send_midi_note": ((c_void_p, c_uint, c_uint8, c_uint8, c_uint8), None),
+    "carla_show_custom_ui": ((c_void_p, c_uint, c_bool), None),
+    "carla_get_buffer_size": ((c_void_p,), c_uint32),
+    "carla_get_sample_rate": ((c_void_p,), c_double),
+    "carla_get_last_error": ((c_void_p,), c_char_p),
+    "carla_get_host_osc_url_tcp": ((c_void_p,), c_char_p),
+    "carla_get_host_osc_url_udp": ((c_void_p,), c_char_p),
+    "carla_nsm_init": ((c_void_p, c_uint64, c_char_p), c_bool),
+    "carla_nsm_ready": ((c_void_p, c_int), None),
+}
 
-        self.lib.carla_get_host_osc_url_udp.argtypes = (c_void_p,)
-        self.lib.carla_get_host_osc_url_udp.restype = c_char_p
+class CarlaHostDLL(CarlaHostMeta):
+    def __init__(self, libName, loadGlobal):
+        CarlaHostMeta.__init__(self)
 
-        self.lib.carla_nsm_init.argtypes = (c_void_p, c_uint64, c_char_p)
-        self.lib.carla_nsm_init.restype = c_bool
+        # info about this host object
+        self.isPlugin = False
 
-        self.lib.carla_nsm_ready.argtypes = (c_void_p, c_int)
-        self.lib.carla_nsm_ready.restype = None
+        self.lib = CarlaLazyLibrary(CDLL(libName, RTLD_GLOBAL if loadGlobal else RTLD_LOCAL), CARLA_HOST_DLL_FUNCTIONS)
 
         self.handle = self.lib.carla_standalone_host_init()
 
@@ -3011,6 +2879,17 @@ class CarlaHostDLL(CarlaHostMeta):
     def switch_plugins(self, pluginIdA, pluginIdB):
         return bool(self.lib.carla_switch_plugins(self.handle, pluginIdA, pluginIdB))
 
+    def prewarm_plugin(self, btype, ptype, filename, name, label, uniqueId, extraPtr, options):
+        cfilename = filename.encode("utf-8") if filename else None
+        cname     = name.encode("utf-8") if name else None
+        clabel    = label.encode("utf-8") if label else None
+        return bool(self.lib.carla_prewarm_plugin(self.handle,
+                                                  btype, ptype,
+                                                  cfilename, cname, clabel, uniqueId, cast(extraPtr, c_void_p), options))
+
+    def clear_plugin_pool(self):
+        self.lib.carla_clear_plugin_pool(self.handle)
+
     def load_plugin_state(self, pluginId, filename):
         return bool(self.lib.carla_load_plugin_state(self.handle, pluginId, filename.encode("utf-8")))
 
@@ -3101,6 +2980,9 @@ class CarlaHostDLL(CarlaHostMeta):
     def get_output_peak_value(self, pluginId, isLeft):
         return float(self.lib.carla_get_output_peak_value(self.handle, pluginId, isLeft))
 
+    def get_plugin_load_time(self, pluginId):
+        return int(self.lib.carla_get_plugin_load_time(self.handle, pluginId))
+
     def render_inline_display(self, pluginId, width, height):
         ptr = self.lib.carla_render_inline_display(self.handle, pluginId, width, height)
         if not ptr or not ptr.contents:
@@ -3408,6 +3290,12 @@ class CarlaHostPlugin(CarlaHostMeta):
             self._switchPlugins(pluginIdA, pluginIdB)
         return ret
 
+    def prewarm_plugin(self, btype, ptype, filename, name, label, uniqueId, extraPtr, options):
+        return False
+
+    def clear_plugin_pool(self):
+        return
+
     def load_plugin_state(self, pluginId, filename):
         return self.sendMsgAndSetError(["load_plugin_state", pluginId, filename])
 
@@ -3510,6 +3398,9 @@ class CarlaHostPlugin(CarlaHostMeta):
     def get_output_peak_value(self, pluginId, isLeft):
         return self.fPluginsInfo[pluginId].peaks[2 if isLeft else 3]
 
+    def get_plugin_load_time(self, pluginId):
+        return 0
+
     def render_inline_display(self, pluginId, width, height):
         return None
 
@@ -0,0 +1,779 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Carla Backend code (asyncio Web stuff)
+# Copyright (C) 2018 Filipe Coelho <falktx@falktx.com>
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as
+# published by the Free Software Foundation; either version 2 of
+# the License, or any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a full copy of the GNU General Public License see the doc/GPL.txt file.
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Imports (Global)
+
+import asyncio
+import json
+import aiohttp
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Imports (Custom)
+
+from carla_backend import *
+from carla_backend_web import CarlaWebStream
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Timeouts for REST requests, in seconds
+# some requests like engine_init and load_project can take quite a while
+
+kRequestTimeout = aiohttp.ClientTimeout(total=None, connect=2.0, sock_read=60.0)
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Websocket reconnection delays, in seconds (first attempt, max)
+# the delay is doubled after each failed attempt
+
+kSocketReconnectDelay = (0.1, 5.0)
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Carla Host object for connecting to the REST API backend, using asyncio.
+# Does not depend on Qt, meant for scripts that control one or more remote Carla instances.
+#
+# All CarlaHostMeta API calls are coroutines here, and several of them can run at the same time.
+# Requests to the same host share a pool of keep-alive connections, of up to 'maxConnections'.
+# Engine callbacks are received via websocket, and can be handled with set_engine_callback() or events().
+#
+# Usage example:
+#   async with CarlaHostAsyncWeb("studio-pc", 2228) as host:
+#       count = await host.get_current_plugin_count()
+#       infos = await asyncio.gather(*(host.get_plugin_info(i) for i in range(count)))
+#
+#       async for action, pluginId, value1, value2, value3, valueStr in host.events():
+#           ...
+
+class CarlaHostAsyncWeb(CarlaHostMeta, CarlaWebStream):
+    def __init__(self, host="localhost", port=2228, maxConnections=8):
+        CarlaHostMeta.__init__(self)
+        CarlaWebStream.__init__(self)
+
+        self.host = host
+        self.port = port
+        self.maxConnections = maxConnections
+
+        self.baseurl = "http://{}:{}".format(self.host, self.port)
+
+        self.isRemote  = True
+        self.isRunning = False
+
+        self.session = None
+        self.socket = None
+        self.streamTask = None
+        self.binaryProtocol = False
+
+        self.fEngineCallback = None
+        self.fFileCallback   = None
+
+        # queues of events() and subscribe() callers
+        self.subscribers = []
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, excType, excValue, traceback):
+        await self.disconnect()
+
+    # --------------------------------------------------------------------------------------------------------
+
+    # Connect to the REST server, must be called before anything else.
+    async def connect(self):
+        self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self.maxConnections),
+                                             timeout=kRequestTimeout)
+
+        await self.connect_socket()
+        await self.update_peaks_size()
+
+        self.isRunning  = True
+        self.streamTask = asyncio.ensure_future(self.stream_loop())
+
+    async def disconnect(self):
+        self.isRunning = False
+
+        if self.streamTask is not None:
+            self.streamTask.cancel()
+            try:
+                await self.streamTask
+            except asyncio.CancelledError:
+                pass
+            self.streamTask = None
+
+        if self.socket is not None:
+            await self.socket.close()
+            self.socket = None
+
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def connect_socket(self):
+        # ask for the binary protocol, servers without support for it reply with their regular welcome message
+        socket = await self.session.ws_connect("{}/ws?protocol=binary".format(self.baseurl))
+        message = await socket.receive()
+        self.binaryProtocol = message.type == aiohttp.WSMsgType.TEXT and message.data == "Protocol: binary"
+        self.socket = socket
+
+    async def stream_loop(self):
+        reconnectDelay = kSocketReconnectDelay[0]
+
+        while True:
+            try:
+                if self.socket is None:
+                    await self.connect_socket()
+                    reconnectDelay = kSocketReconnectDelay[0]
+
+                    # messages might have been missed while disconnected
+                    self.parameterValues.clear()
+                    await self.update_peaks_size()
+
+                message = await self.socket.receive()
+
+                if message.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                    self.handle_stream_message(message.data)
+                    continue
+
+                # anything else means the connection is gone
+                raise ConnectionResetError
+
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError):
+                if self.socket is not None:
+                    await self.socket.close()
+                    self.socket = None
+
+                await asyncio.sleep(reconnectDelay)
+                reconnectDelay = min(reconnectDelay * 2, kSocketReconnectDelay[1])
+
+    async def update_peaks_size(self):
+        try:
+            self.resize_peaks(await self.get_max_plugin_number())
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            pass
+
+    def handle_engine_callback(self, action, pluginId, value1, value2, value3, valueStr):
+        self.update_parameter_values(action, pluginId, value1, value3)
+
+        # maximum number of plugins depends on the process mode
+        if action in (ENGINE_CALLBACK_ENGINE_STARTED, ENGINE_CALLBACK_PROCESS_MODE_CHANGED):
+            asyncio.ensure_future(self.update_peaks_size())
+
+        if self.fEngineCallback is not None:
+            self.fEngineCallback(None, action, pluginId, value1, value2, value3, valueStr)
+
+        event = (action, pluginId, value1, value2, value3, valueStr)
+
+        for queue in self.subscribers:
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                pass
+
+    # --------------------------------------------------------------------------------------------------------
+
+    # Get a queue that receives all engine callbacks, as (action, pluginId, value1, value2, value3, valueStr).
+    # If 'maxsize' is set, events are dropped while the queue is full.
+    def subscribe(self, maxsize=0):
+        queue = asyncio.Queue(maxsize)
+        self.subscribers.append(queue)
+        return queue
+
+    def unsubscribe(self, queue):
+        self.subscribers.remove(queue)
+
+    # Iterate over engine callbacks as they arrive.
+    async def events(self, maxsize=0):
+        queue = self.subscribe(maxsize)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self.unsubscribe(queue)
+
+    # --------------------------------------------------------------------------------------------------------
+
+    async def request(self, name, params=None):
+        async with self.session.get("{}/{}".format(self.baseurl, name), params=params) as response:
+            response.raise_for_status()
+            return await response.text()
+
+    async def request_bool(self, name, params=None):
+        return bool(int(await self.request(name, params)))
+
+    async def request_int(self, name, params=None):
+        return int(await self.request(name, params))
+
+    async def request_float(self, name, params=None):
+        return float(await self.request(name, params))
+
+    async def request_json(self, name, params=None):
+        return json.loads(await self.request(name, params))
+
+    # --------------------------------------------------------------------------------------------------------
+
+    async def get_engine_driver_count(self):
+        return await self.request_int("get_engine_driver_count")
+
+    async def get_engine_driver_name(self, index):
+        return await self.request("get_engine_driver_name", {
+            'index': index,
+        })
+
+    async def get_engine_driver_device_names(self, index):
+        return (await self.request("get_engine_driver_device_names", {
+            'index': index,
+        })).split("\n")
+
+    async def get_engine_driver_device_info(self, index, name):
+        return await self.request_json("get_engine_driver_device_info", {
+            'index': index,
+            'name': name,
+        })
+
+    async def show_engine_driver_device_control_panel(self, index, name):
+        return False
+
+    async def engine_init(self, driverName, clientName):
+        return await self.request_bool("engine_init", {
+            'driverName': driverName,
+            'clientName': clientName,
+        })
+
+    async def engine_close(self):
+        return await self.request_bool("engine_close")
+
+    async def engine_idle(self):
+        # the server idles the engine by itself, and messages are received in the background
+        return
+
+    async def is_engine_running(self):
+        if not self.isRunning:
+            return False
+
+        return await self.request_bool("is_engine_running")
+
+    async def get_runtime_engine_info(self):
+        return PyCarlaRuntimeEngineInfo
+
+    async def get_runtime_engine_driver_device_info(self):
+        return PyCarlaRuntimeEngineDriverDeviceInfo
+
+    async def set_engine_buffer_size_and_sample_rate(self, bufferSize, sampleRate):
+        return False
+
+    async def show_engine_device_control_panel(self):
+        return False
+
+    async def clear_engine_xruns(self):
+        return
+
+    async def cancel_engine_action(self):
+        return
+
+    async def set_engine_about_to_close(self):
+        return await self.request_bool("set_engine_about_to_close")
+
+    def set_engine_callback(self, func):
+        self.fEngineCallback = func
+
+    async def set_engine_option(self, option, value, valueStr):
+        await self.request("set_engine_option", {
+            'option': option,
+            'value': value,
+            'valueStr': valueStr,
+        })
+
+    def set_file_callback(self, func):
+        self.fFileCallback = func
+
+    async def load_file(self, filename):
+        return await self.request_bool("load_file", {
+            'filename': filename,
+        })
+
+    async def load_project(self, filename):
+        return await self.request_bool("load_project", {
+            'filename': filename,
+        })
+
+    async def save_project(self, filename):
+        return await self.request_bool("save_project", {
+            'filename': filename,
+        })
+
+    async def clear_project_filename(self):
+        return
+
+    async def patchbay_connect(self, external, groupIdA, portIdA, groupIdB, portIdB):
+        return await self.request_bool("patchbay_connect", {
+            'groupIdA': groupIdA,
+            'portIdA': portIdA,
+            'groupIdB': groupIdB,
+            'portIdB': portIdB,
+        })
+
+    async def patchbay_disconnect(self, external, connectionId):
+        return await self.request_bool("patchbay_disconnect", {
+            'connectionId': connectionId,
+        })
+
+    async def patchbay_set_group_pos(self, external, groupId, x1, y1, x2, y2):
+        return False
+
+    async def patchbay_refresh(self, external):
+        return await self.request_bool("patchbay_refresh", {
+            'external': int(external),
+        })
+
+    async def transport_play(self):
+        await self.request("transport_play")
+
+    async def transport_pause(self):
+        await self.request("transport_pause")
+
+    async def transport_bpm(self, bpm):
+        await self.request("transport_bpm", {
+            'bpm': bpm,
+        })
+
+    async def transport_relocate(self, frame):
+        await self.request("transport_relocate", {
+            'frame': frame,
+        })
+
+    async def get_current_transport_frame(self):
+        return await self.request_int("get_current_transport_frame")
+
+    async def get_transport_info(self):
+        return await self.request_json("get_transport_info")
+
+    async def get_current_plugin_count(self):
+        return await self.request_int("get_current_plugin_count")
+
+    async def get_max_plugin_number(self):
+        return await self.request_int("get_max_plugin_number")
+
+    async def add_plugin(self, btype, ptype, filename, name, label, uniqueId, extraPtr, options):
+        return await self.request_bool("add_plugin", {
+            'btype': btype,
+            'ptype': ptype,
+            'filename': filename or "",
+            'name': name or "",
+            'label': label or "",
+            'uniqueId': uniqueId,
+            'options': options,
+        })
+
+    async def remove_plugin(self, pluginId):
+        return await self.request_bool("remove_plugin", {
+            'pluginId': pluginId,
+        })
+
+    async def remove_all_plugins(self):
+        self.parameterValues.clear()
+        return await self.request_bool("remove_all_plugins")
+
+    async def rename_plugin(self, pluginId, newName):
+        return await self.request("rename_plugin", {
+            'pluginId': pluginId,
+            'newName': newName,
+        })
+
+    async def clone_plugin(self, pluginId):
+        return await self.request_bool("clone_plugin", {
+            'pluginId': pluginId,
+        })
+
+    async def replace_plugin(self, pluginId):
+        self.parameterValues.pop(pluginId, None)
+        return await self.request_bool("replace_plugin", {
+            'pluginId': pluginId,
+        })
+
+    async def switch_plugins(self, pluginIdA, pluginIdB):
+        ok = await self.request_bool("switch_plugins", {
+            'pluginIdA': pluginIdA,
+            'pluginIdB': pluginIdB,
+        })
+
+        # the engine does not send a callback for this
+        if ok:
+            valuesA = self.parameterValues.pop(pluginIdA, None)
+            valuesB = self.parameterValues.pop(pluginIdB, None)
+            if valuesA is not None:
+                self.parameterValues[pluginIdB] = valuesA
+            if valuesB is not None:
+                self.parameterValues[pluginIdA] = valuesB
+
+        return ok
+
+    async def prewarm_plugin(self, btype, ptype, filename, name, label, uniqueId, extraPtr, options):
+        return False
+
+    async def clear_plugin_pool(self):
+        return
+
+    async def load_plugin_state(self, pluginId, filename):
+        self.parameterValues.pop(pluginId, None)
+        return await self.request_bool("load_plugin_state", {
+            'pluginId': pluginId,
+            'filename': filename,
+        })
+
+    async def save_plugin_state(self, pluginId, filename):
+        return await self.request_bool("save_plugin_state", {
+            'pluginId': pluginId,
+            'filename': filename,
+        })
+
+    async def export_plugin_lv2(self, pluginId, lv2path):
+        return await self.request_bool("export_plugin_lv2", {
+            'pluginId': pluginId,
+            'lv2path': lv2path,
+        })
+
+    async def get_plugin_info(self, pluginId):
+        return await self.request_json("get_plugin_info", {
+            'pluginId': pluginId,
+        })
+
+    async def get_audio_port_count_info(self, pluginId):
+        return await self.request_json("get_audio_port_count_info", {
+            'pluginId': pluginId,
+        })
+
+    async def get_midi_port_count_info(self, pluginId):
+        return await self.request_json("get_midi_port_count_info", {
+            'pluginId': pluginId,
+        })
+
+    async def get_parameter_count_info(self, pluginId):
+        return await self.request_json("get_parameter_count_info", {
+            'pluginId': pluginId,
+        })
+
+    async def get_parameter_info(self, pluginId, parameterId):
+        return await self.request_json("get_parameter_info", {
+            'pluginId': pluginId,
+            'parameterId': parameterId,
+        })
+
+    async def get_parameter_scalepoint_info(self, pluginId, parameterId, scalePointId):
+        return await self.request_json("get_parameter_scalepoint_info", {
+            'pluginId': pluginId,
+            'parameterId': parameterId,
+            'scalePointId': scalePointId,
+        })
+
+    async def get_parameter_data(self, pluginId, parameterId):
+        return await self.request_json("get_parameter_data", {
+            'pluginId': pluginId,
+            'parameterId': parameterId,
+        })
+
+    async def get_parameter_ranges(self, pluginId, parameterId):
+        return await self.request_json("get_parameter_ranges", {
+            'pluginId': pluginId,
+            'parameterId': parameterId,
+        })
+
+    async def get_midi_program_data(self, pluginId, midiProgramId):
+        return await self.request_json("get_midi_program_data", {
+            'pluginId': pluginId,
+            'midiProgramId': midiProgramId,
+        })
+
+    async def get_custom_data(self, pluginId, customDataId):
+        return await self.request_json("get_custom_data", {
+            'pluginId': pluginId,
+            'customDataId': customDataId,
+        })
+
+    async def get_custom_data_value(self, pluginId, type_, key):
+        return await self.request("get_custom_data_value", {
+            'pluginId': pluginId,
+            'type': type_,
+            'key': key,
+        })
+
+    async def get_chunk_data(self, pluginId):
+        return await self.request("get_chunk_data", {
+            'pluginId': pluginId,
+        })
+
+    async def get_parameter_count(self, pluginId):
+        return await self.request_int("get_parameter_count", {
+            'pluginId': pluginId,
+        })
+
+    async def get_program_count(self, pluginId):
+        return await self.request_int("get_program_count", {
+            'pluginId': pluginId,
+        })
+
+    async def get_midi_program_count(self, pluginId):
+        return await self.request_int("get_midi_program_count", {
+            'pluginId': pluginId,
+        })
+
+    async def get_custom_data_count(self, pluginId):
+        return await self.request_int("get_custom_data_count", {
+            'pluginId': pluginId,
+        })
+
+    async def get_parameter_text(self, pluginId, parameterId):
+        return await self.request("get_parameter_text", {
+            'pluginId': pluginId,
+            'parameterId': parameterId,
+        })
+
+    async def get_program_name(self, pluginId, programId):
+        return await self.request("get_program_name", {
+            'pluginId': pluginId,
+            'programId': programId,
+        })
+
+    async def get_midi_program_name(self, pluginId, midiProgramId):
+        return await self.request("get_midi_program_name", {
+            'pluginId': pluginId,
+            'midiProgramId': midiProgramId,
+        })
+
+    async def get_real_plugin_name(self, pluginId):
+        return await self.request("get_real_plugin_name", {
+            'pluginId': pluginId,
+        })
+
+    async def get_current_program_index(self, pluginId):
+        return await self.request_int("get_current_program_index", {
+            'pluginId': pluginId,
+        })
+
+    async def get_current_midi_program_index(self, pluginId):
+        return await self.request_int("get_current_midi_program_index", {
+            'pluginId': pluginId,
+        })
+
+    async def get_default_parameter_value(self, pluginId, parameterId):
+        return await self.request_float("get_default_parameter_value", {
+            'pluginId': pluginId,
+            'parameterId': parameterId,
+        })
+
+    async def get_current_parameter_value(self, pluginId, parameterId):
+        try:
+            return self.parameterValues[pluginId][parameterId]
+        except KeyError:
+            pass
+
+        # only needed the first time, after that the server sends us any changes
+        value = await self.request_float("get_current_parameter_value", {
+            'pluginId': pluginId,
+            'parameterId': parameterId,
+        })
+        self.parameterValues.setdefault(pluginId, {})[parameterId] = value
+        return value
+
+    async def get_internal_parameter_value(self, pluginId, parameterId):
+        return await self.request_float("get_internal_parameter_value", {
+            'pluginId': pluginId,
+            'parameterId': parameterId,
+        })
+
+    async def get_input_peak_value(self, pluginId, isLeft):
+        if pluginId >= len(self.peaks):
+            return 0.0
+        return self.peaks[pluginId][0 if isLeft else 1]
+
+    async def get_output_peak_value(self, pluginId, isLeft):
+        if pluginId >= len(self.peaks):
+            return 0.0
+        return self.peaks[pluginId][2 if isLeft else 3]
+
+    async def get_plugin_load_time(self, pluginId):
+        return 0
+
+    async def render_inline_display(self, pluginId, width, height):
+        return None
+
+    async def set_option(self, pluginId, option, yesNo):
+        await self.request("set_option", {
+            'pluginId': pluginId,
+            'option': option,
+            'yesNo': int(yesNo),
+        })
+
+    async def set_active(self, pluginId, onOff):
+        await self.request("set_active", {
+            'pluginId': pluginId,
+            'onOff': int(onOff),
+        })
+
+    async def set_drywet(self, pluginId, value):
+        await self.request("set_drywet", {
+            'pluginId': pluginId,
+            'value': value,
+        })
+
+    async def set_volume(self, pluginId, value):
+        await self.request("set_volume", {
+            'pluginId': pluginId,
+            'value': value,
+        })
+
+    async def set_balance_left(self, pluginId, value):
+        await self.request("set_balance_left", {
+            'pluginId': pluginId,
+            'value': value,
+        })
+
+    async def set_balance_right(self, pluginId, value):
+        await self.request("set_balance_right", {
+            'pluginId': pluginId,
+            'value': value,
+        })
+
+    async def set_panning(self, pluginId, value):
+        await self.request("set_panning", {
+            'pluginId': pluginId,
+            'value': value,
+        })
+
+    async def set_ctrl_channel(self, pluginId, channel):
+        await self.request("set_ctrl_channel", {
+            'pluginId': pluginId,
+            'channel': channel,
+        })
+
+    async def set_parameter_value(self, pluginId, parameterId, value):
+        # the engine does not send a callback back to us for this
+        self.parameterValues.setdefault(pluginId, {})[parameterId] = value
+        await self.request("set_parameter_value", {
+            'pluginId': pluginId,
+            'parameterId': parameterId,
+            'value': value,
+        })
+
+    async def set_parameter_midi_channel(self, pluginId, parameterId, channel):
+        await self.request("set_parameter_midi_channel", {
+            'pluginId': pluginId,
+            'parameterId': parameterId,
+            'channel': channel,
+        })
+
+    async def set_parameter_midi_cc(self, pluginId, parameterId, cc):
+        await self.request("set_parameter_midi_cc", {
+            'pluginId': pluginId,
+            'parameterId': parameterId,
+            'cc': cc,
+        })
+
+    async def set_parameter_mapped_control_index(self, pluginId, parameterId, index):
+        return
+
+    async def set_parameter_mapped_range(self, pluginId, parameterId, minimum, maximum):
+        return
+
+    async def set_parameter_touch(self, pluginId, parameterId, touch):
+        return
+
+    async def set_program(self, pluginId, programId):
+        self.parameterValues.pop(pluginId, None)
+        await self.request("set_program", {
+            'pluginId': pluginId,
+            'programId': programId,
+        })
+
+    async def set_midi_program(self, pluginId, midiProgramId):
+        self.parameterValues.pop(pluginId, None)
+        await self.request("set_midi_program", {
+            'pluginId': pluginId,
+            'midiProgramId': midiProgramId,
+        })
+
+    async def set_custom_data(self, pluginId, type_, key, value):
+        await self.request("set_custom_data", {
+            'pluginId': pluginId,
+            'type': type_,
+            'key': key,
+            'value': value,
+        })
+
+    async def set_chunk_data(self, pluginId, chunkData):
+        self.parameterValues.pop(pluginId, None)
+        await self.request("set_chunk_data", {
+            'pluginId': pluginId,
+            'chunkData': chunkData,
+        })
+
+    async def prepare_for_save(self, pluginId):
+        await self.request("prepare_for_save", {
+            'pluginId': pluginId,
+        })
+
+    async def reset_parameters(self, pluginId):
+        self.parameterValues.pop(pluginId, None)
+        await self.request("reset_parameters", {
+            'pluginId': pluginId,
+        })
+
+    async def randomize_parameters(self, pluginId):
+        self.parameterValues.pop(pluginId, None)
+        await self.request("randomize_parameters", {
+            'pluginId': pluginId,
+        })
+
+    async def send_midi_note(self, pluginId, channel, note, velocity):
+        await self.request("send_midi_note", {
+            'pluginId': pluginId,
+            'channel': channel,
+            'note': note,
+            'velocity': velocity,
+        })
+
+    async def show_custom_ui(self, pluginId, yesNo):
+        return
+
+    async def get_buffer_size(self):
+        return await self.request_int("get_buffer_size")
+
+    async def get_sample_rate(self):
+        return await self.request_float("get_sample_rate")
+
+    async def get_last_error(self):
+        return await self.request("get_last_error")
+
+    async def get_host_osc_url_tcp(self):
+        return await self.request("get_host_osc_url_tcp")
+
+    async def get_host_osc_url_udp(self):
+        return await self.request("get_host_osc_url_udp")
+
+    async def nsm_init(self, pid, executableName):
+        return False
+
+    async def nsm_ready(self, opcode):
+        return
+
+    # --------------------------------------------------------------------------------------------------------
+
+    # Set how often the server sends the values of output parameters, in Hz (0 to disable).
+    async def set_output_parameter_rate(self, rate):
+        await self.request("set_output_parameter_rate", {
+            'rate': rate,
+        })
+
+# ---------------------------------------------------------------------------------------------------------------------
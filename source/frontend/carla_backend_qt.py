@@ -19,6 +19,8 @@
 # ------------------------------------------------------------------------------------------------------------
 # Imports (Global)
 
+from threading import Lock
+
 from PyQt5.QtCore import pyqtSignal, QObject
 
 # ------------------------------------------------------------------------------------------------------------
@@ -37,6 +39,7 @@ class CarlaHostSignals(QObject):
     PluginRenamedCallback = pyqtSignal(int, str)
     PluginUnavailableCallback = pyqtSignal(int, str)
     ParameterValueChangedCallback = pyqtSignal(int, int, float)
+    ParameterValuesChangedCallback = pyqtSignal(list)
     ParameterDefaultChangedCallback = pyqtSignal(int, int, float)
     ParameterMappedControlIndexChangedCallback = pyqtSignal(int, int, int)
     ParameterMappedRangeChangedCallback = pyqtSignal(int, int, float, float)
@@ -79,6 +82,49 @@ class CarlaHostSignals(QObject):
     QuitCallback = pyqtSignal()
     InlineDisplayRedrawCallback = pyqtSignal(int)
 
+    def __init__(self):
+        QObject.__init__(self)
+
+        # latest parameter value per (pluginId, parameterId) since the last flush
+        # engine callbacks can queue from a non-GUI thread (e.g. while loading a project)
+        self.fPendingParameterLock   = Lock()
+        self.fPendingParameterValues = {}
+        self.fCoalescedEventCount    = 0
+
+    # --------------------------------------------------------------------------------------------------------
+    # Parameter value coalescing
+
+    # Queue a parameter value change, replacing any older value for the same parameter
+    def queueParameterValueChanged(self, pluginId, parameterId, value):
+        key = (pluginId, parameterId)
+
+        with self.fPendingParameterLock:
+            if key in self.fPendingParameterValues:
+                self.fCoalescedEventCount += 1
+
+            self.fPendingParameterValues[key] = value
+
+    # Deliver all queued parameter value changes as a single batch
+    def flushParameterValueChanges(self):
+        with self.fPendingParameterLock:
+            if not self.fPendingParameterValues:
+                return
+
+            pending, self.fPendingParameterValues = self.fPendingParameterValues, {}
+
+        values = [(pluginId, parameterId, value) for (pluginId, parameterId), value in pending.items()]
+
+        self.ParameterValuesChangedCallback.emit(values)
+
+        # keep per-value signal working for anyone still listening to it
+        if self.receivers(self.ParameterValueChangedCallback) > 0:
+            for pluginId, parameterId, value in values:
+                self.ParameterValueChangedCallback.emit(pluginId, parameterId, value)
+
+    # Number of parameter value events dropped in favour of a newer value
+    def getCoalescedEventCount(self):
+        return self.fCoalescedEventCount
+
 # ------------------------------------------------------------------------------------------------------------
 # Carla Host object (dummy/null, does nothing)
 
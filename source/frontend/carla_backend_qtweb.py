@@ -19,151 +19,561 @@
 # ---------------------------------------------------------------------------------------------------------------------
 # Imports (Global)
 
+import json
 import requests
-from websocket import WebSocket, WebSocketConnectionClosedException
+from collections import deque
+from threading import Event, Thread
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlencode
+from urllib3.util.retry import Retry
+from websocket import WebSocket, WebSocketException, WebSocketTimeoutException
 
 # ---------------------------------------------------------------------------------------------------------------------
 # Imports (Custom)
 
 from carla_backend_qt import *
+from carla_backend_web import CarlaWebStream
 
 import os
-from time import sleep
+from time import perf_counter
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Timeouts for REST requests, in seconds (connect, read)
+
+kRequestTimeout = (2.0, 60.0)
+
+# requests that can take as long as the server needs, like loading a big project
+kLongRequests = {
+    "engine_init",
+    "engine_close",
+    "load_file",
+    "load_project",
+    "save_project",
+}
+
+kLongRequestTimeout = (2.0, None)
+
+# set to a non-empty value to print the latency of all REST requests when the engine is closed
+kPrintRequestStats = bool(os.environ.get("CARLA_REST_STATS", ""))
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Websocket reconnection delays, in seconds (first attempt, max)
+# the delay is doubled after each failed attempt
+
+kSocketReconnectDelay = (0.1, 5.0)
+
+# queued by the socket thread after reconnecting, as messages might have been missed meanwhile
+kSocketReconnected = object()
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Plugin requests with results that only change together with an engine callback (or our own changes).
+# These are cached per plugin, see CarlaHostQtWeb.invalidate_plugin_cache()
+
+kCachedRequests = {
+    "get_plugin_info",
+    "get_real_plugin_name",
+    "get_audio_port_count_info",
+    "get_midi_port_count_info",
+    "get_parameter_count_info",
+    "get_parameter_count",
+    "get_program_count",
+    "get_midi_program_count",
+    "get_parameter_info",
+    "get_parameter_scalepoint_info",
+    "get_parameter_data",
+    "get_parameter_ranges",
+    "get_default_parameter_value",
+    "get_program_name",
+    "get_midi_program_name",
+    "get_midi_program_data",
+}
+
+# Kept in the plugin cache after get_parameter_count(), with the number of parameters to prefetch on first use.
+# Stored there so it is dropped together with the rest of the cached plugin data.
+kPendingParameterPrefetch = ("pending_parameter_prefetch",)
 
 # ---------------------------------------------------------------------------------------------------------------------
 # Carla Host object for connecting to the REST API backend
 
-class CarlaHostQtWeb(CarlaHostQtNull):
+class CarlaHostQtWeb(CarlaHostQtNull, CarlaWebStream):
     def __init__(self):
         CarlaHostQtNull.__init__(self)
+        CarlaWebStream.__init__(self)
 
         self.host = "localhost"
         self.port = 2228
 
         self.baseurl = "http://{}:{}".format(self.host, self.port)
-
-        self.socket = WebSocket()
-        self.socket.connect("ws://{}:{}/ws".format(self.host, self.port), timeout=1)
+        self.urls = {}
+
+        # one persistent session, so connections are kept alive and reused between requests.
+        # only failed connection attempts are retried, as most requests are not idempotent.
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=1,
+                                                  pool_maxsize=4,
+                                                  max_retries=Retry(total=3,
+                                                                    connect=3,
+                                                                    read=0,
+                                                                    status=0,
+                                                                    redirect=0,
+                                                                    backoff_factor=0.1)))
+
+        # request name -> [count, total time, max time], times in seconds
+        self.requestStats = {}
+
+        # results of batch requests, waiting to be used by the regular getters.
+        # (request name, *param values) -> result text, cleared on every engine_idle()
+        self.batchSupported = True
+        self.prefetched = {}
+
+        # pluginId -> {(request name, *param values except pluginId) -> result text}
+        self.pluginCache = {}
 
         self.isRemote = True
         self.isRunning = True
-        self.peaks = []
 
-        for i in range(99):
-            self.peaks.append((0.0, 0.0, 0.0, 0.0))
+        # websocket messages are received in a separate thread, and handled during engine_idle().
+        # deque append and popleft are atomic, so no extra locking is needed.
+        self.socket = None
+        self.socketQueue = deque()
+        self.socketStop = Event()
+        self.socketThread = None
+        self.connect_socket()
+        self.start_socket_thread()
+
+        self.update_peaks_size()
+
+    # --------------------------------------------------------------------------------------------------------
+
+    def request(self, name, params=None, data=None):
+        try:
+            url = self.urls[name]
+        except KeyError:
+            url = self.urls[name] = "{}/{}".format(self.baseurl, name)
+
+        timeout = kLongRequestTimeout if name in kLongRequests else kRequestTimeout
+        start   = perf_counter()
+
+        try:
+            if data is not None:
+                return self.session.post(url, data=data, timeout=timeout)
+            return self.session.get(url, params=params, timeout=timeout)
+
+        finally:
+            elapsed = perf_counter() - start
+
+            try:
+                stats = self.requestStats[name]
+            except KeyError:
+                self.requestStats[name] = [1, elapsed, elapsed]
+            else:
+                stats[0] += 1
+                stats[1] += elapsed
+                if elapsed > stats[2]:
+                    stats[2] = elapsed
+
+    # Run several requests in a single round-trip.
+    # 'calls' is a list of (name, params) tuples, the result is a list of response texts in the same order.
+    # Failed calls have None as result.
+    def request_batch(self, calls):
+        lines = []
+
+        for name, params in calls:
+            lines.append("{}?{}".format(name, urlencode(params)) if params else name)
+
+        response = self.request("batch", data="\n".join(lines).encode("utf-8"))
+        response.raise_for_status()
+
+        content = response.content
+        results = []
+        offset  = 0
+
+        while offset < len(content):
+            newline = content.index(b"\n", offset)
+            status, size = content[offset:newline].split(b" ", 1)
+
+            start  = newline + 1
+            offset = start + int(size)
+
+            if int(status) == 200:
+                results.append(content[start:offset].decode("utf-8", errors="ignore"))
+            else:
+                results.append(None)
+
+        return results
+
+    # Request several calls at once, so the regular getters can use their results without another round-trip.
+    def prefetch(self, calls):
+        calls = [(name, params) for name, params in calls if self.get_cached(name, params) is None]
+
+        if not self.batchSupported or len(calls) == 0:
+            return
+
+        try:
+            results = self.request_batch(calls)
+        except requests.exceptions.HTTPError:
+            # server without batch support
+            self.batchSupported = False
+            return
+        except (requests.exceptions.RequestException, ValueError):
+            return
+
+        for (name, params), result in zip(calls, results):
+            if result is None:
+                continue
+            if name in kCachedRequests:
+                self.pluginCache.setdefault(params['pluginId'], {})[self.get_cache_key(name, params)] = result
+            else:
+                self.prefetched[(name,) + tuple(params.values())] = result
+
+    def get_cache_key(self, name, params):
+        return (name,) + tuple(value for key, value in params.items() if key != 'pluginId')
+
+    # Get the result of a request if already known, otherwise None.
+    def get_cached(self, name, params):
+        if name in kCachedRequests:
+            try:
+                return self.pluginCache[params['pluginId']][self.get_cache_key(name, params)]
+            except KeyError:
+                return None
+
+        return self.prefetched.get((name,) + tuple(params.values()))
+
+    # Get the result of a request, from the plugin cache or a previous prefetch() if possible.
+    def cached_request(self, name, params):
+        if name in kCachedRequests:
+            cache = self.pluginCache.setdefault(params['pluginId'], {})
+            key   = self.get_cache_key(name, params)
+
+            try:
+                return cache[key]
+            except KeyError:
+                pass
+
+            result = cache[key] = self.request(name, params=params).text
+            return result
+
+        try:
+            return self.prefetched.pop((name,) + tuple(params.values()))
+        except KeyError:
+            return self.request(name, params=params).text
+
+    # Update cached data and parameter values after an engine callback.
+    def invalidate_plugin_cache(self, action, pluginId, value1, value3):
+        self.update_parameter_values(action, pluginId, value1, value3)
+
+        if action in (ENGINE_CALLBACK_ENGINE_STARTED, ENGINE_CALLBACK_ENGINE_STOPPED):
+            self.pluginCache.clear()
+
+        elif action == ENGINE_CALLBACK_PLUGIN_ADDED:
+            self.pluginCache.pop(pluginId, None)
+
+        elif action == ENGINE_CALLBACK_PLUGIN_REMOVED:
+            # plugins after the removed one move down by one
+            self.pluginCache = {
+                (i-1 if i > pluginId else i): cache for i, cache in self.pluginCache.items() if i != pluginId
+            }
+
+        elif action in (ENGINE_CALLBACK_PLUGIN_RENAMED, ENGINE_CALLBACK_OPTION_CHANGED):
+            self.drop_cached(pluginId, (("get_plugin_info",),))
+
+        elif action in (ENGINE_CALLBACK_PLUGIN_UNAVAILABLE,
+                        ENGINE_CALLBACK_RELOAD_INFO,
+                        ENGINE_CALLBACK_RELOAD_PARAMETERS,
+                        ENGINE_CALLBACK_RELOAD_PROGRAMS,
+                        ENGINE_CALLBACK_RELOAD_ALL):
+            self.pluginCache.pop(pluginId, None)
+
+        elif action == ENGINE_CALLBACK_PARAMETER_DEFAULT_CHANGED:
+            self.drop_cached(pluginId, (("get_default_parameter_value", value1),
+                                        ("get_parameter_ranges", value1)))
+
+        elif action in (ENGINE_CALLBACK_PARAMETER_MAPPED_CONTROL_INDEX_CHANGED,
+                        ENGINE_CALLBACK_PARAMETER_MAPPED_RANGE_CHANGED,
+                        ENGINE_CALLBACK_PARAMETER_MIDI_CHANNEL_CHANGED):
+            self.drop_cached(pluginId, (("get_parameter_data", value1),))
+
+    def drop_cached(self, pluginId, keys):
+        cache = self.pluginCache.get(pluginId)
+
+        if cache is None:
+            return
+
+        for key in keys:
+            cache.pop(key, None)
+
+    # Prefetch the parameters of a plugin if get_parameter_count() left that pending, on first use of any of them.
+    def prefetch_pending_parameters(self, pluginId):
+        cache = self.pluginCache.get(pluginId)
+
+        if cache is None:
+            return
+
+        parameterCount = cache.pop(kPendingParameterPrefetch, 0)
+
+        if parameterCount > 0:
+            self.prefetch_parameters(pluginId, parameterCount)
+
+    # Everything needed to show the parameters of a plugin (as done in plugin reload), in 2 round-trips.
+    def prefetch_parameters(self, pluginId, parameterCount):
+        calls = []
+
+        for i in range(parameterCount):
+            params = {
+                'pluginId': pluginId,
+                'parameterId': i,
+            }
+            calls.append(("get_parameter_info", params))
+            calls.append(("get_parameter_data", params))
+            calls.append(("get_parameter_ranges", params))
+
+            if i not in self.parameterValues.get(pluginId, {}):
+                calls.append(("get_current_parameter_value", params))
+
+        self.prefetch(calls)
+
+        # scale points depend on the parameter info
+        calls = []
+
+        for i in range(parameterCount):
+            paramInfo = self.get_cached("get_parameter_info", {
+                'pluginId': pluginId,
+                'parameterId': i,
+            })
+
+            if paramInfo is None:
+                continue
+
+            for j in range(json.loads(paramInfo)['scalePointCount']):
+                calls.append(("get_parameter_scalepoint_info", {
+                    'pluginId': pluginId,
+                    'parameterId': i,
+                    'scalePointId': j,
+                }))
+
+        self.prefetch(calls)
+
+    # Set how often the server sends the values of output parameters, in Hz (0 to disable).
+    def set_output_parameter_rate(self, rate):
+        self.request("set_output_parameter_rate", params={
+            'rate': rate,
+        })
+
+    # Get latency statistics of all requests made so far, times are in milliseconds.
+    def get_request_stats(self):
+        ret = {}
+
+        for name, (count, total, maximum) in self.requestStats.items():
+            ret[name] = {
+                'count': count,
+                'total': total * 1000.0,
+                'average': total * 1000.0 / count,
+                'max': maximum * 1000.0,
+            }
+
+        return ret
+
+    def print_request_stats(self):
+        stats = self.get_request_stats()
+
+        if len(stats) == 0:
+            return
+
+        print("REST request latency:")
+        print("  %-40s %8s %10s %10s %10s" % ("Request", "Count", "Avg (ms)", "Max (ms)", "Total (ms)"))
+
+        for name, info in sorted(stats.items(), key=lambda item: item[1]['total'], reverse=True):
+            print("  %-40s %8i %10.3f %10.3f %10.3f" % (name,
+                                                         info['count'],
+                                                         info['average'],
+                                                         info['max'],
+                                                         info['total']))
+
+    # --------------------------------------------------------------------------------------------------------
 
     def get_engine_driver_count(self):
-        return int(requests.get("{}/get_engine_driver_count".format(self.baseurl)).text)
+        return int(self.request("get_engine_driver_count").text)
 
     def get_engine_driver_name(self, index):
-        return requests.get("{}/get_engine_driver_name".format(self.baseurl), params={
+        return self.request("get_engine_driver_name", params={
             'index': index,
         }).text
 
     def get_engine_driver_device_names(self, index):
-        return requests.get("{}/get_engine_driver_device_names".format(self.baseurl), params={
+        return self.request("get_engine_driver_device_names", params={
             'index': index,
         }).text.split("\n")
 
     def get_engine_driver_device_info(self, index, name):
-        return requests.get("{}/get_engine_driver_device_info".format(self.baseurl), params={
+        return self.request("get_engine_driver_device_info", params={
             'index': index,
             'name': name,
         }).json()
 
     def engine_init(self, driverName, clientName):
-        return bool(int(requests.get("{}/engine_init".format(self.baseurl), params={
+        # engine_close() stops receiving messages
+        self.start_socket_thread()
+
+        return bool(int(self.request("engine_init", params={
             'driverName': driverName,
             'clientName': clientName,
         }).text))
 
     def engine_close(self):
-        return bool(int(requests.get("{}/engine_close".format(self.baseurl)).text))
+        ret = bool(int(self.request("engine_close").text))
+        self.stop_socket_thread()
+
+        if kPrintRequestStats:
+            self.print_request_stats()
+
+        return ret
 
     def engine_idle(self):
+        # do not keep prefetched results around, they might be outdated by now
+        self.prefetched.clear()
+
         if not self.isRunning:
             return
 
-        while True:
+        # only handle what was received so far, never wait for the server here
+        for _ in range(len(self.socketQueue)):
+            data = self.socketQueue.popleft()
+
+            if data is kSocketReconnected:
+                self.pluginCache.clear()
+                self.parameterValues.clear()
+                self.update_peaks_size()
+            else:
+                self.handle_stream_message(data)
+
+    def connect_socket(self):
+        # ask for the binary protocol, servers without support for it reply with their regular welcome message
+        socket = WebSocket()
+        socket.connect("ws://{}:{}/ws?protocol=binary".format(self.host, self.port), timeout=1)
+        self.binaryProtocol = socket.recv() == "Protocol: binary"
+        self.socket = socket
+
+    def start_socket_thread(self):
+        if self.socketThread is not None:
+            return
+
+        # the socket thread connects again if needed
+        self.socketStop.clear()
+        self.socketThread = Thread(target=self.socket_thread_loop, name="CarlaHostQtWeb socket", daemon=True)
+        self.socketThread.start()
+
+    def stop_socket_thread(self):
+        if self.socketThread is None:
+            return
+
+        self.socketStop.set()
+
+        # wakes up the socket thread if waiting for a message
+        socket = self.socket
+
+        if socket is not None:
             try:
-                line = self.socket.recv().strip()
-            except WebSocketConnectionClosedException:
-                self.isRunning = False
-                if self.fEngineCallback is None:
-                    self.fEngineCallback(None, ENGINE_CALLBACK_QUIT, 0, 0, 0, 0.0, "")
-                return
+                socket.shutdown()
+            except (WebSocketException, OSError):
+                pass
 
-            if line == "Keep-Alive":
-                return
+        self.socketThread.join()
+        self.socketThread = None
 
-            elif line.startswith("Carla: "):
-                if self.fEngineCallback is None:
-                    continue
+        if self.socket is not None:
+            try:
+                self.socket.close()
+            except (WebSocketException, OSError):
+                pass
+            self.socket = None
 
-                # split values from line
-                action, pluginId, value1, value2, value3, valueStr = line[7:].split(" ",5)
+    def socket_thread_loop(self):
+        reconnectDelay = kSocketReconnectDelay[0]
 
-                # convert to proper types
-                action   = int(action)
-                pluginId = int(pluginId)
-                value1   = int(value1)
-                value2   = int(value2)
-                value3   = float(value3)
+        while not self.socketStop.is_set():
+            try:
+                if self.socket is None:
+                    self.connect_socket()
+                    self.socketQueue.append(kSocketReconnected)
+                    reconnectDelay = kSocketReconnectDelay[0]
+
+                self.socketQueue.append(self.socket.recv())
+
+            except WebSocketTimeoutException:
+                # nothing received for a while, keep waiting
+                continue
+
+            except (WebSocketException, OSError):
+                # lost connection, engine_idle() refreshes everything once reconnected
+                if self.socket is not None:
+                    try:
+                        self.socket.close()
+                    except (WebSocketException, OSError):
+                        pass
+                    self.socket = None
+
+                self.socketStop.wait(reconnectDelay)
+                reconnectDelay = min(reconnectDelay * 2, kSocketReconnectDelay[1])
+
+    def update_peaks_size(self):
+        try:
+            count = self.get_max_plugin_number()
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, ValueError):
+            return
 
-                # pass to callback
-                self.fEngineCallback(None, action, pluginId, value1, value2, value3, valueStr)
+        self.resize_peaks(count)
 
-            elif line.startswith("Peaks: "):
-                # split values from line
-                pluginId, value1, value2, value3, value4 = line[7:].split(" ",5)
+    def handle_engine_callback(self, action, pluginId, value1, value2, value3, valueStr):
+        # update cache before anything else can ask for new data
+        self.invalidate_plugin_cache(action, pluginId, value1, value3)
 
-                # convert to proper types
-                pluginId = int(pluginId)
-                value1   = float(value1)
-                value2   = float(value2)
-                value3   = float(value3)
-                value4   = float(value4)
+        # maximum number of plugins depends on the process mode
+        if action in (ENGINE_CALLBACK_ENGINE_STARTED, ENGINE_CALLBACK_PROCESS_MODE_CHANGED):
+            self.update_peaks_size()
 
-                # store peaks
-                self.peaks[pluginId] = (value1, value2, value3, value4)
+        if self.fEngineCallback is None:
+            return
+
+        # pass to callback
+        self.fEngineCallback(None, action, pluginId, value1, value2, value3, valueStr)
 
     def is_engine_running(self):
         if not self.isRunning:
             return False
 
         try:
-            return bool(int(requests.get("{}/is_engine_running".format(self.baseurl)).text))
-        except requests.exceptions.ConnectionError:
+            return bool(int(self.request("is_engine_running").text))
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
             if self.fEngineCallback is None:
                 self.fEngineCallback(None, ENGINE_CALLBACK_QUIT, 0, 0, 0, 0.0, "")
 
     def set_engine_about_to_close(self):
-        return bool(int(requests.get("{}/set_engine_about_to_close".format(self.baseurl)).text))
+        return bool(int(self.request("set_engine_about_to_close").text))
 
     def set_engine_option(self, option, value, valueStr):
-        requests.get("{}/set_engine_option".format(self.baseurl), params={
+        self.request("set_engine_option", params={
             'option': option,
             'value': value,
             'valueStr': valueStr,
         })
 
     def load_file(self, filename):
-        return bool(int(requests.get("{}/load_file".format(self.baseurl), params={
+        return bool(int(self.request("load_file", params={
             'filename': filename,
         }).text))
 
     def load_project(self, filename):
-        return bool(int(requests.get("{}/load_project".format(self.baseurl), params={
+        return bool(int(self.request("load_project", params={
             'filename': filename,
         }).text))
 
     def save_project(self, filename):
-        return bool(int(requests.get("{}/save_project".format(self.baseurl), params={
+        return bool(int(self.request("save_project", params={
             'filename': filename,
         }).text))
 
     def patchbay_connect(self, groupIdA, portIdA, groupIdB, portIdB):
-        return bool(int(requests.get("{}/patchbay_connect".format(self.baseurl), params={
+        return bool(int(self.request("patchbay_connect", params={
             'groupIdA': groupIdA,
             'portIdA': portIdA,
             'groupIdB': groupIdB,
@@ -171,51 +581,51 @@ class CarlaHostQtWeb(CarlaHostQtNull):
         }).text))
 
     def patchbay_disconnect(self, connectionId):
-        return bool(int(requests.get("{}/patchbay_disconnect".format(self.baseurl), params={
+        return bool(int(self.request("patchbay_disconnect", params={
             'connectionId': connectionId,
         }).text))
 
     def patchbay_refresh(self, external):
-        return bool(int(requests.get("{}/patchbay_refresh".format(self.baseurl), params={
+        return bool(int(self.request("patchbay_refresh", params={
             'external': int(external),
         }).text))
 
     def transport_play(self):
-        requests.get("{}/transport_play".format(self.baseurl))
+        self.request("transport_play")
 
     def transport_pause(self):
-        requests.get("{}/transport_pause".format(self.baseurl))
+        self.request("transport_pause")
 
     def transport_bpm(self, bpm):
-        requests.get("{}/transport_bpm".format(self.baseurl), params={
+        self.request("transport_bpm", params={
             'bpm': bpm,
         })
 
     def transport_relocate(self, frame):
-        requests.get("{}/transport_relocate".format(self.baseurl), params={
+        self.request("transport_relocate", params={
             'frame': frame,
         })
 
     def get_current_transport_frame(self):
-        return int(requests.get("{}/get_current_transport_frame".format(self.baseurl)).text)
+        return int(self.request("get_current_transport_frame").text)
 
     def get_transport_info(self):
         if self.isRunning:
             try:
-                return requests.get("{}/get_transport_info".format(self.baseurl)).json()
-            except requests.exceptions.ConnectionError:
+                return self.request("get_transport_info").json()
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
                 if self.fEngineCallback is None:
                     self.fEngineCallback(None, ENGINE_CALLBACK_QUIT, 0, 0, 0, 0.0, "")
         return PyCarlaTransportInfo()
 
     def get_current_plugin_count(self):
-        return int(requests.get("{}/get_current_plugin_count".format(self.baseurl)).text)
+        return int(self.request("get_current_plugin_count").text)
 
     def get_max_plugin_number(self):
-        return int(requests.get("{}/get_max_plugin_number".format(self.baseurl)).text)
+        return int(self.request("get_max_plugin_number").text)
 
     def add_plugin(self, btype, ptype, filename, name, label, uniqueId, extraPtr, options):
-        return bool(int(requests.get("{}/add_plugin".format(self.baseurl), params={
+        return bool(int(self.request("add_plugin", params={
             'btype': btype,
             'ptype': ptype,
             'filename': filename,
@@ -226,288 +636,352 @@ class CarlaHostQtWeb(CarlaHostQtNull):
         }).text))
 
     def remove_plugin(self, pluginId):
-        return bool(int(requests.get("{}/remove_plugin".format(self.baseurl), params={
+        return bool(int(self.request("remove_plugin", params={
             'filename': pluginId,
         }).text))
 
     def remove_all_plugins(self):
-        return bool(int(requests.get("{}/remove_all_plugins".format(self.baseurl)).text))
+        self.pluginCache.clear()
+        self.parameterValues.clear()
+        return bool(int(self.request("remove_all_plugins").text))
 
     def rename_plugin(self, pluginId, newName):
-        return requests.get("{}/rename_plugin".format(self.baseurl), params={
+        return self.request("rename_plugin", params={
             'pluginId': pluginId,
             'newName': newName,
         }).text
 
     def clone_plugin(self, pluginId):
-        return bool(int(requests.get("{}/clone_plugin".format(self.baseurl), params={
+        return bool(int(self.request("clone_plugin", params={
             'pluginId': pluginId,
         }).text))
 
     def replace_plugin(self, pluginId):
-        return bool(int(requests.get("{}/replace_plugin".format(self.baseurl), params={
+        self.pluginCache.pop(pluginId, None)
+        self.parameterValues.pop(pluginId, None)
+        return bool(int(self.request("replace_plugin", params={
             'pluginId': pluginId,
         }).text))
 
     def switch_plugins(self, pluginIdA, pluginIdB):
-        return bool(int(requests.get("{}/switch_plugins".format(self.baseurl), params={
+        ok = bool(int(self.request("switch_plugins", params={
             'pluginIdA': pluginIdA,
             'pluginIdB': pluginIdB,
         }).text))
 
+        # the engine does not send a callback for this
+        if ok:
+            for table in (self.pluginCache, self.parameterValues):
+                dataA = table.pop(pluginIdA, None)
+                dataB = table.pop(pluginIdB, None)
+                if dataA is not None:
+                    table[pluginIdB] = dataA
+                if dataB is not None:
+                    table[pluginIdA] = dataB
+
+        return ok
+
     def load_plugin_state(self, pluginId, filename):
-        return bool(int(requests.get("{}/load_plugin_state".format(self.baseurl), params={
+        self.parameterValues.pop(pluginId, None)
+        return bool(int(self.request("load_plugin_state", params={
             'pluginId': pluginId,
             'filename': filename,
         }).text))
 
     def save_plugin_state(self, pluginId, filename):
-        return bool(int(requests.get("{}/save_plugin_state".format(self.baseurl), params={
+        return bool(int(self.request("save_plugin_state", params={
             'pluginId': pluginId,
             'filename': filename,
         }).text))
 
     def export_plugin_lv2(self, pluginId, lv2path):
-        return bool(int(requests.get("{}/export_plugin_lv2".format(self.baseurl), params={
+        return bool(int(self.request("export_plugin_lv2", params={
             'pluginId': pluginId,
             'lv2path': lv2path,
         }).text))
 
     def get_plugin_info(self, pluginId):
-        return requests.get("{}/get_plugin_info".format(self.baseurl), params={
+        return json.loads(self.cached_request("get_plugin_info", {
             'pluginId': pluginId,
-        }).json()
+        }))
 
     def get_audio_port_count_info(self, pluginId):
-        return requests.get("{}/get_audio_port_count_info".format(self.baseurl), params={
+        return json.loads(self.cached_request("get_audio_port_count_info", {
             'pluginId': pluginId,
-        }).json()
+        }))
 
     def get_midi_port_count_info(self, pluginId):
-        return requests.get("{}/get_midi_port_count_info".format(self.baseurl), params={
+        return json.loads(self.cached_request("get_midi_port_count_info", {
             'pluginId': pluginId,
-        }).json()
+        }))
 
     def get_parameter_count_info(self, pluginId):
-        return requests.get("{}/get_parameter_count_info".format(self.baseurl), params={
+        return json.loads(self.cached_request("get_parameter_count_info", {
             'pluginId': pluginId,
-        }).json()
+        }))
 
     def get_parameter_info(self, pluginId, parameterId):
-        return requests.get("{}/get_parameter_info".format(self.baseurl), params={
+        self.prefetch_pending_parameters(pluginId)
+        return json.loads(self.cached_request("get_parameter_info", {
             'pluginId': pluginId,
             'parameterId': parameterId,
-        }).json()
+        }))
 
     def get_parameter_scalepoint_info(self, pluginId, parameterId, scalePointId):
-        return requests.get("{}/get_parameter_scalepoint_info".format(self.baseurl), params={
+        self.prefetch_pending_parameters(pluginId)
+        return json.loads(self.cached_request("get_parameter_scalepoint_info", {
             'pluginId': pluginId,
             'parameterId': parameterId,
             'scalePointId': scalePointId,
-        }).json()
+        }))
 
     def get_parameter_data(self, pluginId, parameterId):
-        return requests.get("{}/get_parameter_data".format(self.baseurl), params={
+        self.prefetch_pending_parameters(pluginId)
+        return json.loads(self.cached_request("get_parameter_data", {
             'pluginId': pluginId,
             'parameterId': parameterId,
-        }).json()
+        }))
 
     def get_parameter_ranges(self, pluginId, parameterId):
-        return requests.get("{}/get_parameter_ranges".format(self.baseurl), params={
+        self.prefetch_pending_parameters(pluginId)
+        return json.loads(self.cached_request("get_parameter_ranges", {
             'pluginId': pluginId,
             'parameterId': parameterId,
-        }).json()
+        }))
 
     def get_midi_program_data(self, pluginId, midiProgramId):
-        return requests.get("{}/get_midi_program_data".format(self.baseurl), params={
+        return json.loads(self.cached_request("get_midi_program_data", {
             'pluginId': pluginId,
             'midiProgramId': midiProgramId,
-        }).json()
+        }))
 
     def get_custom_data(self, pluginId, customDataId):
-        return requests.get("{}/get_custom_data".format(self.baseurl), params={
+        return self.request("get_custom_data", params={
             'pluginId': pluginId,
             'customDataId': customDataId,
         }).json()
 
     def get_custom_data_value(self, pluginId, type_, key):
-        return requests.get("{}/get_custom_data_value".format(self.baseurl), params={
+        return self.request("get_custom_data_value", params={
             'pluginId': pluginId,
             'type_': type_,
             'key': key,
         }).text
 
     def get_chunk_data(self, pluginId):
-        return requests.get("{}/get_chunk_data".format(self.baseurl), params={
+        return self.request("get_chunk_data", params={
             'pluginId': pluginId,
         }).text
 
+    # NOTE: the count getters prefetch the data for each item as well,
+    #       as pretty much all callers go through all of them right after.
+    #       parameters are only prefetched once one of them is used, as callers often only need the count.
+
     def get_parameter_count(self, pluginId):
-        return int(requests.get("{}/get_parameter_count".format(self.baseurl), params={
+        params = {
             'pluginId': pluginId,
-        }).text)
+        }
+        known = self.get_cached("get_parameter_count", params) is not None
+        count = int(self.cached_request("get_parameter_count", params))
+
+        if not known:
+            self.pluginCache[pluginId][kPendingParameterPrefetch] = min(count, self.maxParameters)
+
+        return count
 
     def get_program_count(self, pluginId):
-        return int(requests.get("{}/get_program_count".format(self.baseurl), params={
+        count = int(self.cached_request("get_program_count", {
             'pluginId': pluginId,
-        }).text)
+        }))
+        self.prefetch([("get_program_name", {
+            'pluginId': pluginId,
+            'programId': i,
+        }) for i in range(count)])
+        return count
 
     def get_midi_program_count(self, pluginId):
-        return int(requests.get("{}/get_midi_program_count".format(self.baseurl), params={
+        count = int(self.cached_request("get_midi_program_count", {
             'pluginId': pluginId,
-        }).text)
+        }))
+        self.prefetch([("get_midi_program_data", {
+            'pluginId': pluginId,
+            'midiProgramId': i,
+        }) for i in range(count)])
+        return count
 
     def get_custom_data_count(self, pluginId):
-        return int(requests.get("{}/get_custom_data_count".format(self.baseurl), params={
+        return int(self.request("get_custom_data_count", params={
             'pluginId': pluginId,
         }).text)
 
     def get_parameter_text(self, pluginId, parameterId):
-        return requests.get("{}/get_parameter_text".format(self.baseurl), params={
+        return self.request("get_parameter_text", params={
             'pluginId': pluginId,
             'parameterId': parameterId,
         }).text
 
     def get_program_name(self, pluginId, programId):
-        return requests.get("{}/get_program_name".format(self.baseurl), params={
+        return self.cached_request("get_program_name", {
             'pluginId': pluginId,
             'programId': programId,
-        }).text
+        })
 
     def get_midi_program_name(self, pluginId, midiProgramId):
-        return requests.get("{}/get_midi_program_name".format(self.baseurl), params={
+        return self.cached_request("get_midi_program_name", {
             'pluginId': pluginId,
             'midiProgramId': midiProgramId,
-        }).text
+        })
 
     def get_real_plugin_name(self, pluginId):
-        return requests.get("{}/get_real_plugin_name".format(self.baseurl), params={
+        return self.cached_request("get_real_plugin_name", {
             'pluginId': pluginId,
-        }).text
+        })
 
     def get_current_program_index(self, pluginId):
-        return int(requests.get("{}/get_custom_data_count".format(self.baseurl), params={
+        return int(self.request("get_custom_data_count", params={
             'pluginId': pluginId,
         }).text)
 
     def get_current_midi_program_index(self, pluginId):
-        return int(requests.get("{}/get_custom_data_count".format(self.baseurl), params={
+        return int(self.request("get_custom_data_count", params={
             'pluginId': pluginId,
         }).text)
 
     def get_default_parameter_value(self, pluginId, parameterId):
-        return float(requests.get("{}/get_default_parameter_value".format(self.baseurl), params={
+        return float(self.cached_request("get_default_parameter_value", {
             'pluginId': pluginId,
             'parameterId': parameterId,
-        }).text)
+        }))
 
     def get_current_parameter_value(self, pluginId, parameterId):
+        try:
+            return self.parameterValues[pluginId][parameterId]
+        except KeyError:
+            pass
+
+        # only needed the first time, after that the server sends us any changes
         if self.isRunning:
+            self.prefetch_pending_parameters(pluginId)
+
             try:
-                return float(requests.get("{}/get_current_parameter_value".format(self.baseurl), params={
+                value = float(self.cached_request("get_current_parameter_value", {
                     'pluginId': pluginId,
                     'parameterId': parameterId,
-                }).text)
-            except requests.exceptions.ConnectionError:
+                }))
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
                 if self.fEngineCallback is None:
                     self.fEngineCallback(None, ENGINE_CALLBACK_QUIT, 0, 0, 0, 0.0, "")
+            else:
+                self.parameterValues.setdefault(pluginId, {})[parameterId] = value
+                return value
         return 0.0
 
     def get_internal_parameter_value(self, pluginId, parameterId):
-        return float(requests.get("{}/get_internal_parameter_value".format(self.baseurl), params={
+        return float(self.request("get_internal_parameter_value", params={
             'pluginId': pluginId,
             'parameterId': parameterId,
         }).text)
 
     def get_input_peak_value(self, pluginId, isLeft):
+        if pluginId >= len(self.peaks):
+            return 0.0
         return self.peaks[pluginId][0 if isLeft else 1]
 
     def get_output_peak_value(self, pluginId, isLeft):
+        if pluginId >= len(self.peaks):
+            return 0.0
         return self.peaks[pluginId][2 if isLeft else 3]
 
     def set_option(self, pluginId, option, yesNo):
-        requests.get("{}/set_option".format(self.baseurl), params={
+        self.drop_cached(pluginId, (("get_plugin_info",),))
+        self.request("set_option", params={
             'pluginId': pluginId,
             'option': option,
             'yesNo': int(yesNo),
         })
 
     def set_active(self, pluginId, onOff):
-        requests.get("{}/set_active".format(self.baseurl), params={
+        self.request("set_active", params={
             'pluginId': pluginId,
             'onOff': int(onOff),
         })
 
     def set_drywet(self, pluginId, value):
-        requests.get("{}/set_drywet".format(self.baseurl), params={
+        self.request("set_drywet", params={
             'pluginId': pluginId,
             'value': value,
         })
 
     def set_volume(self, pluginId, value):
-        requests.get("{}/set_volume".format(self.baseurl), params={
+        self.request("set_volume", params={
             'pluginId': pluginId,
             'value': value,
         })
 
     def set_balance_left(self, pluginId, value):
-        requests.get("{}/set_balance_left".format(self.baseurl), params={
+        self.request("set_balance_left", params={
             'pluginId': pluginId,
             'value': value,
         })
 
     def set_balance_right(self, pluginId, value):
-        requests.get("{}/set_balance_right".format(self.baseurl), params={
+        self.request("set_balance_right", params={
             'pluginId': pluginId,
             'value': value,
         })
 
     def set_panning(self, pluginId, value):
-        requests.get("{}/set_panning".format(self.baseurl), params={
+        self.request("set_panning", params={
             'pluginId': pluginId,
             'value': value,
         })
 
     def set_ctrl_channel(self, pluginId, channel):
-        requests.get("{}/set_ctrl_channel".format(self.baseurl), params={
+        self.request("set_ctrl_channel", params={
             'pluginId': pluginId,
             'channel': channel,
         })
 
     def set_parameter_value(self, pluginId, parameterId, value):
-        requests.get("{}/set_parameter_value".format(self.baseurl), params={
+        # the engine does not send a callback back to us for this
+        self.parameterValues.setdefault(pluginId, {})[parameterId] = value
+        self.request("set_parameter_value", params={
             'pluginId': pluginId,
             'parameterId': parameterId,
             'value': value,
         })
 
     def set_parameter_midi_channel(self, pluginId, parameterId, channel):
-        requests.get("{}/set_parameter_midi_channel".format(self.baseurl), params={
+        self.drop_cached(pluginId, (("get_parameter_data", parameterId),))
+        self.request("set_parameter_midi_channel", params={
             'pluginId': pluginId,
             'parameterId': parameterId,
             'channel': channel,
         })
 
     def set_parameter_midi_cc(self, pluginId, parameterId, cc):
-        requests.get("{}/set_parameter_midi_cc".format(self.baseurl), params={
+        self.drop_cached(pluginId, (("get_parameter_data", parameterId),))
+        self.request("set_parameter_midi_cc", params={
             'pluginId': pluginId,
             'parameterId': parameterId,
             'cc': cc,
         })
 
     def set_program(self, pluginId, programId):
-        requests.get("{}/set_program".format(self.baseurl), params={
+        self.parameterValues.pop(pluginId, None)
+        self.request("set_program", params={
             'pluginId': pluginId,
         })
 
     def set_midi_program(self, pluginId, midiProgramId):
-        requests.get("{}/set_midi_program".format(self.baseurl), params={
+        self.parameterValues.pop(pluginId, None)
+        self.request("set_midi_program", params={
             'pluginId': pluginId,
             'midiProgramId': midiProgramId,
         })
 
     def set_custom_data(self, pluginId, type_, key, value):
-        requests.get("{}/set_custom_data".format(self.baseurl), params={
+        self.request("set_custom_data", params={
             'pluginId': pluginId,
             'type': type_,
             'key': key,
@@ -515,28 +989,31 @@ class CarlaHostQtWeb(CarlaHostQtNull):
         })
 
     def set_chunk_data(self, pluginId, chunkData):
-        requests.get("{}/set_chunk_data".format(self.baseurl), params={
+        self.parameterValues.pop(pluginId, None)
+        self.request("set_chunk_data", params={
             'pluginId': pluginId,
             'chunkData': chunkData,
         })
 
     def prepare_for_save(self, pluginId):
-        requests.get("{}/prepare_for_save".format(self.baseurl), params={
+        self.request("prepare_for_save", params={
             'pluginId': pluginId,
         })
 
     def reset_parameters(self, pluginId):
-        requests.get("{}/reset_parameters".format(self.baseurl), params={
+        self.parameterValues.pop(pluginId, None)
+        self.request("reset_parameters", params={
             'pluginId': pluginId,
         })
 
     def randomize_parameters(self, pluginId):
-        requests.get("{}/randomize_parameters".format(self.baseurl), params={
+        self.parameterValues.pop(pluginId, None)
+        self.request("randomize_parameters", params={
             'pluginId': pluginId,
         })
 
     def send_midi_note(self, pluginId, channel, note, velocity):
-        requests.get("{}/send_midi_note".format(self.baseurl), params={
+        self.request("send_midi_note", params={
             'pluginId': pluginId,
             'channel': channel,
             'note': note,
@@ -544,16 +1021,16 @@ class CarlaHostQtWeb(CarlaHostQtNull):
         })
 
     def get_buffer_size(self):
-        return int(requests.get("{}/get_buffer_size".format(self.baseurl)).text)
+        return int(self.request("get_buffer_size").text)
 
     def get_sample_rate(self):
-        return float(requests.get("{}/get_sample_rate".format(self.baseurl)).text)
+        return float(self.request("get_sample_rate").text)
 
     def get_last_error(self):
-        return requests.get("{}/get_last_error".format(self.baseurl)).text
+        return self.request("get_last_error").text
 
     def get_host_osc_url_tcp(self):
-        return requests.get("{}/get_host_osc_url_tcp".format(self.baseurl)).text
+        return self.request("get_host_osc_url_tcp").text
 
     def get_host_osc_url_udp(self):
-        return requests.get("{}/get_host_osc_url_udp".format(self.baseurl)).text
+        return self.request("get_host_osc_url_udp").text
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Carla Backend code (Web stream stuff, shared by the REST API clients)
+# Copyright (C) 2018 Filipe Coelho <falktx@falktx.com>
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as
+# published by the Free Software Foundation; either version 2 of
+# the License, or any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a full copy of the GNU General Public License see the doc/GPL.txt file.
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Imports (Global)
+
+import struct
+import sys
+from array import array
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Imports (Custom)
+
+from carla_backend import *
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Binary websocket protocol, see rest-server.cpp for details.
+# Each engine tick is a single frame made of records, each with a uint8 type and uint32 payload size.
+
+kBinaryRecordHeader = struct.Struct("<BI")
+kBinaryRecordPeaks = 1
+kBinaryRecordCallback = 2
+kBinaryRecordParams = 3
+kBinaryRecordText = 4
+
+# action, pluginId, value1, value2, value3, followed by valueStr
+kBinaryCallback = struct.Struct("<IIiif")
+
+# pluginId, followed by [parameterId, value] pairs
+kBinaryParamsPluginId = struct.Struct("<I")
+kBinaryParamsValue = struct.Struct("<If")
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Decoding of the REST API websocket stream, into peak and parameter value tables.
+# Used together with a host class, which needs to provide handle_engine_callback().
+
+class CarlaWebStream(object):
+    def __init__(self):
+        object.__init__(self)
+
+        # pluginId -> (input left, input right, output left, output right)
+        self.peaks = []
+
+        # pluginId -> {parameterId -> value}, kept up to date by the server via websocket
+        self.parameterValues = {}
+
+    # --------------------------------------------------------------------------------------------------------
+
+    # Handle a message received from the websocket, either text or a binary frame.
+    def handle_stream_message(self, data):
+        if isinstance(data, bytes):
+            self.handle_binary_frame(data)
+            return
+
+        line = data.strip()
+
+        if line != "Keep-Alive":
+            self.handle_text_line(line)
+
+    def handle_text_line(self, line):
+        if line.startswith("Carla: "):
+            # split values from line
+            action, pluginId, value1, value2, value3, valueStr = line[7:].split(" ",5)
+
+            # convert to proper types
+            action   = int(action)
+            pluginId = int(pluginId)
+            value1   = int(value1)
+            value2   = int(value2)
+            value3   = float(value3)
+
+            self.handle_engine_callback(action, pluginId, value1, value2, value3, valueStr)
+
+        elif line.startswith("Peaks: "):
+            # split values from line
+            pluginId, value1, value2, value3, value4 = line[7:].split(" ",5)
+
+            # convert to proper types
+            pluginId = int(pluginId)
+            value1   = float(value1)
+            value2   = float(value2)
+            value3   = float(value3)
+            value4   = float(value4)
+
+            # store peaks
+            if pluginId < len(self.peaks):
+                self.peaks[pluginId] = (value1, value2, value3, value4)
+
+        elif line.startswith("Params: "):
+            # split values from line, as "pluginId [parameterId value]..."
+            values = line[8:].split(" ")
+
+            # store parameter values
+            parameterValues = self.parameterValues.setdefault(int(values[0]), {})
+            for i in range(1, len(values)-1, 2):
+                parameterValues[int(values[i])] = float(values[i+1])
+
+    def handle_binary_frame(self, data):
+        offset = 0
+        length = len(data)
+
+        while offset + kBinaryRecordHeader.size <= length:
+            rtype, size = kBinaryRecordHeader.unpack_from(data, offset)
+            offset += kBinaryRecordHeader.size
+            payload = data[offset:offset+size]
+            offset += size
+
+            if rtype == kBinaryRecordPeaks:
+                peaks = array('f', payload)
+                if sys.byteorder == "big":
+                    peaks.byteswap()
+
+                for pluginId in range(min(len(peaks) // 4, len(self.peaks))):
+                    self.peaks[pluginId] = tuple(peaks[pluginId*4:pluginId*4+4])
+
+            elif rtype == kBinaryRecordCallback:
+                action, pluginId, value1, value2, value3 = kBinaryCallback.unpack_from(payload)
+                valueStr = payload[kBinaryCallback.size:].decode("utf-8", errors="ignore")
+
+                self.handle_engine_callback(action, pluginId, value1, value2, value3, valueStr)
+
+            elif rtype == kBinaryRecordParams:
+                pluginId, = kBinaryParamsPluginId.unpack_from(payload)
+                parameterValues = self.parameterValues.setdefault(pluginId, {})
+
+                for parameterId, value in kBinaryParamsValue.iter_unpack(payload[kBinaryParamsPluginId.size:]):
+                    parameterValues[parameterId] = value
+
+            elif rtype == kBinaryRecordText:
+                self.handle_text_line(payload.decode("utf-8", errors="ignore").strip())
+
+    def handle_engine_callback(self, action, pluginId, value1, value2, value3, valueStr):
+        raise NotImplementedError
+
+    # --------------------------------------------------------------------------------------------------------
+
+    # Update the parameter value table after an engine callback.
+    def update_parameter_values(self, action, pluginId, value1, value3):
+        if action == ENGINE_CALLBACK_PARAMETER_VALUE_CHANGED:
+            if value1 >= 0:
+                self.parameterValues.setdefault(pluginId, {})[value1] = value3
+
+        elif action in (ENGINE_CALLBACK_ENGINE_STARTED, ENGINE_CALLBACK_ENGINE_STOPPED):
+            self.parameterValues.clear()
+
+        elif action == ENGINE_CALLBACK_PLUGIN_REMOVED:
+            # plugins after the removed one move down by one
+            self.parameterValues = {
+                (i-1 if i > pluginId else i): values for i, values in self.parameterValues.items() if i != pluginId
+            }
+
+        elif action in (ENGINE_CALLBACK_PLUGIN_ADDED,
+                        ENGINE_CALLBACK_PLUGIN_UNAVAILABLE,
+                        ENGINE_CALLBACK_RELOAD_INFO,
+                        ENGINE_CALLBACK_RELOAD_PARAMETERS,
+                        ENGINE_CALLBACK_RELOAD_PROGRAMS,
+                        ENGINE_CALLBACK_RELOAD_ALL,
+                        ENGINE_CALLBACK_PROGRAM_CHANGED,
+                        ENGINE_CALLBACK_MIDI_PROGRAM_CHANGED,
+                        ENGINE_CALLBACK_UPDATE):
+            # all parameters might have changed, without a callback for each
+            self.parameterValues.pop(pluginId, None)
+
+    # Resize the peak table, keeping current values.
+    def resize_peaks(self, count):
+        if count > len(self.peaks):
+            self.peaks += [(0.0, 0.0, 0.0, 0.0)] * (count - len(self.peaks))
+        else:
+            del self.peaks[count:]
+
+# ---------------------------------------------------------------------------------------------------------------------
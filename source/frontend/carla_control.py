@@ -19,7 +19,8 @@
 # ----------------------------------------------------------------------------------------------------------------------
 # Imports (Global)
 
-from PyQt5.QtCore import QEventLoop
+from PyQt5.QtCore import QAbstractTableModel, QEventLoop, QModelIndex
+from PyQt5.QtWidgets import QHeaderView, QLabel, QTableView
 
 # ------------------------------------------------------------------------------------------------------------
 # Imports (Custom)
@@ -34,20 +35,53 @@ from carla_host import *
 from liblo import (
   Address,
   AddressError,
+  Bundle,
+  Message,
   ServerError,
-  Server,
-  make_method,
+  ServerThread,
   send as lo_send,
   TCP as LO_TCP,
   UDP as LO_UDP,
 )
 
+import struct
+
+from array import array
+from collections import deque
+from concurrent.futures import Future
+from math import log10
 from random import random
+from time import monotonic
 
 # ------------------------------------------------------------------------------------------------------------
 
 DEBUG = False
 
+# how long to wait for a response to a blocking request, in seconds
+kResponseTimeout = 30.0
+
+# how long the GUI thread may spend handling received messages per frame, in seconds
+kMaxIdleTime = 0.02
+
+# how often the dashboard is updated, in Hz
+kDashboardRate = 30
+
+# how long an instance can go without sending anything before it is shown as offline, in seconds
+kDashboardTimeout = 2.0
+
+# a pair of peaks, as found in packed peaks messages
+kDashboardPeaks = struct.Struct("<ff")
+
+# continuous values, of which only the latest one per plugin (and parameter) needs to be sent
+kCoalescedMethods = (
+    "set_drywet",
+    "set_volume",
+    "set_balance_left",
+    "set_balance_right",
+    "set_panning",
+    "set_parameter_value",
+)
+
 # ----------------------------------------------------------------------------------------------------------------------
 # OSC connect Dialog
 
@@ -168,33 +202,59 @@ class CarlaHostOSC(CarlaHostQtPlugin):
         self.lo_target_tcp_name = ""
         self.lo_target_udp_name = ""
 
-        self.resetPendingMessages()
+        # messageId -> Future, for messages waiting for a response.
+        # ids keep increasing across resets, so late responses never match a newer message.
+        self.lastMessageId = 1
+        self.pendingMessages = {}
+
+        # value updates waiting to be sent, see flushPendingUpdates().
+        # (path[, parameterId]) -> (path, args), only the latest value is kept.
+        self.pendingUpdates = {}
+        self.lastUpdatesFlush = 0.0
+
+        # how often to send value updates, in Hz (0 to send each one right away)
+        self.updateRate = 30
+
+        # pluginId -> state hash, as last sent by the engine.
+        # kept across reconnects together with fPluginsInfo, so unchanged plugins are not sent again.
+        self.pluginStateHashes = {}
+        self.deltaSyncSupported = False
 
     # -------------------------------------------------------------------
 
     def resetPendingMessages(self):
-        self.lastMessageId = 1
-        self.pendingMessages = []
-        self.responses = {}
+        # nothing will answer these anymore
+        for future in self.pendingMessages.values():
+            future.cancel()
+
+        self.pendingMessages = {}
+        self.pendingUpdates = {}
 
     def printAndReturnError(self, error):
         print(error)
         self.fLastError = error
         return False
 
-    def sendMsg(self, lines):
+    # Send a message to the remote engine, without waiting for its response.
+    # Returns a Future with the error string of the response (empty on success),
+    # or None if the message could not be sent.
+    # Many messages can be in flight at the same time, optional 'callback' is called with the Future once done.
+    def sendMsgAsync(self, lines, callback=None):
         if len(lines) < 1:
-            return self.printAndReturnError("not enough arguments")
+            self.printAndReturnError("not enough arguments")
+            return None
 
         method = lines.pop(0)
 
         if method == "set_engine_option":
-            return True
+            return self.makeDoneFuture(callback)
 
         if self.lo_target_tcp is None:
-            return self.printAndReturnError("lo_target_tcp is None")
+            self.printAndReturnError("lo_target_tcp is None")
+            return None
         if self.lo_target_tcp_name is None:
-            return self.printAndReturnError("lo_target_tcp_name is None")
+            self.printAndReturnError("lo_target_tcp_name is None")
+            return None
 
         if method in ("clear_engine_xruns",
                       "cancel_engine_action",
@@ -217,6 +277,8 @@ class CarlaHostOSC(CarlaHostQtPlugin):
                       "clone_plugin",
                       "replace_plugin",
                       "switch_plugins",
+                      "set_packed_peaks",
+                      "get_plugin_hashes",
                       #"load_plugin_state",
                       #"save_plugin_state",
                       ):
@@ -258,38 +320,143 @@ class CarlaHostOSC(CarlaHostQtPlugin):
                 lines.pop(2)
 
         else:
-            return self.printAndReturnError("invalid method '%s'" % method)
-
-        if len(self.pendingMessages) != 0:
-            return self.printAndReturnError("A previous operation is still pending, please wait")
+            self.printAndReturnError("invalid method '%s'" % method)
+            return None
 
         args = [int(line) if isinstance(line, bool) else line for line in lines]
         #print(path, args)
 
         if not needResp:
-            lo_send(self.lo_target_tcp, path, *args)
-            return True
+            if method in kCoalescedMethods and self.updateRate > 0:
+                key = (path, args[0]) if method == "set_parameter_value" else (path,)
+                self.pendingUpdates[key] = (path, args)
+            else:
+                # keep the order of messages
+                self.flushPendingUpdates()
+                lo_send(self.lo_target_tcp, path, *args)
+            return self.makeDoneFuture(callback)
+
+        self.flushPendingUpdates()
 
         messageId = self.lastMessageId
         self.lastMessageId += 1
-        self.pendingMessages.append(messageId)
 
-        lo_send(self.lo_target_tcp, path, messageId, *args)
+        future = Future()
+        if callback is not None:
+            future.add_done_callback(callback)
+        self.pendingMessages[messageId] = future
 
-        while messageId in self.pendingMessages:
+        lo_send(self.lo_target_tcp, path, messageId, *args)
+        return future
+
+    # Blocking wrapper around sendMsgAsync(), keeps the GUI running while waiting.
+    def sendMsg(self, lines, timeout=kResponseTimeout):
+        future = self.sendMsgAsync(lines)
+
+        if future is None:
+            return False
+
+        return self.waitForResponses([future], timeout)
+
+    # Wait for the responses of several messages at once, returns False if any of them failed.
+    # Used by sendMsg() for a single message. Callers sending many messages can send them all with sendMsgAsync()
+    # first and then wait for all of them here, so they only wait for a single round-trip.
+    # NOTE: the host window still sends its bulk actions (like patchbay "disconnect all") one sendMsg() at a time,
+    #       as they go through the generic host API, one call per item.
+    def waitForResponses(self, futures, timeout=kResponseTimeout):
+        deadline = monotonic() + timeout
+
+        while not all(future.done() for future in futures):
+            if monotonic() >= deadline:
+                for messageId, future in list(self.pendingMessages.items()):
+                    if future in futures:
+                        del self.pendingMessages[messageId]
+                        future.cancel()
+                break
             QApplication.processEvents(QEventLoop.AllEvents, 100)
 
-        error = self.responses.pop(messageId)
+        ok = True
+
+        for future in futures:
+            if future.cancelled():
+                error = "Timed out waiting for a response from the remote engine"
+            else:
+                error = future.result()
 
-        if not error:
-            return True
+            if error:
+                self.fLastError = error
+                ok = False
+
+        return ok
+
+    # Send the pending value updates, if enough time has passed since the last time.
+    def idleUpdates(self):
+        if not self.pendingUpdates:
+            return
+
+        now = monotonic()
+
+        if now - self.lastUpdatesFlush < 1.0 / self.updateRate:
+            return
+
+        self.lastUpdatesFlush = now
+        self.flushPendingUpdates()
+
+    # Send the pending value updates right away, together in a single bundle.
+    def flushPendingUpdates(self):
+        if not self.pendingUpdates:
+            return
+
+        updates = list(self.pendingUpdates.values())
+        self.pendingUpdates.clear()
+
+        if self.lo_target_tcp is None:
+            return
+
+        if len(updates) == 1:
+            path, args = updates[0]
+            lo_send(self.lo_target_tcp, path, *args)
+        else:
+            lo_send(self.lo_target_tcp, Bundle(*(Message(path, *args) for path, args in updates)))
+
+    def makeDoneFuture(self, callback):
+        future = Future()
+        future.set_result("")
+        if callback is not None:
+            callback(future)
+        return future
 
-        self.fLastError = error
-        return False
 
     def sendMsgAndSetError(self, lines):
         return self.sendMsg(lines)
 
+    # Queue depth and latency counters of the control servers, see CarlaControlServer.getStats().
+    def getReceiveStats(self):
+        return {
+            'tcp': self.lo_server_tcp.getStats() if self.lo_server_tcp is not None else None,
+            'udp': self.lo_server_udp.getStats() if self.lo_server_udp is not None else None,
+        }
+
+    # Ask the engine to send the peaks of all plugins in a single message per tick.
+    # Older engines do not know about it and keep sending one message per plugin, which still works.
+    def requestPackedPeaks(self):
+        self.sendMsgAsync(["set_packed_peaks", True])
+
+    # Ask the engine for the state hash of each plugin, now and whenever a plugin changes.
+    # Older engines answer with an error, and every reconnect keeps fetching the full state.
+    def requestPluginHashes(self):
+        def callback(future):
+            self.deltaSyncSupported = not future.cancelled() and not future.result()
+
+        self.deltaSyncSupported = False
+        self.sendMsgAsync(["get_plugin_hashes"], callback)
+
+    # The cached state hashes as sent on register, indexed by plugin id (0 for unknown plugins).
+    def getPluginHashesBlob(self):
+        count = len(self.fPluginsInfo)
+        hashes = [self.pluginStateHashes.get(pluginId, 0) for pluginId in range(count)]
+        return struct.pack("<%iI" % count, *hashes)
+
     # -------------------------------------------------------------------
 
     def engine_init(self, driverName, clientName):
@@ -307,12 +474,37 @@ class CarlaHostOSC(CarlaHostQtPlugin):
     def set_engine_about_to_close(self):
         return
 
+    # -------------------------------------------------------------------
+
+    def _setViaCallback(self, action, pluginId, value1, value2, value3, valuef, valueStr):
+        if action == ENGINE_CALLBACK_ENGINE_STARTED:
+            # drop cached plugins that are gone since the last connection
+            for id in [id for id in self.fPluginsInfo if id >= pluginId]:
+                del self.fPluginsInfo[id]
+            for id in [id for id in self.pluginStateHashes if id >= pluginId]:
+                del self.pluginStateHashes[id]
+
+        elif action == ENGINE_CALLBACK_PLUGIN_REMOVED:
+            # plugin ids after the removed one have shifted
+            for id in [id for id in self.pluginStateHashes if id >= pluginId]:
+                del self.pluginStateHashes[id]
+
+        CarlaHostQtPlugin._setViaCallback(self, action, pluginId, value1, value2, value3, valuef, valueStr)
+
 # ---------------------------------------------------------------------------------------------------------------------
 # OSC Control server
 
-class CarlaControlServerTCP(Server):
-    def __init__(self, host, rhost):
-        Server.__init__(self, proto=LO_TCP)
+# Marks a method of a control server as the handler for an OSC path and typespec, like liblo's make_method does.
+def oscHandler(path, types):
+    def decorator(func):
+        func.oscSpec = (path, types)
+        return func
+    return decorator
+
+# Messages are received by a liblo server thread and queued, then handled in the GUI thread by idle().
+class CarlaControlServer(ServerThread):
+    def __init__(self, host, rhost, proto):
+        ServerThread.__init__(self, proto=proto, reg_methods=False)
 
         if False:
             host = CarlaHostOSC()
@@ -320,29 +512,105 @@ class CarlaControlServerTCP(Server):
         self.host = host
         self.rhost = rhost
 
+        # (path, types) -> handler
+        self.fHandlers = {}
+
+        for name in dir(type(self)):
+            spec = getattr(getattr(type(self), name), "oscSpec", None)
+            if spec is not None:
+                self.fHandlers[spec] = getattr(self, name)
+
+        # received messages, as (time received, path, types, args)
+        self.fQueue = deque()
+
+        # statistics, see getStats()
+        self.fReceivedCount = 0
+        self.fHandledCount = 0
+        self.fMaxQueueDepth = 0
+        self.fTotalLatency = 0.0
+        self.fMaxLatency = 0.0
+
+        self.add_method(None, None, self.queueMessage)
+        self.start()
+
+    # called in the server thread
+    def queueMessage(self, path, args, types):
+        self.fQueue.append((monotonic(), path, types, args))
+        self.fReceivedCount += 1
+
+    # Handle queued messages, stopping early if it takes too long so the GUI stays responsive.
     def idle(self):
-        self.fReceivedMsgs = False
+        self.fMaxQueueDepth = max(self.fMaxQueueDepth, len(self.fQueue))
 
-        while self.recv(0) and self.fReceivedMsgs:
-            pass
+        deadline = monotonic() + kMaxIdleTime
+
+        while self.fQueue:
+            received, path, types, args = self.fQueue.popleft()
+            handler = self.fHandlers.get((path, types), None)
+
+            if handler is not None:
+                handler(path, args)
+            else:
+                self.fallback(path, args)
+
+            now = monotonic()
+            latency = now - received
+
+            self.fHandledCount += 1
+            self.fTotalLatency += latency
+            self.fMaxLatency = max(self.fMaxLatency, latency)
+
+            if now >= deadline:
+                break
+
+    # Stop receiving messages, the ones not handled yet are dropped.
+    def shutdown(self):
+        self.stop()
+        self.fQueue.clear()
+
+    # Queue depth and latency counters, latency being the time between receiving and handling a message.
+    def getStats(self):
+        return {
+            'received': self.fReceivedCount,
+            'handled': self.fHandledCount,
+            'queueDepth': len(self.fQueue),
+            'maxQueueDepth': self.fMaxQueueDepth,
+            'averageLatency': self.fTotalLatency / self.fHandledCount if self.fHandledCount else 0.0,
+            'maxLatency': self.fMaxLatency,
+        }
+
+    def resetStats(self):
+        # messages still queued count as received, so received is always handled plus queue depth
+        self.fReceivedCount = len(self.fQueue)
+        self.fHandledCount = 0
+        self.fMaxQueueDepth = 0
+        self.fTotalLatency = 0.0
+        self.fMaxLatency = 0.0
+
+    def fallback(self, path, args):
+        raise NotImplementedError
+
+# ---------------------------------------------------------------------------------------------------------------------
+
+class CarlaControlServerTCP(CarlaControlServer):
+    def __init__(self, host, rhost):
+        CarlaControlServer.__init__(self, host, rhost, LO_TCP)
 
     def getFullURL(self):
         if self.rhost:
             return "osc.tcp://%s:%i/ctrl" % (self.rhost, self.get_port())
         return "%sctrl" % self.get_url()
 
-    @make_method('/ctrl/cb', 'iiiiifs')
+    @oscHandler('/ctrl/cb', 'iiiiifs')
     def carla_cb(self, path, args):
         if DEBUG: print(path, args)
-        self.fReceivedMsgs = True
         action, pluginId, value1, value2, value3, valuef, valueStr = args
         self.host._setViaCallback(action, pluginId, value1, value2, value3, valuef, valueStr)
         engineCallback(self.host, action, pluginId, value1, value2, value3, valuef, valueStr)
 
-    @make_method('/ctrl/info', 'iiiihiisssssss')
+    @oscHandler('/ctrl/info', 'iiiihiisssssss')
     def carla_info(self, path, args):
         if DEBUG: print(path, args)
-        self.fReceivedMsgs = True
         (
           pluginId, type_, category, hints, uniqueId, optsAvail, optsEnabled,
           name, filename, iconName, realName, label, maker, copyright,
@@ -368,19 +636,17 @@ class CarlaControlServerTCP(Server):
         self.host._set_pluginInfoUpdate(pluginId, pinfo)
         self.host._set_pluginRealName(pluginId, realName)
 
-    @make_method('/ctrl/ports', 'iiiiiiii')
+    @oscHandler('/ctrl/ports', 'iiiiiiii')
     def carla_ports(self, path, args):
         if DEBUG: print(path, args)
-        self.fReceivedMsgs = True
         pluginId, audioIns, audioOuts, midiIns, midiOuts, paramIns, paramOuts, paramTotal = args
         self.host._set_audioCountInfo(pluginId, {'ins': audioIns, 'outs': audioOuts})
         self.host._set_midiCountInfo(pluginId, {'ins': midiOuts, 'outs': midiOuts})
         self.host._set_parameterCountInfo(pluginId, paramTotal, {'ins': paramIns, 'outs': paramOuts})
 
-    @make_method('/ctrl/paramInfo', 'iissss')
+    @oscHandler('/ctrl/paramInfo', 'iissss')
     def carla_paramInfo(self, path, args):
         if DEBUG: print(path, args)
-        self.fReceivedMsgs = True
         pluginId, paramId, name, unit, comment, groupName = args
 
         paramInfo = {
@@ -394,10 +660,9 @@ class CarlaControlServerTCP(Server):
         }
         self.host._set_parameterInfo(pluginId, paramId, paramInfo)
 
-    @make_method('/ctrl/paramData', 'iiiiiifff')
+    @oscHandler('/ctrl/paramData', 'iiiiiifff')
     def carla_paramData(self, path, args):
         if DEBUG: print(path, args)
-        self.fReceivedMsgs = True
         pluginId, paramId, type_, hints, midiChan, mappedCtrl, mappedMin, mappedMax, value = args
 
         hints &= ~(PARAMETER_USES_SCALEPOINTS | PARAMETER_USES_CUSTOM_TEXT)
@@ -415,10 +680,9 @@ class CarlaControlServerTCP(Server):
         self.host._set_parameterData(pluginId, paramId, paramData)
         self.host._set_parameterValue(pluginId, paramId, value)
 
-    @make_method('/ctrl/paramRanges', 'iiffffff')
+    @oscHandler('/ctrl/paramRanges', 'iiffffff')
     def carla_paramRanges(self, path, args):
         if DEBUG: print(path, args)
-        self.fReceivedMsgs = True
         pluginId, paramId, def_, min_, max_, step, stepSmall, stepLarge = args
 
         paramRanges = {
@@ -431,49 +695,43 @@ class CarlaControlServerTCP(Server):
         }
         self.host._set_parameterRanges(pluginId, paramId, paramRanges)
 
-    @make_method('/ctrl/count', 'iiiiii')
+    @oscHandler('/ctrl/count', 'iiiiii')
     def carla_count(self, path, args):
         if DEBUG: print(path, args)
-        self.fReceivedMsgs = True
         pluginId, pcount, mpcount, cdcount, cp, cmp = args
         self.host._set_programCount(pluginId, pcount)
         self.host._set_midiProgramCount(pluginId, mpcount)
         self.host._set_customDataCount(pluginId, cdcount)
         self.host._set_pluginInfoUpdate(pluginId, { 'programCurrent': cp, 'midiProgramCurrent': cmp })
 
-    @make_method('/ctrl/pcount', 'iii')
+    @oscHandler('/ctrl/pcount', 'iii')
     def carla_pcount(self, path, args):
         if DEBUG: print(path, args)
-        self.fReceivedMsgs = True
         pluginId, pcount, mpcount = args
         self.host._set_programCount(pluginId, pcount)
         self.host._set_midiProgramCount(pluginId, mpcount)
 
-    @make_method('/ctrl/prog', 'iis')
+    @oscHandler('/ctrl/prog', 'iis')
     def carla_prog(self, path, args):
         if DEBUG: print(path, args)
-        self.fReceivedMsgs = True
         pluginId, progId, progName = args
         self.host._set_programName(pluginId, progId, progName)
 
-    @make_method('/ctrl/mprog', 'iiiis')
+    @oscHandler('/ctrl/mprog', 'iiiis')
     def carla_mprog(self, path, args):
         if DEBUG: print(path, args)
-        self.fReceivedMsgs = True
         pluginId, midiProgId, bank, program, name = args
         self.host._set_midiProgramData(pluginId, midiProgId, {'bank': bank, 'program': program, 'name': name})
 
-    @make_method('/ctrl/cdata', 'iisss')
+    @oscHandler('/ctrl/cdata', 'iisss')
     def carla_cdata(self, path, args):
         if DEBUG: print(path, args)
-        self.fReceivedMsgs = True
         pluginId, index, type_, key, value = args
         self.host._set_customData(pluginId, index, { 'type': type_, 'key': key, 'value': value })
 
-    @make_method('/ctrl/iparams', 'ifffffff')
+    @oscHandler('/ctrl/iparams', 'ifffffff')
     def carla_iparams(self, path, args):
         if DEBUG: print(path, args)
-        self.fReceivedMsgs = True
         pluginId, active, drywet, volume, balLeft, balRight, pan, ctrlChan = args
         self.host._set_internalValue(pluginId, PARAMETER_ACTIVE, active)
         self.host._set_internalValue(pluginId, PARAMETER_DRYWET, drywet)
@@ -483,81 +741,90 @@ class CarlaControlServerTCP(Server):
         self.host._set_internalValue(pluginId, PARAMETER_PANNING, pan)
         self.host._set_internalValue(pluginId, PARAMETER_CTRL_CHANNEL, ctrlChan)
 
-    @make_method('/ctrl/resp', 'is')
+    @oscHandler('/ctrl/values', 'ib')
+    def carla_values(self, path, args):
+        if DEBUG: print(path, args)
+        pluginId, blob = args
+        values = array('f', bytes(blob))
+
+        if sys.byteorder == "big":
+            values.byteswap()
+
+        for index, value in enumerate(values):
+            self.host._set_parameterValue(pluginId, index, value)
+
+    @oscHandler('/ctrl/hash', 'ii')
+    def carla_hash(self, path, args):
+        if DEBUG: print(path, args)
+        pluginId, stateHash = args
+        self.host.pluginStateHashes[pluginId] = stateHash & 0xFFFFFFFF
+
+    @oscHandler('/ctrl/resp', 'is')
     def carla_resp(self, path, args):
         if DEBUG: print(path, args)
-        self.fReceivedMsgs = True
         messageId, error = args
-        self.host.responses[messageId] = error
-        self.host.pendingMessages.remove(messageId)
+        future = self.host.pendingMessages.pop(messageId, None)
+
+        # might have timed out already
+        if future is not None:
+            future.set_result(error)
 
-    @make_method('/ctrl/exit', '')
+    @oscHandler('/ctrl/exit', '')
     def carla_exit(self, path, args):
         if DEBUG: print(path, args)
-        self.fReceivedMsgs = True
         #self.host.lo_target_tcp = None
         self.host.QuitCallback.emit()
 
-    @make_method('/ctrl/exit-error', 's')
+    @oscHandler('/ctrl/exit-error', 's')
     def carla_exit_error(self, path, args):
         if DEBUG: print(path, args)
-        self.fReceivedMsgs = True
         error, = args
         self.host.lo_target_tcp = None
         self.host.QuitCallback.emit()
         self.host.ErrorCallback.emit(error)
 
-    @make_method(None, None)
     def fallback(self, path, args):
         print("ControlServerTCP::fallback(\"%s\") - unknown message, args =" % path, args)
-        self.fReceivedMsgs = True
 
 # ---------------------------------------------------------------------------------------------------------------------
 
-class CarlaControlServerUDP(Server):
+class CarlaControlServerUDP(CarlaControlServer):
     def __init__(self, host, rhost):
-        Server.__init__(self, proto=LO_UDP)
-
-        if False:
-            host = CarlaHostOSC()
-
-        self.host = host
-        self.rhost = rhost
-
-    def idle(self):
-        self.fReceivedMsgs = False
-
-        while self.recv(0) and self.fReceivedMsgs:
-            pass
+        CarlaControlServer.__init__(self, host, rhost, LO_UDP)
 
     def getFullURL(self):
         if self.rhost:
             return "osc.udp://%s:%i/ctrl" % (self.rhost, self.get_port())
         return "%sctrl" % self.get_url()
 
-    @make_method('/ctrl/runtime', 'fiihiiif')
+    @oscHandler('/ctrl/runtime', 'fiihiiif')
     def carla_runtime(self, path, args):
-        self.fReceivedMsgs = True
         load, xruns, playing, frame, bar, beat, tick, bpm = args
         self.host._set_runtime_info(load, xruns)
         self.host._set_transport(bool(playing), frame, bar, beat, tick, bpm)
 
-    @make_method('/ctrl/param', 'iif')
+    @oscHandler('/ctrl/param', 'iif')
     def carla_param_fixme(self, path, args):
-        self.fReceivedMsgs = True
         pluginId, paramId, paramValue = args
         self.host._set_parameterValue(pluginId, paramId, paramValue)
 
-    @make_method('/ctrl/peaks', 'iffff')
+    @oscHandler('/ctrl/peaks', 'iffff')
     def carla_peaks(self, path, args):
-        self.fReceivedMsgs = True
         pluginId, in1, in2, out1, out2 = args
         self.host._set_peaks(pluginId, in1, in2, out1, out2)
 
-    @make_method(None, None)
+    # all plugins at once, as 4 little-endian floats per plugin
+    @oscHandler('/ctrl/peaks_packed', 'b')
+    def carla_peaks_packed(self, path, args):
+        peaks = array('f', bytes(args[0]))
+        if sys.byteorder == "big":
+            peaks.byteswap()
+
+        for pluginId in range(len(peaks) // 4):
+            self.host._set_peaks(pluginId, *peaks[pluginId*4:pluginId*4+4])
+
     def fallback(self, path, args):
         print("ControlServerUDP::fallback(\"%s\") - unknown message, args =" % path, args)
-        self.fReceivedMsgs = True
 
 # ---------------------------------------------------------------------------------------------------------------------
 # Main Window
@@ -596,6 +863,7 @@ class HostWindowOSC(HostWindow):
         lo_target_udp_name = self.fOscAddressUDP.rsplit("/", 1)[-1]
 
         err = None
+        lo_server_tcp = lo_server_udp = None
 
         try:
             lo_target_tcp = Address(self.fOscAddressTCP)
@@ -614,6 +882,10 @@ class HostWindowOSC(HostWindow):
             err = Exception()
 
         if err is not None:
+            for lo_server in (lo_server_tcp, lo_server_udp):
+                if lo_server is not None:
+                    lo_server.shutdown()
+
             fullError = self.tr("Failed to connect to the Carla instance.")
 
             if len(err.args) > 0:
@@ -640,6 +912,9 @@ class HostWindowOSC(HostWindow):
         self.host.lo_target_udp = lo_target_udp
         self.host.lo_target_udp_name = lo_target_udp_name
 
+        self.host.requestPackedPeaks()
+        self.host.requestPluginHashes()
+
         self.ui.act_file_refresh.setEnabled(True)
 
         self.startTimers()
@@ -647,6 +922,7 @@ class HostWindowOSC(HostWindow):
     def disconnectOsc(self):
         self.killTimers()
         self.unregister()
+        self.host.resetPendingMessages()
         self.removeAllPlugins()
         patchcanvas.clear()
 
@@ -663,9 +939,7 @@ class HostWindowOSC(HostWindow):
                     pass
                 self.host.lo_target_tcp = None
 
-            while self.host.lo_server_tcp.recv(0):
-                pass
-            #self.host.lo_server_tcp.free()
+            self.host.lo_server_tcp.shutdown()
             self.host.lo_server_tcp = None
 
         if self.host.lo_server_udp is not None:
@@ -676,9 +950,7 @@ class HostWindowOSC(HostWindow):
                     pass
                 self.host.lo_target_udp = None
 
-            while self.host.lo_server_udp.recv(0):
-                pass
-            #self.host.lo_server_udp.free()
+            self.host.lo_server_udp.shutdown()
             self.host.lo_server_udp = None
 
         self.host.lo_target_tcp_name = ""
@@ -690,6 +962,8 @@ class HostWindowOSC(HostWindow):
     def idleFast(self):
         HostWindow.idleFast(self)
 
+        self.host.idleUpdates()
+
         if self.host.lo_server_tcp is not None:
             self.host.lo_server_tcp.idle()
         else:
@@ -704,6 +978,7 @@ class HostWindowOSC(HostWindow):
 
     def removeAllPlugins(self):
         self.host.fPluginsInfo = {}
+        self.host.pluginStateHashes = {}
         HostWindow.removeAllPlugins(self)
 
     # --------------------------------------------------------------------------------------------------------
@@ -713,6 +988,7 @@ class HostWindowOSC(HostWindow):
         self.fOscAddressTCP = settings.value("RemoteAddressTCP", "osc.tcp://127.0.0.1:22752/Carla", type=str)
         self.fOscAddressUDP = settings.value("RemoteAddressUDP", "osc.udp://127.0.0.1:22752/Carla", type=str)
         self.fOscReportedHost = settings.value("RemoteReportedHost", "", type=str)
+        self.host.updateRate = settings.value("RemoteUpdateRate", 30, type=int)
 
     def saveSettings(self):
         settings = HostWindow.saveSettings(self)
@@ -722,6 +998,7 @@ class HostWindowOSC(HostWindow):
             settings.setValue("RemoteAddressUDP", self.fOscAddressUDP)
         if self.fOscReportedHost:
             settings.setValue("RemoteReportedHost", self.fOscReportedHost)
+        settings.setValue("RemoteUpdateRate", self.host.updateRate)
 
     # --------------------------------------------------------------------------------------------------------
 
@@ -745,23 +1022,31 @@ class HostWindowOSC(HostWindow):
             return
 
         lo_send(self.host.lo_target_udp, "/unregister", self.host.lo_server_udp.getFullURL())
-        while self.host.lo_server_udp.recv(0):
-            pass
-        #self.host.lo_server_udp.free()
+        self.host.lo_server_udp.shutdown()
 
         lo_send(self.host.lo_target_tcp, "/unregister", self.host.lo_server_tcp.getFullURL())
-        while self.host.lo_server_tcp.recv(0):
-            pass
-        #self.host.lo_server_tcp.free()
+        self.host.lo_server_tcp.shutdown()
+
+        # keep the plugin data around, the engine only sends again what changed since
+        pluginsInfo = self.host.fPluginsInfo
+        pluginStateHashes = self.host.pluginStateHashes
 
         self.removeAllPlugins()
         patchcanvas.clear()
 
+        if self.host.deltaSyncSupported:
+            self.host.fPluginsInfo = pluginsInfo
+            self.host.pluginStateHashes = pluginStateHashes
+
         self.host.lo_server_tcp = CarlaControlServerTCP(self.host, self.fOscReportedHost)
         self.host.lo_server_udp = CarlaControlServerUDP(self.host, self.fOscReportedHost)
 
         try:
-            lo_send(self.host.lo_target_tcp, "/register", self.host.lo_server_tcp.getFullURL())
+            if self.host.deltaSyncSupported and self.host.pluginStateHashes:
+                lo_send(self.host.lo_target_tcp, "/register", self.host.lo_server_tcp.getFullURL(),
+                                                              ('b', self.host.getPluginHashesBlob()))
+            else:
+                lo_send(self.host.lo_target_tcp, "/register", self.host.lo_server_tcp.getFullURL())
         except:
             self.disconnectOsc()
             return
@@ -772,12 +1057,14 @@ class HostWindowOSC(HostWindow):
             self.disconnectOsc()
             return
 
+        self.host.requestPackedPeaks()
+
     # --------------------------------------------------------------------------------------------------------
 
     @pyqtSlot()
     def slot_handleSIGTERM(self):
         print("Got SIGTERM -> Closing now")
-        self.host.pendingMessages = []
+        self.host.resetPendingMessages()
         self.close()
 
     @pyqtSlot()
@@ -794,3 +1081,322 @@ class HostWindowOSC(HostWindow):
         HostWindow.closeEvent(self, event)
 
 # ------------------------------------------------------------------------------------------------------------
+# Dashboard, showing the state of many remote Carla instances at once
+
+# Keeps the latest state of a remote instance, written by the dashboard server thread and read by the GUI.
+# Raises AddressError if the address is not valid.
+class DashboardInstance(object):
+    def __init__(self, address):
+        object.__init__(self)
+
+        # the dashboard only uses UDP
+        if address.startswith("osc.tcp://"):
+            address = "osc.udp://" + address[10:]
+
+        self.address = address
+        self.target  = Address(address)
+
+        self.load  = 0.0
+        self.xruns = 0
+        self.pluginCount = 0
+
+        # master peaks, as in first plugin inputs and last plugin outputs
+        self.peaks = (0.0, 0.0, 0.0, 0.0)
+
+        # set when the engine or the network reported an error, cleared by the next reply
+        self.error   = ""
+        self.changed = False
+        self.online  = False
+
+        # last time a reply arrived from the engine
+        self.lastReceived = 0.0
+
+        # packed peaks of the reply being received, which ends with its runtime message
+        self.replyPeaks = (0.0, 0.0, 0.0, 0.0)
+        self.replyPluginCount = 0
+
+# One UDP server for all instances, each one queried with its own reply path, as in "/dash/<index>".
+# Instances are only queried, never registered to, so regular carla-control clients can still connect to them.
+class CarlaDashboardServer(ServerThread):
+    def __init__(self, rhost):
+        ServerThread.__init__(self, proto=LO_UDP, reg_methods=False)
+
+        self.rhost = rhost
+        self.fInstances = []
+
+        self.add_method(None, None, self.handleMessage)
+        self.start()
+
+    def getInstanceURL(self, index):
+        if self.rhost:
+            return "osc.udp://%s:%i/dash/%i" % (self.rhost, self.get_port(), index)
+        return "%sdash/%i" % (self.get_url(), index)
+
+    def getInstances(self):
+        return self.fInstances
+
+    def addInstance(self, instance):
+        self.fInstances.append(instance)
+
+    # Ask all instances for their current state, each one answers once with peaks and runtime info.
+    def queryInstances(self):
+        for index, instance in enumerate(self.fInstances):
+            try:
+                lo_send(instance.target, "/query_status", self.getInstanceURL(index))
+            except OSError as e:
+                if instance.error != str(e):
+                    instance.error = str(e)
+                    instance.changed = True
+
+    # called in the server thread, only the latest state of each instance is kept
+    def handleMessage(self, path, args, types):
+        try:
+            _, _, index, method = path.split("/", 3)
+            instance = self.fInstances[int(index)]
+        except (ValueError, IndexError):
+            return
+
+        if method == "peaks_packed" and types == "b":
+            blob  = bytes(args[0])
+            count = len(blob) // 16
+
+            if count != 0:
+                instance.replyPeaks = kDashboardPeaks.unpack_from(blob, 0) + kDashboardPeaks.unpack_from(blob, count*16-8)
+            else:
+                instance.replyPeaks = (0.0, 0.0, 0.0, 0.0)
+
+            instance.replyPluginCount = count
+            return
+
+        if method == "runtime" and types == "fiihiiif":
+            instance.lastReceived = monotonic()
+            instance.load  = args[0]
+            instance.xruns = args[1]
+            instance.error = ""
+
+            # engines without plugins send no peaks
+            instance.peaks = instance.replyPeaks
+            instance.pluginCount = instance.replyPluginCount
+            instance.replyPeaks = (0.0, 0.0, 0.0, 0.0)
+            instance.replyPluginCount = 0
+
+        elif method == "exit-error" and types == "s":
+            instance.error = args[0]
+
+        else:
+            return
+
+        instance.changed = True
+
+# ---------------------------------------------------------------------------------------------------------------------
+
+class DashboardModel(QAbstractTableModel):
+    COLUMN_ADDRESS      = 0
+    COLUMN_STATUS       = 1
+    COLUMN_PLUGIN_COUNT = 2
+    COLUMN_LOAD         = 3
+    COLUMN_XRUNS        = 4
+    COLUMN_PEAK_IN_L    = 5
+    COLUMN_PEAK_IN_R    = 6
+    COLUMN_PEAK_OUT_L   = 7
+    COLUMN_PEAK_OUT_R   = 8
+    COLUMN_COUNT        = 9
+
+    def __init__(self, server, parent):
+        QAbstractTableModel.__init__(self, parent)
+
+        self.fServer = server
+        self.fInstances = server.getInstances()
+
+        self.fHeaders = (
+            self.tr("Instance"),
+            self.tr("Status"),
+            self.tr("Plugins"),
+            self.tr("DSP Load"),
+            self.tr("Xruns"),
+            self.tr("In L"),
+            self.tr("In R"),
+            self.tr("Out L"),
+            self.tr("Out R"),
+        )
+
+    # Raises AddressError if the address is not valid, before any row is inserted.
+    def addInstance(self, address):
+        instance = DashboardInstance(address)
+        row = len(self.fInstances)
+
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.fServer.addInstance(instance)
+        self.endInsertRows()
+
+    # Update the rows that changed since the last call, cheap when nothing did.
+    def updateChanged(self):
+        now   = monotonic()
+        first = last = -1
+
+        for row, instance in enumerate(self.fInstances):
+            online = now - instance.lastReceived < kDashboardTimeout
+
+            if not instance.changed and online == instance.online:
+                continue
+
+            instance.changed = False
+            instance.online  = online
+
+            if first < 0:
+                first = row
+            last = row
+
+        if first >= 0:
+            self.dataChanged.emit(self.index(first, 0), self.index(last, self.COLUMN_COUNT-1))
+
+    # -----------------------------------------------------------------------------------------------------------------
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.fInstances)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.COLUMN_COUNT
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.fHeaders[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        column = index.column()
+
+        if role == Qt.TextAlignmentRole:
+            if column in (self.COLUMN_ADDRESS, self.COLUMN_STATUS):
+                return int(Qt.AlignLeft | Qt.AlignVCenter)
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+
+        if role != Qt.DisplayRole:
+            return None
+
+        instance = self.fInstances[index.row()]
+
+        if column == self.COLUMN_ADDRESS:
+            return instance.address
+        if column == self.COLUMN_STATUS:
+            if instance.error:
+                return self.tr("Error: %s") % instance.error
+            if instance.online:
+                return self.tr("Online")
+            return self.tr("Offline")
+
+        if not instance.online:
+            return ""
+
+        if column == self.COLUMN_PLUGIN_COUNT:
+            return str(instance.pluginCount)
+        if column == self.COLUMN_LOAD:
+            return "%.1f%%" % instance.load
+        if column == self.COLUMN_XRUNS:
+            return str(instance.xruns)
+
+        peak = instance.peaks[column - self.COLUMN_PEAK_IN_L]
+
+        if peak <= 0.0:
+            return "-inf dB"
+        return "%.1f dB" % (20.0 * log10(peak))
+
+# ---------------------------------------------------------------------------------------------------------------------
+
+class DashboardWindowOSC(QMainWindow):
+    def __init__(self, addresses):
+        QMainWindow.__init__(self)
+        self.setWindowTitle(self.tr("Carla Control - Dashboard"))
+        self.resize(900, 500)
+
+        settings = QSafeSettings("falkTX", "CarlaOSCConnect")
+
+        if settings.value("ReportedHostAutomatic", True, bool):
+            rhost = ""
+        else:
+            rhost = settings.value("ReportedHost", "", type=str)
+
+        self.fServer = CarlaDashboardServer(rhost)
+        self.fModel  = DashboardModel(self.fServer, self)
+
+        # -------------------------------------------------------------------------------------------------------------
+        # Set-up GUI
+
+        self.fView = QTableView(self)
+        self.fView.setModel(self.fModel)
+        self.fView.setSelectionBehavior(QTableView.SelectRows)
+        self.fView.verticalHeader().hide()
+        self.fView.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.fView.horizontalHeader().setSectionResizeMode(DashboardModel.COLUMN_ADDRESS, QHeaderView.Stretch)
+        self.setCentralWidget(self.fView)
+
+        self.fStatusLabel = QLabel(self)
+        self.statusBar().addWidget(self.fStatusLabel)
+
+        menu = self.menuBar().addMenu(self.tr("&File"))
+        menu.addAction(self.tr("&Add Instance..."), self.slot_addInstance)
+        menu.addSeparator()
+        menu.addAction(self.tr("&Quit"), self.close)
+
+        # -------------------------------------------------------------------------------------------------------------
+        # Final setup
+
+        for address in addresses:
+            self.addInstance(address)
+
+        self.fTimer = self.startTimer(1000 // kDashboardRate)
+
+    def addInstance(self, address):
+        try:
+            self.fModel.addInstance(address)
+        except AddressError as e:
+            CustomMessageBox(self,
+                             QMessageBox.Warning,
+                             self.tr("Error"),
+                             self.tr("Invalid instance address '%s'") % address,
+                             e.args[0] if len(e.args) > 0 else "",
+                             QMessageBox.Ok,
+                             QMessageBox.Ok)
+
+    def updateStatus(self):
+        instances = self.fServer.getInstances()
+        online = [instance for instance in instances if instance.online]
+
+        self.fStatusLabel.setText(self.tr("%i of %i instances online, highest DSP load %.1f%%, total xruns %i") % (
+                                  len(online),
+                                  len(instances),
+                                  max((instance.load for instance in online), default=0.0),
+                                  sum(instance.xruns for instance in online)))
+
+    # -----------------------------------------------------------------------------------------------------------------
+
+    @pyqtSlot()
+    def slot_addInstance(self):
+        dialog = ConnectDialog(self)
+
+        if not dialog.exec_():
+            return
+
+        host, rhost, tcpPort, udpPort = dialog.getResult()
+        self.addInstance("osc.udp://%s:%i/Carla" % (host, udpPort))
+
+    # -----------------------------------------------------------------------------------------------------------------
+
+    def timerEvent(self, event):
+        if event.timerId() == self.fTimer:
+            self.fServer.queryInstances()
+            self.fModel.updateChanged()
+            self.updateStatus()
+
+        QMainWindow.timerEvent(self, event)
+
+    def closeEvent(self, event):
+        self.killTimer(self.fTimer)
+        self.fServer.stop()
+
+        QMainWindow.closeEvent(self, event)
+
+# ------------------------------------------------------------------------------------------------------------
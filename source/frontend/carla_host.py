@@ -21,13 +21,15 @@
 
 import json
 
+from xml.etree import ElementTree
+
 # This fails in some configurations, assume >= 5.6.0 in that case
 try:
     from PyQt5.Qt import PYQT_VERSION
 except ImportError:
     PYQT_VERSION = 0x50600
 
-from PyQt5.QtCore import QT_VERSION, qCritical, QEventLoop, QFileInfo, QModelIndex, QPointF, QTimer, QEvent
+from PyQt5.QtCore import QT_VERSION, qCritical, QEventLoop, QFileInfo, QModelIndex, QPointF, QThread, QTimer, QEvent
 from PyQt5.QtGui import QImage, QImageWriter, QPalette, QBrush
 from PyQt5.QtWidgets import QAction, QApplication, QInputDialog, QFileSystemModel, QListWidgetItem, QGraphicsView, QMainWindow
 
@@ -97,6 +99,47 @@ class CarlaPrint:
     def write(self, string):
         gCarla.utils.fputs(self.err, string)
 
+# ------------------------------------------------------------------------------------------------------------
+# Project load helpers
+
+# Count how many plugins a project (or preset) file is going to load, used for progress reports
+def getProjectPluginCount(filename):
+    count = 0
+    depth = 0
+
+    try:
+        for event, elem in ElementTree.iterparse(filename, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if depth == 1 and elem.tag.lower() == "carla-preset":
+                    return 1
+                continue
+
+            depth -= 1
+            if depth == 1 and elem.tag == "Plugin":
+                count += 1
+            elem.clear()
+    except:
+        pass
+
+    return count
+
+# Runs host.load_project() outside of the GUI thread.
+# Engine callbacks triggered by the load are delivered to the GUI as queued Qt signals.
+class ProjectLoadThread(QThread):
+    def __init__(self, host, filename, parent):
+        QThread.__init__(self, parent)
+        self.host = host
+        self.fFilename = filename
+        self.fSuccess  = False
+        self.fErrorMsg = ""
+
+    def run(self):
+        self.fSuccess = self.host.load_project(self.fFilename)
+
+        if not self.fSuccess:
+            self.fErrorMsg = self.host.get_last_error()
+
 # ------------------------------------------------------------------------------------------------------------
 # Host Window
 
@@ -105,6 +148,7 @@ class HostWindow(QMainWindow):
     # signals
     SIGTERM = pyqtSignal()
     SIGUSR1 = pyqtSignal()
+    ProjectLoadProgress = pyqtSignal(int, int, str) # loaded, total, plugin name
 
     # CustomActions
     CUSTOM_ACTION_NONE         = 0
@@ -144,9 +188,17 @@ class HostWindow(QMainWindow):
 
         self.fPluginDatabaseDialog = None
         self.fFavoritePlugins = []
+        self.fPluginPrewarmQueue = []
 
         self.fProjectFilename  = ""
         self.fIsProjectLoading = False
+
+        # background project loading
+        self.fProjectLoadThread   = None
+        self.fProjectLoadCanceled = False
+        self.fProjectLoadCurrent  = 0
+        self.fProjectLoadTotal    = 0
+        self.fProjectLoadActions  = []
         self.fCurrentlyRemovingAllPlugins = False
 
         self.fLastTransportBPM   = 0.0
@@ -511,6 +563,7 @@ class HostWindow(QMainWindow):
 
         self.SIGUSR1.connect(self.slot_handleSIGUSR1)
         self.SIGTERM.connect(self.slot_handleSIGTERM)
+        self.ProjectLoadProgress.connect(self.slot_projectLoadProgress)
 
         host.EngineStartedCallback.connect(self.slot_handleEngineStartedCallback)
         host.EngineStoppedCallback.connect(self.slot_handleEngineStoppedCallback)
@@ -522,6 +575,7 @@ class HostWindow(QMainWindow):
 
         host.PluginAddedCallback.connect(self.slot_handlePluginAddedCallback)
         host.PluginRemovedCallback.connect(self.slot_handlePluginRemovedCallback)
+        host.ParameterValuesChangedCallback.connect(self.slot_handleParameterValuesChangedCallback)
         host.ReloadAllCallback.connect(self.slot_handleReloadAllCallback)
 
         host.NoteOnCallback.connect(self.slot_handleNoteOnCallback)
@@ -723,6 +777,10 @@ class HostWindow(QMainWindow):
         self.projectLoadingStarted()
         self.fIsProjectLoading = True
 
+        if self.host.asyncProjectLoad and not (self.host.isControl or self.host.isPlugin):
+            self.loadProjectInBackground()
+            return
+
         if not self.host.load_project(self.fProjectFilename):
             self.fIsProjectLoading = False
             self.projectLoadingFinished()
@@ -731,6 +789,32 @@ class HostWindow(QMainWindow):
                              self.host.get_last_error(),
                              QMessageBox.Ok, QMessageBox.Ok)
 
+    def loadProjectInBackground(self):
+        self.fProjectLoadCanceled = False
+        self.fProjectLoadCurrent  = 0
+        self.fProjectLoadTotal    = getProjectPluginCount(self.fProjectFilename)
+
+        # the engine is busy in another thread, do not let the user start other engine operations meanwhile
+        self.fProjectLoadActions = [act for act in (self.ui.act_file_new,
+                                                    self.ui.act_file_open,
+                                                    self.ui.act_file_save,
+                                                    self.ui.act_file_save_as,
+                                                    self.ui.act_engine_start,
+                                                    self.ui.act_engine_stop,
+                                                    self.ui.act_engine_config,
+                                                    self.ui.act_plugin_add,
+                                                    self.ui.act_plugin_add_jack,
+                                                    self.ui.act_plugin_remove_all) if act.isEnabled()]
+
+        for act in self.fProjectLoadActions:
+            act.setEnabled(False)
+
+        self.ui.menu_PluginMacros.setEnabled(False)
+
+        self.fProjectLoadThread = ProjectLoadThread(self.host, self.fProjectFilename, self)
+        self.fProjectLoadThread.finished.connect(self.slot_projectLoadThreadFinished)
+        self.fProjectLoadThread.start()
+
     def loadProjectLater(self, filename):
         self.fProjectFilename = QFileInfo(filename).absoluteFilePath()
         self.setProperWindowTitle()
@@ -842,6 +926,60 @@ class HostWindow(QMainWindow):
     def slot_loadProjectNow(self):
         self.loadProjectNow()
 
+    @pyqtSlot(int, int, str)
+    def slot_projectLoadProgress(self, loaded, total, pluginName):
+        if self.fCancelableActionBox is None:
+            return
+
+        if total > 0:
+            text = self.tr("Loaded plugin %i of %i: %s") % (loaded, total, pluginName)
+        else:
+            text = self.tr("Loaded plugin %i: %s") % (loaded, pluginName)
+
+        self.fCancelableActionBox.setInformativeText(text)
+
+    @pyqtSlot()
+    def slot_projectLoadThreadFinished(self):
+        thread = self.fProjectLoadThread
+        self.fProjectLoadThread = None
+
+        if thread is None:
+            return
+
+        # create the widgets of plugins added while the load thread was running
+        for pluginId in range(self.fPluginCount):
+            if self.fPluginList[pluginId] is None:
+                self.fPluginList[pluginId] = self.ui.listWidget.createItem(pluginId)
+
+        for act in self.fProjectLoadActions:
+            act.setEnabled(True)
+
+        self.fProjectLoadActions = []
+        self.ui.menu_PluginMacros.setEnabled(self.host.is_engine_running())
+        self.ui.act_plugin_remove_all.setEnabled(self.fPluginCount > 0)
+
+        # a canceled or failed load does not report the end of the cancelable action
+        if self.fCancelableActionBox is not None:
+            self.fCancelableActionBox.close()
+            self.fCancelableActionBox = None
+
+        if self.fIsProjectLoading:
+            self.fIsProjectLoading = False
+            self.projectLoadingFinished()
+
+        if thread.fSuccess:
+            return
+
+        # plugins loaded so far are kept, we just stop where the user asked us to
+        if self.fProjectLoadCanceled:
+            self.ui.text_logs.appendPlainText("Project load canceled, %i of %i plugins loaded" % (self.fProjectLoadCurrent,
+                                                                                                 self.fProjectLoadTotal))
+            return
+
+        CustomMessageBox(self, QMessageBox.Critical, self.tr("Error"), self.tr("Failed to load project"),
+                         thread.fErrorMsg,
+                         QMessageBox.Ok, QMessageBox.Ok)
+
     # --------------------------------------------------------------------------------------------------------
     # Engine (menu actions)
 
@@ -995,6 +1133,8 @@ class HostWindow(QMainWindow):
         self.refreshRuntimeInfo(0.0, 0)
         self.startTimers()
 
+        self.queueFavoritePluginsPrewarm()
+
         self.ui.text_logs.appendPlainText("======= Engine started ========")
         self.ui.text_logs.appendPlainText("Carla engine started, details:")
         self.ui.text_logs.appendPlainText("  Driver name:  %s" % driverName)
@@ -1012,6 +1152,8 @@ class HostWindow(QMainWindow):
         self.removeAllPlugins()
         self.refreshRuntimeInfo(0.0, 0)
 
+        self.fPluginPrewarmQueue = []
+
         self.ui.menu_PluginMacros.setEnabled(False)
         self.ui.menu_Canvas.setEnabled(False)
         self.ui.w_transport.setEnabled(False)
@@ -1061,6 +1203,9 @@ class HostWindow(QMainWindow):
 
     @pyqtSlot()
     def slot_canlableActionBoxClicked(self):
+        if self.fProjectLoadThread is not None:
+            self.fProjectLoadCanceled = True
+
         self.host.cancel_engine_action()
 
     @pyqtSlot()
@@ -1090,6 +1235,50 @@ class HostWindow(QMainWindow):
         self.fPluginCount = 0
         self.fPluginList  = []
 
+    # --------------------------------------------------------------------------------------------------------
+    # Plugins (pre-warm pool)
+
+    def canPrewarmPlugins(self):
+        if self.host.isControl or self.host.isPlugin:
+            return False
+        if self.host.pluginPoolMemory <= 0 or self.host.processMode == ENGINE_PROCESS_MODE_MULTIPLE_CLIENTS:
+            return False
+        return self.host.is_engine_running()
+
+    def queuePluginPrewarm(self, plugin):
+        if not self.canPrewarmPlugins():
+            return
+        if plugin['type'] == PLUGIN_JACK:
+            return
+        if plugin not in self.fPluginPrewarmQueue:
+            self.fPluginPrewarmQueue.append(plugin)
+
+    def queueFavoritePluginsPrewarm(self):
+        self.fPluginPrewarmQueue = []
+
+        # most recently added favorites last, so they are kept in the pool when memory runs out
+        for plugin in reversed(self.fFavoritePlugins):
+            self.queuePluginPrewarm(plugin)
+
+    def prewarmQueuedPlugins(self):
+        # the engine creates the plugins on its own thread, here we only hand over the requests
+        if len(self.fPluginPrewarmQueue) == 0:
+            return
+        if self.fIsProjectLoading or self.fCurrentlyRemovingAllPlugins:
+            return
+        if self.fProjectLoadThread is not None:
+            return
+        if not self.canPrewarmPlugins():
+            self.fPluginPrewarmQueue = []
+            return
+
+        queue, self.fPluginPrewarmQueue = self.fPluginPrewarmQueue, []
+
+        # failing is fine, the plugin is then loaded the usual way when added
+        for plugin in queue:
+            self.host.prewarm_plugin(plugin['build'], plugin['type'], plugin['filename'], None,
+                                     plugin['label'], plugin['uniqueId'], None, PLUGIN_OPTIONS_NULL)
+
     # --------------------------------------------------------------------------------------------------------
     # Plugins (menu actions)
 
@@ -1102,6 +1291,7 @@ class HostWindow(QMainWindow):
 
         if dialog.fFavoritePluginsChanged:
             self.fFavoritePlugins = dialog.fFavoritePlugins
+            self.queueFavoritePluginsPrewarm()
 
         if not ret:
             return
@@ -1145,6 +1335,10 @@ class HostWindow(QMainWindow):
                              self.tr("Error"),
                              self.tr("Failed to load plugin"),
                              self.host.get_last_error(), QMessageBox.Ok, QMessageBox.Ok)
+            return
+
+        # the pooled instance (if any) was just taken, prepare a new one
+        self.queuePluginPrewarm(plugin)
 
     @pyqtSlot()
     def slot_showPluginActionsMenu(self):
@@ -1192,6 +1386,13 @@ class HostWindow(QMainWindow):
         if not self.host.add_plugin(btype, ptype, filename, None, label, uniqueId, extraPtr, PLUGIN_OPTIONS_NULL):
             CustomMessageBox(self, QMessageBox.Critical, self.tr("Error"), self.tr("Failed to load plugin"),
                              self.host.get_last_error(), QMessageBox.Ok, QMessageBox.Ok)
+            return
+
+        for plugin in self.fFavoritePlugins:
+            if (plugin['build'], plugin['type'], plugin['filename'], plugin['label'], plugin['uniqueId']) == \
+               (btype, ptype, filename, label, uniqueId):
+                self.queuePluginPrewarm(plugin)
+                break
 
     @pyqtSlot()
     def slot_confirmRemoveAll(self):
@@ -1340,7 +1541,16 @@ class HostWindow(QMainWindow):
         if pluginId != self.fPluginCount:
             print("ERROR: pluginAdded mismatch Id:", pluginId, self.fPluginCount)
             pitem = self.getPluginItem(pluginId)
-            pitem.recreateWidget()
+            if pitem is not None:
+                pitem.recreateWidget()
+            return
+
+        if self.fProjectLoadThread is not None:
+            # the load thread is still setting up this plugin, its widget is created once loading is done
+            self.fPluginList.append(None)
+            self.fPluginCount += 1
+            self.fProjectLoadCurrent += 1
+            self.ProjectLoadProgress.emit(self.fProjectLoadCurrent, self.fProjectLoadTotal, pluginName)
             return
 
         pitem = self.ui.listWidget.createItem(pluginId)
@@ -1379,10 +1589,21 @@ class HostWindow(QMainWindow):
         # push all plugins 1 slot back
         for i in range(pluginId, self.fPluginCount):
             pitem = self.fPluginList[i]
-            pitem.setPluginId(i)
+            if pitem is not None:
+                pitem.setPluginId(i)
 
         self.ui.act_plugin_remove_all.setEnabled(True)
 
+    @pyqtSlot(list)
+    def slot_handleParameterValuesChangedCallback(self, values):
+        for pluginId, parameterId, value in values:
+            pwidget = self.getPluginSlotWidget(pluginId)
+
+            if pwidget is None:
+                continue
+
+            pwidget.setParameterValue(parameterId, value, True)
+
     # --------------------------------------------------------------------------------------------------------
     # Canvas
 
@@ -1944,6 +2165,7 @@ class HostWindow(QMainWindow):
             pass
         elif self.host.is_engine_running():
             self.host.patchbay_refresh(self.fExternalPatchbay)
+            self.queueFavoritePluginsPrewarm()
 
     # --------------------------------------------------------------------------------------------------------
     # About (menu actions)
@@ -2586,6 +2808,7 @@ class HostWindow(QMainWindow):
 
     def idleFast(self):
         self.host.engine_idle()
+        self.host.flushParameterValueChanges()
         self.refreshTransport()
 
         if self.fPluginCount == 0 or self.fCurrentlyRemovingAllPlugins:
@@ -2618,6 +2841,7 @@ class HostWindow(QMainWindow):
 
     def idleSlow(self):
         self.getAndRefreshRuntimeInfo()
+        self.prewarmQueuedPlugins()
 
         if self.fPluginCount == 0 or self.fCurrentlyRemovingAllPlugins:
             return
@@ -2629,7 +2853,12 @@ class HostWindow(QMainWindow):
             pitem.getWidget().idleSlow()
 
     def timerEvent(self, event):
-        if event.timerId() == self.fIdleTimerFast:
+        # the project load thread is changing the engine plugins, do not touch the engine until it is done
+        # only the progress box is updated meanwhile, through ProjectLoadProgress
+        if self.fProjectLoadThread is not None:
+            pass
+
+        elif event.timerId() == self.fIdleTimerFast:
             self.idleFast()
 
         elif event.timerId() == self.fIdleTimerSlow:
@@ -2747,6 +2976,11 @@ class HostWindow(QMainWindow):
             QTimer.singleShot(100, self.close)
             return
 
+        if self.fProjectLoadThread is not None:
+            self.host.set_engine_about_to_close()
+            self.host.cancel_engine_action()
+            self.fProjectLoadThread.wait()
+
         self.killTimers()
         self.saveSettings()
 
@@ -2868,10 +3102,138 @@ def canvasCallback(action, value1, value2, valueStr):
 # ------------------------------------------------------------------------------------------------------------
 # Engine callback
 
+def _parameterMappedRangeChanged(host, pluginId, value1, value2, value3, valuef, valueStr):
+    minimum, maximum = (float(v) for v in valueStr.split(":", 2))
+    host.ParameterMappedRangeChangedCallback.emit(pluginId, value1, minimum, maximum)
+
+def _patchbayConnectionAdded(host, pluginId, value1, value2, value3, valuef, valueStr):
+    gOut, pOut, gIn, pIn = [int(i) for i in valueStr.split(":")] # FIXME
+    host.PatchbayConnectionAddedCallback.emit(pluginId, gOut, pOut, gIn, pIn)
+
+def _engineIdle(host, pluginId, value1, value2, value3, valuef, valueStr):
+    # background project loading sends idle callbacks from its own thread, the GUI thread is free to run then
+    if QThread.currentThread() != QApplication.instance().thread():
+        return
+    QApplication.processEvents()
+
+# action -> handler(host, pluginId, value1, value2, value3, valuef, valueStr)
+# ENGINE_CALLBACK_PARAMETER_VALUE_CHANGED is not here, it goes through the host coalescing queue
+gEngineCallbackHandlers = {
+    ENGINE_CALLBACK_DEBUG:
+        lambda h,p,v1,v2,v3,vf,vs: h.DebugCallback.emit(p, v1, v2, v3, vf, vs),
+    ENGINE_CALLBACK_PLUGIN_ADDED:
+        lambda h,p,v1,v2,v3,vf,vs: h.PluginAddedCallback.emit(p, vs),
+    ENGINE_CALLBACK_PLUGIN_REMOVED:
+        lambda h,p,v1,v2,v3,vf,vs: h.PluginRemovedCallback.emit(p),
+    ENGINE_CALLBACK_PLUGIN_RENAMED:
+        lambda h,p,v1,v2,v3,vf,vs: h.PluginRenamedCallback.emit(p, vs),
+    ENGINE_CALLBACK_PLUGIN_UNAVAILABLE:
+        lambda h,p,v1,v2,v3,vf,vs: h.PluginUnavailableCallback.emit(p, vs),
+    ENGINE_CALLBACK_PARAMETER_DEFAULT_CHANGED:
+        lambda h,p,v1,v2,v3,vf,vs: h.ParameterDefaultChangedCallback.emit(p, v1, vf),
+    ENGINE_CALLBACK_PARAMETER_MAPPED_CONTROL_INDEX_CHANGED:
+        lambda h,p,v1,v2,v3,vf,vs: h.ParameterMappedControlIndexChangedCallback.emit(p, v1, v2),
+    ENGINE_CALLBACK_PARAMETER_MAPPED_RANGE_CHANGED:
+        _parameterMappedRangeChanged,
+    ENGINE_CALLBACK_PARAMETER_MIDI_CHANNEL_CHANGED:
+        lambda h,p,v1,v2,v3,vf,vs: h.ParameterMidiChannelChangedCallback.emit(p, v1, v2),
+    ENGINE_CALLBACK_PROGRAM_CHANGED:
+        lambda h,p,v1,v2,v3,vf,vs: h.ProgramChangedCallback.emit(p, v1),
+    ENGINE_CALLBACK_MIDI_PROGRAM_CHANGED:
+        lambda h,p,v1,v2,v3,vf,vs: h.MidiProgramChangedCallback.emit(p, v1),
+    ENGINE_CALLBACK_OPTION_CHANGED:
+        lambda h,p,v1,v2,v3,vf,vs: h.OptionChangedCallback.emit(p, v1, bool(v2)),
+    ENGINE_CALLBACK_UI_STATE_CHANGED:
+        lambda h,p,v1,v2,v3,vf,vs: h.UiStateChangedCallback.emit(p, v1),
+    ENGINE_CALLBACK_NOTE_ON:
+        lambda h,p,v1,v2,v3,vf,vs: h.NoteOnCallback.emit(p, v1, v2, v3),
+    ENGINE_CALLBACK_NOTE_OFF:
+        lambda h,p,v1,v2,v3,vf,vs: h.NoteOffCallback.emit(p, v1, v2),
+    ENGINE_CALLBACK_UPDATE:
+        lambda h,p,v1,v2,v3,vf,vs: h.UpdateCallback.emit(p),
+    ENGINE_CALLBACK_RELOAD_INFO:
+        lambda h,p,v1,v2,v3,vf,vs: h.ReloadInfoCallback.emit(p),
+    ENGINE_CALLBACK_RELOAD_PARAMETERS:
+        lambda h,p,v1,v2,v3,vf,vs: h.ReloadParametersCallback.emit(p),
+    ENGINE_CALLBACK_RELOAD_PROGRAMS:
+        lambda h,p,v1,v2,v3,vf,vs: h.ReloadProgramsCallback.emit(p),
+    ENGINE_CALLBACK_RELOAD_ALL:
+        lambda h,p,v1,v2,v3,vf,vs: h.ReloadAllCallback.emit(p),
+    ENGINE_CALLBACK_PATCHBAY_CLIENT_ADDED:
+        lambda h,p,v1,v2,v3,vf,vs: h.PatchbayClientAddedCallback.emit(p, v1, v2, vs),
+    ENGINE_CALLBACK_PATCHBAY_CLIENT_REMOVED:
+        lambda h,p,v1,v2,v3,vf,vs: h.PatchbayClientRemovedCallback.emit(p),
+    ENGINE_CALLBACK_PATCHBAY_CLIENT_RENAMED:
+        lambda h,p,v1,v2,v3,vf,vs: h.PatchbayClientRenamedCallback.emit(p, vs),
+    ENGINE_CALLBACK_PATCHBAY_CLIENT_DATA_CHANGED:
+        lambda h,p,v1,v2,v3,vf,vs: h.PatchbayClientDataChangedCallback.emit(p, v1, v2),
+    ENGINE_CALLBACK_PATCHBAY_CLIENT_POSITION_CHANGED:
+        lambda h,p,v1,v2,v3,vf,vs: h.PatchbayClientPositionChangedCallback.emit(p, v1, v2, v3, int(round(vf))),
+    ENGINE_CALLBACK_PATCHBAY_PORT_ADDED:
+        lambda h,p,v1,v2,v3,vf,vs: h.PatchbayPortAddedCallback.emit(p, v1, v2, v3, vs),
+    ENGINE_CALLBACK_PATCHBAY_PORT_REMOVED:
+        lambda h,p,v1,v2,v3,vf,vs: h.PatchbayPortRemovedCallback.emit(p, v1),
+    ENGINE_CALLBACK_PATCHBAY_PORT_CHANGED:
+        lambda h,p,v1,v2,v3,vf,vs: h.PatchbayPortChangedCallback.emit(p, v1, v2, v3, vs),
+    ENGINE_CALLBACK_PATCHBAY_PORT_GROUP_ADDED:
+        lambda h,p,v1,v2,v3,vf,vs: h.PatchbayPortGroupAddedCallback.emit(p, v1, v2, vs),
+    ENGINE_CALLBACK_PATCHBAY_PORT_GROUP_REMOVED:
+        lambda h,p,v1,v2,v3,vf,vs: h.PatchbayPortGroupRemovedCallback.emit(p, v1),
+    ENGINE_CALLBACK_PATCHBAY_PORT_GROUP_CHANGED:
+        lambda h,p,v1,v2,v3,vf,vs: h.PatchbayPortGroupChangedCallback.emit(p, v1, v2, vs),
+    ENGINE_CALLBACK_PATCHBAY_CONNECTION_ADDED:
+        _patchbayConnectionAdded,
+    ENGINE_CALLBACK_PATCHBAY_CONNECTION_REMOVED:
+        lambda h,p,v1,v2,v3,vf,vs: h.PatchbayConnectionRemovedCallback.emit(p, v1, v2),
+    ENGINE_CALLBACK_ENGINE_STARTED:
+        lambda h,p,v1,v2,v3,vf,vs: h.EngineStartedCallback.emit(p, v1, v2, v3, vf, vs),
+    ENGINE_CALLBACK_ENGINE_STOPPED:
+        lambda h,p,v1,v2,v3,vf,vs: h.EngineStoppedCallback.emit(),
+    ENGINE_CALLBACK_PROCESS_MODE_CHANGED:
+        lambda h,p,v1,v2,v3,vf,vs: h.ProcessModeChangedCallback.emit(v1),
+    ENGINE_CALLBACK_TRANSPORT_MODE_CHANGED:
+        lambda h,p,v1,v2,v3,vf,vs: h.TransportModeChangedCallback.emit(v1, vs),
+    ENGINE_CALLBACK_BUFFER_SIZE_CHANGED:
+        lambda h,p,v1,v2,v3,vf,vs: h.BufferSizeChangedCallback.emit(v1),
+    ENGINE_CALLBACK_SAMPLE_RATE_CHANGED:
+        lambda h,p,v1,v2,v3,vf,vs: h.SampleRateChangedCallback.emit(vf),
+    ENGINE_CALLBACK_CANCELABLE_ACTION:
+        lambda h,p,v1,v2,v3,vf,vs: h.CancelableActionCallback.emit(p, bool(v1 != 0), vs),
+    ENGINE_CALLBACK_PROJECT_LOAD_FINISHED:
+        lambda h,p,v1,v2,v3,vf,vs: h.ProjectLoadFinishedCallback.emit(),
+    ENGINE_CALLBACK_NSM:
+        lambda h,p,v1,v2,v3,vf,vs: h.NSMCallback.emit(v1, v2, vs),
+    ENGINE_CALLBACK_IDLE:
+        _engineIdle,
+    ENGINE_CALLBACK_INFO:
+        lambda h,p,v1,v2,v3,vf,vs: h.InfoCallback.emit(vs),
+    ENGINE_CALLBACK_ERROR:
+        lambda h,p,v1,v2,v3,vf,vs: h.ErrorCallback.emit(vs),
+    ENGINE_CALLBACK_QUIT:
+        lambda h,p,v1,v2,v3,vf,vs: h.QuitCallback.emit(),
+    ENGINE_CALLBACK_INLINE_DISPLAY_REDRAW:
+        lambda h,p,v1,v2,v3,vf,vs: h.InlineDisplayRedrawCallback.emit(p),
+}
+
+# Actions that do not depend on parameter values being up-to-date.
+# Anything else flushes the pending parameter values first, so ordering is kept as seen by the engine.
+gEngineCallbackUnorderedActions = frozenset((
+    ENGINE_CALLBACK_DEBUG,
+    ENGINE_CALLBACK_NOTE_ON,
+    ENGINE_CALLBACK_NOTE_OFF,
+    ENGINE_CALLBACK_IDLE,
+    ENGINE_CALLBACK_INFO,
+    ENGINE_CALLBACK_INLINE_DISPLAY_REDRAW,
+))
+
 def engineCallback(host, action, pluginId, value1, value2, value3, valuef, valueStr):
     # kdevelop likes this :)
     if False: host = CarlaHostNull()
 
+    if action == ENGINE_CALLBACK_PARAMETER_VALUE_CHANGED:
+        host.queueParameterValueChanged(pluginId, value1, valuef)
+        return
+
     valueStr = charPtrToString(valueStr)
 
     if action == ENGINE_CALLBACK_ENGINE_STARTED:
@@ -2883,106 +3245,16 @@ def engineCallback(host, action, pluginId, value1, value2, value3, valuef, value
         host.transportMode  = value1
         host.transportExtra = valueStr
 
-    if action == ENGINE_CALLBACK_DEBUG:
-        host.DebugCallback.emit(pluginId, value1, value2, value3, valuef, valueStr)
-    elif action == ENGINE_CALLBACK_PLUGIN_ADDED:
-        host.PluginAddedCallback.emit(pluginId, valueStr)
-    elif action == ENGINE_CALLBACK_PLUGIN_REMOVED:
-        host.PluginRemovedCallback.emit(pluginId)
-    elif action == ENGINE_CALLBACK_PLUGIN_RENAMED:
-        host.PluginRenamedCallback.emit(pluginId, valueStr)
-    elif action == ENGINE_CALLBACK_PLUGIN_UNAVAILABLE:
-        host.PluginUnavailableCallback.emit(pluginId, valueStr)
-    elif action == ENGINE_CALLBACK_PARAMETER_VALUE_CHANGED:
-        host.ParameterValueChangedCallback.emit(pluginId, value1, valuef)
-    elif action == ENGINE_CALLBACK_PARAMETER_DEFAULT_CHANGED:
-        host.ParameterDefaultChangedCallback.emit(pluginId, value1, valuef)
-    elif action == ENGINE_CALLBACK_PARAMETER_MAPPED_CONTROL_INDEX_CHANGED:
-        host.ParameterMappedControlIndexChangedCallback.emit(pluginId, value1, value2)
-    elif action == ENGINE_CALLBACK_PARAMETER_MAPPED_RANGE_CHANGED:
-        minimum, maximum = (float(v) for v in valueStr.split(":", 2))
-        host.ParameterMappedRangeChangedCallback.emit(pluginId, value1, minimum, maximum)
-    elif action == ENGINE_CALLBACK_PARAMETER_MIDI_CHANNEL_CHANGED:
-        host.ParameterMidiChannelChangedCallback.emit(pluginId, value1, value2)
-    elif action == ENGINE_CALLBACK_PROGRAM_CHANGED:
-        host.ProgramChangedCallback.emit(pluginId, value1)
-    elif action == ENGINE_CALLBACK_MIDI_PROGRAM_CHANGED:
-        host.MidiProgramChangedCallback.emit(pluginId, value1)
-    elif action == ENGINE_CALLBACK_OPTION_CHANGED:
-        host.OptionChangedCallback.emit(pluginId, value1, bool(value2))
-    elif action == ENGINE_CALLBACK_UI_STATE_CHANGED:
-        host.UiStateChangedCallback.emit(pluginId, value1)
-    elif action == ENGINE_CALLBACK_NOTE_ON:
-        host.NoteOnCallback.emit(pluginId, value1, value2, value3)
-    elif action == ENGINE_CALLBACK_NOTE_OFF:
-        host.NoteOffCallback.emit(pluginId, value1, value2)
-    elif action == ENGINE_CALLBACK_UPDATE:
-        host.UpdateCallback.emit(pluginId)
-    elif action == ENGINE_CALLBACK_RELOAD_INFO:
-        host.ReloadInfoCallback.emit(pluginId)
-    elif action == ENGINE_CALLBACK_RELOAD_PARAMETERS:
-        host.ReloadParametersCallback.emit(pluginId)
-    elif action == ENGINE_CALLBACK_RELOAD_PROGRAMS:
-        host.ReloadProgramsCallback.emit(pluginId)
-    elif action == ENGINE_CALLBACK_RELOAD_ALL:
-        host.ReloadAllCallback.emit(pluginId)
-    elif action == ENGINE_CALLBACK_PATCHBAY_CLIENT_ADDED:
-        host.PatchbayClientAddedCallback.emit(pluginId, value1, value2, valueStr)
-    elif action == ENGINE_CALLBACK_PATCHBAY_CLIENT_REMOVED:
-        host.PatchbayClientRemovedCallback.emit(pluginId)
-    elif action == ENGINE_CALLBACK_PATCHBAY_CLIENT_RENAMED:
-        host.PatchbayClientRenamedCallback.emit(pluginId, valueStr)
-    elif action == ENGINE_CALLBACK_PATCHBAY_CLIENT_DATA_CHANGED:
-        host.PatchbayClientDataChangedCallback.emit(pluginId, value1, value2)
-    elif action == ENGINE_CALLBACK_PATCHBAY_CLIENT_POSITION_CHANGED:
-        host.PatchbayClientPositionChangedCallback.emit(pluginId, value1, value2, value3, int(round(valuef)))
-    elif action == ENGINE_CALLBACK_PATCHBAY_PORT_ADDED:
-        host.PatchbayPortAddedCallback.emit(pluginId, value1, value2, value3, valueStr)
-    elif action == ENGINE_CALLBACK_PATCHBAY_PORT_REMOVED:
-        host.PatchbayPortRemovedCallback.emit(pluginId, value1)
-    elif action == ENGINE_CALLBACK_PATCHBAY_PORT_CHANGED:
-        host.PatchbayPortChangedCallback.emit(pluginId, value1, value2, value3, valueStr)
-    elif action == ENGINE_CALLBACK_PATCHBAY_PORT_GROUP_ADDED:
-        host.PatchbayPortGroupAddedCallback.emit(pluginId, value1, value2, valueStr)
-    elif action == ENGINE_CALLBACK_PATCHBAY_PORT_GROUP_REMOVED:
-        host.PatchbayPortGroupRemovedCallback.emit(pluginId, value1)
-    elif action == ENGINE_CALLBACK_PATCHBAY_PORT_GROUP_CHANGED:
-        host.PatchbayPortGroupChangedCallback.emit(pluginId, value1, value2, valueStr)
-    elif action == ENGINE_CALLBACK_PATCHBAY_CONNECTION_ADDED:
-        gOut, pOut, gIn, pIn = [int(i) for i in valueStr.split(":")] # FIXME
-        host.PatchbayConnectionAddedCallback.emit(pluginId, gOut, pOut, gIn, pIn)
-    elif action == ENGINE_CALLBACK_PATCHBAY_CONNECTION_REMOVED:
-        host.PatchbayConnectionRemovedCallback.emit(pluginId, value1, value2)
-    elif action == ENGINE_CALLBACK_ENGINE_STARTED:
-        host.EngineStartedCallback.emit(pluginId, value1, value2, value3, valuef, valueStr)
-    elif action == ENGINE_CALLBACK_ENGINE_STOPPED:
-        host.EngineStoppedCallback.emit()
-    elif action == ENGINE_CALLBACK_PROCESS_MODE_CHANGED:
-        host.ProcessModeChangedCallback.emit(value1)
-    elif action == ENGINE_CALLBACK_TRANSPORT_MODE_CHANGED:
-        host.TransportModeChangedCallback.emit(value1, valueStr)
-    elif action == ENGINE_CALLBACK_BUFFER_SIZE_CHANGED:
-        host.BufferSizeChangedCallback.emit(value1)
-    elif action == ENGINE_CALLBACK_SAMPLE_RATE_CHANGED:
-        host.SampleRateChangedCallback.emit(valuef)
-    elif action == ENGINE_CALLBACK_CANCELABLE_ACTION:
-        host.CancelableActionCallback.emit(pluginId, bool(value1 != 0), valueStr)
-    elif action == ENGINE_CALLBACK_PROJECT_LOAD_FINISHED:
-        host.ProjectLoadFinishedCallback.emit()
-    elif action == ENGINE_CALLBACK_NSM:
-        host.NSMCallback.emit(value1, value2, valueStr)
-    elif action == ENGINE_CALLBACK_IDLE:
-        QApplication.processEvents()
-    elif action == ENGINE_CALLBACK_INFO:
-        host.InfoCallback.emit(valueStr)
-    elif action == ENGINE_CALLBACK_ERROR:
-        host.ErrorCallback.emit(valueStr)
-    elif action == ENGINE_CALLBACK_QUIT:
-        host.QuitCallback.emit()
-    elif action == ENGINE_CALLBACK_INLINE_DISPLAY_REDRAW:
-        host.InlineDisplayRedrawCallback.emit(pluginId)
-    else:
+    if action not in gEngineCallbackUnorderedActions:
+        host.flushParameterValueChanges()
+
+    handler = gEngineCallbackHandlers.get(action, None)
+
+    if handler is None:
         print("unhandled action", action)
+        return
+
+    handler(host, pluginId, value1, value2, value3, valuef, valueStr)
 
 # ------------------------------------------------------------------------------------------------------------
 # File callback
@@ -3104,10 +3376,13 @@ def loadHostSettings(host):
 
     settings = QSafeSettings("falkTX", "Carla2")
 
+    host.asyncProjectLoad = settings.value(CARLA_KEY_EXPERIMENTAL_ASYNC_PROJECT_LOAD, CARLA_DEFAULT_EXPERIMENTAL_ASYNC_PROJECT_LOAD, bool)
     host.experimental = settings.value(CARLA_KEY_MAIN_EXPERIMENTAL, CARLA_DEFAULT_MAIN_EXPERIMENTAL, bool)
     host.exportLV2 = settings.value(CARLA_KEY_EXPERIMENTAL_EXPORT_LV2, CARLA_DEFAULT_EXPERIMENTAL_LV2_EXPORT, bool)
     host.manageUIs = settings.value(CARLA_KEY_ENGINE_MANAGE_UIS, CARLA_DEFAULT_MANAGE_UIS, bool)
     host.maxParameters = settings.value(CARLA_KEY_ENGINE_MAX_PARAMETERS, CARLA_DEFAULT_MAX_PARAMETERS, int)
+    host.parallelProjectLoad = settings.value(CARLA_KEY_EXPERIMENTAL_PARALLEL_PROJECT_LOAD, CARLA_DEFAULT_EXPERIMENTAL_PARALLEL_PROJECT_LOAD, bool)
+    host.pluginPoolMemory    = settings.value(CARLA_KEY_EXPERIMENTAL_PLUGIN_POOL_MEMORY, CARLA_DEFAULT_EXPERIMENTAL_PLUGIN_POOL_MEMORY, int)
     host.resetXruns = settings.value(CARLA_KEY_ENGINE_RESET_XRUNS, CARLA_DEFAULT_RESET_XRUNS, bool)
     host.forceStereo = settings.value(CARLA_KEY_ENGINE_FORCE_STEREO, CARLA_DEFAULT_FORCE_STEREO, bool)
     host.preferPluginBridges = settings.value(CARLA_KEY_ENGINE_PREFER_PLUGIN_BRIDGES, CARLA_DEFAULT_PREFER_PLUGIN_BRIDGES, bool)
@@ -3168,6 +3443,8 @@ def setHostSettings(host):
     host.set_engine_option(ENGINE_OPTION_PREVENT_BAD_BEHAVIOUR, host.preventBadBehaviour, "")
     host.set_engine_option(ENGINE_OPTION_UI_BRIDGES_TIMEOUT,    host.uiBridgesTimeout,    "")
     host.set_engine_option(ENGINE_OPTION_UIS_ALWAYS_ON_TOP,     host.uisAlwaysOnTop,      "")
+    host.set_engine_option(ENGINE_OPTION_PARALLEL_PROJECT_LOAD, host.parallelProjectLoad, "")
+    host.set_engine_option(ENGINE_OPTION_PLUGIN_POOL_MEMORY, host.pluginPoolMemory, "")
 
     if host.isPlugin or host.isRemote or host.is_engine_running():
         return
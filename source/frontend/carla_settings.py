@@ -412,6 +412,10 @@ class CarlaSettingsW(QDialog):
         if host.isControl or host.isPlugin:
             self.ui.ch_main_confirm_exit.hide()
             self.ui.ch_exp_load_lib_global.hide()
+            self.ui.ch_exp_async_project_load.hide()
+            self.ui.ch_exp_parallel_project_load.hide()
+            self.ui.label_exp_plugin_pool_memory.hide()
+            self.ui.sb_exp_plugin_pool_memory.hide()
             self.ui.lw_page.hideRow(self.TAB_INDEX_OSC)
             self.ui.lw_page.hideRow(self.TAB_INDEX_WINE)
 
@@ -586,6 +590,9 @@ class CarlaSettingsW(QDialog):
         self.ui.ch_engine_force_stereo.setChecked(self.host.forceStereo or not self.ui.ch_engine_force_stereo.isEnabled())
         self.ui.ch_engine_prefer_plugin_bridges.setChecked(self.host.preferPluginBridges)
         self.ui.ch_exp_export_lv2.setChecked(self.host.exportLV2)
+        self.ui.ch_exp_async_project_load.setChecked(self.host.asyncProjectLoad)
+        self.ui.ch_exp_parallel_project_load.setChecked(self.host.parallelProjectLoad)
+        self.ui.sb_exp_plugin_pool_memory.setValue(self.host.pluginPoolMemory)
         self.ui.cb_exp_plugin_bridges.setChecked(self.host.showPluginBridges)
         self.ui.ch_exp_wine_bridges.setChecked(self.host.showWineBridges)
 
@@ -798,11 +805,14 @@ class CarlaSettingsW(QDialog):
 
             settings.setValue(CARLA_KEY_ENGINE_PROCESS_MODE, self.host.nextProcessMode)
 
+        self.host.asyncProjectLoad    = self.ui.ch_exp_async_project_load.isChecked()
         self.host.exportLV2           = self.ui.ch_exp_export_lv2.isChecked()
         self.host.forceStereo         = self.ui.ch_engine_force_stereo.isChecked()
         self.host.resetXruns          = self.ui.cb_engine_reset_xruns.isChecked()
         self.host.maxParameters       = self.ui.sb_engine_max_params.value()
         self.host.manageUIs           = self.ui.ch_engine_manage_uis.isChecked()
+        self.host.parallelProjectLoad = self.ui.ch_exp_parallel_project_load.isChecked()
+        self.host.pluginPoolMemory    = self.ui.sb_exp_plugin_pool_memory.value()
         self.host.preferPluginBridges = self.ui.ch_engine_prefer_plugin_bridges.isChecked()
         self.host.preferUIBridges     = self.ui.ch_engine_prefer_ui_bridges.isChecked()
         self.host.showLogs            = self.ui.ch_main_show_logs.isChecked()
@@ -823,6 +833,9 @@ class CarlaSettingsW(QDialog):
         settings.setValue(CARLA_KEY_ENGINE_UI_BRIDGES_TIMEOUT,    self.host.uiBridgesTimeout)
         settings.setValue(CARLA_KEY_ENGINE_UIS_ALWAYS_ON_TOP,     self.host.uisAlwaysOnTop)
         settings.setValue(CARLA_KEY_EXPERIMENTAL_EXPORT_LV2,      self.host.exportLV2)
+        settings.setValue(CARLA_KEY_EXPERIMENTAL_ASYNC_PROJECT_LOAD, self.host.asyncProjectLoad)
+        settings.setValue(CARLA_KEY_EXPERIMENTAL_PARALLEL_PROJECT_LOAD, self.host.parallelProjectLoad)
+        settings.setValue(CARLA_KEY_EXPERIMENTAL_PLUGIN_POOL_MEMORY, self.host.pluginPoolMemory)
         settings.setValue(CARLA_KEY_EXPERIMENTAL_PLUGIN_BRIDGES,  self.host.showPluginBridges)
         settings.setValue(CARLA_KEY_EXPERIMENTAL_WINE_BRIDGES,    self.host.showWineBridges)
 
@@ -1100,6 +1113,9 @@ class CarlaSettingsW(QDialog):
         self.ui.ch_exp_wine_bridges.setChecked(CARLA_DEFAULT_EXPERIMENTAL_WINE_BRIDGES)
         self.ui.ch_exp_jack_apps.setChecked(CARLA_DEFAULT_EXPERIMENTAL_JACK_APPS)
         self.ui.ch_exp_export_lv2.setChecked(CARLA_DEFAULT_EXPERIMENTAL_LV2_EXPORT)
+        self.ui.ch_exp_async_project_load.setChecked(CARLA_DEFAULT_EXPERIMENTAL_ASYNC_PROJECT_LOAD)
+        self.ui.ch_exp_parallel_project_load.setChecked(CARLA_DEFAULT_EXPERIMENTAL_PARALLEL_PROJECT_LOAD)
+        self.ui.sb_exp_plugin_pool_memory.setValue(CARLA_DEFAULT_EXPERIMENTAL_PLUGIN_POOL_MEMORY)
         self.ui.ch_exp_load_lib_global.setChecked(CARLA_DEFAULT_EXPERIMENTAL_LOAD_LIB_GLOBAL)
         self.ui.ch_exp_prevent_bad_behaviour.setChecked(CARLA_DEFAULT_EXPERIMENTAL_PREVENT_BAD_BEHAVIOUR)
 
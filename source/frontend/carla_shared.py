@@ -235,6 +235,9 @@ CARLA_KEY_EXPERIMENTAL_JACK_APPS             = "Experimental/JackApplications"
 CARLA_KEY_EXPERIMENTAL_EXPORT_LV2            = "Experimental/ExportLV2"           # bool
 CARLA_KEY_EXPERIMENTAL_PREVENT_BAD_BEHAVIOUR = "Experimental/PreventBadBehaviour" # bool
 CARLA_KEY_EXPERIMENTAL_LOAD_LIB_GLOBAL       = "Experimental/LoadLibGlobal"       # bool
+CARLA_KEY_EXPERIMENTAL_ASYNC_PROJECT_LOAD    = "Experimental/AsyncProjectLoad"    # bool
+CARLA_KEY_EXPERIMENTAL_PARALLEL_PROJECT_LOAD = "Experimental/ParallelProjectLoad" # bool
+CARLA_KEY_EXPERIMENTAL_PLUGIN_POOL_MEMORY    = "Experimental/PluginPoolMemory"    # int
 
 # if pro theme is on and color is black
 CARLA_KEY_CUSTOM_PAINTING = "UseCustomPainting" # bool
@@ -321,6 +324,9 @@ CARLA_DEFAULT_EXPERIMENTAL_JACK_APPS             = False
 CARLA_DEFAULT_EXPERIMENTAL_LV2_EXPORT            = False
 CARLA_DEFAULT_EXPERIMENTAL_PREVENT_BAD_BEHAVIOUR = False
 CARLA_DEFAULT_EXPERIMENTAL_LOAD_LIB_GLOBAL       = False
+CARLA_DEFAULT_EXPERIMENTAL_ASYNC_PROJECT_LOAD    = False
+CARLA_DEFAULT_EXPERIMENTAL_PARALLEL_PROJECT_LOAD = False
+CARLA_DEFAULT_EXPERIMENTAL_PLUGIN_POOL_MEMORY    = 0
 
 # ------------------------------------------------------------------------------------------------------------
 # Default File Folders
@@ -645,6 +651,7 @@ def handleInitialCommandLineArguments(file):
             print("")
             print("    --gdb    \t Run Carla inside gdb.")
             print(" -n,--no-gui \t Run Carla headless, don't show UI.")
+            print("    --dashboard\t Carla-Control only, show DSP load, xruns and peaks of all URLs at once.")
             print("")
             print(" -h,--help   \t Print this help text and exit.")
             print(" -v,--version\t Print version information and exit.")
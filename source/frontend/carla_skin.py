@@ -284,7 +284,6 @@ class AbstractPluginSlot(QFrame, PluginEditParentMeta):
         self.customContextMenuRequested.connect(self.slot_showCustomMenu)
         host.PluginRenamedCallback.connect(self.slot_handlePluginRenamedCallback)
         host.PluginUnavailableCallback.connect(self.slot_handlePluginUnavailableCallback)
-        host.ParameterValueChangedCallback.connect(self.slot_handleParameterValueChangedCallback)
         host.ParameterDefaultChangedCallback.connect(self.slot_handleParameterDefaultChangedCallback)
         host.ParameterMappedControlIndexChangedCallback.connect(self.slot_handleParameterMappedControlIndexChangedCallback)
         host.ParameterMappedRangeChangedCallback.connect(self.slot_handleParameterMappedRangeChangedCallback)
@@ -312,11 +311,6 @@ class AbstractPluginSlot(QFrame, PluginEditParentMeta):
         if self.fPluginId == pluginId:
             pass
 
-    @pyqtSlot(int, int, float)
-    def slot_handleParameterValueChangedCallback(self, pluginId, index, value):
-        if self.fPluginId == pluginId:
-            self.setParameterValue(index, value, True)
-
     @pyqtSlot(int, int, float)
     def slot_handleParameterDefaultChangedCallback(self, pluginId, index, value):
         if self.fPluginId == pluginId:
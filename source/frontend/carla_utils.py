@@ -20,7 +20,9 @@
 # Imports (Global)
 
 from os import environ
+from struct import Struct
 from sys import argv
+from time import perf_counter
 
 # ------------------------------------------------------------------------------------------------------------
 # Imports (Custom)
@@ -196,104 +198,122 @@ PyCarlaCachedPluginInfo = {
 }
 
 # ------------------------------------------------------------------------------------------------------------
-# Carla Utils object using a DLL
-
-class CarlaUtils(object):
-    def __init__(self, filename):
-        object.__init__(self)
-
-        self.lib = cdll.LoadLibrary(filename)
-        #self.lib = CDLL(filename, RTLD_GLOBAL)
-
-        self.lib.carla_get_complete_license_text.argtypes = None
-        self.lib.carla_get_complete_license_text.restype = c_char_p
+# Pipe tracing, enabled by setting CARLA_PIPE_TRACE to a filename before calling pipe_client_new()
 
-        self.lib.carla_get_juce_version.argtypes = None
-        self.lib.carla_get_juce_version.restype = c_char_p
+# File layout: magic, then one record per pipe call, each being
+#  - time in seconds since the trace started (double), direction (byte), payload size (uint32)
+#  - payload, the lines sent or received in utf-8, separated by '\n', with newlines within them escaped as '\r'
+# Received lines are recorded as read, a single record can have parts of several messages.
+# Sent lines are recorded per write call, which is a whole message for ExternalUI.
 
-        self.lib.carla_get_supported_file_extensions.argtypes = None
-        self.lib.carla_get_supported_file_extensions.restype = POINTER(c_char_p)
+PIPE_TRACE_MAGIC = b"CRLPTRC1"
+PIPE_TRACE_IN    = 0
+PIPE_TRACE_OUT   = 1
 
-        self.lib.carla_get_supported_features.argtypes = None
-        self.lib.carla_get_supported_features.restype = POINTER(c_char_p)
+kPipeTraceRecord = Struct("=dBI")
 
-        self.lib.carla_get_cached_plugin_count.argtypes = [c_enum, c_char_p]
-        self.lib.carla_get_cached_plugin_count.restype = c_uint
-
-        self.lib.carla_get_cached_plugin_info.argtypes = [c_enum, c_uint]
-        self.lib.carla_get_cached_plugin_info.restype = POINTER(CarlaCachedPluginInfo)
-
-        self.lib.carla_fflush.argtypes = [c_bool]
-        self.lib.carla_fflush.restype = None
-
-        self.lib.carla_fputs.argtypes = [c_bool, c_char_p]
-        self.lib.carla_fputs.restype = None
-
-        self.lib.carla_set_process_name.argtypes = [c_char_p]
-        self.lib.carla_set_process_name.restype = None
-
-        self.lib.carla_pipe_client_new.argtypes = [POINTER(c_char_p), CarlaPipeCallbackFunc, c_void_p]
-        self.lib.carla_pipe_client_new.restype = CarlaPipeClientHandle
-
-        self.lib.carla_pipe_client_idle.argtypes = [CarlaPipeClientHandle]
-        self.lib.carla_pipe_client_idle.restype = c_char_p
+class CarlaPipeTrace(object):
+    def __init__(self, filename):
+        object.__init__(self)
 
-        self.lib.carla_pipe_client_is_running.argtypes = [CarlaPipeClientHandle]
-        self.lib.carla_pipe_client_is_running.restype = c_bool
+        self.fFile  = open(filename, "wb")
+        self.fStart = perf_counter()
+        self.fFile.write(PIPE_TRACE_MAGIC)
 
-        self.lib.carla_pipe_client_lock.argtypes = [CarlaPipeClientHandle]
-        self.lib.carla_pipe_client_lock.restype = None
+    def close(self):
+        if self.fFile is None:
+            return
 
-        self.lib.carla_pipe_client_unlock.argtypes = [CarlaPipeClientHandle]
-        self.lib.carla_pipe_client_unlock.restype = None
+        self.fFile.close()
+        self.fFile = None
 
-        self.lib.carla_pipe_client_readlineblock.argtypes = [CarlaPipeClientHandle, c_uint]
-        self.lib.carla_pipe_client_readlineblock.restype = c_char_p
+    def write(self, direction, lines):
+        if self.fFile is None or len(lines) == 0:
+            return
 
-        self.lib.carla_pipe_client_readlineblock_bool.argtypes = [CarlaPipeClientHandle, c_uint]
-        self.lib.carla_pipe_client_readlineblock_bool.restype = c_bool
+        self.writeData(direction, "\n".join(line.replace("\n", "\r") for line in lines).encode("utf-8"))
 
-        self.lib.carla_pipe_client_readlineblock_int.argtypes = [CarlaPipeClientHandle, c_uint]
-        self.lib.carla_pipe_client_readlineblock_int.restype = c_int
+    # msg as written to the pipe, with newlines within lines already escaped
+    def writeRaw(self, direction, msg):
+        if self.fFile is None:
+            return
 
-        self.lib.carla_pipe_client_readlineblock_float.argtypes = [CarlaPipeClientHandle, c_uint]
-        self.lib.carla_pipe_client_readlineblock_float.restype = c_double
+        self.writeData(direction, msg.rstrip("\n").encode("utf-8"))
 
-        self.lib.carla_pipe_client_write_msg.argtypes = [CarlaPipeClientHandle, c_char_p]
-        self.lib.carla_pipe_client_write_msg.restype = c_bool
+    def writeData(self, direction, data):
+        self.fFile.write(kPipeTraceRecord.pack(perf_counter() - self.fStart, direction, len(data)))
+        self.fFile.write(data)
 
-        self.lib.carla_pipe_client_write_and_fix_msg.argtypes = [CarlaPipeClientHandle, c_char_p]
-        self.lib.carla_pipe_client_write_and_fix_msg.restype = c_bool
+# Generator of (time, direction, lines) tuples, for each record of a trace file.
+def readPipeTrace(filename):
+    with open(filename, "rb") as fh:
+        if fh.read(len(PIPE_TRACE_MAGIC)) != PIPE_TRACE_MAGIC:
+            raise ValueError("%s is not a Carla pipe trace" % filename)
 
-        self.lib.carla_pipe_client_flush.argtypes = [CarlaPipeClientHandle]
-        self.lib.carla_pipe_client_flush.restype = c_bool
+        while True:
+            header = fh.read(kPipeTraceRecord.size)
 
-        self.lib.carla_pipe_client_flush_and_unlock.argtypes = [CarlaPipeClientHandle]
-        self.lib.carla_pipe_client_flush_and_unlock.restype = c_bool
+            if len(header) < kPipeTraceRecord.size:
+                break
 
-        self.lib.carla_pipe_client_destroy.argtypes = [CarlaPipeClientHandle]
-        self.lib.carla_pipe_client_destroy.restype = None
+            time, direction, size = kPipeTraceRecord.unpack(header)
+            data = fh.read(size)
 
-        self.lib.carla_juce_init.argtypes = None
-        self.lib.carla_juce_init.restype = None
+            if len(data) < size:
+                break
 
-        self.lib.carla_juce_idle.argtypes = None
-        self.lib.carla_juce_idle.restype = None
+            lines = [line.replace("\r", "\n") for line in data.decode("utf-8", errors="ignore").split("\n")]
+            yield time, direction, lines
 
-        self.lib.carla_juce_cleanup.argtypes = None
-        self.lib.carla_juce_cleanup.restype = None
+# ------------------------------------------------------------------------------------------------------------
+# Carla Utils object using a DLL
 
-        self.lib.carla_cocoa_get_window.argtypes = [c_uintptr]
-        self.lib.carla_cocoa_get_window.restype = c_int
+CARLA_UTILS_FUNCTIONS = {
+    # name: (argtypes, restype)
+    "carla_get_complete_license_text": (None, c_char_p),
+    "carla_get_juce_version": (None, c_char_p),
+    "carla_get_supported_file_extensions": (None, POINTER(c_char_p)),
+    "carla_get_supported_features": (None, POINTER(c_char_p)),
+    "carla_get_cached_plugin_count": ([c_enum, c_char_p], c_uint),
+    "carla_get_cached_plugin_info": ([c_enum, c_uint], POINTER(CarlaCachedPluginInfo)),
+    "carla_fflush": ([c_bool], None),
+    "carla_fputs": ([c_bool, c_char_p], None),
+    "carla_set_process_name": ([c_char_p], None),
+    "carla_pipe_client_new": ([POINTER(c_char_p), CarlaPipeCallbackFunc, c_void_p], CarlaPipeClientHandle),
+    "carla_pipe_client_idle": ([CarlaPipeClientHandle], c_char_p),
+    "carla_pipe_client_readlines": ([CarlaPipeClientHandle], c_char_p),
+    "carla_pipe_client_start_reader": ([CarlaPipeClientHandle], c_bool),
+    "carla_pipe_client_map_shared_data": ([CarlaPipeClientHandle, c_char_p, c_uint], c_void_p),
+    "carla_pipe_client_is_running": ([CarlaPipeClientHandle], c_bool),
+    "carla_pipe_client_lock": ([CarlaPipeClientHandle], None),
+    "carla_pipe_client_unlock": ([CarlaPipeClientHandle], None),
+    "carla_pipe_client_readlineblock": ([CarlaPipeClientHandle, c_uint], c_char_p),
+    "carla_pipe_client_readlineblock_bool": ([CarlaPipeClientHandle, c_uint], c_bool),
+    "carla_pipe_client_readlineblock_int": ([CarlaPipeClientHandle, c_uint], c_int),
+    "carla_pipe_client_readlineblock_float": ([CarlaPipeClientHandle, c_uint], c_double),
+    "carla_pipe_client_write_msg": ([CarlaPipeClientHandle, c_char_p], c_bool),
+    "carla_pipe_client_write_and_fix_msg": ([CarlaPipeClientHandle, c_char_p], c_bool),
+    "carla_pipe_client_flush": ([CarlaPipeClientHandle], c_bool),
+    "carla_pipe_client_flush_and_unlock": ([CarlaPipeClientHandle], c_bool),
+    "carla_pipe_client_destroy": ([CarlaPipeClientHandle], None),
+    "carla_juce_init": (None, None),
+    "carla_juce_idle": (None, None),
+    "carla_juce_cleanup": (None, None),
+    "carla_cocoa_get_window": ([c_uintptr], c_int),
+    "carla_x11_reparent_window": ([c_uintptr, c_uintptr], None),
+    "carla_x11_move_window": ([c_uintptr, c_int, c_int], None),
+    "carla_x11_get_window_pos": ([c_uintptr], POINTER(c_int)),
+}
 
-        self.lib.carla_x11_reparent_window.argtypes = [c_uintptr, c_uintptr]
-        self.lib.carla_x11_reparent_window.restype = None
+class CarlaUtils(object):
+    def __init__(self, filename):
+        object.__init__(self)
 
-        self.lib.carla_x11_move_window.argtypes = [c_uintptr, c_int, c_int]
-        self.lib.carla_x11_move_window.restype = None
+        self.lib = CarlaLazyLibrary(cdll.LoadLibrary(filename), CARLA_UTILS_FUNCTIONS)
+        #self.lib = CarlaLazyLibrary(CDLL(filename, RTLD_GLOBAL), CARLA_UTILS_FUNCTIONS)
 
-        self.lib.carla_x11_get_window_pos.argtypes = [c_uintptr]
-        self.lib.carla_x11_get_window_pos.restype = POINTER(c_int)
+        # see CarlaPipeTrace
+        self._pipeTrace = None
 
         # use _putenv on windows
         if not WINDOWS:
@@ -371,6 +391,12 @@ class CarlaUtils(object):
 
         self._pipeClientFunc = func
         self._pipeClientCallback = CarlaPipeCallbackFunc(func)
+
+        traceFilename = environ.get("CARLA_PIPE_TRACE", "")
+
+        if traceFilename and self._pipeTrace is None:
+            self._pipeTrace = CarlaPipeTrace(traceFilename)
+
         return self.lib.carla_pipe_client_new(cargv, self._pipeClientCallback, None)
 
     def pipe_client_idle(self, handle):
@@ -384,7 +410,51 @@ class CarlaUtils(object):
             if not msg:
                 break
 
-            self._pipeClientFunc(None, msg.decode("utf-8", errors="ignore"))
+            msg = msg.decode("utf-8", errors="ignore")
+
+            if self._pipeTrace is not None:
+                self._pipeTrace.write(PIPE_TRACE_IN, [msg])
+
+            self._pipeClientFunc(None, msg)
+
+    # Read all lines currently available in the pipe, without waiting.
+    # Used instead of pipe_client_idle() by clients that decode messages themselves, see ExternalUI.
+    def pipe_client_readlines(self, handle):
+        try:
+            lines = self.lib.carla_pipe_client_readlines(handle)
+        except OSError as e:
+            print("pipe_client_readlines", e)
+            return []
+
+        if not lines:
+            return []
+
+        text = lines.decode("utf-8", errors="ignore")
+        lines = text.split("\n")
+        lines.pop()
+
+        if "\r" in text:
+            lines = [line.replace("\r", "\n") for line in lines]
+
+        if self._pipeTrace is not None:
+            self._pipeTrace.write(PIPE_TRACE_IN, lines)
+
+        return lines
+
+    # Read the pipe in a background thread from now on, pipe_client_readlines() then only takes what it read.
+    # pipe_client_idle() and pipe_client_readlineblock*() must not be used after this.
+    def pipe_client_start_reader(self, handle):
+        return bool(self.lib.carla_pipe_client_start_reader(handle))
+
+    # Map a shared memory object created by the other side of the pipe.
+    # Returns a memoryview of it, or None on failure. It must not be used after pipe_client_destroy().
+    def pipe_client_map_shared_data(self, handle, filename, size):
+        ptr = self.lib.carla_pipe_client_map_shared_data(handle, filename.encode("utf-8"), size)
+
+        if not ptr:
+            return None
+
+        return memoryview((c_char * size).from_address(ptr)).cast("B")
 
     def pipe_client_is_running(self, handle):
         return bool(self.lib.carla_pipe_client_is_running(handle))
@@ -396,21 +466,47 @@ class CarlaUtils(object):
         self.lib.carla_pipe_client_unlock(handle)
 
     def pipe_client_readlineblock(self, handle, timeout):
-        return charPtrToString(self.lib.carla_pipe_client_readlineblock(handle, timeout))
+        line = charPtrToString(self.lib.carla_pipe_client_readlineblock(handle, timeout))
+
+        if self._pipeTrace is not None:
+            self._pipeTrace.write(PIPE_TRACE_IN, [line])
+
+        return line
 
     def pipe_client_readlineblock_bool(self, handle, timeout):
-        return bool(self.lib.carla_pipe_client_readlineblock_bool(handle, timeout))
+        value = bool(self.lib.carla_pipe_client_readlineblock_bool(handle, timeout))
+
+        if self._pipeTrace is not None:
+            self._pipeTrace.write(PIPE_TRACE_IN, ["true" if value else "false"])
+
+        return value
 
     def pipe_client_readlineblock_int(self, handle, timeout):
-        return int(self.lib.carla_pipe_client_readlineblock_int(handle, timeout))
+        value = int(self.lib.carla_pipe_client_readlineblock_int(handle, timeout))
+
+        if self._pipeTrace is not None:
+            self._pipeTrace.write(PIPE_TRACE_IN, ["%i" % value])
+
+        return value
 
     def pipe_client_readlineblock_float(self, handle, timeout):
-        return float(self.lib.carla_pipe_client_readlineblock_float(handle, timeout))
+        value = float(self.lib.carla_pipe_client_readlineblock_float(handle, timeout))
+
+        if self._pipeTrace is not None:
+            self._pipeTrace.write(PIPE_TRACE_IN, ["%.10f" % value])
+
+        return value
 
     def pipe_client_write_msg(self, handle, msg):
+        if self._pipeTrace is not None:
+            self._pipeTrace.writeRaw(PIPE_TRACE_OUT, msg)
+
         return bool(self.lib.carla_pipe_client_write_msg(handle, msg.encode("utf-8")))
 
     def pipe_client_write_and_fix_msg(self, handle, msg):
+        if self._pipeTrace is not None:
+            self._pipeTrace.write(PIPE_TRACE_OUT, [msg])
+
         return bool(self.lib.carla_pipe_client_write_and_fix_msg(handle, msg.encode("utf-8")))
 
     def pipe_client_flush(self, handle):
@@ -422,6 +518,10 @@ class CarlaUtils(object):
     def pipe_client_destroy(self, handle):
         self.lib.carla_pipe_client_destroy(handle)
 
+        if self._pipeTrace is not None:
+            self._pipeTrace.close()
+            self._pipeTrace = None
+
     def juce_init(self):
         self.lib.carla_juce_init()
 
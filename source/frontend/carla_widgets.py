@@ -581,7 +581,8 @@ class PluginEdit(QDialog):
         self.fFirstInit      = True
 
         self.fParameterList      = [] # (type, id, widget)
-        self.fParametersToUpdate = [] # (id, value)
+        self.fParameterInputs    = {} # id -> widget
+        self.fParametersToUpdate = {} # id -> value
 
         self.fPlayingNotes = [] # (channel, note)
 
@@ -817,7 +818,7 @@ class PluginEdit(QDialog):
         self.ui.keyboard.allNotesOff()
         self._updateCtrlPrograms()
 
-        self.fParametersToUpdate = []
+        self.fParametersToUpdate = {}
 
     #------------------------------------------------------------------
 
@@ -918,7 +919,8 @@ class PluginEdit(QDialog):
     def reloadParameters(self):
         # Reset
         self.fParameterList      = []
-        self.fParametersToUpdate = []
+        self.fParameterInputs    = {}
+        self.fParametersToUpdate = {}
         self.fTabIconTimers      = []
 
         # Remove all previous parameters
@@ -1101,12 +1103,7 @@ class PluginEdit(QDialog):
     #------------------------------------------------------------------
 
     def setParameterValue(self, parameterId, value):
-        for paramItem in self.fParametersToUpdate:
-            if paramItem[0] == parameterId:
-                paramItem[1] = value
-                break
-        else:
-            self.fParametersToUpdate.append([parameterId, value])
+        self.fParametersToUpdate[parameterId] = value
 
     def setParameterDefault(self, parameterId, value):
         for paramType, paramId, paramWidget in self.fParameterList:
@@ -1197,7 +1194,7 @@ class PluginEdit(QDialog):
                 self.ui.tabWidget.setTabIcon(i+1, self.fTabIconOff)
 
         # Check parameters needing update
-        for index, value in self.fParametersToUpdate:
+        for index, value in self.fParametersToUpdate.items():
             if index == PARAMETER_DRYWET:
                 self.ui.dial_drywet.blockSignals(True)
                 self.ui.dial_drywet.setValue(value)
@@ -1232,28 +1229,25 @@ class PluginEdit(QDialog):
                 self._updateCtrlPrograms()
 
             elif index >= 0:
-                for paramType, paramId, paramWidget in self.fParameterList:
-                    if paramId != index:
-                        continue
-                    # FIXME see below
-                    if paramType != PARAMETER_INPUT:
-                        continue
+                # FIXME see below
+                paramWidget = self.fParameterInputs.get(index, None)
+
+                if paramWidget is None:
+                    continue
 
-                    paramWidget.blockSignals(True)
-                    paramWidget.setValue(value)
-                    paramWidget.blockSignals(False)
+                paramWidget.blockSignals(True)
+                paramWidget.setValue(value)
+                paramWidget.blockSignals(False)
 
-                    #if paramType == PARAMETER_INPUT:
-                    tabIndex = paramWidget.getTabIndex()
+                tabIndex = paramWidget.getTabIndex()
 
-                    if self.fTabIconTimers[tabIndex-1] == ICON_STATE_NULL:
-                        self.ui.tabWidget.setTabIcon(tabIndex, self.fTabIconOn)
+                if self.fTabIconTimers[tabIndex-1] == ICON_STATE_NULL:
+                    self.ui.tabWidget.setTabIcon(tabIndex, self.fTabIconOn)
 
-                    self.fTabIconTimers[tabIndex-1] = ICON_STATE_ON
-                    break
+                self.fTabIconTimers[tabIndex-1] = ICON_STATE_ON
 
         # Clear all parameters
-        self.fParametersToUpdate = []
+        self.fParametersToUpdate = {}
 
         # Update parameter outputs | FIXME needed?
         for paramType, paramId, paramWidget in self.fParameterList:
@@ -1636,6 +1630,7 @@ class PluginEdit(QDialog):
                 self.fParameterList.append((paramType, paramInfo['index'], paramWidget))
 
                 if paramType == PARAMETER_INPUT:
+                    self.fParameterInputs[paramInfo['index']] = paramWidget
                     paramWidget.valueChanged.connect(self.slot_parameterValueChanged)
 
                 paramWidget.mappedControlChanged.connect(self.slot_parameterMappedControlChanged)
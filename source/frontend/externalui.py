@@ -16,24 +16,84 @@
 #
 # For a full copy of the GNU General Public License see the doc/GPL.txt file.
 
+# ------------------------------------------------------------------------------------------------------------
+# Imports (Global)
+
+from collections import deque
+from time import perf_counter
+
 # ------------------------------------------------------------------------------------------------------------
 # Imports (Custom Stuff)
 
 from carla_shared import *
 
+# ------------------------------------------------------------------------------------------------------------
+
+# Characters of the ids some messages end with, like "PARAMVAL_0:-1"
+kMsgIdChars = "0123456789:-"
+
+# Maximum time spent handling messages on each idle, in seconds, the rest is handled on the next ones
+kIdleTimeBudget = 0.01
+
+# ------------------------------------------------------------------------------------------------------------
+# Raised by ExternalUI.readlineblock*() when the lines of a message did not arrive yet
+
+class ExternalUIIncompleteMessage(Exception):
+    pass
+
 # ------------------------------------------------------------------------------------------------------------
 # External UI
 
 class ExternalUI(object):
+    # Messages decoded in bulk by idleExternalUI(), without going through msgCallback().
+    # Keys are message names without their trailing ids (like "PEAKS_" for "PEAKS_3"), values are
+    # how many lines follow the message and the name of the method handling it.
+    # Handlers get the ids part of the message and a list of the lines following it.
+    # Other messages go to msgCallback(), which reads their lines with readlineblock(), and is called again
+    # with the same message on a later idle if they did not all arrive yet.
+    kMsgHandlers = {
+        "control":   (2, "handleMsgControl"),
+        "program":   (3, "handleMsgProgram"),
+        "configure": (2, "handleMsgConfigure"),
+        "note":      (4, "handleMsgNote"),
+        "show":      (0, "handleMsgShow"),
+        "focus":     (0, "handleMsgFocus"),
+        "hide":      (0, "handleMsgHide"),
+        "quit":      (0, "handleMsgQuit"),
+        "uiTitle":   (1, "handleMsgUiTitle"),
+    }
+
     def __init__(self):
         object.__init__(self)
 
         self.fQuitReceived = False
 
+        # lines read from the pipe, but not handled yet
+        self.fPendingLines = deque()
+
+        # lines taken by readlineblock() for the message given to msgCallback()
+        self.fMsgLines = []
+
+        # formatted messages waiting to be written on the next idle, see send()
+        self.fOutMessages = []
+
+        # index of the last "control" message for each parameter in fOutMessages
+        self.fOutControls = {}
+
+        # result of the last flushMessages() call
+        self.fOutFlushed = True
+
+        self.fMsgHandlers = dict((name, (count, getattr(self, method)))
+                                 for name, (count, method) in self.kMsgHandlers.items())
+
         if len(sys.argv) > 1:
             self.fSampleRate = float(sys.argv[1])
             self.fUiName     = sys.argv[2]
             self.fPipeClient = gCarla.utils.pipe_client_new(lambda s,msg: self.msgCallback(msg))
+
+            # read the pipe in the background, idleExternalUI() never waits for it
+            if self.fPipeClient is not None:
+                gCarla.utils.pipe_client_start_reader(self.fPipeClient)
         else:
             self.fSampleRate = 44100.0
             self.fUiName     = "TestUI"
@@ -53,8 +113,12 @@ class ExternalUI(object):
         return False
 
     def idleExternalUI(self):
-        if self.fPipeClient is not None:
-            gCarla.utils.pipe_client_idle(self.fPipeClient)
+        if self.fPipeClient is None:
+            return
+
+        self.fPendingLines.extend(gCarla.utils.pipe_client_readlines(self.fPipeClient))
+        self.handlePendingLines()
+        self.flushMessages()
 
     def closeExternalUI(self):
         if self.fPipeClient is None:
@@ -64,6 +128,8 @@ class ExternalUI(object):
         if not self.fQuitReceived:
             self.send(["exiting"])
 
+        self.flushMessages()
+
         gCarla.utils.pipe_client_destroy(self.fPipeClient)
         self.fPipeClient = None
 
@@ -121,109 +187,192 @@ class ExternalUI(object):
     # -------------------------------------------------------------------
     # Callback
 
-    def msgCallback(self, msg):
-        msg = charPtrToString(msg)
+    # Handle complete messages read so far, an incomplete one is kept until its lines arrive.
+    # Stops after kIdleTimeBudget, so a burst of messages is spread over several idles.
+    def handlePendingLines(self):
+        lines = self.fPendingLines
+        deadline = perf_counter() + kIdleTimeBudget
+        handled = False
+
+        while lines:
+            # always handle at least one message
+            if handled and perf_counter() >= deadline:
+                break
+
+            handled = True
+            msg  = lines[0]
+            name = msg.rstrip(kMsgIdChars)
+            handler = self.fMsgHandlers.get(name, None)
+
+            if handler is None:
+                lines.popleft()
+                self.fMsgLines = []
+                try:
+                    self.msgCallback(msg)
+                except ExternalUIIncompleteMessage:
+                    # put everything back, and try again once more lines arrive
+                    lines.extendleft(reversed(self.fMsgLines))
+                    lines.appendleft(msg)
+                    break
+                except Exception as e:
+                    print("msgCallback error, skipped for", msg, e)
+                continue
 
-        #if not msg:
-            #return
-
-        if msg == "control":
-            index = self.readlineblock_int()
-            value = self.readlineblock_float()
-            self.dspParameterChanged(index, value)
-
-        elif msg == "program":
-            channel = self.readlineblock_int()
-            bank    = self.readlineblock_int()
-            program = self.readlineblock_int()
-            self.dspProgramChanged(channel, bank, program)
-
-        elif msg == "configure":
-            key   = self.readlineblock()
-            value = self.readlineblock()
-            self.dspStateChanged(key, value)
-
-        elif msg == "note":
-            onOff    = self.readlineblock_bool()
-            channel  = self.readlineblock_int()
-            note     = self.readlineblock_int()
-            velocity = self.readlineblock_int()
-            self.dspNoteReceived(onOff, channel, note, velocity)
-
-        elif msg == "show":
-            self.uiShow()
+            count, func = handler
 
-        elif msg == "focus":
-            self.uiFocus()
+            if len(lines) <= count:
+                break
 
-        elif msg == "hide":
-            self.uiHide()
+            lines.popleft()
+            args = [lines.popleft() for _ in range(count)]
 
-        elif msg == "quit":
-            self.fQuitReceived = True
-            self.uiQuit()
+            try:
+                func(msg[len(name):], args)
+            except Exception as e:
+                print("msgCallback error, skipped for", msg, e)
 
-        elif msg == "uiTitle":
-            uiTitle = self.readlineblock()
-            self.uiTitleChanged(uiTitle)
+    def handleMsgControl(self, ids, lines):
+        self.dspParameterChanged(int(lines[0]), float(lines[1]))
 
-        else:
-            print("unknown message: \"" + msg + "\"")
+    def handleMsgProgram(self, ids, lines):
+        channel, bank, program = [int(i) for i in lines]
+        self.dspProgramChanged(channel, bank, program)
+
+    def handleMsgConfigure(self, ids, lines):
+        key, value = lines
+        self.dspStateChanged(key, value)
+
+    def handleMsgNote(self, ids, lines):
+        onOff = lines[0] == "true"
+        channel, note, velocity = [int(i) for i in lines[1:]]
+        self.dspNoteReceived(onOff, channel, note, velocity)
+
+    def handleMsgShow(self, ids, lines):
+        self.uiShow()
+
+    def handleMsgFocus(self, ids, lines):
+        self.uiFocus()
+
+    def handleMsgHide(self, ids, lines):
+        self.uiHide()
+
+    def handleMsgQuit(self, ids, lines):
+        self.fQuitReceived = True
+        self.uiQuit()
+
+    def handleMsgUiTitle(self, ids, lines):
+        self.uiTitleChanged(lines[0])
+
+    # Messages not in kMsgHandlers, extra lines must be read with readlineblock().
+    # Must not change any state before reading all lines, as it is called again if they are not all available.
+    def msgCallback(self, msg):
+        msg = charPtrToString(msg)
+
+        print("unknown message: \"" + msg + "\"")
 
     # -------------------------------------------------------------------
     # Internal stuff
 
+    # Take the next line of the current message, without waiting for it.
+    # Raises ExternalUIIncompleteMessage if it did not arrive yet.
     def readlineblock(self):
         if self.fPipeClient is None:
             return ""
 
-        return gCarla.utils.pipe_client_readlineblock(self.fPipeClient, 5000)
+        if not self.fPendingLines:
+            raise ExternalUIIncompleteMessage()
+
+        line = self.fPendingLines.popleft()
+        self.fMsgLines.append(line)
+        return line
 
     def readlineblock_bool(self):
         if self.fPipeClient is None:
             return False
 
-        return gCarla.utils.pipe_client_readlineblock_bool(self.fPipeClient, 5000)
+        return self.readlineblock() == "true"
 
     def readlineblock_int(self):
         if self.fPipeClient is None:
             return 0
 
-        return gCarla.utils.pipe_client_readlineblock_int(self.fPipeClient, 5000)
+        return int(self.readlineblock())
 
     def readlineblock_float(self):
         if self.fPipeClient is None:
             return 0.0
 
-        return gCarla.utils.pipe_client_readlineblock_float(self.fPipeClient, 5000)
+        return float(self.readlineblock())
 
+    # Queue a message, written on the next idleExternalUI() call.
+    # A "control" message replaces the one queued for the same parameter, in place, unless other messages were
+    # queued after it.
+    # Returns false if the message cannot be written, either because the pipe is closed or because writing the
+    # previous messages failed.
     def send(self, lines):
         if self.fPipeClient is None or len(lines) == 0:
             return False
 
-        hasError = False
+        msg = ""
+
+        for line in lines:
+            if line is None:
+                line2 = "(null)"
+            elif isinstance(line, str):
+                line2 = line.replace("\n", "\r")
+            elif isinstance(line, bool):
+                line2 = "true" if line else "false"
+            elif isinstance(line, int):
+                line2 = "%i" % line
+            elif isinstance(line, float):
+                line2 = "%.10f" % line
+            else:
+                print("unknown data type to send:", type(line))
+                return False
+
+            msg += line2 + "\n"
+
+        if lines[0] == "control" and len(lines) == 3:
+            index = self.fOutControls.get(lines[1], None)
+
+            if index is not None:
+                self.fOutMessages[index] = msg
+            else:
+                self.fOutControls[lines[1]] = len(self.fOutMessages)
+                self.fOutMessages.append(msg)
+
+        else:
+            # controls queued before this message must still be written before it
+            self.fOutControls.clear()
+            self.fOutMessages.append(msg)
+
+        return self.fOutFlushed and gCarla.utils.pipe_client_is_running(self.fPipeClient)
+
+    # Write all queued messages, one native call each.
+    def flushMessages(self):
+        if self.fPipeClient is None:
+            self.fOutMessages = []
+            self.fOutControls.clear()
+            return False
+
+        if len(self.fOutMessages) == 0:
+            return True
+
+        msgs = self.fOutMessages
+        self.fOutMessages = []
+        self.fOutControls.clear()
+
+        written = True
         gCarla.utils.pipe_client_lock(self.fPipeClient)
 
         try:
-            for line in lines:
-                if line is None:
-                    line2 = "(null)"
-                elif isinstance(line, str):
-                    line2 = line.replace("\n", "\r")
-                elif isinstance(line, bool):
-                    line2 = "true" if line else "false"
-                elif isinstance(line, int):
-                    line2 = "%i" % line
-                elif isinstance(line, float):
-                    line2 = "%.10f" % line
-                else:
-                    print("unknown data type to send:", type(line))
-                    hasError = True
-                    break
-
-                if not gCarla.utils.pipe_client_write_msg(self.fPipeClient, line2 + "\n"):
-                    hasError = True
+            for msg in msgs:
+                if not gCarla.utils.pipe_client_write_msg(self.fPipeClient, msg):
+                    written = False
                     break
 
         finally:
-            return gCarla.utils.pipe_client_flush_and_unlock(self.fPipeClient) and not hasError
+            flushed = gCarla.utils.pipe_client_flush_and_unlock(self.fPipeClient)
+
+        self.fOutFlushed = written and flushed
+        return self.fOutFlushed
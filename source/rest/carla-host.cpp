@@ -31,10 +31,6 @@ static void EngineCallback(void* ptr, EngineCallbackOpcode action, uint pluginId
     carla_debug("EngineCallback(%p, %u:%s, %u, %i, %i, %f, %s)",
                 ptr, (uint)action, EngineCallbackOpcode2Str(action), pluginId, value1, value2, value3, valueStr);
 
-    char msgBuf[1024];
-    std::snprintf(msgBuf, 1023, "Carla: %u %u %i %i %f %s", action, pluginId, value1, value2, value3, valueStr);
-    msgBuf[1023] = '\0';
-
     switch (action)
     {
     case ENGINE_CALLBACK_ENGINE_STARTED:
@@ -48,7 +44,7 @@ static void EngineCallback(void* ptr, EngineCallbackOpcode action, uint pluginId
         break;
     }
 
-    return send_server_side_message(msgBuf);
+    return send_server_side_callback(action, pluginId, value1, value2, value3, valueStr);
 
     // maybe unused
     (void)ptr;
@@ -71,13 +67,15 @@ static const char* FileCallback(void* ptr, FileCallbackOpcode action, bool isDir
 
 // -------------------------------------------------------------------------------------------------------------------
 
-void handle_carla_get_engine_driver_count(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_engine_driver_count(const std::shared_ptr<SessionType> session)
 {
     const char* const buf = str_buf_uint(carla_get_engine_driver_count());
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_engine_driver_name(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_engine_driver_name(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -88,7 +86,8 @@ void handle_carla_get_engine_driver_name(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_engine_driver_device_names(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_engine_driver_device_names(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -99,7 +98,8 @@ void handle_carla_get_engine_driver_device_names(const std::shared_ptr<Session>
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_engine_driver_device_info(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_engine_driver_device_info(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -122,7 +122,8 @@ void handle_carla_get_engine_driver_device_info(const std::shared_ptr<Session> s
 
 // -------------------------------------------------------------------------------------------------------------------
 
-void handle_carla_engine_init(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_engine_init(const std::shared_ptr<SessionType> session)
 {
     // setup callbacks
     carla_set_engine_callback(EngineCallback, nullptr);
@@ -138,19 +139,22 @@ void handle_carla_engine_init(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_engine_close(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_engine_close(const std::shared_ptr<SessionType> session)
 {
     const char* const buf = str_buf_bool(carla_engine_close());
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_is_engine_running(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_is_engine_running(const std::shared_ptr<SessionType> session)
 {
     const char* const buf = str_buf_bool(carla_is_engine_running());
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_set_engine_about_to_close(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_set_engine_about_to_close(const std::shared_ptr<SessionType> session)
 {
     const char* const buf = str_buf_bool(carla_set_engine_about_to_close());
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
@@ -158,7 +162,8 @@ void handle_carla_set_engine_about_to_close(const std::shared_ptr<Session> sessi
 
 // -------------------------------------------------------------------------------------------------------------------
 
-void handle_carla_set_engine_option(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_set_engine_option(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -176,7 +181,8 @@ void handle_carla_set_engine_option(const std::shared_ptr<Session> session)
 
 // -------------------------------------------------------------------------------------------------------------------
 
-void handle_carla_load_file(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_load_file(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -186,7 +192,8 @@ void handle_carla_load_file(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_load_project(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_load_project(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -196,7 +203,8 @@ void handle_carla_load_project(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_save_project(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_save_project(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -208,7 +216,8 @@ void handle_carla_save_project(const std::shared_ptr<Session> session)
 
 // -------------------------------------------------------------------------------------------------------------------
 
-void handle_carla_patchbay_connect(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_patchbay_connect(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -228,7 +237,8 @@ void handle_carla_patchbay_connect(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_patchbay_disconnect(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_patchbay_disconnect(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -239,7 +249,8 @@ void handle_carla_patchbay_disconnect(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_patchbay_refresh(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_patchbay_refresh(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -252,19 +263,22 @@ void handle_carla_patchbay_refresh(const std::shared_ptr<Session> session)
 
 // -------------------------------------------------------------------------------------------------------------------
 
-void handle_carla_transport_play(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_transport_play(const std::shared_ptr<SessionType> session)
 {
     carla_transport_play();
     session->close(OK);
 }
 
-void handle_carla_transport_pause(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_transport_pause(const std::shared_ptr<SessionType> session)
 {
     carla_transport_pause();
     session->close(OK);
 }
 
-void handle_carla_transport_bpm(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_transport_bpm(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -275,7 +289,8 @@ void handle_carla_transport_bpm(const std::shared_ptr<Session> session)
     session->close(OK);
 }
 
-void handle_carla_transport_relocate(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_transport_relocate(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -286,13 +301,15 @@ void handle_carla_transport_relocate(const std::shared_ptr<Session> session)
     session->close(OK);
 }
 
-void handle_carla_get_current_transport_frame(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_current_transport_frame(const std::shared_ptr<SessionType> session)
 {
     const char* const buf = str_buf_uint64(carla_get_current_transport_frame());
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_transport_info(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_transport_info(const std::shared_ptr<SessionType> session)
 {
     const CarlaTransportInfo* const info = carla_get_transport_info();
 
@@ -311,19 +328,22 @@ void handle_carla_get_transport_info(const std::shared_ptr<Session> session)
 
 // -------------------------------------------------------------------------------------------------------------------
 
-void handle_carla_get_current_plugin_count(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_current_plugin_count(const std::shared_ptr<SessionType> session)
 {
     const char* const buf = str_buf_uint(carla_get_current_plugin_count());
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_max_plugin_number(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_max_plugin_number(const std::shared_ptr<SessionType> session)
 {
     const char* const buf = str_buf_uint(carla_get_max_plugin_number());
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_add_plugin(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_add_plugin(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -354,7 +374,8 @@ void handle_carla_add_plugin(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_remove_plugin(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_remove_plugin(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -365,7 +386,8 @@ void handle_carla_remove_plugin(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_remove_all_plugins(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_remove_all_plugins(const std::shared_ptr<SessionType> session)
 {
     const char* const buf = str_buf_bool(carla_remove_all_plugins());
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
@@ -373,7 +395,8 @@ void handle_carla_remove_all_plugins(const std::shared_ptr<Session> session)
 
 // -------------------------------------------------------------------------------------------------------------------
 
-void handle_carla_rename_plugin(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_rename_plugin(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -386,7 +409,8 @@ void handle_carla_rename_plugin(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_clone_plugin(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_clone_plugin(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -397,7 +421,8 @@ void handle_carla_clone_plugin(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_replace_plugin(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_replace_plugin(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -408,7 +433,8 @@ void handle_carla_replace_plugin(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_switch_plugins(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_switch_plugins(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -424,7 +450,8 @@ void handle_carla_switch_plugins(const std::shared_ptr<Session> session)
 
 // -------------------------------------------------------------------------------------------------------------------
 
-void handle_carla_load_plugin_state(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_load_plugin_state(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -437,7 +464,8 @@ void handle_carla_load_plugin_state(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_save_plugin_state(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_save_plugin_state(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -450,7 +478,8 @@ void handle_carla_save_plugin_state(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_export_plugin_lv2(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_export_plugin_lv2(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -465,7 +494,8 @@ void handle_carla_export_plugin_lv2(const std::shared_ptr<Session> session)
 
 // -------------------------------------------------------------------------------------------------------------------
 
-void handle_carla_get_plugin_info(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_plugin_info(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -496,7 +526,8 @@ void handle_carla_get_plugin_info(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_audio_port_count_info(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_audio_port_count_info(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -514,7 +545,8 @@ void handle_carla_get_audio_port_count_info(const std::shared_ptr<Session> sessi
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_midi_port_count_info(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_midi_port_count_info(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -532,7 +564,8 @@ void handle_carla_get_midi_port_count_info(const std::shared_ptr<Session> sessio
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_parameter_count_info(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_parameter_count_info(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -550,7 +583,8 @@ void handle_carla_get_parameter_count_info(const std::shared_ptr<Session> sessio
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_parameter_info(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_parameter_info(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -573,7 +607,8 @@ void handle_carla_get_parameter_info(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_parameter_scalepoint_info(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_parameter_scalepoint_info(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -597,7 +632,8 @@ void handle_carla_get_parameter_scalepoint_info(const std::shared_ptr<Session> s
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_parameter_data(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_parameter_data(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -622,7 +658,8 @@ void handle_carla_get_parameter_data(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_parameter_ranges(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_parameter_ranges(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -647,7 +684,8 @@ void handle_carla_get_parameter_ranges(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_midi_program_data(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_midi_program_data(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -669,7 +707,8 @@ void handle_carla_get_midi_program_data(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_custom_data(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_custom_data(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -692,7 +731,8 @@ void handle_carla_get_custom_data(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_custom_data_value(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_custom_data_value(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -706,7 +746,8 @@ void handle_carla_get_custom_data_value(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_chunk_data(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_chunk_data(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -719,7 +760,8 @@ void handle_carla_get_chunk_data(const std::shared_ptr<Session> session)
 
 // -------------------------------------------------------------------------------------------------------------------
 
-void handle_carla_get_parameter_count(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_parameter_count(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -730,7 +772,8 @@ void handle_carla_get_parameter_count(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_program_count(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_program_count(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -741,7 +784,8 @@ void handle_carla_get_program_count(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_midi_program_count(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_midi_program_count(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -752,7 +796,8 @@ void handle_carla_get_midi_program_count(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_custom_data_count(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_custom_data_count(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -763,7 +808,8 @@ void handle_carla_get_custom_data_count(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_parameter_text(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_parameter_text(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -777,7 +823,8 @@ void handle_carla_get_parameter_text(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_program_name(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_program_name(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -791,7 +838,8 @@ void handle_carla_get_program_name(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_midi_program_name(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_midi_program_name(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -805,7 +853,8 @@ void handle_carla_get_midi_program_name(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_real_plugin_name(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_real_plugin_name(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -816,7 +865,8 @@ void handle_carla_get_real_plugin_name(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_current_program_index(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_current_program_index(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -827,7 +877,8 @@ void handle_carla_get_current_program_index(const std::shared_ptr<Session> sessi
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_current_midi_program_index(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_current_midi_program_index(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -838,7 +889,8 @@ void handle_carla_get_current_midi_program_index(const std::shared_ptr<Session>
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_default_parameter_value(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_default_parameter_value(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -852,7 +904,8 @@ void handle_carla_get_default_parameter_value(const std::shared_ptr<Session> ses
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_current_parameter_value(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_current_parameter_value(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -866,7 +919,8 @@ void handle_carla_get_current_parameter_value(const std::shared_ptr<Session> ses
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_internal_parameter_value(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_internal_parameter_value(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -880,7 +934,8 @@ void handle_carla_get_internal_parameter_value(const std::shared_ptr<Session> se
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_input_peak_value(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_input_peak_value(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -894,7 +949,8 @@ void handle_carla_get_input_peak_value(const std::shared_ptr<Session> session)
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_output_peak_value(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_output_peak_value(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -910,7 +966,8 @@ void handle_carla_get_output_peak_value(const std::shared_ptr<Session> session)
 
 // -------------------------------------------------------------------------------------------------------------------
 
-void handle_carla_set_active(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_set_active(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -924,7 +981,8 @@ void handle_carla_set_active(const std::shared_ptr<Session> session)
     session->close(OK);
 }
 
-void handle_carla_set_drywet(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_set_drywet(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -938,7 +996,8 @@ void handle_carla_set_drywet(const std::shared_ptr<Session> session)
     session->close(OK);
 }
 
-void handle_carla_set_volume(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_set_volume(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -952,7 +1011,8 @@ void handle_carla_set_volume(const std::shared_ptr<Session> session)
     session->close(OK);
 }
 
-void handle_carla_set_balance_left(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_set_balance_left(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -966,7 +1026,8 @@ void handle_carla_set_balance_left(const std::shared_ptr<Session> session)
     session->close(OK);
 }
 
-void handle_carla_set_balance_right(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_set_balance_right(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -980,7 +1041,8 @@ void handle_carla_set_balance_right(const std::shared_ptr<Session> session)
     session->close(OK);
 }
 
-void handle_carla_set_panning(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_set_panning(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -994,7 +1056,8 @@ void handle_carla_set_panning(const std::shared_ptr<Session> session)
     session->close(OK);
 }
 
-void handle_carla_set_ctrl_channel(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_set_ctrl_channel(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -1008,7 +1071,8 @@ void handle_carla_set_ctrl_channel(const std::shared_ptr<Session> session)
     session->close(OK);
 }
 
-void handle_carla_set_option(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_set_option(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -1027,7 +1091,8 @@ void handle_carla_set_option(const std::shared_ptr<Session> session)
 
 // -------------------------------------------------------------------------------------------------------------------
 
-void handle_carla_set_parameter_value(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_set_parameter_value(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -1043,7 +1108,8 @@ void handle_carla_set_parameter_value(const std::shared_ptr<Session> session)
     session->close(OK);
 }
 
-void handle_carla_set_parameter_midi_channel(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_set_parameter_midi_channel(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -1060,7 +1126,8 @@ void handle_carla_set_parameter_midi_channel(const std::shared_ptr<Session> sess
     session->close(OK);
 }
 
-void handle_carla_set_parameter_midi_cc(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_set_parameter_midi_cc(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -1070,14 +1137,15 @@ void handle_carla_set_parameter_midi_cc(const std::shared_ptr<Session> session)
     const int parameterId = std::atoi(request->get_query_parameter("parameterId").c_str());
     CARLA_SAFE_ASSERT_RETURN(parameterId >= 0,)
 
-    const int cc = std::atoi(request->get_query_parameter("channel").c_str());
+    const int cc = std::atoi(request->get_query_parameter("cc").c_str());
     CARLA_SAFE_ASSERT_RETURN(cc >= -1 && cc < INT16_MAX,);
 
     carla_set_parameter_midi_cc(pluginId, parameterId, cc);
     session->close(OK);
 }
 
-void handle_carla_set_program(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_set_program(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -1091,7 +1159,8 @@ void handle_carla_set_program(const std::shared_ptr<Session> session)
     session->close(OK);
 }
 
-void handle_carla_set_midi_program(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_set_midi_program(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -1105,7 +1174,8 @@ void handle_carla_set_midi_program(const std::shared_ptr<Session> session)
     session->close(OK);
 }
 
-void handle_carla_set_custom_data(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_set_custom_data(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -1120,7 +1190,8 @@ void handle_carla_set_custom_data(const std::shared_ptr<Session> session)
     session->close(OK);
 }
 
-void handle_carla_set_chunk_data(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_set_chunk_data(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -1135,7 +1206,8 @@ void handle_carla_set_chunk_data(const std::shared_ptr<Session> session)
 
 // -------------------------------------------------------------------------------------------------------------------
 
-void handle_carla_prepare_for_save(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_prepare_for_save(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -1146,7 +1218,8 @@ void handle_carla_prepare_for_save(const std::shared_ptr<Session> session)
     session->close(OK);
 }
 
-void handle_carla_reset_parameters(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_reset_parameters(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -1157,7 +1230,8 @@ void handle_carla_reset_parameters(const std::shared_ptr<Session> session)
     session->close(OK);
 }
 
-void handle_carla_randomize_parameters(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_randomize_parameters(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -1168,7 +1242,8 @@ void handle_carla_randomize_parameters(const std::shared_ptr<Session> session)
     session->close(OK);
 }
 
-void handle_carla_send_midi_note(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_send_midi_note(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -1190,31 +1265,36 @@ void handle_carla_send_midi_note(const std::shared_ptr<Session> session)
 
 // -------------------------------------------------------------------------------------------------------------------
 
-void handle_carla_get_buffer_size(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_buffer_size(const std::shared_ptr<SessionType> session)
 {
     const char* const buf = str_buf_uint(carla_get_buffer_size());
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_sample_rate(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_sample_rate(const std::shared_ptr<SessionType> session)
 {
     const char* const buf = str_buf_float(carla_get_sample_rate());
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_last_error(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_last_error(const std::shared_ptr<SessionType> session)
 {
     const char* const buf = carla_get_last_error();
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_host_osc_url_tcp(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_host_osc_url_tcp(const std::shared_ptr<SessionType> session)
 {
     const char* const buf = carla_get_host_osc_url_tcp();
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_host_osc_url_udp(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_host_osc_url_udp(const std::shared_ptr<SessionType> session)
 {
     const char* const buf = carla_get_host_osc_url_udp();
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
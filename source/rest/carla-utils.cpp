@@ -21,25 +21,29 @@
 
 // -------------------------------------------------------------------------------------------------------------------
 
-void handle_carla_get_complete_license_text(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_complete_license_text(const std::shared_ptr<SessionType> session)
 {
     const char* const buf = str_buf_string(carla_get_complete_license_text());
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_supported_file_extensions(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_supported_file_extensions(const std::shared_ptr<SessionType> session)
 {
     const char* const buf = str_buf_string_array(carla_get_supported_file_extensions());
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_supported_features(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_supported_features(const std::shared_ptr<SessionType> session)
 {
     const char* const buf = str_buf_string_array(carla_get_supported_features());
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_cached_plugin_count(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_cached_plugin_count(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -53,7 +57,8 @@ void handle_carla_get_cached_plugin_count(const std::shared_ptr<Session> session
     session->close(OK, buf, { { "Content-Length", size_buf(buf) } } );
 }
 
-void handle_carla_get_cached_plugin_info(const std::shared_ptr<Session> session)
+template <class SessionType>
+void handle_carla_get_cached_plugin_info(const std::shared_ptr<SessionType> session)
 {
     const std::shared_ptr<const Request> request = session->get_request();
 
@@ -35,6 +35,12 @@ using restbed::OK;
 
 CARLA_BACKEND_USE_NAMESPACE;
 
+// NOTE all request handlers are templated on the session type.
+// They are used with restbed::Session for regular requests, and with BatchSession for calls inside a batch request.
+// The session type only needs to provide get_request() and close(status[, body, headers]).
+
 void send_server_side_message(const char* const message);
+void send_server_side_callback(EngineCallbackOpcode action, uint pluginId,
+                               int value1, int value2, float value3, const char* valueStr);
 
 #endif // REST_COMMON_HPP_INCLUDED
@@ -27,11 +27,12 @@
 #include "carla-utils.cpp"
 
 #include "CarlaMutex.hpp"
-#include "CarlaStringList.hpp"
 
 // -------------------------------------------------------------------------------------------------------------------
 
 #include <map>
+#include <set>
+#include <vector>
 #include <restbed>
 #include <system_error>
 #include <openssl/sha.h>
@@ -46,18 +47,205 @@ using namespace std::chrono;
 
 // std::vector<std::shared_ptr<Session>> gSessions;
 
-CarlaStringList gSessionMessages;
+// A message for websocket clients, in both text and binary form, so each client gets the one it asked for.
+struct ServerSideMessage {
+    string text;
+    Bytes record;
+};
+
+std::vector<ServerSideMessage> gSessionMessages;
 CarlaMutex gSessionMessagesMutex;
 
 std::map< string, shared_ptr< WebSocket > > sockets = { };
 
+// keys of sockets that negotiated the binary protocol, see get_method_handler
+std::set< string > gBinarySockets;
+
+// how often to send output parameter values, in Hz (0 to disable)
+static uint gOutputParameterRate = 10;
+
+// -------------------------------------------------------------------------------------------------------------------
+// Binary websocket protocol
+//
+// Clients connecting to "/ws?protocol=binary" get "Protocol: binary" as first (text) message.
+// After that each engine idle tick is sent as a single binary frame, which replaces the "Keep-Alive" text line.
+// A frame is a list of records, each one is a uint8 type and uint32 payload size followed by the payload.
+// All values are little-endian, floats are IEEE-754 single precision.
+
+enum BinaryRecordType {
+    // all peaks of the tick, 4 floats per plugin in pluginId order
+    kBinaryRecordPeaks = 1,
+    // engine callback, uint32 action, uint32 pluginId, int32 value1, int32 value2, float value3, valueStr (utf-8)
+    kBinaryRecordCallback = 2,
+    // output parameters of a plugin, uint32 pluginId, then [uint32 parameterId, float value] pairs
+    kBinaryRecordParams = 3,
+    // any other server-side message, as utf-8 text
+    kBinaryRecordText = 4
+};
+
+template <typename T>
+static void append_binary_value(Bytes& bytes, const T value)
+{
+    // NOTE assumes a little-endian host, like every platform Carla runs on
+    const uint8_t* const ptr = reinterpret_cast<const uint8_t*>(&value);
+    bytes.insert(bytes.end(), ptr, ptr + sizeof(T));
+}
+
+static void append_binary_record_header(Bytes& bytes, const BinaryRecordType type, const std::size_t size)
+{
+    append_binary_value<uint8_t>(bytes, static_cast<uint8_t>(type));
+    append_binary_value<uint32_t>(bytes, static_cast<uint32_t>(size));
+}
+
+// -------------------------------------------------------------------------------------------------------------------
+
+static void send_to_text_sockets(const char* const message)
+{
+    for (auto entry : sockets)
+    {
+        auto socket = entry.second;
+
+        if (gBinarySockets.count(entry.first) != 0)
+            continue;
+
+        if (socket->is_open())
+            socket->send(message);
+    }
+}
+
+static void send_to_binary_sockets(const Bytes& frame)
+{
+    if (gBinarySockets.empty())
+        return;
+
+    const auto message = make_shared<WebSocketMessage>(WebSocketMessage::BINARY_FRAME, frame);
+
+    for (auto entry : sockets)
+    {
+        auto socket = entry.second;
+
+        if (gBinarySockets.count(entry.first) == 0)
+            continue;
+
+        if (socket->is_open())
+            socket->send(message);
+    }
+}
+
 // -------------------------------------------------------------------------------------------------------------------
 
 void send_server_side_message(const char* const message)
 {
+    ServerSideMessage msg;
+    msg.text = message;
+
+    const std::size_t size = std::strlen(message);
+    append_binary_record_header(msg.record, kBinaryRecordText, size);
+    msg.record.insert(msg.record.end(), message, message + size);
+
     const CarlaMutexLocker cml(gSessionMessagesMutex);
 
-    gSessionMessages.append(message);
+    gSessionMessages.push_back(msg);
+}
+
+void send_server_side_callback(const EngineCallbackOpcode action, const uint pluginId,
+                               const int value1, const int value2, const float value3, const char* const valueStr)
+{
+    char msgBuf[1024];
+    std::snprintf(msgBuf, 1023, "Carla: %u %u %i %i %f %s", action, pluginId, value1, value2, value3, valueStr);
+    msgBuf[1023] = '\0';
+
+    ServerSideMessage msg;
+    msg.text = msgBuf;
+
+    const std::size_t strSize = valueStr != nullptr ? std::strlen(valueStr) : 0;
+    append_binary_record_header(msg.record, kBinaryRecordCallback, sizeof(uint32_t)*4 + sizeof(float) + strSize);
+    append_binary_value<uint32_t>(msg.record, static_cast<uint32_t>(action));
+    append_binary_value<uint32_t>(msg.record, pluginId);
+    append_binary_value<int32_t>(msg.record, value1);
+    append_binary_value<int32_t>(msg.record, value2);
+    append_binary_value<float>(msg.record, value3);
+
+    if (strSize != 0)
+        msg.record.insert(msg.record.end(), valueStr, valueStr + strSize);
+
+    const CarlaMutexLocker cml(gSessionMessagesMutex);
+
+    gSessionMessages.push_back(msg);
+}
+
+// -------------------------------------------------------------------------------------------------------------------
+
+// Output parameters do not trigger callbacks, so their values are sent periodically.
+// One "Params: pluginId parameterId value [parameterId value]..." line is sent per plugin,
+// and a kBinaryRecordParams record is appended to the binary frame.
+// Input parameter changes are already sent as ENGINE_CALLBACK_PARAMETER_VALUE_CHANGED callbacks.
+static void send_output_parameter_values(const uint pluginCount, Bytes& frame)
+{
+    if (gOutputParameterRate == 0)
+        return;
+
+    static steady_clock::time_point lastTime;
+    const steady_clock::time_point now = steady_clock::now();
+
+    if (now - lastTime < milliseconds(1000 / gOutputParameterRate))
+        return;
+
+    lastTime = now;
+
+    std::string message;
+    Bytes record;
+    char valueBuf[64];
+
+    for (uint i=0; i<pluginCount; ++i)
+    {
+        const uint32_t parameterCount = carla_get_parameter_count(i);
+
+        std::snprintf(valueBuf, 63, "Params: %u", i);
+        valueBuf[63] = '\0';
+        message = valueBuf;
+        record.clear();
+
+        for (uint32_t j=0; j<parameterCount; ++j)
+        {
+            const ParameterData* const paramData = carla_get_parameter_data(i, j);
+            CARLA_SAFE_ASSERT_BREAK(paramData != nullptr);
+
+            if (paramData->type != PARAMETER_OUTPUT)
+                continue;
+            if ((paramData->hints & PARAMETER_IS_ENABLED) == 0)
+                continue;
+
+            const float value = carla_get_current_parameter_value(i, j);
+
+            std::snprintf(valueBuf, 63, " %u %f", j, value);
+            valueBuf[63] = '\0';
+            message += valueBuf;
+
+            append_binary_value<uint32_t>(record, j);
+            append_binary_value<float>(record, value);
+        }
+
+        if (record.empty())
+            continue;
+
+        send_to_text_sockets(message.c_str());
+
+        append_binary_record_header(frame, kBinaryRecordParams, sizeof(uint32_t) + record.size());
+        append_binary_value<uint32_t>(frame, i);
+        frame.insert(frame.end(), record.begin(), record.end());
+    }
+}
+
+void handle_set_output_parameter_rate(const std::shared_ptr<Session> session)
+{
+    const std::shared_ptr<const Request> request = session->get_request();
+
+    const int rate = std::atoi(request->get_query_parameter("rate").c_str());
+    CARLA_SAFE_ASSERT_RETURN(rate >= 0 && rate <= 1000, session->close(BAD_REQUEST));
+
+    gOutputParameterRate = static_cast<uint>(rate);
+    session->close(OK);
 }
 
 // -------------------------------------------------------------------------------------------------------------------
@@ -77,24 +265,22 @@ static void event_stream_handler(void)
     if (running)
         carla_engine_idle();
 
-    CarlaStringList messages;
+    std::vector<ServerSideMessage> messages;
 
     {
         const CarlaMutexLocker cml(gSessionMessagesMutex);
 
-        if (gSessionMessages.count() > 0)
-            gSessionMessages.moveTo(messages);
+        if (! gSessionMessages.empty())
+            gSessionMessages.swap(messages);
     }
 
-    for (auto message : messages)
-    {
-        for (auto entry : sockets)
-        {
-            auto socket = entry.second;
+    // everything for binary clients in this tick goes into a single frame
+    Bytes frame;
 
-            if (socket->is_open())
-                socket->send(message);
-        }
+    for (const ServerSideMessage& message : messages)
+    {
+        send_to_text_sockets(message.text.c_str());
+        frame.insert(frame.end(), message.record.begin(), message.record.end());
     }
 
     if (running)
@@ -104,32 +290,36 @@ static void event_stream_handler(void)
             char msgBuf[1024];
             float* peaks;
 
+            append_binary_record_header(frame, kBinaryRecordPeaks, sizeof(float)*4*count);
+
             for (uint i=0; i<count; ++i)
             {
                 peaks = carla_get_peak_values(i);
-                CARLA_SAFE_ASSERT_BREAK(peaks != nullptr);
+
+                if (peaks == nullptr)
+                {
+                    // keep record size intact
+                    carla_safe_assert("peaks != nullptr", __FILE__, __LINE__);
+                    for (uint j=0; j<4; ++j)
+                        append_binary_value<float>(frame, 0.0f);
+                    continue;
+                }
 
                 std::snprintf(msgBuf, 1023, "Peaks: %u %f %f %f %f", i, peaks[0], peaks[1], peaks[2], peaks[3]);
                 msgBuf[1023] = '\0';
 
-                for (auto entry : sockets)
-                {
-                    auto socket = entry.second;
+                send_to_text_sockets(msgBuf);
 
-                    if (socket->is_open())
-                        socket->send(msgBuf);
-                }
+                for (uint j=0; j<4; ++j)
+                    append_binary_value<float>(frame, peaks[j]);
             }
+
+            send_output_parameter_values(count, frame);
         }
     }
 
-    for (auto entry : sockets)
-    {
-        auto socket = entry.second;
-
-        if (socket->is_open())
-            socket->send("Keep-Alive");
-    }
+    send_to_text_sockets("Keep-Alive");
+    send_to_binary_sockets(frame);
 }
 
 
@@ -185,6 +375,7 @@ void close_handler( const shared_ptr< WebSocket > socket )
 
     const auto key = socket->get_key( );
     sockets.erase( key );
+    gBinarySockets.erase( key );
 
     fprintf( stderr, "Closed connection to %s.\n", key.data( ) );
 }
@@ -255,8 +446,9 @@ void get_method_handler(const shared_ptr<Session> session)
         if ( request->get_header( "upgrade", String::lowercase ) == "websocket" )
         {
             const auto headers = build_websocket_handshake_response_headers( request );
+            const bool binary = request->get_query_parameter( "protocol" ) == "binary";
 
-            session->upgrade( SWITCHING_PROTOCOLS, headers, [ ]( const shared_ptr< WebSocket > socket )
+            session->upgrade( SWITCHING_PROTOCOLS, headers, [ binary ]( const shared_ptr< WebSocket > socket )
             {
                 if ( socket->is_open( ) )
                 {
@@ -264,9 +456,19 @@ void get_method_handler(const shared_ptr<Session> session)
                     socket->set_error_handler( error_handler );
                     socket->set_message_handler( message_handler );
 
-                    socket->send("Welcome to Corvusoft Chat!");
-
                     auto key = socket->get_key( );
+
+                    if ( binary )
+                    {
+                        // clients not getting this reply (older servers) must fall back to the text protocol
+                        socket->send("Protocol: binary");
+                        gBinarySockets.insert( key );
+                    }
+                    else
+                    {
+                        socket->send("Welcome to Corvusoft Chat!");
+                    }
+
                     sockets[key] = socket;
                 }
                 else
@@ -300,16 +502,152 @@ void ping_handler( void )
     }
 }
 
+// -------------------------------------------------------------------------------------------------------------------
+// Batch requests
+
+// Stand-in for restbed::Session, used to run a single call from a batch request and keep its result
+class BatchSession
+{
+public:
+    BatchSession(const std::shared_ptr<const Request> request)
+        : fRequest(request),
+          fStatus(BAD_REQUEST),
+          fBody() {}
+
+    const std::shared_ptr<const Request> get_request() const
+    {
+        return fRequest;
+    }
+
+    void close(const int status)
+    {
+        fStatus = status;
+        fBody.clear();
+    }
+
+    void close(const int status, const std::string& body, const std::multimap<std::string, std::string>&)
+    {
+        fStatus = status;
+        fBody = body;
+    }
+
+    int get_status() const noexcept
+    {
+        return fStatus;
+    }
+
+    const std::string& get_body() const noexcept
+    {
+        return fBody;
+    }
+
+private:
+    const std::shared_ptr<const Request> fRequest;
+    // calls that fail their checks never close the session, so they are a bad request by default
+    int fStatus;
+    std::string fBody;
+};
+
+typedef void (*SessionHandler)(const std::shared_ptr<Session>);
+typedef void (*BatchSessionHandler)(const std::shared_ptr<BatchSession>);
+
+// call name (path without leading '/') -> handler
+static std::map<std::string, BatchSessionHandler> gBatchHandlers;
+
+static std::shared_ptr<Request> make_batch_call_request(const std::string& query)
+{
+    std::shared_ptr<Request> request = std::make_shared<Request>();
+
+    for (std::size_t start = 0; start < query.size();)
+    {
+        std::size_t end = query.find('&', start);
+
+        if (end == std::string::npos)
+            end = query.size();
+
+        const std::string parameter(query.substr(start, end - start));
+        const std::size_t sep = parameter.find('=');
+
+        if (sep != std::string::npos)
+            request->set_query_parameter(Uri::decode_parameter(parameter.substr(0, sep)),
+                                         Uri::decode_parameter(parameter.substr(sep + 1)));
+        else if (! parameter.empty())
+            request->set_query_parameter(Uri::decode_parameter(parameter), "");
+
+        start = end + 1;
+    }
+
+    return request;
+}
+
+// Runs a list of calls and returns all results in one response.
+// The request body has one call per line, written as "name?query", with the same query parameters as the regular request.
+// For each call the response contains a "status size" line followed by exactly 'size' bytes of the call result.
+// Calls are run in order, an unknown or failed call does not stop the following ones.
+static void handle_batch_request(const std::shared_ptr<Session> session)
+{
+    const std::shared_ptr<const Request> request = session->get_request();
+
+    const int contentLength = std::atoi(request->get_header("Content-Length").c_str());
+    CARLA_SAFE_ASSERT_RETURN(contentLength >= 0, session->close(BAD_REQUEST));
+
+    session->fetch(static_cast<std::size_t>(contentLength), [](const std::shared_ptr<Session> session, const Bytes& body)
+    {
+        const std::string calls(body.begin(), body.end());
+        std::string response;
+        char header[64];
+
+        for (std::size_t start = 0; start < calls.size();)
+        {
+            std::size_t end = calls.find('\n', start);
+
+            if (end == std::string::npos)
+                end = calls.size();
+
+            const std::string call(calls.substr(start, end - start));
+            start = end + 1;
+
+            if (call.empty())
+                continue;
+
+            const std::size_t sep = call.find('?');
+            const std::string name(call.substr(0, sep));
+            const std::shared_ptr<BatchSession> batchSession = std::make_shared<BatchSession>(
+                make_batch_call_request(sep != std::string::npos ? call.substr(sep + 1) : std::string()));
+
+            const std::map<std::string, BatchSessionHandler>::const_iterator it = gBatchHandlers.find(name);
+
+            if (it != gBatchHandlers.end())
+                it->second(batchSession);
+            else
+                carla_stderr2("Batch request has unknown call '%s'", name.c_str());
+
+            const std::string& result(batchSession->get_body());
+
+            std::snprintf(header, sizeof(header)-1, "%i " P_SIZE "\n", batchSession->get_status(), result.size());
+            header[sizeof(header)-1] = '\0';
+
+            response += header;
+            response += result;
+        }
+
+        session->close(OK, response, { { "Content-Length", std::to_string(response.size()) } } );
+    });
+}
+
 // -------------------------------------------------------------------------------------------------------------------
 
 static void make_resource(Service& service,
-                   const char* const path,
-                   const std::function<void (const std::shared_ptr<Session>)>& callback)
+                          const char* const path,
+                          const SessionHandler sessionHandler,
+                          const BatchSessionHandler batchHandler)
 {
     std::shared_ptr<Resource> resource = std::make_shared<Resource>();
     resource->set_path(path);
-    resource->set_method_handler("GET", callback);
+    resource->set_method_handler("GET", sessionHandler);
     service.publish(resource);
+
+    gBatchHandlers[path + 1] = batchHandler;
 }
 
 // -------------------------------------------------------------------------------------------------------------------
@@ -326,115 +664,131 @@ int main(int, const char**)
         service.publish(resource);
     }
 
+    // batch requests
+    {
+        std::shared_ptr<Resource> resource = std::make_shared<Resource>();
+        resource->set_path("/batch");
+        resource->set_method_handler("POST", handle_batch_request);
+        service.publish(resource);
+    }
+
     // carla-host
-    make_resource(service, "/get_engine_driver_count", handle_carla_get_engine_driver_count);
-    make_resource(service, "/get_engine_driver_name", handle_carla_get_engine_driver_name);
-    make_resource(service, "/get_engine_driver_device_names", handle_carla_get_engine_driver_device_names);
-    make_resource(service, "/get_engine_driver_device_info", handle_carla_get_engine_driver_device_info);
-
-    make_resource(service, "/engine_init", handle_carla_engine_init);
-    make_resource(service, "/engine_close", handle_carla_engine_close);
-    make_resource(service, "/is_engine_running", handle_carla_is_engine_running);
-    make_resource(service, "/set_engine_about_to_close", handle_carla_set_engine_about_to_close);
-
-    make_resource(service, "/set_engine_option", handle_carla_set_engine_option);
-    make_resource(service, "/load_file", handle_carla_load_file);
-    make_resource(service, "/load_project", handle_carla_load_project);
-    make_resource(service, "/save_project", handle_carla_save_project);
-
-    make_resource(service, "/patchbay_connect", handle_carla_patchbay_connect);
-    make_resource(service, "/patchbay_disconnect", handle_carla_patchbay_disconnect);
-    make_resource(service, "/patchbay_refresh", handle_carla_patchbay_refresh);
-
-    make_resource(service, "/transport_play", handle_carla_transport_play);
-    make_resource(service, "/transport_pause", handle_carla_transport_pause);
-    make_resource(service, "/transport_bpm", handle_carla_transport_bpm);
-    make_resource(service, "/transport_relocate", handle_carla_transport_relocate);
-    make_resource(service, "/get_current_transport_frame", handle_carla_get_current_transport_frame);
-    make_resource(service, "/get_transport_info", handle_carla_get_transport_info);
-
-    make_resource(service, "/get_current_plugin_count", handle_carla_get_current_plugin_count);
-    make_resource(service, "/get_max_plugin_number", handle_carla_get_max_plugin_number);
-    make_resource(service, "/add_plugin", handle_carla_add_plugin);
-    make_resource(service, "/remove_plugin", handle_carla_remove_plugin);
-    make_resource(service, "/remove_all_plugins", handle_carla_remove_all_plugins);
-
-    make_resource(service, "/rename_plugin", handle_carla_rename_plugin);
-    make_resource(service, "/clone_plugin", handle_carla_clone_plugin);
-    make_resource(service, "/replace_plugin", handle_carla_replace_plugin);
-    make_resource(service, "/switch_plugins", handle_carla_switch_plugins);
-
-    make_resource(service, "/load_plugin_state", handle_carla_load_plugin_state);
-    make_resource(service, "/save_plugin_state", handle_carla_save_plugin_state);
-    make_resource(service, "/export_plugin_lv2", handle_carla_export_plugin_lv2);
-
-    make_resource(service, "/get_plugin_info", handle_carla_get_plugin_info);
-    make_resource(service, "/get_audio_port_count_info", handle_carla_get_audio_port_count_info);
-    make_resource(service, "/get_midi_port_count_info", handle_carla_get_midi_port_count_info);
-    make_resource(service, "/get_parameter_count_info", handle_carla_get_parameter_count_info);
-    make_resource(service, "/get_parameter_info", handle_carla_get_parameter_info);
-    make_resource(service, "/get_parameter_scalepoint_info", handle_carla_get_parameter_scalepoint_info);
-
-    make_resource(service, "/get_parameter_data", handle_carla_get_parameter_data);
-    make_resource(service, "/get_parameter_ranges", handle_carla_get_parameter_ranges);
-    make_resource(service, "/get_midi_program_data", handle_carla_get_midi_program_data);
-    make_resource(service, "/get_custom_data", handle_carla_get_custom_data);
-    make_resource(service, "/get_custom_data_value", handle_carla_get_custom_data_value);
-    make_resource(service, "/get_chunk_data", handle_carla_get_chunk_data);
-
-    make_resource(service, "/get_parameter_count", handle_carla_get_parameter_count);
-    make_resource(service, "/get_program_count", handle_carla_get_program_count);
-    make_resource(service, "/get_midi_program_count", handle_carla_get_midi_program_count);
-    make_resource(service, "/get_custom_data_count", handle_carla_get_custom_data_count);
-
-    make_resource(service, "/get_parameter_text", handle_carla_get_parameter_text);
-    make_resource(service, "/get_program_name", handle_carla_get_program_name);
-    make_resource(service, "/get_midi_program_name", handle_carla_get_midi_program_name);
-    make_resource(service, "/get_real_plugin_name", handle_carla_get_real_plugin_name);
-
-    make_resource(service, "/get_current_program_index", handle_carla_get_current_program_index);
-    make_resource(service, "/get_current_midi_program_index", handle_carla_get_current_midi_program_index);
-
-    make_resource(service, "/get_default_parameter_value", handle_carla_get_default_parameter_value);
-    make_resource(service, "/get_current_parameter_value", handle_carla_get_current_parameter_value);
-    make_resource(service, "/get_internal_parameter_value", handle_carla_get_internal_parameter_value);
-    make_resource(service, "/get_input_peak_value", handle_carla_get_input_peak_value);
-    make_resource(service, "/get_output_peak_value", handle_carla_get_output_peak_value);
-
-    make_resource(service, "/set_active", handle_carla_set_active);
-    make_resource(service, "/set_drywet", handle_carla_set_drywet);
-    make_resource(service, "/set_volume", handle_carla_set_volume);
-    make_resource(service, "/set_balance_left", handle_carla_set_balance_left);
-    make_resource(service, "/set_balance_right", handle_carla_set_balance_right);
-    make_resource(service, "/set_panning", handle_carla_set_panning);
-    make_resource(service, "/set_ctrl_channel", handle_carla_set_ctrl_channel);
-    make_resource(service, "/set_option", handle_carla_set_option);
-
-    make_resource(service, "/set_parameter_value", handle_carla_set_parameter_value);
-    make_resource(service, "/set_parameter_midi_channel", handle_carla_set_parameter_midi_channel);
-    make_resource(service, "/set_parameter_midi_cc", handle_carla_set_parameter_midi_cc);
-    make_resource(service, "/set_program", handle_carla_set_program);
-    make_resource(service, "/set_midi_program", handle_carla_set_midi_program);
-    make_resource(service, "/set_custom_data", handle_carla_set_custom_data);
-    make_resource(service, "/set_chunk_data", handle_carla_set_chunk_data);
-
-    make_resource(service, "/prepare_for_save", handle_carla_prepare_for_save);
-    make_resource(service, "/reset_parameters", handle_carla_reset_parameters);
-    make_resource(service, "/randomize_parameters", handle_carla_randomize_parameters);
-    make_resource(service, "/send_midi_note", handle_carla_send_midi_note);
-
-    make_resource(service, "/get_buffer_size", handle_carla_get_buffer_size);
-    make_resource(service, "/get_sample_rate", handle_carla_get_sample_rate);
-    make_resource(service, "/get_last_error", handle_carla_get_last_error);
-    make_resource(service, "/get_host_osc_url_tcp", handle_carla_get_host_osc_url_tcp);
-    make_resource(service, "/get_host_osc_url_udp", handle_carla_get_host_osc_url_udp);
+    make_resource(service, "/get_engine_driver_count", handle_carla_get_engine_driver_count<Session>, handle_carla_get_engine_driver_count<BatchSession>);
+    make_resource(service, "/get_engine_driver_name", handle_carla_get_engine_driver_name<Session>, handle_carla_get_engine_driver_name<BatchSession>);
+    make_resource(service, "/get_engine_driver_device_names", handle_carla_get_engine_driver_device_names<Session>, handle_carla_get_engine_driver_device_names<BatchSession>);
+    make_resource(service, "/get_engine_driver_device_info", handle_carla_get_engine_driver_device_info<Session>, handle_carla_get_engine_driver_device_info<BatchSession>);
+
+    make_resource(service, "/engine_init", handle_carla_engine_init<Session>, handle_carla_engine_init<BatchSession>);
+    make_resource(service, "/engine_close", handle_carla_engine_close<Session>, handle_carla_engine_close<BatchSession>);
+    make_resource(service, "/is_engine_running", handle_carla_is_engine_running<Session>, handle_carla_is_engine_running<BatchSession>);
+    make_resource(service, "/set_engine_about_to_close", handle_carla_set_engine_about_to_close<Session>, handle_carla_set_engine_about_to_close<BatchSession>);
+
+    make_resource(service, "/set_engine_option", handle_carla_set_engine_option<Session>, handle_carla_set_engine_option<BatchSession>);
+    make_resource(service, "/load_file", handle_carla_load_file<Session>, handle_carla_load_file<BatchSession>);
+    make_resource(service, "/load_project", handle_carla_load_project<Session>, handle_carla_load_project<BatchSession>);
+    make_resource(service, "/save_project", handle_carla_save_project<Session>, handle_carla_save_project<BatchSession>);
+
+    make_resource(service, "/patchbay_connect", handle_carla_patchbay_connect<Session>, handle_carla_patchbay_connect<BatchSession>);
+    make_resource(service, "/patchbay_disconnect", handle_carla_patchbay_disconnect<Session>, handle_carla_patchbay_disconnect<BatchSession>);
+    make_resource(service, "/patchbay_refresh", handle_carla_patchbay_refresh<Session>, handle_carla_patchbay_refresh<BatchSession>);
+
+    make_resource(service, "/transport_play", handle_carla_transport_play<Session>, handle_carla_transport_play<BatchSession>);
+    make_resource(service, "/transport_pause", handle_carla_transport_pause<Session>, handle_carla_transport_pause<BatchSession>);
+    make_resource(service, "/transport_bpm", handle_carla_transport_bpm<Session>, handle_carla_transport_bpm<BatchSession>);
+    make_resource(service, "/transport_relocate", handle_carla_transport_relocate<Session>, handle_carla_transport_relocate<BatchSession>);
+    make_resource(service, "/get_current_transport_frame", handle_carla_get_current_transport_frame<Session>, handle_carla_get_current_transport_frame<BatchSession>);
+    make_resource(service, "/get_transport_info", handle_carla_get_transport_info<Session>, handle_carla_get_transport_info<BatchSession>);
+
+    make_resource(service, "/get_current_plugin_count", handle_carla_get_current_plugin_count<Session>, handle_carla_get_current_plugin_count<BatchSession>);
+    make_resource(service, "/get_max_plugin_number", handle_carla_get_max_plugin_number<Session>, handle_carla_get_max_plugin_number<BatchSession>);
+    make_resource(service, "/add_plugin", handle_carla_add_plugin<Session>, handle_carla_add_plugin<BatchSession>);
+    make_resource(service, "/remove_plugin", handle_carla_remove_plugin<Session>, handle_carla_remove_plugin<BatchSession>);
+    make_resource(service, "/remove_all_plugins", handle_carla_remove_all_plugins<Session>, handle_carla_remove_all_plugins<BatchSession>);
+
+    make_resource(service, "/rename_plugin", handle_carla_rename_plugin<Session>, handle_carla_rename_plugin<BatchSession>);
+    make_resource(service, "/clone_plugin", handle_carla_clone_plugin<Session>, handle_carla_clone_plugin<BatchSession>);
+    make_resource(service, "/replace_plugin", handle_carla_replace_plugin<Session>, handle_carla_replace_plugin<BatchSession>);
+    make_resource(service, "/switch_plugins", handle_carla_switch_plugins<Session>, handle_carla_switch_plugins<BatchSession>);
+
+    make_resource(service, "/load_plugin_state", handle_carla_load_plugin_state<Session>, handle_carla_load_plugin_state<BatchSession>);
+    make_resource(service, "/save_plugin_state", handle_carla_save_plugin_state<Session>, handle_carla_save_plugin_state<BatchSession>);
+    make_resource(service, "/export_plugin_lv2", handle_carla_export_plugin_lv2<Session>, handle_carla_export_plugin_lv2<BatchSession>);
+
+    make_resource(service, "/get_plugin_info", handle_carla_get_plugin_info<Session>, handle_carla_get_plugin_info<BatchSession>);
+    make_resource(service, "/get_audio_port_count_info", handle_carla_get_audio_port_count_info<Session>, handle_carla_get_audio_port_count_info<BatchSession>);
+    make_resource(service, "/get_midi_port_count_info", handle_carla_get_midi_port_count_info<Session>, handle_carla_get_midi_port_count_info<BatchSession>);
+    make_resource(service, "/get_parameter_count_info", handle_carla_get_parameter_count_info<Session>, handle_carla_get_parameter_count_info<BatchSession>);
+    make_resource(service, "/get_parameter_info", handle_carla_get_parameter_info<Session>, handle_carla_get_parameter_info<BatchSession>);
+    make_resource(service, "/get_parameter_scalepoint_info", handle_carla_get_parameter_scalepoint_info<Session>, handle_carla_get_parameter_scalepoint_info<BatchSession>);
+
+    make_resource(service, "/get_parameter_data", handle_carla_get_parameter_data<Session>, handle_carla_get_parameter_data<BatchSession>);
+    make_resource(service, "/get_parameter_ranges", handle_carla_get_parameter_ranges<Session>, handle_carla_get_parameter_ranges<BatchSession>);
+    make_resource(service, "/get_midi_program_data", handle_carla_get_midi_program_data<Session>, handle_carla_get_midi_program_data<BatchSession>);
+    make_resource(service, "/get_custom_data", handle_carla_get_custom_data<Session>, handle_carla_get_custom_data<BatchSession>);
+    make_resource(service, "/get_custom_data_value", handle_carla_get_custom_data_value<Session>, handle_carla_get_custom_data_value<BatchSession>);
+    make_resource(service, "/get_chunk_data", handle_carla_get_chunk_data<Session>, handle_carla_get_chunk_data<BatchSession>);
+
+    make_resource(service, "/get_parameter_count", handle_carla_get_parameter_count<Session>, handle_carla_get_parameter_count<BatchSession>);
+    make_resource(service, "/get_program_count", handle_carla_get_program_count<Session>, handle_carla_get_program_count<BatchSession>);
+    make_resource(service, "/get_midi_program_count", handle_carla_get_midi_program_count<Session>, handle_carla_get_midi_program_count<BatchSession>);
+    make_resource(service, "/get_custom_data_count", handle_carla_get_custom_data_count<Session>, handle_carla_get_custom_data_count<BatchSession>);
+
+    make_resource(service, "/get_parameter_text", handle_carla_get_parameter_text<Session>, handle_carla_get_parameter_text<BatchSession>);
+    make_resource(service, "/get_program_name", handle_carla_get_program_name<Session>, handle_carla_get_program_name<BatchSession>);
+    make_resource(service, "/get_midi_program_name", handle_carla_get_midi_program_name<Session>, handle_carla_get_midi_program_name<BatchSession>);
+    make_resource(service, "/get_real_plugin_name", handle_carla_get_real_plugin_name<Session>, handle_carla_get_real_plugin_name<BatchSession>);
+
+    make_resource(service, "/get_current_program_index", handle_carla_get_current_program_index<Session>, handle_carla_get_current_program_index<BatchSession>);
+    make_resource(service, "/get_current_midi_program_index", handle_carla_get_current_midi_program_index<Session>, handle_carla_get_current_midi_program_index<BatchSession>);
+
+    make_resource(service, "/get_default_parameter_value", handle_carla_get_default_parameter_value<Session>, handle_carla_get_default_parameter_value<BatchSession>);
+    make_resource(service, "/get_current_parameter_value", handle_carla_get_current_parameter_value<Session>, handle_carla_get_current_parameter_value<BatchSession>);
+    make_resource(service, "/get_internal_parameter_value", handle_carla_get_internal_parameter_value<Session>, handle_carla_get_internal_parameter_value<BatchSession>);
+    make_resource(service, "/get_input_peak_value", handle_carla_get_input_peak_value<Session>, handle_carla_get_input_peak_value<BatchSession>);
+    make_resource(service, "/get_output_peak_value", handle_carla_get_output_peak_value<Session>, handle_carla_get_output_peak_value<BatchSession>);
+
+    make_resource(service, "/set_active", handle_carla_set_active<Session>, handle_carla_set_active<BatchSession>);
+    make_resource(service, "/set_drywet", handle_carla_set_drywet<Session>, handle_carla_set_drywet<BatchSession>);
+    make_resource(service, "/set_volume", handle_carla_set_volume<Session>, handle_carla_set_volume<BatchSession>);
+    make_resource(service, "/set_balance_left", handle_carla_set_balance_left<Session>, handle_carla_set_balance_left<BatchSession>);
+    make_resource(service, "/set_balance_right", handle_carla_set_balance_right<Session>, handle_carla_set_balance_right<BatchSession>);
+    make_resource(service, "/set_panning", handle_carla_set_panning<Session>, handle_carla_set_panning<BatchSession>);
+    make_resource(service, "/set_ctrl_channel", handle_carla_set_ctrl_channel<Session>, handle_carla_set_ctrl_channel<BatchSession>);
+    make_resource(service, "/set_option", handle_carla_set_option<Session>, handle_carla_set_option<BatchSession>);
+
+    make_resource(service, "/set_parameter_value", handle_carla_set_parameter_value<Session>, handle_carla_set_parameter_value<BatchSession>);
+    make_resource(service, "/set_parameter_midi_channel", handle_carla_set_parameter_midi_channel<Session>, handle_carla_set_parameter_midi_channel<BatchSession>);
+    make_resource(service, "/set_parameter_midi_cc", handle_carla_set_parameter_midi_cc<Session>, handle_carla_set_parameter_midi_cc<BatchSession>);
+    make_resource(service, "/set_program", handle_carla_set_program<Session>, handle_carla_set_program<BatchSession>);
+    make_resource(service, "/set_midi_program", handle_carla_set_midi_program<Session>, handle_carla_set_midi_program<BatchSession>);
+    make_resource(service, "/set_custom_data", handle_carla_set_custom_data<Session>, handle_carla_set_custom_data<BatchSession>);
+    make_resource(service, "/set_chunk_data", handle_carla_set_chunk_data<Session>, handle_carla_set_chunk_data<BatchSession>);
+
+    make_resource(service, "/prepare_for_save", handle_carla_prepare_for_save<Session>, handle_carla_prepare_for_save<BatchSession>);
+    make_resource(service, "/reset_parameters", handle_carla_reset_parameters<Session>, handle_carla_reset_parameters<BatchSession>);
+    make_resource(service, "/randomize_parameters", handle_carla_randomize_parameters<Session>, handle_carla_randomize_parameters<BatchSession>);
+    make_resource(service, "/send_midi_note", handle_carla_send_midi_note<Session>, handle_carla_send_midi_note<BatchSession>);
+
+    make_resource(service, "/get_buffer_size", handle_carla_get_buffer_size<Session>, handle_carla_get_buffer_size<BatchSession>);
+    make_resource(service, "/get_sample_rate", handle_carla_get_sample_rate<Session>, handle_carla_get_sample_rate<BatchSession>);
+    make_resource(service, "/get_last_error", handle_carla_get_last_error<Session>, handle_carla_get_last_error<BatchSession>);
+    make_resource(service, "/get_host_osc_url_tcp", handle_carla_get_host_osc_url_tcp<Session>, handle_carla_get_host_osc_url_tcp<BatchSession>);
+    make_resource(service, "/get_host_osc_url_udp", handle_carla_get_host_osc_url_udp<Session>, handle_carla_get_host_osc_url_udp<BatchSession>);
+
+    // rest-server
+    {
+        std::shared_ptr<Resource> resource = std::make_shared<Resource>();
+        resource->set_path("/set_output_parameter_rate");
+        resource->set_method_handler("GET", handle_set_output_parameter_rate);
+        service.publish(resource);
+    }
 
     // carla-utils
-    make_resource(service, "/get_complete_license_text", handle_carla_get_complete_license_text);
-    make_resource(service, "/get_supported_file_extensions", handle_carla_get_supported_file_extensions);
-    make_resource(service, "/get_supported_features", handle_carla_get_supported_features);
-    make_resource(service, "/get_cached_plugin_count", handle_carla_get_cached_plugin_count);
-    make_resource(service, "/get_cached_plugin_info", handle_carla_get_cached_plugin_info);
+    make_resource(service, "/get_complete_license_text", handle_carla_get_complete_license_text<Session>, handle_carla_get_complete_license_text<BatchSession>);
+    make_resource(service, "/get_supported_file_extensions", handle_carla_get_supported_file_extensions<Session>, handle_carla_get_supported_file_extensions<BatchSession>);
+    make_resource(service, "/get_supported_features", handle_carla_get_supported_features<Session>, handle_carla_get_supported_features<BatchSession>);
+    make_resource(service, "/get_cached_plugin_count", handle_carla_get_cached_plugin_count<Session>, handle_carla_get_cached_plugin_count<BatchSession>);
+    make_resource(service, "/get_cached_plugin_info", handle_carla_get_cached_plugin_info<Session>, handle_carla_get_cached_plugin_info<BatchSession>);
 
     // schedule events
     service.schedule(event_stream_handler, std::chrono::milliseconds(33));
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Carla frontend startup benchmark
+# Copyright (C) 2011-2020 Filipe Coelho <falktx@falktx.com>
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as
+# published by the Free Software Foundation; either version 2 of
+# the License, or any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a full copy of the GNU General Public License see the doc/GPL.txt file.
+
+# ------------------------------------------------------------------------------------------------------------
+# Measures how long it takes to import carla_backend/carla_utils and create the DLL-based objects.
+# Each run happens in a new python process, so imports are never cached.
+#
+# Usage: frontend-startup-bench.py [binary-dir] [runs]
+# binary-dir defaults to the top-level 'bin' dir, where 'make' places the Carla libraries.
+
+# ------------------------------------------------------------------------------------------------------------
+# Imports (Global)
+
+import os
+import sys
+
+from statistics import median
+from subprocess import check_output
+
+# ------------------------------------------------------------------------------------------------------------
+
+kSourceDir   = os.path.dirname(os.path.abspath(__file__))
+kFrontendDir = os.path.join(kSourceDir, "..", "frontend")
+kDefaultBinaryDir = os.path.join(kSourceDir, "..", "..", "bin")
+
+# the code run for each measurement, prints times in ms for import, host init and utils init
+kRunnerCode = """
+import sys
+from time import perf_counter
+sys.path.insert(0, %(frontend)r)
+
+t0 = perf_counter()
+import carla_backend
+import carla_utils
+t1 = perf_counter()
+
+host = carla_backend.CarlaHostDLL(%(hostlib)r, False)
+if %(eager)r:
+    for name in carla_backend.CARLA_HOST_DLL_FUNCTIONS:
+        getattr(host.lib, name)
+t2 = perf_counter()
+
+utils = carla_utils.CarlaUtils(%(utilslib)r)
+if %(eager)r:
+    for name in carla_utils.CARLA_UTILS_FUNCTIONS:
+        getattr(utils.lib, name)
+t3 = perf_counter()
+
+print((t1-t0)*1000.0, (t2-t1)*1000.0, (t3-t2)*1000.0)
+"""
+
+# ------------------------------------------------------------------------------------------------------------
+
+def runOnce(hostlib, utilslib, eager):
+    code = kRunnerCode % {
+        'frontend': kFrontendDir,
+        'hostlib': hostlib,
+        'utilslib': utilslib,
+        'eager': eager,
+    }
+    output = check_output([sys.executable, "-c", code]).decode("utf-8", errors="ignore")
+    return tuple(float(v) for v in output.strip().splitlines()[-1].split())
+
+def runBenchmark(hostlib, utilslib, runs, eager):
+    results = [runOnce(hostlib, utilslib, eager) for _ in range(runs)]
+
+    importTime = median(r[0] for r in results)
+    hostTime   = median(r[1] for r in results)
+    utilsTime  = median(r[2] for r in results)
+
+    print("%s binding (median of %i runs):" % ("Eager" if eager else "Lazy", runs))
+    print("  import carla_backend+carla_utils: %8.3f ms" % importTime)
+    print("  CarlaHostDLL init:                %8.3f ms" % hostTime)
+    print("  CarlaUtils init:                  %8.3f ms" % utilsTime)
+    print("  Total:                            %8.3f ms" % (importTime + hostTime + utilsTime))
+
+# ------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    binaryDir = sys.argv[1] if len(sys.argv) > 1 else kDefaultBinaryDir
+    runs      = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    if sys.platform == "darwin":
+        extension = "dylib"
+    elif sys.platform in ("win32", "win64", "cygwin"):
+        extension = "dll"
+    else:
+        extension = "so"
+
+    hostlib  = os.path.join(binaryDir, "libcarla_standalone2.%s" % extension)
+    utilslib = os.path.join(binaryDir, "libcarla_utils.%s" % extension)
+
+    for lib in (hostlib, utilslib):
+        if not os.path.exists(lib):
+            print("Library '%s' not found, please build Carla first" % lib)
+            sys.exit(1)
+
+    # eager binding sets up every function right away, as CarlaHostDLL and CarlaUtils used to do
+    runBenchmark(hostlib, utilslib, runs, True)
+    runBenchmark(hostlib, utilslib, runs, False)
+
+# ------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Carla OSC control benchmark
+# Copyright (C) 2011-2020 Filipe Coelho <falktx@falktx.com>
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as
+# published by the Free Software Foundation; either version 2 of
+# the License, or any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a full copy of the GNU General Public License see the doc/GPL.txt file.
+
+# ------------------------------------------------------------------------------------------------------------
+# Measures the host side of carla-control (CarlaHostOSC and its control servers) against osc-fake-engine.py,
+# for each combination of plugin and parameter counts:
+#  - time from registering until the full engine state is received
+#  - round-trip latency of a single request, and requests/s when many are in flight
+#  - messages/s received from the engine stream, and time spent handling them per GUI tick
+#
+# Usage: osc-control-bench.py [--plugins 1,10,50] [--parameters 8,32,128] [--rate 30] [--no-packed-peaks]
+# The frontend needs to be built first ('make'), as carla_control imports the generated UI files.
+
+# ------------------------------------------------------------------------------------------------------------
+# Imports (Global)
+
+import argparse
+import os
+import sys
+
+from statistics import mean, median
+from subprocess import Popen, PIPE
+from time import perf_counter, sleep
+
+# ------------------------------------------------------------------------------------------------------------
+
+kSourceDir   = os.path.dirname(os.path.abspath(__file__))
+kFrontendDir = os.path.join(kSourceDir, "..", "frontend")
+kEnginePath  = os.path.join(kSourceDir, "osc-fake-engine.py")
+
+sys.path.insert(0, kFrontendDir)
+
+# ------------------------------------------------------------------------------------------------------------
+
+def startEngine(args, port, plugins, parameters):
+    engine = Popen([sys.executable, kEnginePath,
+                    "--port", str(port),
+                    "--plugins", str(plugins),
+                    "--parameters", str(parameters),
+                    "--outputs", str(args.outputs),
+                    "--rate", str(args.rate)], stdout=PIPE)
+
+    # wait until the engine is ready
+    engine.stdout.readline()
+    return engine
+
+# Same as HostWindowOSC.connectOsc(), without the GUI parts.
+def connectHost(port, packedPeaks):
+    from carla_control import Address, CarlaHostOSC, CarlaControlServerTCP, CarlaControlServerUDP, lo_send
+
+    host = CarlaHostOSC()
+
+    host.lo_target_tcp = Address("osc.tcp://127.0.0.1:%i/Carla" % port)
+    host.lo_target_tcp_name = "Carla"
+    host.lo_server_tcp = CarlaControlServerTCP(host, "")
+    lo_send(host.lo_target_tcp, "/register", host.lo_server_tcp.getFullURL())
+
+    host.lo_target_udp = Address("osc.udp://127.0.0.1:%i/Carla" % port)
+    host.lo_target_udp_name = "Carla"
+    host.lo_server_udp = CarlaControlServerUDP(host, "")
+    lo_send(host.lo_target_udp, "/register", host.lo_server_udp.getFullURL())
+
+    if packedPeaks:
+        host.requestPackedPeaks()
+
+    return host
+
+def disconnectHost(host):
+    from carla_control import lo_send
+
+    lo_send(host.lo_target_udp, "/unregister", host.lo_server_udp.getFullURL())
+    lo_send(host.lo_target_tcp, "/unregister", host.lo_server_tcp.getFullURL())
+
+    host.lo_server_udp.shutdown()
+    host.lo_server_tcp.shutdown()
+    host.resetPendingMessages()
+
+# One GUI tick, as done by HostWindowOSC.idleFast().
+def idleHost(host):
+    host.idleUpdates()
+    host.lo_server_tcp.idle()
+    host.lo_server_udp.idle()
+
+def waitForFutures(host, futures, timeout=30.0):
+    start = perf_counter()
+
+    while not all(future.done() for future in futures):
+        if perf_counter() - start > timeout:
+            raise TimeoutError("No response from the stand-in engine")
+        idleHost(host)
+        sleep(0.0001)
+
+# ------------------------------------------------------------------------------------------------------------
+
+def benchSync(host):
+    # the response is sent after all the plugin data, as the engine handles messages in order
+    start = perf_counter()
+    waitForFutures(host, [host.sendMsgAsync(["clear_engine_xruns"])])
+    return perf_counter() - start
+
+def benchRoundTrip(host, count):
+    times = []
+
+    for _ in range(count):
+        start = perf_counter()
+        waitForFutures(host, [host.sendMsgAsync(["clear_engine_xruns"])])
+        times.append(perf_counter() - start)
+
+    return median(times), max(times)
+
+def benchThroughput(host, count):
+    start = perf_counter()
+    waitForFutures(host, [host.sendMsgAsync(["clear_engine_xruns"]) for _ in range(count)])
+    return count / (perf_counter() - start)
+
+def benchTicks(host, duration, rate):
+    for server in (host.lo_server_tcp, host.lo_server_udp):
+        server.resetStats()
+
+    receivedStart = host.lo_server_udp.getStats()['received']
+    times = []
+    start = perf_counter()
+
+    while perf_counter() - start < duration:
+        tickStart = perf_counter()
+        idleHost(host)
+        times.append(perf_counter() - tickStart)
+        sleep(1.0 / rate)
+
+    stats = host.lo_server_udp.getStats()
+    messagesPerSecond = (stats['received'] - receivedStart) / (perf_counter() - start)
+
+    return mean(times), max(times), messagesPerSecond, stats
+
+# ------------------------------------------------------------------------------------------------------------
+
+def runBenchmark(args, port, plugins, parameters):
+    engine = startEngine(args, port, plugins, parameters)
+
+    try:
+        host = connectHost(port, not args.no_packed_peaks)
+
+        try:
+            syncTime = benchSync(host)
+            roundTrip, roundTripMax = benchRoundTrip(host, args.requests)
+            requestsPerSecond = benchThroughput(host, args.requests)
+            tickMean, tickMax, messagesPerSecond, stats = benchTicks(host, args.duration, 30.0)
+        finally:
+            disconnectHost(host)
+
+    finally:
+        engine.terminate()
+        engine.wait()
+
+    print("OSC control (%i plugins, %i parameters, %g Hz stream, %s peaks):" % (
+          plugins, parameters, args.rate, "per-plugin" if args.no_packed_peaks else "packed"))
+    print("  initial state sync:       %10.3f ms" % (syncTime * 1000.0))
+    print("  request round-trip:       %10.3f ms (max %.3f ms)" % (roundTrip * 1000.0, roundTripMax * 1000.0))
+    print("  pipelined requests:       %10.1f requests/s" % requestsPerSecond)
+    print("  stream received:          %10.1f messages/s" % messagesPerSecond)
+    print("  GUI tick cost:            %10.3f ms (max %.3f ms)" % (tickMean * 1000.0, tickMax * 1000.0))
+    print("  queue latency:            %10.3f ms (max %.3f ms, max depth %i)" % (
+          stats['averageLatency'] * 1000.0, stats['maxLatency'] * 1000.0, stats['maxQueueDepth']))
+
+# ------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Carla OSC control benchmark")
+    parser.add_argument("--plugins", type=str, default="1,10,50", help="comma-separated numbers of plugins")
+    parser.add_argument("--parameters", type=str, default="8,32,128", help="comma-separated numbers of parameters per plugin")
+    parser.add_argument("--outputs", type=int, default=4, help="how many of the parameters are outputs")
+    parser.add_argument("--rate", type=float, default=30.0, help="engine ticks per second")
+    parser.add_argument("--requests", type=int, default=200, help="number of requests for the request benchmarks")
+    parser.add_argument("--duration", type=float, default=3.0, help="duration of the GUI tick benchmark, in seconds")
+    parser.add_argument("--port", type=int, default=22850, help="first port to use, one per combination")
+    parser.add_argument("--no-packed-peaks", action="store_true", help="use one peaks message per plugin")
+    args = parser.parse_args()
+
+    from PyQt5.QtCore import QCoreApplication
+    app = QCoreApplication(sys.argv)
+
+    port = args.port
+
+    for plugins in (int(value) for value in args.plugins.split(",")):
+        for parameters in (int(value) for value in args.parameters.split(",")):
+            runBenchmark(args, port, plugins, parameters)
+            port += 1
+
+# ------------------------------------------------------------------------------------------------------------
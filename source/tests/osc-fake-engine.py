@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Carla OSC control stand-in engine
+# Copyright (C) 2011-2020 Filipe Coelho <falktx@falktx.com>
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as
+# published by the Free Software Foundation; either version 2 of
+# the License, or any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a full copy of the GNU General Public License see the doc/GPL.txt file.
+
+# ------------------------------------------------------------------------------------------------------------
+# A pure-Python replacement for the OSC side of a running Carla (CarlaEngineOsc), backed by a synthetic engine.
+# Speaks the same protocol as carla-control expects:
+#  - TCP: /register, /unregister, /ctrl/<method> requests answered with /ctrl/resp,
+#         /<name>/<pluginId>/<method> plugin changes, and the /ctrl/cb, info, ports, paramInfo, paramData,
+#         paramRanges, count, iparams messages sent when a client registers or a plugin is added
+#  - UDP: /register, /unregister, /set_packed_peaks, and the /ctrl/param, peaks (or peaks_packed) and
+#         runtime messages sent on every engine tick
+#
+# Usage: osc-fake-engine.py [--port 22752] [--name Carla] [--plugins 10] [--parameters 32] [--outputs 4]
+#                           [--rate 30]
+
+# ------------------------------------------------------------------------------------------------------------
+# Imports (Global)
+
+import argparse
+import os
+import struct
+import sys
+
+from math import sin
+from random import random
+from threading import Lock
+from time import monotonic, sleep
+from urllib.parse import urlsplit
+
+from liblo import Address, ServerThread, send as lo_send, TCP as LO_TCP, UDP as LO_UDP
+
+# ------------------------------------------------------------------------------------------------------------
+# Imports (Custom)
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "frontend"))
+
+from carla_backend import *
+
+# ------------------------------------------------------------------------------------------------------------
+# Synthetic engine, with plugins made of plain python data.
+
+class FakePlugin(object):
+    def __init__(self, name, parameterCount, outputCount):
+        object.__init__(self)
+
+        self.name = name
+        self.parameterCount = parameterCount
+        self.outputCount = min(outputCount, parameterCount)
+        self.values = [0.5] * parameterCount
+
+        # active, drywet, volume, balance left, balance right, panning, ctrl channel
+        self.internalValues = [1.0, 1.0, 1.0, -1.0, 1.0, 0.0, -1.0]
+
+    def is_output(self, parameterId):
+        return parameterId >= self.parameterCount - self.outputCount
+
+class FakeEngine(object):
+    def __init__(self, pluginCount, parameterCount, outputCount):
+        object.__init__(self)
+
+        self.lock = Lock()
+        self.parameterCount = parameterCount
+        self.outputCount = outputCount
+        self.xruns = 0
+        self.frame = 0
+        self.plugins = [self.new_plugin(i) for i in range(pluginCount)]
+
+    def new_plugin(self, index):
+        return FakePlugin("Fake Plugin %i" % (index + 1), self.parameterCount, self.outputCount)
+
+    def get_peaks(self, now):
+        return [abs(sin(now * 3.0 + i)) * (0.8 + 0.2 * random()) for i in range(len(self.plugins) * 4)]
+
+# ------------------------------------------------------------------------------------------------------------
+# OSC side, as in CarlaEngineOsc
+
+class FakeOscEngine(object):
+    def __init__(self, engine, name, port):
+        object.__init__(self)
+
+        self.engine = engine
+        self.name = name
+
+        # registered clients, as (target address, base path)
+        self.clientTCP = None
+        self.clientUDP = None
+        self.clientUrlTCP = None
+        self.clientUrlUDP = None
+        self.packedPeaks = False
+
+        self.serverTCP = ServerThread(port, LO_TCP, reg_methods=False)
+        self.serverTCP.add_method(None, None, self.handle_tcp)
+
+        self.serverUDP = ServerThread(port, LO_UDP, reg_methods=False)
+        self.serverUDP.add_method(None, None, self.handle_udp)
+
+    def start(self):
+        self.serverTCP.start()
+        self.serverUDP.start()
+
+    # --------------------------------------------------------------------------------------------------------
+    # TCP, only used from the TCP server thread
+
+    def send_tcp(self, method, *args):
+        target, path = self.clientTCP
+        lo_send(target, path + "/" + method, *args)
+
+    def send_callback(self, action, pluginId=0, value1=0, value2=0, value3=0, valuef=0.0, valueStr=""):
+        self.send_tcp("cb", action, pluginId, value1, value2, value3, float(valuef), valueStr)
+
+    def send_plugin_added(self, pluginId):
+        plugin = self.engine.plugins[pluginId]
+
+        self.send_tcp("info", pluginId, PLUGIN_LV2, PLUGIN_CATEGORY_SYNTH, PLUGIN_IS_SYNTH|PLUGIN_CAN_DRYWET,
+                      ('h', 1000 + pluginId), 0, 0,
+                      plugin.name, "", "plugin", plugin.name, "fake", "Carla", "GPL")
+        self.send_tcp("ports", pluginId, 0, 2, 1, 0,
+                      min(plugin.parameterCount - plugin.outputCount, 49),
+                      min(plugin.outputCount, 49),
+                      plugin.parameterCount)
+        self.send_tcp("count", pluginId, 0, 0, 0, -1, -1)
+
+        for parameterId in range(plugin.parameterCount):
+            output = plugin.is_output(parameterId)
+            hints  = PARAMETER_IS_ENABLED | (0 if output else PARAMETER_IS_AUTOMABLE)
+
+            self.send_tcp("paramInfo", pluginId, parameterId, "Parameter %i" % (parameterId + 1), "", "", "")
+            self.send_tcp("paramData", pluginId, parameterId,
+                          PARAMETER_OUTPUT if output else PARAMETER_INPUT, hints, 0, -1,
+                          0.0, 1.0, float(plugin.values[parameterId]))
+            self.send_tcp("paramRanges", pluginId, parameterId, 0.5, 0.0, 1.0, 0.01, 0.001, 0.1)
+
+        self.send_tcp("iparams", pluginId, *plugin.internalValues)
+        self.send_callback(ENGINE_CALLBACK_PLUGIN_ADDED, pluginId, valueStr=plugin.name)
+
+    def handle_tcp(self, path, args, types):
+        if path == "/register" and types == "s":
+            if self.clientTCP is not None:
+                print("OSC backend already registered to %s" % self.clientUrlTCP)
+                return
+
+            url = args[0]
+            self.clientUrlTCP = url
+            self.clientTCP = (Address(url), urlsplit(url).path)
+
+            with self.engine.lock:
+                self.send_callback(ENGINE_CALLBACK_ENGINE_STARTED, len(self.engine.plugins),
+                                   ENGINE_PROCESS_MODE_CONTINUOUS_RACK, ENGINE_TRANSPORT_MODE_INTERNAL,
+                                   512, 48000.0, "Dummy")
+
+                for pluginId in range(len(self.engine.plugins)):
+                    self.send_plugin_added(pluginId)
+            return
+
+        if path == "/unregister" and types == "s":
+            if args[0] == self.clientUrlTCP:
+                self.clientTCP = self.clientUrlTCP = None
+            return
+
+        if self.clientTCP is None:
+            return
+
+        if path.startswith("/ctrl/") and types.startswith("i"):
+            messageId = args[0]
+            error = self.handle_control(path[6:], args[1:])
+            self.send_tcp("resp", messageId, error)
+            return
+
+        # /<name>/<pluginId>/<method>
+        try:
+            _, name, pluginId, method = path.split("/", 3)
+            pluginId = int(pluginId)
+        except ValueError:
+            return
+
+        if name != self.name:
+            return
+
+        with self.engine.lock:
+            if pluginId >= len(self.engine.plugins):
+                return
+
+            plugin = self.engine.plugins[pluginId]
+
+            if method == "set_parameter_value":
+                parameterId, value = args
+                if parameterId < plugin.parameterCount:
+                    plugin.values[parameterId] = value
+
+            elif method == "set_active":
+                plugin.internalValues[0] = float(args[0])
+            elif method == "set_drywet":
+                plugin.internalValues[1] = args[0]
+            elif method == "set_volume":
+                plugin.internalValues[2] = args[0]
+            elif method == "set_balance_left":
+                plugin.internalValues[3] = args[0]
+            elif method == "set_balance_right":
+                plugin.internalValues[4] = args[0]
+            elif method == "set_panning":
+                plugin.internalValues[5] = args[0]
+
+    # Returns the error string sent back in the response, empty on success.
+    def handle_control(self, method, args):
+        engine = self.engine
+
+        with engine.lock:
+            if method == "clear_engine_xruns":
+                engine.xruns = 0
+
+            elif method == "add_plugin":
+                pluginId = len(engine.plugins)
+                engine.plugins.append(engine.new_plugin(pluginId))
+                self.send_plugin_added(pluginId)
+
+            elif method == "remove_plugin":
+                pluginId = args[0]
+                if pluginId >= len(engine.plugins):
+                    return "Invalid plugin"
+                engine.plugins.pop(pluginId)
+                self.send_callback(ENGINE_CALLBACK_PLUGIN_REMOVED, pluginId)
+
+            elif method == "remove_all_plugins":
+                for pluginId in reversed(range(len(engine.plugins))):
+                    self.send_callback(ENGINE_CALLBACK_PLUGIN_REMOVED, pluginId)
+                engine.plugins = []
+
+            elif method == "rename_plugin":
+                pluginId, newName = args
+                if pluginId >= len(engine.plugins):
+                    return "Invalid plugin"
+                engine.plugins[pluginId].name = newName
+                self.send_callback(ENGINE_CALLBACK_PLUGIN_RENAMED, pluginId, valueStr=newName)
+
+            elif method in ("cancel_engine_action",
+                            "patchbay_refresh",
+                            "transport_play",
+                            "transport_pause",
+                            "transport_bpm",
+                            "transport_relocate"):
+                pass
+
+            else:
+                return "Unhandled OSC control method"
+
+        return ""
+
+    # --------------------------------------------------------------------------------------------------------
+    # UDP, registration happens in the UDP server thread, sending in the tick thread
+
+    def handle_udp(self, path, args, types):
+        if path == "/register" and types == "s":
+            if self.clientUDP is not None:
+                print("OSC backend already registered to %s" % self.clientUrlUDP)
+                return
+
+            url = args[0]
+            self.packedPeaks = False
+            self.clientUrlUDP = url
+            self.clientUDP = (Address(url), urlsplit(url).path)
+
+        elif path == "/unregister" and types == "s":
+            if args[0] == self.clientUrlUDP:
+                self.packedPeaks = False
+                self.clientUDP = self.clientUrlUDP = None
+
+        elif path == "/set_packed_peaks" and types == "si":
+            if args[0] == self.clientUrlUDP:
+                self.packedPeaks = bool(args[1])
+
+    def send_tick(self, now):
+        client = self.clientUDP
+
+        if client is None:
+            return
+
+        target, path = client
+        engine = self.engine
+
+        with engine.lock:
+            peaks = engine.get_peaks(now)
+            outputs = []
+
+            for pluginId, plugin in enumerate(engine.plugins):
+                for parameterId in range(plugin.parameterCount - plugin.outputCount, plugin.parameterCount):
+                    plugin.values[parameterId] = random()
+                    outputs.append((pluginId, parameterId, plugin.values[parameterId]))
+
+            engine.frame += 512
+            frame = engine.frame
+            xruns = engine.xruns
+
+        for pluginId, parameterId, value in outputs:
+            lo_send(target, path + "/param", pluginId, parameterId, value)
+
+        if self.packedPeaks:
+            if peaks:
+                lo_send(target, path + "/peaks_packed", ('b', struct.pack("<%if" % len(peaks), *peaks)))
+        else:
+            for pluginId in range(len(peaks) // 4):
+                lo_send(target, path + "/peaks", pluginId, *peaks[pluginId*4:pluginId*4+4])
+
+        lo_send(target, path + "/runtime", 10.0 + 5.0 * random(), xruns, 1, ('h', frame), 1, 1, 0, 120.0)
+
+# ------------------------------------------------------------------------------------------------------------
+
+def run_ticks(oscEngine, rate):
+    while True:
+        sleep(1.0 / rate)
+        oscEngine.send_tick(monotonic())
+
+# ------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Carla OSC control stand-in engine, with a synthetic engine")
+    parser.add_argument("--port", type=int, default=22752, help="TCP and UDP port")
+    parser.add_argument("--name", type=str, default="Carla", help="engine client name, as used in plugin paths")
+    parser.add_argument("--plugins", type=int, default=10, help="number of plugins")
+    parser.add_argument("--parameters", type=int, default=32, help="number of parameters per plugin")
+    parser.add_argument("--outputs", type=int, default=4, help="how many of the parameters are outputs")
+    parser.add_argument("--rate", type=float, default=30.0, help="engine ticks per second")
+    args = parser.parse_args()
+
+    engine = FakeEngine(args.plugins, args.parameters, args.outputs)
+
+    oscEngine = FakeOscEngine(engine, args.name, args.port)
+    oscEngine.start()
+
+    print("Carla OSC stand-in engine running on osc.tcp://127.0.0.1:%i/%s and osc.udp://127.0.0.1:%i/%s" % (
+          args.port, args.name, args.port, args.name))
+    sys.stdout.flush()
+
+    try:
+        run_ticks(oscEngine, args.rate)
+    except KeyboardInterrupt:
+        pass
+
+# ------------------------------------------------------------------------------------------------------------
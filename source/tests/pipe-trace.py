@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Carla pipe trace tool
+# Copyright (C) 2011-2020 Filipe Coelho <falktx@falktx.com>
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as
+# published by the Free Software Foundation; either version 2 of
+# the License, or any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a full copy of the GNU General Public License see the doc/GPL.txt file.
+
+# ------------------------------------------------------------------------------------------------------------
+# Looks into traces of the pipe between a plugin and its external UI, as written by CarlaUtils when the
+# CARLA_PIPE_TRACE environment variable is set, for example:
+#   CARLA_PIPE_TRACE=/tmp/carla-plugin.trace carla-single ...
+#
+# Usage:
+#   pipe-trace.py stats trace-file [--ui carla-plugin]
+#     prints a histogram of the message types in each direction, their rates, and how many lines arrive per read
+#   pipe-trace.py replay trace-file [--ui carla-plugin] [--realtime] [--interval 30]
+#     feeds the received lines into the UI, without a window or a plugin side, and measures the time spent per idle
+#
+# The UI is one of the scripts in the frontend dir (carla-plugin, carla-plugin-patchbay, bigmeter-ui,
+# midipattern-ui or notes-ui), it provides the message table used to split lines into messages.
+# The frontend and the Carla libraries need to be built first ('make').
+# Peaks and output parameter values given through shared memory are not part of the pipe, so not traced.
+
+# ------------------------------------------------------------------------------------------------------------
+# Imports (Global)
+
+import argparse
+import os
+import sys
+
+from collections import Counter
+from importlib.machinery import SourceFileLoader
+from importlib.util import module_from_spec, spec_from_loader
+from statistics import mean, median
+from time import perf_counter, sleep
+
+# ------------------------------------------------------------------------------------------------------------
+
+kSourceDir   = os.path.dirname(os.path.abspath(__file__))
+kFrontendDir = os.path.join(kSourceDir, "..", "frontend")
+
+sys.path.insert(0, kFrontendDir)
+
+# main window class of each UI
+kUiClasses = {
+    "bigmeter-ui": "DistrhoUIBigMeter",
+    "carla-plugin": "CarlaMiniW",
+    "carla-plugin-patchbay": "CarlaMiniW",
+    "midipattern-ui": "MidiPatternW",
+    "notes-ui": "DistrhoUINotes",
+}
+
+# ------------------------------------------------------------------------------------------------------------
+
+# Import one of the UI scripts as a module, without running its main code.
+def loadUiModule(uiName):
+    loader = SourceFileLoader("carla_trace_ui", os.path.join(kFrontendDir, uiName))
+    module = module_from_spec(spec_from_loader(loader.name, loader))
+    loader.exec_module(module)
+    return module
+
+def checkUiName(uiName):
+    if uiName not in kUiClasses:
+        print("Unknown UI '%s', must be one of: %s" % (uiName, ", ".join(sorted(kUiClasses))))
+        sys.exit(1)
+
+def getUiClass(uiName):
+    checkUiName(uiName)
+    return getattr(loadUiModule(uiName), kUiClasses[uiName])
+
+def readTrace(filename):
+    from carla_utils import PIPE_TRACE_IN, readPipeTrace
+
+    received = []
+    sent = []
+
+    for time, direction, lines in readPipeTrace(filename):
+        if direction == PIPE_TRACE_IN:
+            received.append((time, lines))
+        else:
+            sent.append((time, lines))
+
+    return received, sent
+
+# ------------------------------------------------------------------------------------------------------------
+
+# Split received lines into (time, name, lines, bytes) messages, using the line counts of the UI message table.
+# Messages not in the table are counted as one line, plus the value lines (without letters) following them, as for
+# the variable sized messages handled in msgCallback(), like "midievent-add".
+def splitReceivedMessages(received, lineCounts):
+    from externalui import kMsgIdChars
+
+    allLines = [(time, line) for time, lines in received for line in lines]
+    messages = []
+    index = 0
+
+    while index < len(allLines):
+        time, line = allLines[index]
+        name = line.rstrip(kMsgIdChars)
+
+        if messages and name not in lineCounts and not any(c.isalpha() for c in line):
+            prevTime, prevName, prevCount, prevSize = messages[-1]
+            messages[-1] = (prevTime, prevName, prevCount + 1, prevSize + len(line) + 1)
+            index += 1
+            continue
+
+        count = lineCounts.get(name, 0) + 1
+        size  = sum(len(l) + 1 for _, l in allLines[index:index+count])
+
+        messages.append((time, name or "(unknown)", count, size))
+        index += count
+
+    return messages
+
+def getSentMessages(sent):
+    return [(time, lines[0], len(lines), sum(len(l) + 1 for l in lines)) for time, lines in sent]
+
+def printHistogram(title, messages, duration):
+    print("%s: %i messages, %.1f messages/s" % (title, len(messages), len(messages) / duration))
+
+    if len(messages) == 0:
+        return
+
+    counts = Counter()
+    lines  = Counter()
+    sizes  = Counter()
+
+    for _, name, lineCount, size in messages:
+        counts[name] += 1
+        lines[name]  += lineCount
+        sizes[name]  += size
+
+    maxCount = max(counts.values())
+
+    print("  %-24s %8s %10s %8s %10s  %s" % ("message", "count", "rate/s", "lines", "bytes", "share"))
+
+    for name, count in counts.most_common():
+        print("  %-24s %8i %10.1f %8i %10i  %s" % (name, count, count / duration, lines[name], sizes[name],
+                                                   "#" * max(1, int(40 * count / maxCount))))
+
+    perSecond = Counter(int(time) for time, _, _, _ in messages)
+    second, count = perSecond.most_common(1)[0]
+    print("  busiest second: %i messages at %i s" % (count, second))
+
+def runStats(args):
+    received, sent = readTrace(args.trace)
+
+    times = [time for time, _ in received] + [time for time, _ in sent]
+    duration = max(max(times) if times else 0.0, 0.001)
+
+    uiClass = getUiClass(args.ui)
+    lineCounts = dict((name, count) for name, (count, _) in uiClass.kMsgHandlers.items())
+
+    print("Pipe trace '%s', %.3f s long" % (args.trace, duration))
+
+    # many lines per read means the plugin side sends more than the UI handles per idle
+    if len(received) != 0:
+        lineCountsPerRead = [len(lines) for _, lines in received]
+        print("Reads: %i, lines per read: %.1f mean, %i median, %i max" % (
+              len(received), mean(lineCountsPerRead), median(lineCountsPerRead), max(lineCountsPerRead)))
+
+    printHistogram("Received", splitReceivedMessages(received, lineCounts), duration)
+    printHistogram("Sent", getSentMessages(sent), duration)
+
+# ------------------------------------------------------------------------------------------------------------
+
+# Stands in for CarlaUtils during replay, the pipe calls use the trace instead of a real pipe.
+class PipeReplayUtils(object):
+    def __init__(self, utils):
+        object.__init__(self)
+
+        self.fUtils = utils
+        self.fLines = []
+        self.fSentCount = 0
+
+    def __getattr__(self, name):
+        return getattr(self.fUtils, name)
+
+    def pipe_client_new(self, func):
+        return self
+
+    def pipe_client_start_reader(self, handle):
+        return True
+
+    def pipe_client_readlines(self, handle):
+        lines = self.fLines
+        self.fLines = []
+        return lines
+
+    def pipe_client_map_shared_data(self, handle, filename, size):
+        return None
+
+    def pipe_client_is_running(self, handle):
+        return True
+
+    def pipe_client_lock(self, handle):
+        return
+
+    def pipe_client_unlock(self, handle):
+        return
+
+    def pipe_client_write_msg(self, handle, msg):
+        self.fSentCount += 1
+        return True
+
+    def pipe_client_write_and_fix_msg(self, handle, msg):
+        self.fSentCount += 1
+        return True
+
+    def pipe_client_flush(self, handle):
+        return True
+
+    def pipe_client_flush_and_unlock(self, handle):
+        return True
+
+    def pipe_client_destroy(self, handle):
+        return
+
+# Same set-up as the main code of each UI.
+def createUi(args, module, app):
+    from carla_shared import DLL_EXTENSION, gCarla, getPaths
+    from carla_utils import CarlaUtils
+
+    # ExternalUI only uses the pipe with these arguments
+    sys.argv = [os.path.join(kFrontendDir, args.ui), "48000", "Replay"]
+    module.app = app
+
+    if args.ui.startswith("carla-plugin"):
+        isPatchbay = args.ui == "carla-plugin-patchbay"
+
+        host = module.initHost("Carla-Plugin", None, False, True, True, module.PluginHost)
+        host.processMode       = module.ENGINE_PROCESS_MODE_PATCHBAY if isPatchbay else module.ENGINE_PROCESS_MODE_CONTINUOUS_RACK
+        host.processModeForced = True
+        host.nextProcessMode   = host.processMode
+        module.loadHostSettings(host)
+
+        gCarla.utils = PipeReplayUtils(gCarla.utils)
+        gui = module.CarlaMiniW(host, isPatchbay)
+
+    else:
+        pathBinaries, _ = getPaths()
+        gCarla.utils = PipeReplayUtils(CarlaUtils(os.path.join(pathBinaries, "libcarla_utils." + DLL_EXTENSION)))
+        gui = getattr(module, kUiClasses[args.ui])()
+
+    return gui, gCarla.utils
+
+def runReplay(args):
+    # no window needed
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    received, sent = readTrace(args.trace)
+
+    checkUiName(args.ui)
+
+    from PyQt5.QtWidgets import QApplication
+    from carla_app import CarlaApplication
+    import resources_rc
+
+    module = loadUiModule(args.ui)
+    app = CarlaApplication("Carla2-Replay")
+    gui, utils = createUi(args, module, app)
+
+    # only idle from here, not from the UI timers
+    idleExternalUI = gui.idleExternalUI
+    gui.idleExternalUI = lambda: None
+
+    idleTimes  = []
+    eventTimes = []
+    index = 0
+    start = perf_counter()
+
+    # with --realtime the lines arrive at their recorded times, otherwise each idle gets the lines of one read
+    while gui.fPipeClient is not None and (index < len(received) or gui.fPendingLines):
+        if args.realtime:
+            now = perf_counter() - start
+            while index < len(received) and received[index][0] <= now:
+                utils.fLines.extend(received[index][1])
+                index += 1
+        elif index < len(received):
+            utils.fLines.extend(received[index][1])
+            index += 1
+
+        tickStart = perf_counter()
+        idleExternalUI()
+        idleTimes.append(perf_counter() - tickStart)
+
+        tickStart = perf_counter()
+        QApplication.processEvents()
+        eventTimes.append(perf_counter() - tickStart)
+
+        if args.realtime:
+            sleep(args.interval / 1000.0)
+
+    duration = perf_counter() - start
+    lineCount = sum(len(lines) for _, lines in received)
+
+    print("Replay of '%s' into %s (%s):" % (args.trace, kUiClasses[args.ui], "realtime" if args.realtime else "as fast as possible"))
+    print("  replay time:              %10.3f ms" % (duration * 1000.0))
+    print("  received lines:           %10i (%.1f lines/s)" % (lineCount, lineCount / duration))
+    print("  sent messages:            %10i (%i in trace)" % (utils.fSentCount, len(sent)))
+    print("  idles:                    %10i" % len(idleTimes))
+
+    if len(idleTimes) != 0:
+        print("  idleExternalUI per idle:  %10.3f ms (median %.3f ms, max %.3f ms)" % (
+              mean(idleTimes) * 1000.0, median(idleTimes) * 1000.0, max(idleTimes) * 1000.0))
+        print("  Qt events per idle:       %10.3f ms (max %.3f ms)" % (mean(eventTimes) * 1000.0, max(eventTimes) * 1000.0))
+
+    gui.closeExternalUI()
+
+# ------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Carla pipe trace tool")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    statsParser = subparsers.add_parser("stats", help="print message types and rates")
+    statsParser.add_argument("trace", help="trace file")
+    statsParser.add_argument("--ui", type=str, default="carla-plugin", help="UI the trace was recorded with")
+
+    replayParser = subparsers.add_parser("replay", help="feed a trace into its UI and measure it")
+    replayParser.add_argument("trace", help="trace file")
+    replayParser.add_argument("--ui", type=str, default="carla-plugin", help="UI the trace was recorded with")
+    replayParser.add_argument("--realtime", action="store_true", help="use the recorded timing instead of replaying as fast as possible")
+    replayParser.add_argument("--interval", type=float, default=30.0, help="time between idles with --realtime, in ms")
+
+    args = parser.parse_args()
+
+    if args.command == "stats":
+        runStats(args)
+    else:
+        runReplay(args)
+
+# ------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,654 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Carla REST API stand-in server
+# Copyright (C) 2011-2020 Filipe Coelho <falktx@falktx.com>
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as
+# published by the Free Software Foundation; either version 2 of
+# the License, or any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a full copy of the GNU General Public License see the doc/GPL.txt file.
+
+# ------------------------------------------------------------------------------------------------------------
+# A pure-Python replacement for source/rest/rest-server.cpp, backed by a synthetic engine instead of a real one.
+# Implements the same endpoints, "/batch" and the "/ws" stream (text and binary protocol),
+# so the REST frontends can be tested and benchmarked without building restbed or loading any plugins.
+#
+# Usage: rest-fake-server.py [--port 2228] [--plugins 10] [--parameters 32] [--outputs 4]
+#                            [--rate 30] [--latency 0] [--no-engine]
+
+# ------------------------------------------------------------------------------------------------------------
+# Imports (Global)
+
+import argparse
+import os
+import struct
+import sys
+
+from base64 import b64encode
+from hashlib import sha1
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from math import sin
+from random import random
+from threading import Lock, Thread
+from time import monotonic, sleep
+from urllib.parse import parse_qsl, urlsplit
+
+# ------------------------------------------------------------------------------------------------------------
+# Imports (Custom)
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "frontend"))
+
+from carla_backend import *
+
+# ------------------------------------------------------------------------------------------------------------
+# Websocket details, see RFC 6455
+
+kWebSocketGUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+kWebSocketOpText   = 0x1
+kWebSocketOpBinary = 0x2
+kWebSocketOpClose  = 0x8
+kWebSocketOpPing   = 0x9
+kWebSocketOpPong   = 0xA
+
+# binary stream records, as in rest-server.cpp
+kBinaryRecordPeaks    = 1
+kBinaryRecordCallback = 2
+kBinaryRecordParams   = 3
+
+# ------------------------------------------------------------------------------------------------------------
+# Synthetic engine, with plugins made of plain python data.
+
+class FakePlugin(object):
+    def __init__(self, name, parameterCount, outputCount):
+        object.__init__(self)
+
+        self.name = name
+        self.parameterCount = parameterCount
+        self.outputCount = min(outputCount, parameterCount)
+        self.values = [0.5] * parameterCount
+        self.program = 0
+
+    def is_output(self, parameterId):
+        return parameterId >= self.parameterCount - self.outputCount
+
+class FakeEngine(object):
+    def __init__(self, pluginCount, parameterCount, outputCount):
+        object.__init__(self)
+
+        self.lock = Lock()
+        self.running = False
+        self.parameterCount = parameterCount
+        self.outputCount = outputCount
+        self.outputRate = 10
+        self.plugins = [self.new_plugin(i) for i in range(pluginCount)]
+
+        # engine callbacks waiting to be sent to websocket clients
+        self.callbacks = []
+
+    def new_plugin(self, index):
+        return FakePlugin("Fake Plugin %i" % (index + 1), self.parameterCount, self.outputCount)
+
+    def callback(self, action, pluginId=0, value1=0, value2=0, value3=0.0, valueStr=""):
+        self.callbacks.append((action, pluginId, value1, value2, value3, valueStr))
+
+    def take_callbacks(self):
+        with self.lock:
+            callbacks, self.callbacks = self.callbacks, []
+        return callbacks
+
+    # --------------------------------------------------------------------------------------------------------
+    # Values that change on their own, sent over the websocket
+
+    def get_peaks(self, now):
+        return [abs(sin(now * 3.0 + i)) * (0.8 + 0.2 * random()) for i in range(len(self.plugins) * 4)]
+
+    def update_output_values(self):
+        with self.lock:
+            outputs = []
+            for pluginId, plugin in enumerate(self.plugins):
+                values = []
+                for parameterId in range(plugin.parameterCount - plugin.outputCount, plugin.parameterCount):
+                    plugin.values[parameterId] = random()
+                    values.append((parameterId, plugin.values[parameterId]))
+                if values:
+                    outputs.append((pluginId, values))
+            return outputs
+
+# ------------------------------------------------------------------------------------------------------------
+# Request handlers, using the same names and query parameters as rest-server.cpp.
+# Each one gets the engine and query dict, and returns the response text.
+
+def str_bool(value):
+    return "1" if value else "0"
+
+def str_float(value):
+    return "%f" % value
+
+def json_text(*items):
+    values = []
+    for key, value in items:
+        if isinstance(value, bool):
+            values.append('"%s": %s' % (key, "true" if value else "false"))
+        elif isinstance(value, str):
+            values.append('"%s": "%s"' % (key, value.replace('"', '\\"')))
+        elif isinstance(value, float):
+            values.append('"%s": %f' % (key, value))
+        else:
+            values.append('"%s": %i' % (key, value))
+    return "{" + ", ".join(values) + "}"
+
+def get_plugin(engine, query):
+    pluginId = int(query.get('pluginId', -1))
+    if pluginId < 0 or pluginId >= len(engine.plugins):
+        raise LookupError
+    return pluginId, engine.plugins[pluginId]
+
+def get_parameter(engine, query):
+    pluginId, plugin = get_plugin(engine, query)
+    parameterId = int(query.get('parameterId', -1))
+    if parameterId < 0 or parameterId >= plugin.parameterCount:
+        raise LookupError
+    return pluginId, plugin, parameterId
+
+def handle_engine_init(engine, query):
+    engine.running = True
+    engine.callback(ENGINE_CALLBACK_ENGINE_STARTED, len(engine.plugins),
+                    ENGINE_PROCESS_MODE_CONTINUOUS_RACK, ENGINE_TRANSPORT_MODE_INTERNAL,
+                    512.0, query.get('driverName', "Dummy"))
+    return str_bool(True)
+
+def handle_engine_close(engine, query):
+    engine.running = False
+    engine.callback(ENGINE_CALLBACK_ENGINE_STOPPED)
+    return str_bool(True)
+
+def handle_add_plugin(engine, query):
+    plugin = engine.new_plugin(len(engine.plugins))
+    if query.get('name'):
+        plugin.name = query['name']
+    engine.plugins.append(plugin)
+    engine.callback(ENGINE_CALLBACK_PLUGIN_ADDED, len(engine.plugins) - 1, valueStr=plugin.name)
+    return str_bool(True)
+
+def handle_remove_plugin(engine, query):
+    pluginId, plugin = get_plugin(engine, query)
+    engine.plugins.pop(pluginId)
+    engine.callback(ENGINE_CALLBACK_PLUGIN_REMOVED, pluginId)
+    return str_bool(True)
+
+def handle_remove_all_plugins(engine, query):
+    for pluginId in reversed(range(len(engine.plugins))):
+        engine.callback(ENGINE_CALLBACK_PLUGIN_REMOVED, pluginId)
+    engine.plugins = []
+    return str_bool(True)
+
+def handle_rename_plugin(engine, query):
+    pluginId, plugin = get_plugin(engine, query)
+    plugin.name = query.get('newName', "")
+    engine.callback(ENGINE_CALLBACK_PLUGIN_RENAMED, pluginId, valueStr=plugin.name)
+    return plugin.name
+
+def handle_switch_plugins(engine, query):
+    pluginIdA = int(query.get('pluginIdA', -1))
+    pluginIdB = int(query.get('pluginIdB', -1))
+    count = len(engine.plugins)
+    if pluginIdA < 0 or pluginIdB < 0 or pluginIdA >= count or pluginIdB >= count:
+        return str_bool(False)
+    engine.plugins[pluginIdA], engine.plugins[pluginIdB] = engine.plugins[pluginIdB], engine.plugins[pluginIdA]
+    return str_bool(True)
+
+def handle_get_plugin_info(engine, query):
+    pluginId, plugin = get_plugin(engine, query)
+    return json_text(('type', PLUGIN_INTERNAL),
+                     ('category', PLUGIN_CATEGORY_UTILITY),
+                     ('hints', PLUGIN_IS_RTSAFE),
+                     ('optionsAvailable', 0),
+                     ('optionsEnabled', 0),
+                     ('filename', ""),
+                     ('name', plugin.name),
+                     ('label', "fake%i" % pluginId),
+                     ('maker', "falkTX"),
+                     ('copyright', "GPL2+"),
+                     ('iconName', "plugin"),
+                     ('uniqueId', 0))
+
+def handle_get_parameter_count_info(engine, query):
+    pluginId, plugin = get_plugin(engine, query)
+    return json_text(('ins', plugin.parameterCount - plugin.outputCount), ('outs', plugin.outputCount))
+
+def handle_get_parameter_info(engine, query):
+    pluginId, plugin, parameterId = get_parameter(engine, query)
+    return json_text(('name', "Parameter %i" % (parameterId + 1)),
+                     ('symbol', "param%i" % parameterId),
+                     ('unit', ""),
+                     ('scalePointCount', 0))
+
+def handle_get_parameter_data(engine, query):
+    pluginId, plugin, parameterId = get_parameter(engine, query)
+    output = plugin.is_output(parameterId)
+    return json_text(('type', PARAMETER_OUTPUT if output else PARAMETER_INPUT),
+                     ('hints', PARAMETER_IS_ENABLED | (0 if output else PARAMETER_IS_AUTOMABLE)),
+                     ('index', parameterId),
+                     ('rindex', parameterId),
+                     ('midiCC', -1),
+                     ('midiChannel', 0))
+
+def handle_get_parameter_ranges(engine, query):
+    get_parameter(engine, query)
+    return json_text(('def', 0.5), ('min', 0.0), ('max', 1.0),
+                     ('step', 0.01), ('stepSmall', 0.0001), ('stepLarge', 0.1))
+
+def handle_get_parameter_text(engine, query):
+    pluginId, plugin, parameterId = get_parameter(engine, query)
+    return "%.2f" % plugin.values[parameterId]
+
+def handle_get_current_parameter_value(engine, query):
+    pluginId, plugin, parameterId = get_parameter(engine, query)
+    return str_float(plugin.values[parameterId])
+
+def handle_set_parameter_value(engine, query):
+    pluginId, plugin, parameterId = get_parameter(engine, query)
+    plugin.values[parameterId] = float(query.get('value', 0.0))
+    return ""
+
+def handle_set_program(engine, query):
+    pluginId, plugin = get_plugin(engine, query)
+    plugin.program = int(query.get('programId', 0))
+    engine.callback(ENGINE_CALLBACK_PROGRAM_CHANGED, pluginId, plugin.program)
+    return ""
+
+def handle_reset_parameters(engine, query):
+    pluginId, plugin = get_plugin(engine, query)
+    plugin.values = [0.5] * plugin.parameterCount
+    return ""
+
+def handle_set_output_parameter_rate(engine, query):
+    rate = int(query.get('rate', -1))
+    if rate < 0 or rate > 1000:
+        raise LookupError
+    engine.outputRate = rate
+    return ""
+
+kHandlers = {
+    'get_engine_driver_count': lambda e, q: "1",
+    'get_engine_driver_name': lambda e, q: "Dummy",
+    'get_engine_driver_device_names': lambda e, q: "",
+    'get_engine_driver_device_info': lambda e, q: '{"hints": 0, "bufferSizes": [512], "sampleRates": [48000.000000]}',
+    'engine_init': handle_engine_init,
+    'engine_close': handle_engine_close,
+    'is_engine_running': lambda e, q: str_bool(e.running),
+    'set_engine_about_to_close': lambda e, q: str_bool(True),
+    'set_engine_option': lambda e, q: "",
+    'load_file': lambda e, q: str_bool(False),
+    'load_project': lambda e, q: str_bool(False),
+    'save_project': lambda e, q: str_bool(False),
+    'patchbay_connect': lambda e, q: str_bool(False),
+    'patchbay_disconnect': lambda e, q: str_bool(False),
+    'patchbay_refresh': lambda e, q: str_bool(True),
+    'transport_play': lambda e, q: "",
+    'transport_pause': lambda e, q: "",
+    'transport_bpm': lambda e, q: "",
+    'transport_relocate': lambda e, q: "",
+    'get_current_transport_frame': lambda e, q: "0",
+    'get_transport_info': lambda e, q: json_text(('playing', False), ('frame', 0), ('bar', 0), ('beat', 0),
+                                                 ('tick', 0), ('bpm', 120.0)),
+    'get_current_plugin_count': lambda e, q: str(len(e.plugins)),
+    'get_max_plugin_number': lambda e, q: str(MAX_DEFAULT_PLUGINS if e.running else 0),
+    'add_plugin': handle_add_plugin,
+    'remove_plugin': handle_remove_plugin,
+    'remove_all_plugins': handle_remove_all_plugins,
+    'rename_plugin': handle_rename_plugin,
+    'clone_plugin': lambda e, q: str_bool(False),
+    'replace_plugin': lambda e, q: str_bool(False),
+    'switch_plugins': handle_switch_plugins,
+    'load_plugin_state': lambda e, q: str_bool(False),
+    'save_plugin_state': lambda e, q: str_bool(False),
+    'export_plugin_lv2': lambda e, q: str_bool(False),
+    'get_plugin_info': handle_get_plugin_info,
+    'get_audio_port_count_info': lambda e, q: get_plugin(e, q) and json_text(('ins', 2), ('outs', 2)),
+    'get_midi_port_count_info': lambda e, q: get_plugin(e, q) and json_text(('ins', 0), ('outs', 0)),
+    'get_parameter_count_info': handle_get_parameter_count_info,
+    'get_parameter_info': handle_get_parameter_info,
+    'get_parameter_scalepoint_info': lambda e, q: json_text(('value', 0.0), ('label', "")),
+    'get_parameter_data': handle_get_parameter_data,
+    'get_parameter_ranges': handle_get_parameter_ranges,
+    'get_midi_program_data': lambda e, q: json_text(('bank', 0), ('program', 0), ('name', "")),
+    'get_custom_data': lambda e, q: json_text(('type', ""), ('key', ""), ('value', "")),
+    'get_custom_data_value': lambda e, q: "",
+    'get_chunk_data': lambda e, q: "",
+    'get_parameter_count': lambda e, q: str(get_plugin(e, q)[1].parameterCount),
+    'get_program_count': lambda e, q: get_plugin(e, q) and "0",
+    'get_midi_program_count': lambda e, q: get_plugin(e, q) and "0",
+    'get_custom_data_count': lambda e, q: get_plugin(e, q) and "0",
+    'get_parameter_text': handle_get_parameter_text,
+    'get_program_name': lambda e, q: "",
+    'get_midi_program_name': lambda e, q: "",
+    'get_real_plugin_name': lambda e, q: get_plugin(e, q)[1].name,
+    'get_current_program_index': lambda e, q: str(get_plugin(e, q)[1].program),
+    'get_current_midi_program_index': lambda e, q: get_plugin(e, q) and "0",
+    'get_default_parameter_value': lambda e, q: get_parameter(e, q) and str_float(0.5),
+    'get_current_parameter_value': handle_get_current_parameter_value,
+    'get_internal_parameter_value': lambda e, q: str_float(0.0),
+    'get_input_peak_value': lambda e, q: str_float(0.0),
+    'get_output_peak_value': lambda e, q: str_float(0.0),
+    'set_active': lambda e, q: "",
+    'set_drywet': lambda e, q: "",
+    'set_volume': lambda e, q: "",
+    'set_balance_left': lambda e, q: "",
+    'set_balance_right': lambda e, q: "",
+    'set_panning': lambda e, q: "",
+    'set_ctrl_channel': lambda e, q: "",
+    'set_option': lambda e, q: "",
+    'set_parameter_value': handle_set_parameter_value,
+    'set_parameter_midi_channel': lambda e, q: "",
+    'set_parameter_midi_cc': lambda e, q: "",
+    'set_program': handle_set_program,
+    'set_midi_program': lambda e, q: "",
+    'set_custom_data': lambda e, q: "",
+    'set_chunk_data': lambda e, q: "",
+    'prepare_for_save': lambda e, q: "",
+    'reset_parameters': handle_reset_parameters,
+    'randomize_parameters': lambda e, q: "",
+    'send_midi_note': lambda e, q: "",
+    'get_buffer_size': lambda e, q: "512",
+    'get_sample_rate': lambda e, q: str_float(48000.0),
+    'get_last_error': lambda e, q: "",
+    'get_host_osc_url_tcp': lambda e, q: "",
+    'get_host_osc_url_udp': lambda e, q: "",
+    'set_output_parameter_rate': handle_set_output_parameter_rate,
+    'get_complete_license_text': lambda e, q: "GPL2+",
+    'get_supported_file_extensions': lambda e, q: "*.carxp",
+    'get_supported_features': lambda e, q: "",
+    'get_cached_plugin_count': lambda e, q: "0",
+    'get_cached_plugin_info': lambda e, q: json_text(('valid', False)),
+}
+
+# ------------------------------------------------------------------------------------------------------------
+
+class FakeServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port, engine, latency):
+        ThreadingHTTPServer.__init__(self, ("", port), FakeRequestHandler)
+
+        self.engine = engine
+        self.latency = latency
+
+        # connected websocket clients
+        self.clients = []
+        self.clientsLock = Lock()
+
+    def call(self, name, query):
+        handler = kHandlers.get(name)
+
+        if handler is None:
+            return 404, ""
+
+        with self.engine.lock:
+            try:
+                return 200, handler(self.engine, query)
+            except (LookupError, ValueError):
+                return 400, ""
+
+    # Send one engine tick to all websocket clients, like event_stream_handler() in rest-server.cpp.
+    def send_tick(self, peaks, outputs):
+        callbacks = self.engine.take_callbacks()
+
+        with self.clientsLock:
+            clients = list(self.clients)
+
+        if not clients:
+            return
+
+        textMessages = None
+        binaryFrame = None
+
+        for client in clients:
+            if client.binary:
+                if binaryFrame is None:
+                    binaryFrame = encode_binary_tick(callbacks, peaks, outputs)
+                client.send(kWebSocketOpBinary, binaryFrame)
+            else:
+                if textMessages is None:
+                    textMessages = encode_text_tick(callbacks, peaks, outputs)
+                for message in textMessages:
+                    client.send(kWebSocketOpText, message)
+
+def encode_text_tick(callbacks, peaks, outputs):
+    messages = []
+
+    for action, pluginId, value1, value2, value3, valueStr in callbacks:
+        messages.append(("Carla: %u %u %i %i %f %s" % (action, pluginId, value1, value2, value3, valueStr)).encode())
+
+    for pluginId in range(len(peaks) // 4):
+        messages.append(("Peaks: %u %f %f %f %f" % (pluginId, *peaks[pluginId*4:pluginId*4+4])).encode())
+
+    for pluginId, values in outputs:
+        messages.append(("Params: %u" % pluginId + "".join(" %u %f" % v for v in values)).encode())
+
+    messages.append(b"Keep-Alive")
+    return messages
+
+def encode_binary_tick(callbacks, peaks, outputs):
+    frame = bytearray()
+
+    for action, pluginId, value1, value2, value3, valueStr in callbacks:
+        valueStr = valueStr.encode()
+        frame += struct.pack("<BI", kBinaryRecordCallback, 20 + len(valueStr))
+        frame += struct.pack("<IIiif", action, pluginId, value1, value2, value3) + valueStr
+
+    if peaks:
+        frame += struct.pack("<BI", kBinaryRecordPeaks, len(peaks) * 4)
+        frame += struct.pack("<%if" % len(peaks), *peaks)
+
+    for pluginId, values in outputs:
+        frame += struct.pack("<BII", kBinaryRecordParams, 4 + len(values) * 8, pluginId)
+        for parameterId, value in values:
+            frame += struct.pack("<If", parameterId, value)
+
+    return bytes(frame)
+
+# ------------------------------------------------------------------------------------------------------------
+
+class FakeWebSocketClient(object):
+    def __init__(self, handler, binary):
+        object.__init__(self)
+
+        self.handler = handler
+        self.binary = binary
+        self.lock = Lock()
+
+    def send(self, opcode, data):
+        size = len(data)
+
+        if size < 126:
+            header = struct.pack("!BB", 0x80 | opcode, size)
+        elif size < 0x10000:
+            header = struct.pack("!BBH", 0x80 | opcode, 126, size)
+        else:
+            header = struct.pack("!BBQ", 0x80 | opcode, 127, size)
+
+        try:
+            with self.lock:
+                self.handler.wfile.write(header + data)
+        except OSError:
+            pass
+
+    def receive(self):
+        rfile = self.handler.rfile
+        header = rfile.read(2)
+
+        if len(header) < 2:
+            return None, None
+
+        opcode = header[0] & 0x0F
+        size = header[1] & 0x7F
+
+        if size == 126:
+            size, = struct.unpack("!H", rfile.read(2))
+        elif size == 127:
+            size, = struct.unpack("!Q", rfile.read(8))
+
+        # client frames are always masked
+        mask = rfile.read(4) if header[1] & 0x80 else b"\0\0\0\0"
+        data = bytes(b ^ mask[i % 4] for i, b in enumerate(rfile.read(size)))
+
+        return opcode, data
+
+class FakeRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        return
+
+    def send_text(self, status, text):
+        body = text.encode()
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = dict(parse_qsl(url.query, keep_blank_values=True))
+
+        if url.path == "/ws":
+            self.handle_websocket(query)
+            return
+
+        if self.server.latency > 0.0:
+            sleep(self.server.latency)
+
+        status, text = self.server.call(url.path[1:], query)
+        self.send_text(status, text)
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode()
+
+        if url.path != "/batch":
+            self.send_text(404, "")
+            return
+
+        if self.server.latency > 0.0:
+            sleep(self.server.latency)
+
+        # same format as handle_batch_request() in rest-server.cpp
+        response = []
+
+        for call in body.split("\n"):
+            if not call:
+                continue
+
+            name, _, callQuery = call.partition("?")
+            status, text = self.server.call(name, dict(parse_qsl(callQuery, keep_blank_values=True)))
+            text = text.encode()
+
+            # unknown calls keep the default BAD_REQUEST status of BatchSession
+            if status == 404:
+                status = 400
+            response.append(b"%i %i\n" % (status, len(text)) + text)
+
+        body = b"".join(response)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def handle_websocket(self, query):
+        key = self.headers.get("Sec-WebSocket-Key", "")
+        accept = b64encode(sha1((key + kWebSocketGUID).encode()).digest()).decode()
+
+        self.send_response(101)
+        self.send_header("Upgrade", "websocket")
+        self.send_header("Connection", "Upgrade")
+        self.send_header("Sec-WebSocket-Accept", accept)
+        self.end_headers()
+
+        client = FakeWebSocketClient(self, query.get("protocol") == "binary")
+        client.send(kWebSocketOpText, b"Protocol: binary" if client.binary else b"Welcome to Corvusoft Chat!")
+
+        with self.server.clientsLock:
+            self.server.clients.append(client)
+
+        try:
+            while True:
+                opcode, data = client.receive()
+
+                if opcode is None or opcode == kWebSocketOpClose:
+                    break
+                if opcode == kWebSocketOpPing:
+                    client.send(kWebSocketOpPong, data)
+
+        except OSError:
+            pass
+
+        finally:
+            with self.server.clientsLock:
+                self.server.clients.remove(client)
+
+        self.close_connection = True
+
+# ------------------------------------------------------------------------------------------------------------
+
+def run_stream(server, rate):
+    engine = server.engine
+    lastOutputTime = 0.0
+
+    while True:
+        sleep(1.0 / rate)
+
+        now = monotonic()
+
+        if not engine.running:
+            server.send_tick([], [])
+            continue
+
+        peaks = engine.get_peaks(now)
+
+        if engine.outputRate > 0 and now - lastOutputTime >= 1.0 / engine.outputRate:
+            lastOutputTime = now
+            outputs = engine.update_output_values()
+        else:
+            outputs = []
+
+        server.send_tick(peaks, outputs)
+
+# ------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Carla REST API stand-in server, with a synthetic engine")
+    parser.add_argument("--port", type=int, default=2228)
+    parser.add_argument("--plugins", type=int, default=10, help="number of plugins")
+    parser.add_argument("--parameters", type=int, default=32, help="number of parameters per plugin")
+    parser.add_argument("--outputs", type=int, default=4, help="how many of the parameters are outputs")
+    parser.add_argument("--rate", type=float, default=30.0, help="websocket ticks per second")
+    parser.add_argument("--latency", type=float, default=0.0, help="extra delay for each request, in ms")
+    parser.add_argument("--no-engine", action="store_true", help="start with the engine stopped")
+    args = parser.parse_args()
+
+    engine = FakeEngine(args.plugins, args.parameters, args.outputs)
+    engine.running = not args.no_engine
+
+    server = FakeServer(args.port, engine, args.latency / 1000.0)
+
+    Thread(target=run_stream, args=(server, args.rate), daemon=True).start()
+
+    print("Carla REST API stand-in server running on port %i" % args.port)
+    sys.stdout.flush()
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+# ------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Carla REST frontend benchmark
+# Copyright (C) 2011-2020 Filipe Coelho <falktx@falktx.com>
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as
+# published by the Free Software Foundation; either version 2 of
+# the License, or any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a full copy of the GNU General Public License see the doc/GPL.txt file.
+
+# ------------------------------------------------------------------------------------------------------------
+# Measures the host side of carla-rest-frontend (CarlaHostQtWeb) against rest-fake-server.py:
+#  - calls/s of a simple uncached request
+#  - time to reload all plugins, as done by the plugin widgets, both with empty and filled caches
+#  - time spent in engine_idle() per UI tick, while the server streams peaks and output parameters
+#
+# Usage: rest-frontend-bench.py [--plugins 10] [--parameters 32] [--rate 30] [--latency 0] [--external]
+# With --external no server is started, an already running server on localhost:2228 is used instead.
+
+# ------------------------------------------------------------------------------------------------------------
+# Imports (Global)
+
+import argparse
+import os
+import sys
+
+from statistics import mean, median
+from subprocess import Popen, PIPE
+from time import perf_counter, sleep
+
+# ------------------------------------------------------------------------------------------------------------
+
+kSourceDir   = os.path.dirname(os.path.abspath(__file__))
+kFrontendDir = os.path.join(kSourceDir, "..", "frontend")
+kServerPath  = os.path.join(kSourceDir, "rest-fake-server.py")
+
+sys.path.insert(0, kFrontendDir)
+
+# ------------------------------------------------------------------------------------------------------------
+
+def startServer(args):
+    server = Popen([sys.executable, kServerPath,
+                    "--plugins", str(args.plugins),
+                    "--parameters", str(args.parameters),
+                    "--rate", str(args.rate),
+                    "--latency", str(args.latency)], stdout=PIPE)
+
+    # wait until the server is ready
+    server.stdout.readline()
+    return server
+
+# Same calls as PluginEdit and the plugin skins do when (re)loading a plugin.
+def reloadPlugin(host, pluginId):
+    host.get_plugin_info(pluginId)
+    host.get_real_plugin_name(pluginId)
+    host.get_audio_port_count_info(pluginId)
+    host.get_midi_port_count_info(pluginId)
+    host.get_parameter_count_info(pluginId)
+
+    for i in range(host.get_parameter_count(pluginId)):
+        paramInfo = host.get_parameter_info(pluginId, i)
+        host.get_parameter_data(pluginId, i)
+        host.get_parameter_ranges(pluginId, i)
+        host.get_current_parameter_value(pluginId, i)
+
+        for j in range(paramInfo['scalePointCount']):
+            host.get_parameter_scalepoint_info(pluginId, i, j)
+
+    for i in range(host.get_program_count(pluginId)):
+        host.get_program_name(pluginId, i)
+
+    for i in range(host.get_midi_program_count(pluginId)):
+        host.get_midi_program_data(pluginId, i)
+
+def reloadAllPlugins(host):
+    start = perf_counter()
+    for pluginId in range(host.get_current_plugin_count()):
+        reloadPlugin(host, pluginId)
+    return perf_counter() - start
+
+# ------------------------------------------------------------------------------------------------------------
+
+def benchCalls(host, duration):
+    count = 0
+    start = perf_counter()
+
+    while perf_counter() - start < duration:
+        host.get_current_plugin_count()
+        count += 1
+
+    return count / (perf_counter() - start)
+
+def benchReload(host, runs):
+    coldTimes = []
+    warmTimes = []
+
+    for _ in range(runs):
+        host.pluginCache.clear()
+        host.parameterValues.clear()
+        coldTimes.append(reloadAllPlugins(host))
+        warmTimes.append(reloadAllPlugins(host))
+
+    return median(coldTimes), median(warmTimes)
+
+def benchIdle(host, duration, rate):
+    times = []
+    start = perf_counter()
+
+    while perf_counter() - start < duration:
+        tickStart = perf_counter()
+        host.engine_idle()
+        times.append(perf_counter() - tickStart)
+        sleep(1.0 / rate)
+
+    return mean(times), max(times)
+
+# ------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Carla REST frontend benchmark")
+    parser.add_argument("--plugins", type=int, default=10, help="number of plugins")
+    parser.add_argument("--parameters", type=int, default=32, help="number of parameters per plugin")
+    parser.add_argument("--rate", type=float, default=30.0, help="server websocket ticks per second")
+    parser.add_argument("--latency", type=float, default=0.0, help="extra server delay for each request, in ms")
+    parser.add_argument("--runs", type=int, default=5, help="how many times to reload all plugins")
+    parser.add_argument("--duration", type=float, default=3.0, help="duration of the timed benchmarks, in seconds")
+    parser.add_argument("--external", action="store_true", help="use an already running server")
+    args = parser.parse_args()
+
+    from carla_backend import MAX_DEFAULT_PARAMETERS
+    from carla_backend_qtweb import CarlaHostQtWeb
+
+    server = None if args.external else startServer(args)
+
+    try:
+        host = CarlaHostQtWeb()
+        host.maxParameters = MAX_DEFAULT_PARAMETERS
+
+        # let the websocket settle, and get all plugins loaded
+        host.engine_idle()
+
+        callsPerSecond = benchCalls(host, args.duration)
+        coldReload, warmReload = benchReload(host, args.runs)
+        idleMean, idleMax = benchIdle(host, args.duration, 30.0)
+
+        print("REST frontend (%i plugins, %i parameters, %g Hz stream, %g ms latency):" % (
+              args.plugins, args.parameters, args.rate, args.latency))
+        print("  requests:                 %10.1f calls/s" % callsPerSecond)
+        print("  reload all, empty cache:  %10.3f ms" % (coldReload * 1000.0))
+        print("  reload all, filled cache: %10.3f ms" % (warmReload * 1000.0))
+        print("  engine_idle per UI tick:  %10.3f ms (max %.3f ms)" % (idleMean * 1000.0, idleMax * 1000.0))
+
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+# ------------------------------------------------------------------------------------------------------------
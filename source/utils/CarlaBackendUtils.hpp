@@ -398,6 +398,10 @@ const char* EngineOption2Str(const EngineOption option) noexcept
 #endif
     case ENGINE_OPTION_DEBUG_CONSOLE_OUTPUT:
         return "ENGINE_OPTION_DEBUG_CONSOLE_OUTPUT";
+    case ENGINE_OPTION_PARALLEL_PROJECT_LOAD:
+        return "ENGINE_OPTION_PARALLEL_PROJECT_LOAD";
+    case ENGINE_OPTION_PLUGIN_POOL_MEMORY:
+        return "ENGINE_OPTION_PLUGIN_POOL_MEMORY";
     }
 
     carla_stderr("CarlaBackend::EngineOption2Str(%i) - invalid option", option);
@@ -41,6 +41,7 @@
 # include <ctime>
 #else
 # include <cerrno>
+# include <poll.h>
 # include <signal.h>
 # include <sys/wait.h>
 # ifdef CARLA_OS_LINUX
@@ -599,6 +600,10 @@ struct CarlaPipeCommon::PrivateData {
     mutable char        tmpBuf[0xffff];
     mutable CarlaString tmpStr;
 
+    // line being read by readNextLineIfAvailable(), kept across calls until its '\n' arrives
+    CarlaString nextLine;
+    bool nextLineComplete;
+
     PrivateData() noexcept
 #ifdef CARLA_OS_WIN
         : processInfo(),
@@ -614,7 +619,9 @@ struct CarlaPipeCommon::PrivateData {
           isServer(false),
           writeLock(),
           tmpBuf(),
-          tmpStr()
+          tmpStr(),
+          nextLine(),
+          nextLineComplete(false)
     {
 #ifdef CARLA_OS_WIN
         carla_zeroStruct(processInfo);
@@ -689,6 +696,138 @@ void CarlaPipeCommon::idlePipe(const bool onlyOnce) noexcept
     }
 }
 
+const char* CarlaPipeCommon::readNextLineIfAvailable() noexcept
+{
+    char    buf[0xff];
+    char    c;
+    ssize_t ret;
+
+    for (;;)
+    {
+        if (pData->pipeRecv == INVALID_PIPE_VALUE || pData->pipeClosed)
+            return nullptr;
+
+        // the previous line was returned already, start a new one
+        if (pData->nextLineComplete)
+        {
+            pData->nextLine.clear();
+            pData->nextLineComplete = false;
+        }
+
+        std::size_t len = 0;
+        ret = -1;
+
+        for (;;)
+        {
+            try {
+    #ifdef CARLA_OS_WIN
+                ret = ReadFileWin32(pData->pipeRecv, pData->ovRecv, &c, 1);
+    #else
+                ret = ::read(pData->pipeRecv, &c, 1);
+    #endif
+            } CARLA_SAFE_EXCEPTION_BREAK("CarlaPipeCommon::readNextLineIfAvailable() - read");
+
+            if (ret != 1)
+                break;
+
+            if (c == '\n')
+            {
+                pData->nextLineComplete = true;
+                break;
+            }
+
+            if (c == '\r')
+                c = '\n';
+
+            buf[len++] = c;
+
+            if (len == 0xfe)
+            {
+                buf[len] = '\0';
+                pData->nextLine += buf;
+                len = 0;
+            }
+        }
+
+        if (len != 0)
+        {
+            buf[len] = '\0';
+            pData->nextLine += buf;
+        }
+
+#ifndef CARLA_OS_WIN
+        // end of file, the other side went away without telling us
+        if (ret == 0)
+            pData->pipeClosed = true;
+#endif
+
+        // nothing more to read for now, a partial line is kept until the rest of it arrives
+        if (! pData->nextLineComplete)
+            return nullptr;
+
+        const char* const line = pData->nextLine.buffer();
+
+        // same as idlePipe()
+        if (std::strcmp(line, "__carla-quit__") == 0)
+        {
+            pData->pipeClosed = true;
+            return nullptr;
+        }
+
+        if (pData->clientClosingDown)
+            continue;
+
+        return line;
+    }
+}
+
+bool CarlaPipeCommon::waitForPipeData(const uint timeOutMilliseconds) const noexcept
+{
+    CARLA_SAFE_ASSERT_RETURN(pData->pipeRecv != INVALID_PIPE_VALUE, false);
+
+    if (pData->pipeClosed)
+        return false;
+
+#ifdef CARLA_OS_WIN
+    // overlapped reads cannot be waited on without reading, poll the pipe instead
+    for (uint waited = 0;; waited += 5)
+    {
+        DWORD available = 0;
+
+        if (::PeekNamedPipe(pData->pipeRecv, nullptr, 0, nullptr, &available, nullptr) == FALSE)
+        {
+            // broken pipe, the other side went away
+            pData->pipeClosed = true;
+            return false;
+        }
+
+        if (available != 0 || waited >= timeOutMilliseconds)
+            return true;
+
+        carla_msleep(5);
+    }
+#else
+    struct pollfd pfd;
+    pfd.fd      = pData->pipeRecv;
+    pfd.events  = POLLIN;
+    pfd.revents = 0;
+
+    const int ret = ::poll(&pfd, 1, static_cast<int>(timeOutMilliseconds));
+
+    if (ret < 0)
+        return errno == EINTR;
+
+    // the other side went away and there is nothing left to read, otherwise poll() would return at once forever
+    if ((pfd.revents & POLLIN) == 0 && (pfd.revents & (POLLHUP|POLLERR|POLLNVAL)) != 0)
+    {
+        pData->pipeClosed = true;
+        return false;
+    }
+
+    return true;
+#endif
+}
+
 // -------------------------------------------------------------------
 
 void CarlaPipeCommon::lockPipe() const noexcept
@@ -71,6 +71,20 @@ public:
      */
     void idlePipe(bool onlyOnce = false) noexcept;
 
+    /*!
+     * Read the next line from the pipe if there is one, without waiting or calling msgReceived().
+     * This is an alternative to idlePipe(), for users that decode messages themselves.
+     * Returns null if there is nothing to read. The returned string is only valid until the next read.
+     * A line that is only partially available is kept until the rest of it arrives.
+     */
+    const char* readNextLineIfAvailable() noexcept;
+
+    /*!
+     * Wait until there is something to read from the pipe, or until @a timeOutMilliseconds have passed.
+     * Returns false if the pipe is not running, which includes the other side having closed it.
+     */
+    bool waitForPipeData(uint timeOutMilliseconds) const noexcept;
+
     // -------------------------------------------------------------------
     // write lock
 